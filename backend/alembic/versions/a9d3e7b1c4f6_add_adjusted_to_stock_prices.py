@@ -0,0 +1,30 @@
+"""add_adjusted_to_stock_prices
+
+Revision ID: a9d3e7b1c4f6
+Revises: f2a7d9c1e5b8
+Create Date: 2026-10-18 10:12:37.204518
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e7b1c4f6'
+down_revision: Union[str, None] = 'f2a7d9c1e5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 행은 어느 기준으로 저장됐는지 알 수 없으므로 수정주가가 아닌 것으로 보고 다시 확인
+    op.add_column(
+        'stock_prices',
+        sa.Column('adjusted', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('stock_prices', 'adjusted')
@@ -2,17 +2,68 @@
 
 재무제표 및 주가 데이터를 분석합니다.
 """
+import asyncio
 import logging
 
 from app.agents.financial.prompts import ANALYSIS_PROMPT_TEMPLATE, SYSTEM_PROMPT
 from app.agents.financial.tools.dart_financial_tool import get_financial_statements
 from app.agents.financial.tools.stock_price_tool import get_stock_analysis
 from app.agents.state import AnalysisState
+from app.data_sources.krx_session import run_krx
 from app.llm.provider import get_llm_provider
 
 logger = logging.getLogger(__name__)
 
 
+def _build_messages(
+    company_name: str,
+    stock_code: str,
+    financial_result: str,
+    stock_result: str
+) -> list[dict]:
+    """조회한 재무제표·주가 데이터로 분석 요청 메시지 생성"""
+    analysis_prompt = ANALYSIS_PROMPT_TEMPLATE.format(
+        company_name=company_name,
+        stock_code=stock_code,
+        financial_statements=financial_result,
+        stock_analysis=stock_result
+    )
+
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": analysis_prompt}
+    ]
+
+
+def _build_result(
+    financial_result: str,
+    stock_result: str,
+    analysis_text: str | None
+) -> AnalysisState:
+    """노드 결과 상태 (병렬 실행 시 기존 키 덮어쓰지 않기)"""
+    if not analysis_text:
+        logger.error("LLM 분석 실패")
+        analysis_text = "재무 분석 중 오류가 발생했습니다."
+
+    logger.info("재무 분석 완료")
+
+    return {
+        "financial_statements": [{"content": financial_result}],
+        "stock_price_data": {"content": stock_result},
+        "financial_analysis_text": analysis_text,
+    }
+
+
+def _build_error(e: Exception) -> AnalysisState:
+    logger.error(f"재무 분석 오류: {e}", exc_info=True)
+
+    return {
+        "financial_statements": [],
+        "stock_price_data": {},
+        "financial_analysis_text": f"재무 분석 오류: {str(e)}",
+    }
+
+
 def analyze_financials_node(state: AnalysisState) -> AnalysisState:
     """
     재무 분석 노드
@@ -47,39 +98,54 @@ def analyze_financials_node(state: AnalysisState) -> AnalysisState:
         # 3. LLM을 사용하여 재무 분석
         logger.info("재무 데이터 분석 중...")
 
-        analysis_prompt = ANALYSIS_PROMPT_TEMPLATE.format(
-            company_name=company_name,
-            stock_code=stock_code,
-            financial_statements=financial_result,
-            stock_analysis=stock_result
-        )
+        messages = _build_messages(company_name, stock_code, financial_result, stock_result)
+        analysis_text = get_llm_provider().complete(messages, temperature=0.3, max_tokens=2000)
 
-        llm_provider = get_llm_provider()
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": analysis_prompt}
-        ]
+        return _build_result(financial_result, stock_result, analysis_text)
+
+    except Exception as e:
+        return _build_error(e)
 
-        analysis_text = llm_provider.complete(messages, temperature=0.3, max_tokens=2000)
 
-        if not analysis_text:
-            logger.error("LLM 분석 실패")
-            analysis_text = "재무 분석 중 오류가 발생했습니다."
+async def aanalyze_financials_node(state: AnalysisState) -> AnalysisState:
+    """
+    재무 분석 노드 (비동기)
 
-        logger.info("재무 분석 완료")
+    재무제표 조회(워커 스레드)와 주가 조회(KRX 워커 풀)를 동시에 실행하고,
+    LLM 호출은 acomplete로 기다립니다.
 
-        # 상태 업데이트 (병렬 실행 시 기존 키 덮어쓰지 않기)
-        return {
-            "financial_statements": [{"content": financial_result}],
-            "stock_price_data": {"content": stock_result},
-            "financial_analysis_text": analysis_text,
-        }
+    Args:
+        state: 현재 상태
 
-    except Exception as e:
-        logger.error(f"재무 분석 오류: {e}", exc_info=True)
+    Returns:
+        업데이트된 상태 (재무 분석 결과 포함)
+    """
+    stock_code = state["stock_code"]
+    company_name = state["company_name"]
 
-        return {
-            "financial_statements": [],
-            "stock_price_data": {},
-            "financial_analysis_text": f"재무 분석 오류: {str(e)}",
-        }
+    logger.info(f"재무 분석 시작: {company_name} ({stock_code})")
+
+    try:
+        # 1~2. DART 재무제표 + 주가 데이터 (동시 실행)
+        logger.info("재무제표·주가 데이터 조회 중...")
+        financial_result, stock_result = await asyncio.gather(
+            get_financial_statements.ainvoke({
+                "stock_code": stock_code,
+                "year": 2023,
+                "report_type": "annual"
+            }),
+            run_krx(get_stock_analysis.invoke, {"stock_code": stock_code, "days": 252}),
+        )
+
+        # 3. LLM을 사용하여 재무 분석
+        logger.info("재무 데이터 분석 중...")
+
+        messages = _build_messages(company_name, stock_code, financial_result, stock_result)
+        analysis_text = await get_llm_provider().acomplete(
+            messages, temperature=0.3, max_tokens=2000
+        )
+
+        return _build_result(financial_result, stock_result, analysis_text)
+
+    except Exception as e:
+        return _build_error(e)
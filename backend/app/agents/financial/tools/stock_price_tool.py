@@ -21,28 +21,22 @@ def get_stock_analysis(
     """
     client = StockClient()
 
-    # 최근 주가 데이터
-    df = client.get_recent_price(stock_code, days=days)
+    # 주가 데이터 1회 조회로 통계·수익률·52주 범위 계산
+    snapshot = client.get_price_snapshot(stock_code, days=days)
 
-    if df is None or df.empty:
+    if snapshot is None:
         return f"종목코드 {stock_code}의 주가 데이터를 찾을 수 없습니다."
 
     # 현재가 및 통계
-    current_price = int(df["close"].iloc[-1])
-    avg_price = int(df["close"].mean())
-    high = int(df["high"].max())
-    low = int(df["low"].min())
-    market_cap = df["market_cap"].iloc[-1]
-
     result_lines = [f"주가 분석 ({days}일 기준):"]
-    result_lines.append(f"  - 현재가: {current_price:,}원")
-    result_lines.append(f"  - 평균가: {avg_price:,}원")
-    result_lines.append(f"  - 최고가: {high:,}원")
-    result_lines.append(f"  - 최저가: {low:,}원")
-    result_lines.append(f"  - 시가총액: {market_cap / 1_000_000_000_000:.2f}조원")
+    result_lines.append(f"  - 현재가: {snapshot['current_price']:,}원")
+    result_lines.append(f"  - 평균가: {snapshot['avg_price']:,}원")
+    result_lines.append(f"  - 최고가: {snapshot['high']:,}원")
+    result_lines.append(f"  - 최저가: {snapshot['low']:,}원")
+    result_lines.append(f"  - 시가총액: {snapshot['market_cap'] / 1_000_000_000_000:.2f}조원")
 
-    # 수익률 계산
-    change_rates = client.get_price_change_rate(stock_code, days=days)
+    # 수익률
+    change_rates = snapshot["change_rates"]
 
     if change_rates:
         result_lines.append(f"\n수익률:")
@@ -56,7 +50,7 @@ def get_stock_analysis(
             result_lines.append(f"  - 1년: {change_rates['1y']:+.2f}%")
 
     # 52주 최고/최저가
-    week_52 = client.get_52week_high_low(stock_code)
+    week_52 = snapshot["week_52"]
 
     if week_52:
         result_lines.append(f"\n52주 기준:")
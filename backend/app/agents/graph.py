@@ -5,18 +5,29 @@ Pipeline flow:
         ├── collect_information (parallel)
         └── analyze_financials  (parallel)
     orchestrator_merge
-    evaluate_valuation
+        ├── evaluate_deep_value (parallel)
+        └── evaluate_quality    (parallel)
+    score_valuation
     generate_report
+
+analysis_graph는 동기 노드(invoke), async_analysis_graph는 같은 흐름의
+비동기 노드(ainvoke)로 구성됩니다.
 """
 import logging
 
 from langgraph.graph import END, START, StateGraph
 
-from app.agents.financial.agent import analyze_financials_node
-from app.agents.information.agent import collect_information_node
-from app.agents.report.agent import generate_report_node
+from app.agents.financial.agent import aanalyze_financials_node, analyze_financials_node
+from app.agents.information.agent import acollect_information_node, collect_information_node
+from app.agents.report.agent import agenerate_report_node, generate_report_node
 from app.agents.state import AnalysisState
-from app.agents.valuation.agent import evaluate_valuation_node
+from app.agents.valuation.agent import (
+    aevaluate_deep_value_node,
+    aevaluate_quality_node,
+    evaluate_deep_value_node,
+    evaluate_quality_node,
+    score_valuation_node,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -83,22 +94,36 @@ def orchestrator_merge(state: AnalysisState) -> AnalysisState:
     }
 
 
-def build_graph() -> StateGraph:
+def build_graph(async_mode: bool = False) -> StateGraph:
     """
     분석 파이프라인 그래프 생성
 
+    Args:
+        async_mode: True면 비동기 노드 사용 (ainvoke 전용)
+
     Returns:
         컴파일된 StateGraph
     """
     graph = StateGraph(AnalysisState)
 
+    if async_mode:
+        collect, analyze = acollect_information_node, aanalyze_financials_node
+        deep_value, quality = aevaluate_deep_value_node, aevaluate_quality_node
+        report = agenerate_report_node
+    else:
+        collect, analyze = collect_information_node, analyze_financials_node
+        deep_value, quality = evaluate_deep_value_node, evaluate_quality_node
+        report = generate_report_node
+
     # 노드 추가
     graph.add_node("orchestrator_start", orchestrator_start)
-    graph.add_node("collect_information", collect_information_node)
-    graph.add_node("analyze_financials", analyze_financials_node)
+    graph.add_node("collect_information", collect)
+    graph.add_node("analyze_financials", analyze)
     graph.add_node("orchestrator_merge", orchestrator_merge)
-    graph.add_node("evaluate_valuation", evaluate_valuation_node)
-    graph.add_node("generate_report", generate_report_node)
+    graph.add_node("evaluate_deep_value", deep_value)
+    graph.add_node("evaluate_quality", quality)
+    graph.add_node("score_valuation", score_valuation_node)
+    graph.add_node("generate_report", report)
 
     # 엣지: START -> orchestrator
     graph.add_edge(START, "orchestrator_start")
@@ -111,15 +136,21 @@ def build_graph() -> StateGraph:
     graph.add_edge("collect_information", "orchestrator_merge")
     graph.add_edge("analyze_financials", "orchestrator_merge")
 
-    # 순차 실행: merge -> evaluate -> report -> END
-    graph.add_edge("orchestrator_merge", "evaluate_valuation")
-    graph.add_edge("evaluate_valuation", "generate_report")
+    # Fan-out: 가치투자 평가 두 관점 병렬 실행
+    graph.add_edge("orchestrator_merge", "evaluate_deep_value")
+    graph.add_edge("orchestrator_merge", "evaluate_quality")
+
+    # Fan-in: 점수 병합 -> report -> END
+    graph.add_edge("evaluate_deep_value", "score_valuation")
+    graph.add_edge("evaluate_quality", "score_valuation")
+    graph.add_edge("score_valuation", "generate_report")
     graph.add_edge("generate_report", END)
 
-    logger.info("LangGraph 파이프라인 그래프 빌드 완료")
+    logger.info(f"LangGraph 파이프라인 그래프 빌드 완료 (async_mode={async_mode})")
 
     return graph
 
 
 # 컴파일된 그래프 인스턴스
 analysis_graph = build_graph().compile()
+async_analysis_graph = build_graph(async_mode=True).compile()
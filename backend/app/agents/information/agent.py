@@ -2,6 +2,7 @@
 
 기업 관련 정보(공시, 뉴스, 블로그)를 수집하고 분석합니다.
 """
+import asyncio
 import logging
 
 from app.agents.information.prompts import ANALYSIS_PROMPT_TEMPLATE, SYSTEM_PROMPT
@@ -13,6 +14,51 @@ from app.llm.provider import get_llm_provider
 logger = logging.getLogger(__name__)
 
 
+def _build_messages(
+    company_name: str,
+    stock_code: str,
+    dart_result: str,
+    news_result: str
+) -> list[dict]:
+    """수집한 공시·뉴스로 분석 요청 메시지 생성"""
+    analysis_prompt = ANALYSIS_PROMPT_TEMPLATE.format(
+        company_name=company_name,
+        stock_code=stock_code,
+        dart_disclosures=dart_result,
+        news_articles=news_result
+    )
+
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": analysis_prompt}
+    ]
+
+
+def _build_result(dart_result: str, news_result: str, analysis_text: str | None) -> AnalysisState:
+    """노드 결과 상태 (병렬 실행 시 기존 키 덮어쓰지 않기)"""
+    if not analysis_text:
+        logger.error("LLM 분석 실패")
+        analysis_text = "정보 분석 중 오류가 발생했습니다."
+
+    logger.info("정보 수집 완료")
+
+    return {
+        "dart_disclosures": [{"content": dart_result}],
+        "news_articles": [{"content": news_result}],
+        "earnings_outlook_raw": analysis_text,
+    }
+
+
+def _build_error(e: Exception) -> AnalysisState:
+    logger.error(f"정보 수집 오류: {e}", exc_info=True)
+
+    return {
+        "dart_disclosures": [],
+        "news_articles": [],
+        "earnings_outlook_raw": f"정보 수집 오류: {str(e)}",
+    }
+
+
 def collect_information_node(state: AnalysisState) -> AnalysisState:
     """
     정보 수집 노드
@@ -40,39 +86,50 @@ def collect_information_node(state: AnalysisState) -> AnalysisState:
         # 3. LLM을 사용하여 정보 분석
         logger.info("수집된 정보 분석 중...")
 
-        analysis_prompt = ANALYSIS_PROMPT_TEMPLATE.format(
-            company_name=company_name,
-            stock_code=stock_code,
-            dart_disclosures=dart_result,
-            news_articles=news_result
-        )
+        messages = _build_messages(company_name, stock_code, dart_result, news_result)
+        analysis_text = get_llm_provider().complete(messages, temperature=0.3, max_tokens=2000)
 
-        llm_provider = get_llm_provider()
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": analysis_prompt}
-        ]
+        return _build_result(dart_result, news_result, analysis_text)
+
+    except Exception as e:
+        return _build_error(e)
 
-        analysis_text = llm_provider.complete(messages, temperature=0.3, max_tokens=2000)
 
-        if not analysis_text:
-            logger.error("LLM 분석 실패")
-            analysis_text = "정보 분석 중 오류가 발생했습니다."
+async def acollect_information_node(state: AnalysisState) -> AnalysisState:
+    """
+    정보 수집 노드 (비동기)
 
-        logger.info("정보 수집 완료")
+    공시 검색(워커 스레드)과 뉴스 검색(httpx)을 동시에 실행하고,
+    LLM 호출은 acomplete로 이벤트 루프를 막지 않고 기다립니다.
 
-        # 상태 업데이트 (병렬 실행 시 기존 키 덮어쓰지 않기)
-        return {
-            "dart_disclosures": [{"content": dart_result}],
-            "news_articles": [{"content": news_result}],
-            "earnings_outlook_raw": analysis_text,
-        }
+    Args:
+        state: 현재 상태
 
-    except Exception as e:
-        logger.error(f"정보 수집 오류: {e}", exc_info=True)
+    Returns:
+        업데이트된 상태 (뉴스, 공시 정보 포함)
+    """
+    stock_code = state["stock_code"]
+    company_name = state["company_name"]
 
-        return {
-            "dart_disclosures": [],
-            "news_articles": [],
-            "earnings_outlook_raw": f"정보 수집 오류: {str(e)}",
-        }
+    logger.info(f"정보 수집 시작: {company_name} ({stock_code})")
+
+    try:
+        # 1~2. DART 공시 검색 + 네이버 뉴스 검색 (동시 실행)
+        logger.info("DART 공시·네이버 뉴스 검색 중...")
+        dart_result, news_result = await asyncio.gather(
+            search_dart_disclosures.ainvoke({"stock_code": stock_code, "days_back": 90}),
+            search_naver_news.ainvoke({"company_name": company_name, "max_results": 10}),
+        )
+
+        # 3. LLM을 사용하여 정보 분석
+        logger.info("수집된 정보 분석 중...")
+
+        messages = _build_messages(company_name, stock_code, dart_result, news_result)
+        analysis_text = await get_llm_provider().acomplete(
+            messages, temperature=0.3, max_tokens=2000
+        )
+
+        return _build_result(dart_result, news_result, analysis_text)
+
+    except Exception as e:
+        return _build_error(e)
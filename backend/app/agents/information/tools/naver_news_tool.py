@@ -1,13 +1,12 @@
 """네이버 뉴스 검색 도구"""
 import asyncio
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 from app.data_sources.naver_client import NaverClient
 
 
-@tool
-def search_naver_news(
+async def _asearch_naver_news(
     company_name: str,
     max_results: int = 10
 ) -> str:
@@ -23,20 +22,11 @@ def search_naver_news(
     """
     client = NaverClient()
 
-    # 비동기 함수를 동기적으로 실행
-    async def _search():
-        return await client.search_news(
-            query=company_name,
-            display=max_results,
-            sort="date"
-        )
-
-    try:
-        result = asyncio.run(_search())
-    except RuntimeError:
-        # 이미 이벤트 루프가 실행 중인 경우
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(_search())
+    result = await client.search_news(
+        query=company_name,
+        display=max_results,
+        sort="date"
+    )
 
     if not result or not result.get("items"):
         return f"{company_name} 관련 뉴스를 찾을 수 없습니다."
@@ -57,3 +47,34 @@ def search_naver_news(
         result_lines.append(f"   요약: {description[:100]}...")
 
     return "\n".join(result_lines)
+
+
+def _search_naver_news(
+    company_name: str,
+    max_results: int = 10
+) -> str:
+    """
+    네이버에서 기업 관련 최신 뉴스를 검색합니다.
+
+    Args:
+        company_name: 기업명 (예: "삼성전자")
+        max_results: 최대 결과 수 (기본값: 10)
+
+    Returns:
+        뉴스 검색 결과 요약
+    """
+    # 비동기 함수를 동기적으로 실행
+    try:
+        return asyncio.run(_asearch_naver_news(company_name, max_results))
+    except RuntimeError:
+        # 이미 이벤트 루프가 실행 중인 경우
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(_asearch_naver_news(company_name, max_results))
+
+
+# invoke()는 동기 경로, ainvoke()는 이벤트 루프에서 바로 실행 (스레드 사용 없음)
+search_naver_news = StructuredTool.from_function(
+    func=_search_naver_news,
+    coroutine=_asearch_naver_news,
+    name="search_naver_news",
+)
@@ -1,18 +1,24 @@
 """Report Generation Agent
 
 분석 결과를 종합하여 최종 보고서를 생성하고 데이터베이스에 저장합니다.
+보고서는 미공개 초안으로 먼저 만들고, 스트리밍으로 생성되는 본문을 주기적으로 저장한 뒤
+생성이 끝나면 공개합니다.
 """
+import asyncio
 import logging
+import time
 from datetime import datetime
 
 import httpx
 from slugify import slugify
+from sqlalchemy import delete, update
 
 from app.agents.report.prompts import REPORT_PROMPT_TEMPLATE, SYSTEM_PROMPT
 from app.agents.state import AnalysisState
 from app.config import settings
 from app.db.session import get_sync_session
 from app.llm.provider import get_llm_provider
+from app.services.report_stream import close_report_stream, open_report_stream
 
 logger = logging.getLogger(__name__)
 
@@ -45,106 +51,235 @@ def trigger_revalidation(slug: str) -> bool:
         return False
 
 
-def generate_report_node(state: AnalysisState) -> AnalysisState:
+async def atrigger_revalidation(slug: str) -> bool:
     """
-    보고서 생성 노드
+    프론트엔드 ISR 재검증 웹훅을 호출합니다 (비동기).
+
+    Args:
+        slug: 보고서 slug
+
+    Returns:
+        성공 여부
+    """
+    try:
+        url = f"{settings.frontend_url}/api/revalidate"
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.post(
+                url,
+                json={"slug": slug, "secret": settings.revalidation_secret},
+            )
+        if response.status_code == 200:
+            logger.info(f"ISR 재검증 성공: {slug}")
+            return True
+        else:
+            logger.warning(f"ISR 재검증 실패: {response.status_code} - {response.text}")
+            return False
+    except Exception as e:
+        logger.warning(f"ISR 재검증 호출 실패: {e}")
+        return False
+
+
+# Verdict 한글 변환
+VERDICT_KOREAN = {
+    "strong_buy": "적극 매수",
+    "buy": "매수",
+    "hold": "보유",
+    "sell": "매도",
+    "strong_sell": "적극 매도",
+}
+
+
+def _build_messages(state: AnalysisState) -> list[dict]:
+    """분석 결과로 보고서 생성 요청 메시지 생성"""
+    overall_verdict = state.get("overall_verdict", "hold")
+
+    report_prompt = REPORT_PROMPT_TEMPLATE.format(
+        company_name=state["company_name"],
+        stock_code=state["stock_code"],
+        analysis_date=datetime.now().strftime("%Y-%m-%d"),
+        information_analysis=state.get("earnings_outlook_raw", ""),
+        financial_analysis=state.get("financial_analysis_text", ""),
+        deep_value_score=state.get("deep_value_evaluation", {}).get("score", 50),
+        deep_value_analysis=state.get("deep_value_evaluation", {}).get("analysis", ""),
+        quality_score=state.get("quality_evaluation", {}).get("score", 50),
+        quality_analysis=state.get("quality_evaluation", {}).get("analysis", ""),
+        overall_score=state.get("overall_score", 50.0),
+        overall_verdict=overall_verdict,
+        overall_verdict_korean=VERDICT_KOREAN.get(overall_verdict, "보유"),
+    )
+
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": report_prompt}
+    ]
+
+
+def _create_draft_report(state: AnalysisState) -> tuple[int, str]:
+    """
+    생성 시작 전 미공개 초안 보고서를 만듭니다 (이후 체크포인트로 본문 저장).
+
+    같은 slug의 미공개 초안(중단된 이전 실행이 남긴 것)은 새 초안으로 대체합니다.
 
     Args:
         state: 현재 상태
 
     Returns:
-        업데이트된 상태 (보고서 ID 포함)
+        (보고서 ID, slug)
     """
     company_name = state["company_name"]
     stock_code = state["stock_code"]
-    company_id = state["company_id"]
-    analysis_run_id = state.get("analysis_run_id")
 
-    logger.info(f"보고서 생성 시작: {company_name} ({stock_code})")
+    # 보고서 제목 및 slug 생성
+    title = f"{company_name} 투자 분석 보고서"
+    slug = slugify(f"{company_name}-{stock_code}-{datetime.now().strftime('%Y%m%d')}")
 
-    try:
-        # Verdict 한글 변환
-        verdict_map = {
-            "strong_buy": "적극 매수",
-            "buy": "매수",
-            "hold": "보유",
-            "sell": "매도",
-            "strong_sell": "적극 매도",
-        }
+    logger.info(f"초안 보고서 생성 중... slug={slug}")
 
-        overall_verdict = state.get("overall_verdict", "hold")
-        overall_verdict_korean = verdict_map.get(overall_verdict, "보유")
+    from app.db.models.report import AnalysisReport
 
-        # LLM으로 보고서 생성
-        logger.info("LLM으로 보고서 생성 중...")
+    with get_sync_session() as session:
+        session.execute(
+            delete(AnalysisReport).where(
+                AnalysisReport.slug == slug,
+                AnalysisReport.is_published.is_(False),
+            )
+        )
 
-        report_prompt = REPORT_PROMPT_TEMPLATE.format(
-            company_name=company_name,
-            stock_code=stock_code,
-            analysis_date=datetime.now().strftime("%Y-%m-%d"),
-            information_analysis=state.get("earnings_outlook_raw", ""),
-            financial_analysis=state.get("financial_analysis_text", ""),
-            deep_value_score=state.get("deep_value_evaluation", {}).get("score", 50),
-            deep_value_analysis=state.get("deep_value_evaluation", {}).get("analysis", ""),
-            quality_score=state.get("quality_evaluation", {}).get("score", 50),
-            quality_analysis=state.get("quality_evaluation", {}).get("analysis", ""),
+        report = AnalysisReport(
+            company_id=state["company_id"],
+            analysis_run_id=state.get("analysis_run_id"),
+            slug=slug,
+            title=title,
+            report_date=datetime.now().date(),
+            executive_summary="",
+            company_overview="",
+            financial_analysis="",  # TODO: 섹션별로 분리
+            news_sentiment_summary="",
+            earnings_outlook="",
+            deep_value_evaluation=state.get("deep_value_evaluation", {}),
+            quality_evaluation=state.get("quality_evaluation", {}),
             overall_score=state.get("overall_score", 50.0),
-            overall_verdict=overall_verdict,
-            overall_verdict_korean=overall_verdict_korean,
+            overall_verdict=state.get("overall_verdict", "hold"),
+            is_published=False,
+        )
+
+        session.add(report)
+        session.commit()
+        session.refresh(report)
+
+        report_id = report.id
+
+    return report_id, slug
+
+
+def _checkpoint_report(report_id: int, report_content: str) -> None:
+    """
+    생성 중인 본문을 초안에 저장합니다 (서버가 중단돼도 생성된 부분까지 보존).
+
+    Args:
+        report_id: 초안 보고서 ID
+        report_content: 지금까지 생성된 본문
+    """
+    from app.db.models.report import AnalysisReport
+
+    with get_sync_session() as session:
+        session.execute(
+            update(AnalysisReport)
+            .where(AnalysisReport.id == report_id)
+            .values(
+                executive_summary=report_content[:500],  # 임시로 앞부분만
+                company_overview=report_content,  # 전체 내용 (임시)
+            )
         )
 
-        llm_provider = get_llm_provider()
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": report_prompt}
-        ]
+    logger.debug(f"보고서 체크포인트 저장: ID={report_id}, {len(report_content)} 문자")
 
-        report_content = llm_provider.complete(messages, temperature=0.5, max_tokens=4000)
 
-        if not report_content:
-            logger.error("보고서 생성 실패")
-            report_content = "보고서 생성 중 오류가 발생했습니다."
+def _publish_report(report_id: int, report_content: str | None) -> str:
+    """
+    완성된 본문을 저장하고 보고서를 공개합니다.
 
-        # 보고서 제목 및 slug 생성
-        title = f"{company_name} 투자 분석 보고서"
-        slug = slugify(f"{company_name}-{stock_code}-{datetime.now().strftime('%Y%m%d')}")
+    Args:
+        report_id: 초안 보고서 ID
+        report_content: LLM 생성 보고서 (실패 시 None)
 
-        logger.info(f"보고서 데이터베이스 저장 중... slug={slug}")
+    Returns:
+        저장한 본문
+    """
+    if not report_content:
+        logger.error("보고서 생성 실패")
+        report_content = "보고서 생성 중 오류가 발생했습니다."
 
-        # 데이터베이스에 저장
-        from app.db.models.report import AnalysisReport
+    from app.db.models.report import AnalysisReport
 
-        with get_sync_session() as session:
-            report = AnalysisReport(
-                company_id=company_id,
-                analysis_run_id=analysis_run_id,
-                slug=slug,
-                title=title,
-                report_date=datetime.now().date(),
+    with get_sync_session() as session:
+        session.execute(
+            update(AnalysisReport)
+            .where(AnalysisReport.id == report_id)
+            .values(
                 executive_summary=report_content[:500],  # 임시로 앞부분만
                 company_overview=report_content,  # 전체 내용 (임시)
-                financial_analysis="",  # TODO: 섹션별로 분리
-                news_sentiment_summary="",
-                earnings_outlook="",
-                deep_value_evaluation=state.get("deep_value_evaluation", {}),
-                quality_evaluation=state.get("quality_evaluation", {}),
-                overall_score=state.get("overall_score", 50.0),
-                overall_verdict=overall_verdict,
                 is_published=True,
                 published_at=datetime.now(),
             )
+        )
+
+    logger.info(f"보고서 저장 완료: ID={report_id}")
+
+    return report_content
+
+
+def _build_error(state: AnalysisState, e: Exception) -> AnalysisState:
+    logger.error(f"보고서 생성 오류: {e}", exc_info=True)
+
+    errors = list(state.get("errors", []))
+    errors.append(f"보고서 생성 오류: {str(e)}")
+
+    return {
+        "errors": errors,
+        "current_stage": "report_failed",
+    }
+
+
+def generate_report_node(state: AnalysisState) -> AnalysisState:
+    """
+    보고서 생성 노드
+
+    LLM 응답을 스트리밍으로 받으며 settings.report_checkpoint_seconds마다 초안에 저장합니다.
+
+    Args:
+        state: 현재 상태
 
-            session.add(report)
-            session.commit()
-            session.refresh(report)
+    Returns:
+        업데이트된 상태 (보고서 ID 포함)
+    """
+    logger.info(f"보고서 생성 시작: {state['company_name']} ({state['stock_code']})")
 
-            report_id = report.id
-            saved_slug = slug
+    try:
+        report_id, slug = _create_draft_report(state)
 
-        logger.info(f"보고서 저장 완료: ID={report_id}, slug={saved_slug}")
+        # LLM으로 보고서 생성
+        logger.info("LLM으로 보고서 생성 중...")
+        parts = []
+        checkpoint_at = time.monotonic() + settings.report_checkpoint_seconds
+        try:
+            for text in get_llm_provider().stream(
+                _build_messages(state), temperature=0.5, max_tokens=4000
+            ):
+                parts.append(text)
+                if time.monotonic() >= checkpoint_at:
+                    _checkpoint_report(report_id, "".join(parts))
+                    checkpoint_at = time.monotonic() + settings.report_checkpoint_seconds
+        except Exception:
+            # 스트림 도중 실패: 생성된 부분까지 초안에 남김
+            if parts:
+                _checkpoint_report(report_id, "".join(parts))
+            raise
+
+        report_content = _publish_report(report_id, "".join(parts))
 
         # ISR 재검증 트리거
-        trigger_revalidation(saved_slug)
+        trigger_revalidation(slug)
 
         # 상태 업데이트
         return {
@@ -154,12 +289,70 @@ def generate_report_node(state: AnalysisState) -> AnalysisState:
         }
 
     except Exception as e:
-        logger.error(f"보고서 생성 오류: {e}", exc_info=True)
+        return _build_error(state, e)
 
-        errors = list(state.get("errors", []))
-        errors.append(f"보고서 생성 오류: {str(e)}")
 
+async def agenerate_report_node(state: AnalysisState) -> AnalysisState:
+    """
+    보고서 생성 노드 (비동기)
+
+    LLM 응답을 스트리밍으로 받아 조각마다 보고서 스트림(/analysis/runs/{run_id}/report/stream)에
+    전달하고, settings.report_checkpoint_seconds마다 초안에 저장합니다.
+    DB 저장은 워커 스레드, ISR 재검증은 httpx 비동기 호출로 처리합니다.
+
+    Args:
+        state: 현재 상태
+
+    Returns:
+        업데이트된 상태 (보고서 ID 포함)
+    """
+    logger.info(f"보고서 생성 시작: {state['company_name']} ({state['stock_code']})")
+
+    run_id = state.get("analysis_run_id")
+    done_sent = False
+    error_message = "보고서 생성 취소"
+    try:
+        report_id, slug = await asyncio.to_thread(_create_draft_report, state)
+        stream = open_report_stream(run_id, report_id=report_id, slug=slug)
+
+        # LLM으로 보고서 생성
+        logger.info("LLM으로 보고서 생성 중...")
+        parts = []
+        checkpoint_at = time.monotonic() + settings.report_checkpoint_seconds
+        try:
+            async for text in get_llm_provider().astream(
+                _build_messages(state), temperature=0.5, max_tokens=4000
+            ):
+                parts.append(text)
+                stream.publish(text)
+                if time.monotonic() >= checkpoint_at:
+                    await asyncio.to_thread(_checkpoint_report, report_id, "".join(parts))
+                    checkpoint_at = time.monotonic() + settings.report_checkpoint_seconds
+        except (Exception, asyncio.CancelledError):
+            # 스트림 도중 실패·취소: 생성된 부분까지 초안에 남김
+            if parts:
+                await asyncio.to_thread(_checkpoint_report, report_id, "".join(parts))
+            raise
+
+        report_content = await asyncio.to_thread(_publish_report, report_id, "".join(parts))
+        close_report_stream(run_id, "done", {"report_id": report_id, "slug": slug})
+        done_sent = True
+
+        # ISR 재검증 트리거
+        await atrigger_revalidation(slug)
+
+        # 상태 업데이트
         return {
-            "errors": errors,
-            "current_stage": "report_failed",
+            "report_sections": {"full_report": report_content},
+            "report_id": report_id,
+            "current_stage": "report_generated",
         }
+
+    except Exception as e:
+        error_message = f"보고서 생성 오류: {e}"
+        return _build_error(state, e)
+
+    finally:
+        # 취소(CancelledError) 포함 어떤 경로로 끝나도 스트림을 닫아 구독자가 기다리지 않게 함
+        if not done_sent:
+            close_report_stream(run_id, "error", {"message": error_message})
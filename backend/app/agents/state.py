@@ -1,6 +1,7 @@
 """Shared state schema for the LangGraph analysis pipeline."""
 
-from typing import TypedDict
+import operator
+from typing import Annotated, TypedDict
 
 
 class AnalysisState(TypedDict, total=False):
@@ -36,3 +37,5 @@ class AnalysisState(TypedDict, total=False):
     # Execution tracking
     current_stage: str
     errors: list[str]
+    # 단계·분기별 소요 시간(초), 병렬 분기가 동시에 기록하므로 dict 병합
+    stage_timings: Annotated[dict[str, float], operator.or_]
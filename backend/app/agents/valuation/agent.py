@@ -1,15 +1,21 @@
 """Valuation Agent
 
 투자 철학(Deep Value + Quality)을 기반으로 기업을 평가합니다.
+
+두 관점의 평가는 서로 의존하지 않으므로 그래프에서 병렬 분기
+(evaluate_deep_value, evaluate_quality)로 실행하고, score_valuation 노드에서
+점수를 합쳐 종합 판단을 내립니다. 분기별 소요 시간은 stage_timings에 기록합니다.
 """
 import logging
 import re
+import time
 
 from app.agents.state import AnalysisState
 from app.agents.valuation.prompts import (
     DEEP_VALUE_PROMPT_TEMPLATE,
+    DEEP_VALUE_SYSTEM_TEMPLATE,
     QUALITY_PROMPT_TEMPLATE,
-    SYSTEM_PROMPT,
+    QUALITY_SYSTEM_TEMPLATE,
     load_knowledge_base,
 )
 from app.llm.provider import get_llm_provider
@@ -44,124 +50,208 @@ def extract_score(text: str) -> int:
     return 50
 
 
-def evaluate_valuation_node(state: AnalysisState) -> AnalysisState:
-    """
-    가치투자 평가 노드
+def _deep_value_messages(state: AnalysisState, knowledge: dict[str, str]) -> list[dict]:
+    """Deep Value 평가 요청 메시지"""
+    deep_value_prompt = DEEP_VALUE_PROMPT_TEMPLATE.format(
+        company_name=state["company_name"],
+        stock_code=state["stock_code"],
+        financial_analysis=state.get("financial_analysis_text", "재무 분석 데이터 없음"),
+        stock_data=str(state.get("stock_price_data", {}))
+    )
+
+    return [
+        # 고정 prefix: 철학 파일이 바뀌지 않는 한 모든 기업에서 같은 내용 (프롬프트 캐시)
+        {
+            "role": "system",
+            "content": DEEP_VALUE_SYSTEM_TEMPLATE.format(
+                deep_value_philosophy=knowledge["deep_value"]
+            ),
+        },
+        {"role": "user", "content": deep_value_prompt}
+    ]
+
+
+def _quality_messages(state: AnalysisState, knowledge: dict[str, str]) -> list[dict]:
+    """Quality 평가 요청 메시지"""
+    quality_prompt = QUALITY_PROMPT_TEMPLATE.format(
+        company_name=state["company_name"],
+        stock_code=state["stock_code"],
+        financial_analysis=state.get("financial_analysis_text", "재무 분석 데이터 없음"),
+        news_sentiment=state.get("earnings_outlook_raw", "뉴스 분석 데이터 없음")
+    )
+
+    return [
+        {
+            "role": "system",
+            "content": QUALITY_SYSTEM_TEMPLATE.format(quality_philosophy=knowledge["quality"]),
+        },
+        {"role": "user", "content": quality_prompt}
+    ]
+
+
+# 평가 분기: 이름 → (상태 키, 표시 이름, 메시지 생성 함수)
+_BRANCHES = {
+    "deep_value": ("deep_value_evaluation", "Deep Value", _deep_value_messages),
+    "quality": ("quality_evaluation", "Quality", _quality_messages),
+}
+
+
+def _branch_result(branch: str, text: str | None, elapsed: float) -> AnalysisState:
+    """분기 결과 상태 (자기 평가 키와 소요 시간만 반환하여 다른 분기와 충돌하지 않음)"""
+    key, label, _ = _BRANCHES[branch]
+
+    if not text:
+        logger.error(f"{label} 평가 실패")
+        text = f"{label} 평가 중 오류가 발생했습니다."
+
+    score = extract_score(text)
+    logger.info(f"{label} 평가 완료: 점수={score}, {elapsed:.1f}초")
+
+    return {
+        key: {"score": score, "analysis": text},
+        "stage_timings": {f"valuation.{branch}": round(elapsed, 3)},
+    }
+
+
+def _branch_error(branch: str, e: Exception, elapsed: float) -> AnalysisState:
+    key, label, _ = _BRANCHES[branch]
+    logger.error(f"{label} 평가 오류: {e}", exc_info=True)
+
+    return {
+        key: {"error": str(e)},
+        "stage_timings": {f"valuation.{branch}": round(elapsed, 3)},
+    }
+
+
+def _evaluate(branch: str, state: AnalysisState) -> AnalysisState:
+    _, label, build_messages = _BRANCHES[branch]
+    started = time.perf_counter()
+    logger.info(f"{label} 평가 중: {state['company_name']} ({state['stock_code']})")
 
-    Args:
-        state: 현재 상태
+    try:
+        knowledge = load_knowledge_base()
+        text = get_llm_provider().complete(
+            build_messages(state, knowledge), temperature=0.3, max_tokens=2000
+        )
+    except Exception as e:
+        return _branch_error(branch, e, time.perf_counter() - started)
 
-    Returns:
-        업데이트된 상태 (Deep Value 및 Quality 평가 포함)
-    """
-    company_name = state["company_name"]
-    stock_code = state["stock_code"]
+    return _branch_result(branch, text, time.perf_counter() - started)
 
-    logger.info(f"가치투자 평가 시작: {company_name} ({stock_code})")
+
+async def _aevaluate(branch: str, state: AnalysisState) -> AnalysisState:
+    _, label, build_messages = _BRANCHES[branch]
+    started = time.perf_counter()
+    logger.info(f"{label} 평가 중: {state['company_name']} ({state['stock_code']})")
 
     try:
-        # Knowledge Base 로드
-        logger.info("투자 철학 로드 중...")
+        # 메모리 캐시 (파일이 바뀐 경우에만 다시 읽음)
         knowledge = load_knowledge_base()
+        text = await get_llm_provider().acomplete(
+            build_messages(state, knowledge), temperature=0.3, max_tokens=2000
+        )
+    except Exception as e:
+        return _branch_error(branch, e, time.perf_counter() - started)
 
-        financial_analysis = state.get("financial_analysis_text", "재무 분석 데이터 없음")
-        stock_data = str(state.get("stock_price_data", {}))
-        news_sentiment = state.get("earnings_outlook_raw", "뉴스 분석 데이터 없음")
+    return _branch_result(branch, text, time.perf_counter() - started)
 
-        llm_provider = get_llm_provider()
 
-        # 1. Deep Value 평가
-        logger.info("Deep Value 평가 중...")
+def evaluate_deep_value_node(state: AnalysisState) -> AnalysisState:
+    """
+    Deep Value 평가 노드 (Quality 평가와 병렬 실행)
 
-        deep_value_prompt = DEEP_VALUE_PROMPT_TEMPLATE.format(
-            deep_value_philosophy=knowledge["deep_value"],
-            company_name=company_name,
-            stock_code=stock_code,
-            financial_analysis=financial_analysis,
-            stock_data=stock_data
-        )
+    Args:
+        state: 현재 상태
 
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": deep_value_prompt}
-        ]
+    Returns:
+        업데이트된 상태 (deep_value_evaluation, 소요 시간)
+    """
+    return _evaluate("deep_value", state)
 
-        deep_value_text = llm_provider.complete(messages, temperature=0.3, max_tokens=2000)
 
-        if not deep_value_text:
-            logger.error("Deep Value 평가 실패")
-            deep_value_text = "Deep Value 평가 중 오류가 발생했습니다."
+def evaluate_quality_node(state: AnalysisState) -> AnalysisState:
+    """
+    Quality 평가 노드 (Deep Value 평가와 병렬 실행)
 
-        deep_value_score = extract_score(deep_value_text)
+    Args:
+        state: 현재 상태
 
-        # 2. Quality 평가
-        logger.info("Quality 평가 중...")
+    Returns:
+        업데이트된 상태 (quality_evaluation, 소요 시간)
+    """
+    return _evaluate("quality", state)
 
-        quality_prompt = QUALITY_PROMPT_TEMPLATE.format(
-            quality_philosophy=knowledge["quality"],
-            company_name=company_name,
-            stock_code=stock_code,
-            financial_analysis=financial_analysis,
-            news_sentiment=news_sentiment
-        )
 
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": quality_prompt}
-        ]
-
-        quality_text = llm_provider.complete(messages, temperature=0.3, max_tokens=2000)
-
-        if not quality_text:
-            logger.error("Quality 평가 실패")
-            quality_text = "Quality 평가 중 오류가 발생했습니다."
-
-        quality_score = extract_score(quality_text)
-
-        # 3. 종합 점수 계산 (가중 평균: Deep Value 40%, Quality 60%)
-        overall_score = (deep_value_score * 0.4) + (quality_score * 0.6)
-
-        # 4. 투자 판단
-        if overall_score >= 80:
-            verdict = "strong_buy"
-        elif overall_score >= 65:
-            verdict = "buy"
-        elif overall_score >= 50:
-            verdict = "hold"
-        elif overall_score >= 35:
-            verdict = "sell"
-        else:
-            verdict = "strong_sell"
-
-        logger.info(
-            f"평가 완료: Deep Value={deep_value_score}, "
-            f"Quality={quality_score}, Overall={overall_score:.1f}, Verdict={verdict}"
-        )
+async def aevaluate_deep_value_node(state: AnalysisState) -> AnalysisState:
+    """Deep Value 평가 노드 (비동기, LLM 호출은 acomplete)"""
+    return await _aevaluate("deep_value", state)
 
-        # 상태 업데이트
-        return {
-            **state,
-            "deep_value_evaluation": {
-                "score": deep_value_score,
-                "analysis": deep_value_text,
-            },
-            "quality_evaluation": {
-                "score": quality_score,
-                "analysis": quality_text,
-            },
-            "overall_score": overall_score,
-            "overall_verdict": verdict,
-            "current_stage": "valuation_completed",
-        }
 
-    except Exception as e:
-        logger.error(f"가치투자 평가 오류: {e}", exc_info=True)
+async def aevaluate_quality_node(state: AnalysisState) -> AnalysisState:
+    """Quality 평가 노드 (비동기, LLM 호출은 acomplete)"""
+    return await _aevaluate("quality", state)
 
-        errors = state.get("errors", [])
-        errors.append(f"가치투자 평가 오류: {str(e)}")
 
+def score_valuation_node(state: AnalysisState) -> AnalysisState:
+    """
+    가치투자 평가 병합 노드: 두 분기의 점수로 종합 점수 및 투자 판단 계산
+
+    Args:
+        state: Deep Value·Quality 평가가 끝난 상태
+
+    Returns:
+        업데이트된 상태 (종합 점수, 투자 판단 포함)
+    """
+    deep_value = state.get("deep_value_evaluation", {})
+    quality = state.get("quality_evaluation", {})
+
+    # 병렬 분기는 동시에 시작하므로 단계 소요 시간 = 가장 오래 걸린 분기
+    timings = state.get("stage_timings", {})
+    branch_seconds = [timings.get(f"valuation.{branch}", 0.0) for branch in _BRANCHES]
+    stage_timings = {"valuation": max(branch_seconds)}
+
+    branch_errors = [
+        f"가치투자 평가 오류: {evaluation['error']}"
+        for evaluation in (deep_value, quality)
+        if "error" in evaluation
+    ]
+    if branch_errors:
         return {
             **state,
-            "errors": errors,
+            "errors": list(state.get("errors", [])) + branch_errors,
+            "stage_timings": stage_timings,
             "current_stage": "valuation_failed",
         }
+
+    deep_value_score = deep_value.get("score", 50)
+    quality_score = quality.get("score", 50)
+
+    # 종합 점수 계산 (가중 평균: Deep Value 40%, Quality 60%)
+    overall_score = (deep_value_score * 0.4) + (quality_score * 0.6)
+
+    # 투자 판단
+    if overall_score >= 80:
+        verdict = "strong_buy"
+    elif overall_score >= 65:
+        verdict = "buy"
+    elif overall_score >= 50:
+        verdict = "hold"
+    elif overall_score >= 35:
+        verdict = "sell"
+    else:
+        verdict = "strong_sell"
+
+    logger.info(
+        f"평가 완료: Deep Value={deep_value_score}, "
+        f"Quality={quality_score}, Overall={overall_score:.1f}, Verdict={verdict}, "
+        f"소요 {stage_timings['valuation']:.1f}초 (분기 합계 {sum(branch_seconds):.1f}초)"
+    )
+
+    # 상태 업데이트
+    return {
+        **state,
+        "overall_score": overall_score,
+        "overall_verdict": verdict,
+        "stage_timings": stage_timings,
+        "current_stage": "valuation_completed",
+    }
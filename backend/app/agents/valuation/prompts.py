@@ -1,35 +1,57 @@
-"""Valuation Agent prompts"""
+"""Valuation Agent prompts
+
+투자 철학·응답 형식은 system 메시지(호출 간 고정 prefix, 프롬프트 캐시 대상)에,
+기업별 데이터는 user 메시지에 둡니다.
+"""
+import logging
+import threading
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트의 knowledge 디렉토리
+KNOWLEDGE_DIR = Path(__file__).parents[4] / "knowledge"
+
+# 관점 → (파일명, 파일이 없을 때 내용)
+_KNOWLEDGE_FILES = {
+    "deep_value": ("deep_value.md", "Deep Value 투자 철학 파일을 찾을 수 없습니다."),
+    "quality": ("quality.md", "Quality 투자 철학 파일을 찾을 수 없습니다."),
+}
+
+# 관점 → (파일 mtime_ns 또는 None, 내용)
+_knowledge_cache: dict[str, tuple[int | None, str]] = {}
+_knowledge_lock = threading.Lock()
+
 
 def load_knowledge_base() -> dict[str, str]:
     """
     knowledge/ 디렉토리에서 투자 철학 파일을 로드합니다.
 
+    프로세스에서 한 번 읽어 두고, 파일 수정 시각(mtime)이 바뀐 경우에만 다시 읽습니다.
+
     Returns:
         {
             "deep_value": "Deep Value 철학 내용",
             "quality": "Quality 철학 내용"
         }
     """
-    # 프로젝트 루트의 knowledge 디렉토리
-    knowledge_dir = Path(__file__).parents[4] / "knowledge"
-
     knowledge = {}
 
-    # deep_value.md
-    deep_value_path = knowledge_dir / "deep_value.md"
-    if deep_value_path.exists():
-        knowledge["deep_value"] = deep_value_path.read_text(encoding="utf-8")
-    else:
-        knowledge["deep_value"] = "Deep Value 투자 철학 파일을 찾을 수 없습니다."
+    with _knowledge_lock:
+        for key, (filename, missing_text) in _KNOWLEDGE_FILES.items():
+            path = KNOWLEDGE_DIR / filename
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
 
-    # quality.md
-    quality_path = knowledge_dir / "quality.md"
-    if quality_path.exists():
-        knowledge["quality"] = quality_path.read_text(encoding="utf-8")
-    else:
-        knowledge["quality"] = "Quality 투자 철학 파일을 찾을 수 없습니다."
+            cached = _knowledge_cache.get(key)
+            if cached is None or cached[0] != mtime:
+                text = path.read_text(encoding="utf-8") if mtime is not None else missing_text
+                _knowledge_cache[key] = (mtime, text)
+                logger.info(f"투자 철학 로드: {filename} ({len(text)}자)")
+
+            knowledge[key] = _knowledge_cache[key][1]
 
     return knowledge
 
@@ -43,27 +65,15 @@ SYSTEM_PROMPT = """당신은 가치투자 전문가입니다.
 각 관점에서 0-100점 척도로 점수를 매기고, 객관적인 근거를 제시하세요.
 """
 
-DEEP_VALUE_PROMPT_TEMPLATE = """
+# system 메시지 (고정 prefix): 역할 + 투자 철학 + 응답 형식
+DEEP_VALUE_SYSTEM_TEMPLATE = SYSTEM_PROMPT + """
 ## Deep Value 투자 철학
 
 {deep_value_philosophy}
 
 ---
 
-## 기업 정보
-
-기업명: {company_name}
-종목코드: {stock_code}
-
-### 재무 분석
-{financial_analysis}
-
-### 주가 데이터
-{stock_data}
-
----
-
-위 투자 철학에 따라 **Deep Value 관점**에서 이 기업을 평가하세요.
+기업 정보가 주어지면 위 투자 철학에 따라 **Deep Value 관점**에서 평가하세요.
 
 다음 형식으로 작성:
 
@@ -80,13 +90,8 @@ DEEP_VALUE_PROMPT_TEMPLATE = """
 **경고 신호**: (부정 요인 3-5개)
 """
 
-QUALITY_PROMPT_TEMPLATE = """
-## Quality 투자 철학
-
-{quality_philosophy}
-
----
-
+# user 메시지: 기업별 데이터
+DEEP_VALUE_PROMPT_TEMPLATE = """
 ## 기업 정보
 
 기업명: {company_name}
@@ -95,12 +100,22 @@ QUALITY_PROMPT_TEMPLATE = """
 ### 재무 분석
 {financial_analysis}
 
-### 뉴스 및 전망
-{news_sentiment}
+### 주가 데이터
+{stock_data}
 
 ---
 
-위 투자 철학에 따라 **Quality 관점**에서 이 기업을 평가하세요.
+위 투자 철학에 따라 **Deep Value 관점**에서 이 기업을 평가하세요.
+"""
+
+QUALITY_SYSTEM_TEMPLATE = SYSTEM_PROMPT + """
+## Quality 투자 철학
+
+{quality_philosophy}
+
+---
+
+기업 정보가 주어지면 위 투자 철학에 따라 **Quality 관점**에서 평가하세요.
 
 다음 형식으로 작성:
 
@@ -116,3 +131,20 @@ QUALITY_PROMPT_TEMPLATE = """
 **강점**: (3-5개)
 **약점**: (3-5개)
 """
+
+QUALITY_PROMPT_TEMPLATE = """
+## 기업 정보
+
+기업명: {company_name}
+종목코드: {stock_code}
+
+### 재무 분석
+{financial_analysis}
+
+### 뉴스 및 전망
+{news_sentiment}
+
+---
+
+위 투자 철학에 따라 **Quality 관점**에서 이 기업을 평가하세요.
+"""
@@ -1,32 +1,27 @@
+import asyncio
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import AsyncIterator
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_user
+from app.config import settings
 from app.db.models import AnalysisRun, Company
-from app.db.session import get_db
+from app.db.session import async_session_factory, get_db
+from app.llm.governor import get_llm_governor
+from app.llm.response_cache import get_llm_response_cache
 from app.schemas import AnalysisBatchCreate, AnalysisRunCreate, AnalysisRunResponse
-from app.services.analysis_service import run_analysis_pipeline
+from app.services.analysis_queue import get_analysis_queue
+from app.services.report_stream import get_report_stream
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
-# 스레드풀 (LangGraph는 동기 실행이므로)
-executor = ThreadPoolExecutor(max_workers=2)
-
-
-def _run_pipeline_in_thread(run_id: int, company_id: int, stock_code: str, company_name: str):
-    """스레드에서 파이프라인을 실행합니다."""
-    try:
-        result = run_analysis_pipeline(run_id, company_id, stock_code, company_name)
-        logger.info(f"파이프라인 완료: {result}")
-    except Exception as e:
-        logger.error(f"파이프라인 실행 오류: {e}")
-
 
 @router.post("/run", response_model=AnalysisRunResponse, status_code=201)
 async def trigger_analysis(
@@ -52,10 +47,11 @@ async def trigger_analysis(
     db.add(run)
     await db.flush()
     await db.refresh(run)
+    # 파이프라인이 별도 세션에서 run을 읽으므로 먼저 커밋
+    await db.commit()
 
-    # 백그라운드에서 파이프라인 실행 (스레드풀 사용)
-    executor.submit(
-        _run_pipeline_in_thread,
+    # 백그라운드에서 파이프라인 실행 (실행 큐가 동시 실행 수 제한)
+    get_analysis_queue().submit(
         run.id,
         company.id,
         company.stock_code,
@@ -117,10 +113,13 @@ async def trigger_batch_analysis(
         await db.refresh(run)
         runs.append((run, company))
 
-    # 각 분석을 백그라운드에서 실행
+    # 파이프라인이 별도 세션에서 run을 읽으므로 먼저 커밋
+    await db.commit()
+
+    # 각 분석을 백그라운드에서 실행 (실행 큐가 동시 실행 수 제한)
+    queue = get_analysis_queue()
     for run, company in runs:
-        executor.submit(
-            _run_pipeline_in_thread,
+        queue.submit(
             run.id,
             company.id,
             company.stock_code,
@@ -130,6 +129,22 @@ async def trigger_batch_analysis(
     return [AnalysisRunResponse.model_validate(r) for r, _ in runs]
 
 
+@router.get("/queue")
+async def get_analysis_queue_stats():
+    """
+    분석 실행 큐 상태
+
+    동시 실행 한도, 실행 중·대기 중 수, LLM 응답 캐시 적중률, 모델별 속도 제한
+    """
+    response_cache = get_llm_response_cache()
+    governor = get_llm_governor()
+    return {
+        **get_analysis_queue().stats(),
+        "llm_response_cache": response_cache.stats() if response_cache else None,
+        "llm_rate_limits": governor.stats() if governor else None,
+    }
+
+
 @router.get("/status/{run_id}")
 async def get_analysis_status(
     run_id: int,
@@ -176,5 +191,74 @@ async def get_analysis_status(
         "started_at": run.started_at.isoformat() if run.started_at else None,
         "completed_at": run.completed_at.isoformat() if run.completed_at else None,
         "error_message": run.error_message,
+        "stage_timings": (run.metadata_json or {}).get("stage_timings"),
         "report": report_info,
     }
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _report_stream_events(run_id: int) -> AsyncIterator[str]:
+    """
+    보고서 생성 SSE 이벤트
+
+    이 프로세스에서 생성 중이면 스트림을 그대로 전달하고, 아니면(보고서 단계 전, 다른 프로세스,
+    동기 파이프라인) DB의 부분 본문(체크포인트)이 바뀔 때마다 snapshot으로 전달합니다.
+    """
+    from app.db.models import AnalysisReport
+
+    last_content = None
+    while True:
+        stream = get_report_stream(run_id)
+        if stream is not None:
+            async for event, data in stream.events():
+                yield _sse(event, data)
+            return
+
+        async with async_session_factory() as session:
+            run = await session.get(AnalysisRun, run_id)
+            report = (await session.execute(
+                select(AnalysisReport).where(AnalysisReport.analysis_run_id == run_id)
+            )).scalar_one_or_none()
+
+        if report and report.company_overview and report.company_overview != last_content:
+            last_content = report.company_overview
+            yield _sse(
+                "snapshot",
+                {"content": last_content, "report_id": report.id, "slug": report.slug},
+            )
+
+        if report and report.is_published:
+            yield _sse("done", {"report_id": report.id, "slug": report.slug})
+            return
+        if run is None or run.status in ("completed", "failed"):
+            message = run.error_message if run else None
+            yield _sse("error", {"message": message or "보고서가 생성되지 않았습니다."})
+            return
+
+        # 연결 유지 (SSE 주석)
+        yield ": keep-alive\n\n"
+        await asyncio.sleep(settings.report_checkpoint_seconds)
+
+
+@router.get("/runs/{run_id}/report/stream")
+async def stream_analysis_report(
+    run_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    보고서 생성 과정을 SSE로 전달합니다.
+
+    이벤트: snapshot(지금까지의 본문) → delta(새로 생성된 조각) … → done(report_id, slug) 또는 error
+    """
+    run = await db.get(AnalysisRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="분석 실행을 찾을 수 없습니다.")
+
+    return StreamingResponse(
+        _report_stream_events(run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,18 +1,18 @@
 """
 종목 검색 API
 
-pykrx를 활용하여 전체 상장 종목 리스트를 제공하고 검색 기능을 제공합니다.
+전체 상장 종목 리스트를 제공하고 검색 기능을 제공합니다.
+종목 목록은 심볼 디렉터리(app.data_sources.symbol_directory)가 KRX에서 일괄 조회하여 보관합니다.
 """
+import asyncio
 import logging
-from datetime import datetime, timedelta
 from typing import List
 
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
-from pykrx import stock
 
-# stock_client 임포트는 pykrx Post.read 세션 패치를 적용합니다 (KRX WAF 우회).
-import app.data_sources.stock_client  # noqa: F401, E402
+from app.data_sources.symbol_directory import get_symbol_directory
+from app.services.stock_search import StockSearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -26,93 +26,43 @@ class StockInfo(BaseModel):
     market: str
 
 
-# 전체 종목 리스트 캐시
-_stock_cache: List[StockInfo] = []
-_cache_updated_at: datetime | None = None
-_CACHE_TTL = timedelta(hours=24)  # 24시간 캐시
+# 디렉터리 목록 → StockInfo 변환 결과와 검색 색인 (디렉터리 색인이 바뀔 때만 다시 생성)
+_search_state: tuple[list, List[StockInfo], StockSearchIndex] = ([], [], StockSearchIndex([]))
 
 
-def _load_stocks_from_dart() -> List[StockInfo]:
-    """DART corp_codes에서 상장종목만 로드 (pykrx 실패 시 백업)."""
-    try:
-        from app.data_sources.dart_client import DARTClient
-
-        dart = DARTClient()
-        corp_list = dart.client.corp_codes
-        # stock_code가 비어있지 않은 행만 (상장사)
-        listed = corp_list[corp_list["stock_code"].str.strip() != ""].copy()
-        listed = listed.drop_duplicates(subset=["stock_code"], keep="last")
-        return [
-            StockInfo(stock_code=row["stock_code"], company_name=row["corp_name"], market="")
-            for _, row in listed.iterrows()
+def _get_search_state(entries: list[dict]) -> tuple[List[StockInfo], StockSearchIndex]:
+    global _search_state
+    state = _search_state
+    if state[0] is not entries:
+        stock_infos = [
+            StockInfo(
+                stock_code=entry["stock_code"],
+                company_name=entry["company_name"] or "",
+                market=entry["market"] or ""
+            )
+            for entry in entries
         ]
-    except Exception as e:
-        logger.error(f"DART 백업 로드 실패: {e}", exc_info=True)
-        return []
+        state = (entries, stock_infos, StockSearchIndex(entries))
+        _search_state = state
+    return state[1], state[2]
 
 
-def _load_all_stocks() -> List[StockInfo]:
+async def _load_all_stocks() -> tuple[List[StockInfo], StockSearchIndex]:
     """
-    pykrx에서 전체 상장 종목 리스트를 로드합니다.
+    전체 상장 종목 리스트와 검색 색인 (심볼 디렉터리)
+
+    목록은 심볼 디렉터리가 시작 시 저장 파일에서 읽고 백그라운드에서 갱신하므로
+    요청 처리 중 KRX를 조회하지 않습니다. 저장 파일 없이 처음 시작한 경우에만
+    첫 로드가 끝날 때까지 워커 스레드에서 기다립니다 (이벤트 루프는 막지 않음).
     """
-    global _stock_cache, _cache_updated_at
-
-    # 캐시가 유효하면 재사용
-    if _stock_cache and _cache_updated_at:
-        if datetime.now() - _cache_updated_at < _CACHE_TTL:
-            logger.info(f"종목 리스트 캐시 사용 (총 {len(_stock_cache)}개)")
-            return _stock_cache
-
-    logger.info("pykrx에서 전체 종목 리스트 로드 중...")
-    stocks = []
-
-    try:
-        # KOSPI 종목
-        kospi_tickers = stock.get_market_ticker_list(market="KOSPI")
-        for ticker in kospi_tickers:
-            try:
-                name = stock.get_market_ticker_name(ticker)
-                stocks.append(StockInfo(
-                    stock_code=ticker,
-                    company_name=name,
-                    market="KOSPI"
-                ))
-            except Exception as e:
-                logger.warning(f"KOSPI 종목 {ticker} 정보 로드 실패: {e}")
-                continue
-
-        # KOSDAQ 종목
-        kosdaq_tickers = stock.get_market_ticker_list(market="KOSDAQ")
-        for ticker in kosdaq_tickers:
-            try:
-                name = stock.get_market_ticker_name(ticker)
-                stocks.append(StockInfo(
-                    stock_code=ticker,
-                    company_name=name,
-                    market="KOSDAQ"
-                ))
-            except Exception as e:
-                logger.warning(f"KOSDAQ 종목 {ticker} 정보 로드 실패: {e}")
-                continue
-
-        _stock_cache = stocks
-        _cache_updated_at = datetime.now()
-        logger.info(f"종목 리스트 로드 완료: KOSPI={len(kospi_tickers)}, KOSDAQ={len(kosdaq_tickers)}, 총={len(stocks)}개")
-
-    except Exception as e:
-        logger.error(f"pykrx 종목 리스트 로드 실패: {e}", exc_info=True)
-        if _stock_cache:
-            logger.info("기존 캐시 사용")
-            return _stock_cache
-        logger.warning("pykrx 실패 — DART corp_codes로 백업 로드 시도")
-        stocks = _load_stocks_from_dart()
-        if stocks:
-            _stock_cache = stocks
-            _cache_updated_at = datetime.now()
-            logger.info(f"DART 백업 로드 완료: {len(stocks)}개")
-        return stocks
-
-    return stocks
+    directory = get_symbol_directory()
+    await asyncio.to_thread(directory.ensure_loaded)
+
+    entries = directory.listed()
+    if _search_state[0] is not entries:
+        # 목록이 바뀐 직후 한 번: 색인 생성(수십 ms)도 워커 스레드에서
+        return await asyncio.to_thread(_get_search_state, entries)
+    return _get_search_state(entries)
 
 
 @router.get("/search", response_model=List[StockInfo])
@@ -122,54 +72,23 @@ async def search_stocks(
     """
     종목명 또는 종목코드로 종목을 검색합니다.
 
+    순위: 종목코드 일치 → 종목명 시작 일치 → 종목명 부분 일치 → 종목코드 부분 일치
+    (검색어가 모두 한글 초성이면 종목명 대신 초성으로 비교)
+
     Args:
-        q: 검색어 (예: "삼성", "005930")
+        q: 검색어 (예: "삼성", "005930", "ㅅㅅㅈㅈ")
 
     Returns:
         최대 10개의 매칭되는 종목 리스트
     """
     # 전체 종목 로드
-    all_stocks = _load_all_stocks()
+    all_stocks, index = await _load_all_stocks()
 
-    # 검색어 정규화 (공백 제거, 소문자화)
     query = q.strip()
-
-    results = []
-
-    # 1차: 완전 일치 (종목코드)
-    for stock_info in all_stocks:
-        if stock_info.stock_code == query:
-            results.append(stock_info)
-
-    # 2차: 종목명 시작 일치
-    if len(results) < 10:
-        for stock_info in all_stocks:
-            if stock_info not in results:
-                if stock_info.company_name.startswith(query):
-                    results.append(stock_info)
-                    if len(results) >= 10:
-                        break
-
-    # 3차: 종목명 부분 일치
-    if len(results) < 10:
-        for stock_info in all_stocks:
-            if stock_info not in results:
-                if query in stock_info.company_name:
-                    results.append(stock_info)
-                    if len(results) >= 10:
-                        break
-
-    # 4차: 종목코드 부분 일치
-    if len(results) < 10:
-        for stock_info in all_stocks:
-            if stock_info not in results:
-                if query in stock_info.stock_code:
-                    results.append(stock_info)
-                    if len(results) >= 10:
-                        break
+    results = [all_stocks[position] for position in index.search(query, limit=10)]
 
     logger.info(f"검색어 '{query}': {len(results)}개 결과")
-    return results[:10]
+    return results
 
 
 @router.post("/cache/refresh")
@@ -177,14 +96,14 @@ async def refresh_cache():
     """
     종목 리스트 캐시를 강제로 새로고침합니다.
     """
-    global _stock_cache, _cache_updated_at
-    _stock_cache = []
-    _cache_updated_at = None
+    directory = get_symbol_directory()
+    await asyncio.to_thread(directory.refresh)
 
-    stocks = _load_all_stocks()
+    stocks, _ = await _load_all_stocks()
+    loaded_at = directory.loaded_at("krx")
 
     return {
         "message": "캐시 갱신 완료",
         "total_stocks": len(stocks),
-        "updated_at": _cache_updated_at.isoformat() if _cache_updated_at else None
+        "updated_at": loaded_at.isoformat() if loaded_at else None
     }
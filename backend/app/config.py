@@ -14,6 +14,31 @@ class Settings(BaseSettings):
 
     # DART OpenAPI
     dart_api_key: str = ""
+    dart_requests_per_second: float = 5.0  # API 키당 초당 호출 수
+    dart_fetch_concurrency: int = 4  # 재무제표 동시 조회 워커 수
+    dart_daily_quota: int = 20000  # OpenDART 일일 호출 한도
+    dart_quota_persist_enabled: bool = True  # 일일 사용량을 DB에 기록 (재시작·프로세스 간 공유)
+    dart_cache_enabled: bool = True  # finstate_all 응답 로컬 캐시 사용 여부
+    dart_cache_dir: str = ".cache/dart/finstate"
+    dart_cache_max_mb: int = 1024  # 캐시 최대 용량 (MB)
+    dart_cache_negative_ttl_hours: int = 24  # 빈 응답(미공시) 재조회 주기
+    dart_document_archive_enabled: bool = True  # 공시 원문(XML) 로컬 보관 여부
+    dart_document_dir: str = ".cache/dart/documents"
+    dart_corp_code_path: str = ".cache/dart/corp_codes.parquet"  # 기업코드 목록 (하루 한 번 갱신)
+
+    # KRX (pykrx)
+    krx_pool_size: int = 8  # keep-alive 연결 수 = 최대 동시 요청 수
+    krx_timeout_seconds: float = 10.0
+    stock_price_read_through: bool = False  # 과거 주가를 stock_prices 테이블에서 우선 조회
+    stock_price_history_days: int = 730  # 주가 최초 적재 기간 (일)
+    trading_calendar_path: str = ".cache/krx/trading_calendar.json"  # 거래일 캘린더 저장 파일
+    symbol_directory_refresh_minutes: int = 360  # 종목 심볼 디렉터리 백그라운드 갱신 주기
+    symbol_directory_path: str = ".cache/krx/symbols.json"  # 심볼 디렉터리 저장 파일
+    symbol_listing_ttl_hours: int = 24  # KRX·DART 종목 목록 재조회 주기
+
+    # 전체 종목 일괄 갱신
+    batch_refresh_workers: int = 4  # 동시에 처리할 회사 수
+    reparse_workers: int = 4  # 보관 문서 재파싱 프로세스 수
 
     # Naver Developers
     naver_client_id: str = ""
@@ -21,6 +46,13 @@ class Settings(BaseSettings):
 
     # 금융위원회 공공데이터 API (재무정보 PER/PBR 계산용)
     public_data_service_key: str = ""
+    public_data_cache_enabled: bool = True  # 조회 결과를 market_cap_points 테이블에 보관
+    public_data_cache_success_ttl_days: int = 365  # 조회 성공 결과 보관 기간
+    public_data_cache_failure_ttl_hours: int = 24  # "데이터 없음" 결과 재조회 주기
+    public_data_concurrency: int = 8  # 비동기 조회 동시 요청 수 (keep-alive 연결 수)
+    public_data_timeout_seconds: float = 10.0
+    public_data_max_retries: int = 3  # 연결 오류·429·5xx 재시도 횟수
+    public_data_retry_backoff_seconds: float = 0.5  # 첫 재시도 대기 (회차마다 2배)
 
     # YouTube Data API
     youtube_api_key: str = ""
@@ -29,6 +61,28 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     anthropic_api_key: str = ""
     default_llm_model: str = "gpt-4o"
+    # 프롬프트 캐싱 (Anthropic은 system 메시지에 cache_control 추가, OpenAI는 자동 prefix 캐시)
+    llm_prompt_cache_enabled: bool = True
+    # 응답 캐시: 같은 요청(model, messages, temperature, max_tokens)은 저장된 응답 재사용
+    # (기본 비활성화)
+    llm_response_cache_enabled: bool = False
+    llm_response_cache_path: str = ".cache/llm/responses.sqlite3"
+    llm_response_cache_ttl_hours: int = 168  # 응답 유효 기간 (기본 7일)
+    llm_response_cache_max_mb: int = 256  # 캐시 최대 용량 (MB)
+    # 속도 제한 (모델별 분당 요청·토큰 버킷, 429 응답 시 재시도)
+    llm_governor_enabled: bool = True
+    llm_default_rpm: int = 500
+    llm_default_tpm: int = 200_000
+    # 모델별 한도 {"gpt-4o": {"rpm": 500, "tpm": 30000}}
+    llm_rate_limits: dict[str, dict[str, int]] = {}
+    llm_rate_limit_max_retries: int = 5
+    llm_rate_limit_backoff_seconds: float = 2.0  # Retry-After가 없을 때 첫 대기 (회차마다 2배)
+    llm_rate_limit_max_backoff_seconds: float = 60.0
+
+    # 분석 파이프라인 실행 큐 (동시에 실행할 최대 분석 수, 나머지는 pending으로 대기)
+    analysis_max_concurrency: int = 16
+    # 보고서 스트리밍 생성 중 부분 본문을 DB에 저장하는 간격 (초)
+    report_checkpoint_seconds: float = 3.0
 
     # Frontend
     frontend_url: str = "http://localhost:3000"
@@ -2,9 +2,10 @@
 
 from .dart_client import DARTClient
 from .naver_client import NaverClient
-from .stock_client import StockClient
+from .stock_client import AsyncStockClient, StockClient
 
 __all__ = [
+    "AsyncStockClient",
     "DARTClient",
     "NaverClient",
     "StockClient",
@@ -0,0 +1,99 @@
+"""
+API 일일 사용량 저장소
+
+DailyQuota의 사용량을 api_daily_usage 테이블에 (한도 키, 날짜) 단위로 누적합니다.
+프로세스가 재시작되거나 여러 프로세스가 같은 API 키를 써도 오늘 사용량을 함께 셉니다.
+
+- 한도 키의 API 키 부분은 해시로 바꿔 저장합니다 (예: "dart:<api_key>" → "dart:<sha256 앞 32자>").
+- 증가는 UPSERT(used = used + n) 한 문장으로 처리하므로 프로세스 간 경합에도 누락이 없습니다.
+"""
+import hashlib
+import logging
+import threading
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.db.models import ApiDailyUsage
+from app.db.session import get_sync_session
+
+logger = logging.getLogger(__name__)
+
+
+def storage_key(key: str) -> str:
+    """한도 키 → 저장용 키 (API 키는 해시로 대체)"""
+    prefix, _, secret = key.partition(":")
+    if not secret:
+        return key
+    return f"{prefix}:{hashlib.sha256(secret.encode('utf-8')).hexdigest()[:32]}"
+
+
+class ApiUsageStore:
+    """api_daily_usage 테이블 접근 (동기 세션)"""
+
+    def get(self, key: str, day: date) -> int:
+        """
+        저장된 사용량 조회
+
+        Args:
+            key: 한도 키 (예: "dart:<api_key>")
+            day: 한도 기준일
+
+        Returns:
+            사용량 (기록이 없으면 0)
+        """
+        with get_sync_session() as session:
+            used = session.execute(
+                select(ApiDailyUsage.used).where(
+                    ApiDailyUsage.quota_key == storage_key(key),
+                    ApiDailyUsage.usage_date == day,
+                )
+            ).scalar_one_or_none()
+        return used or 0
+
+    def add(self, key: str, day: date, count: int) -> int:
+        """
+        사용량 누적
+
+        Args:
+            key: 한도 키
+            day: 한도 기준일
+            count: 추가할 호출 수
+
+        Returns:
+            누적 후 사용량 (다른 프로세스 사용량 포함)
+        """
+        stmt = pg_insert(ApiDailyUsage).values(
+            quota_key=storage_key(key), usage_date=day, used=count
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["quota_key", "usage_date"],
+            set_={"used": ApiDailyUsage.used + stmt.excluded.used},
+        ).returning(ApiDailyUsage.used)
+
+        with get_sync_session() as session:
+            return session.execute(stmt).scalar_one()
+
+
+# 전역 저장소 인스턴스 (싱글톤)
+_usage_store: ApiUsageStore | None = None
+_usage_store_lock = threading.Lock()
+
+
+def get_api_usage_store() -> ApiUsageStore | None:
+    """
+    API 일일 사용량 저장소 싱글톤 가져오기
+
+    Returns:
+        ApiUsageStore 인스턴스 또는 기록 비활성화 시 None
+    """
+    global _usage_store
+    if not settings.dart_quota_persist_enabled:
+        return None
+
+    with _usage_store_lock:
+        if _usage_store is None:
+            _usage_store = ApiUsageStore()
+        return _usage_store
@@ -0,0 +1,248 @@
+"""
+DART 재무제표 원본 로컬 캐시
+
+finstate_all 응답 DataFrame을 (corp_code, year, reprt_code, fs_div) 키로
+디스크에 zstd 압축 Parquet 파일로 저장합니다.
+
+- 확정 공시된 재무제표는 바뀌지 않으므로 정상 응답은 만료 없이 보관합니다.
+- 빈 응답(아직 공시 전이거나 해당 재무제표 없음)은 음성 캐시로 저장하고,
+  TTL이 지나면 다시 조회하도록 합니다.
+- 전체 용량이 상한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 용량 초과 시 이 비율까지 줄임 (매 저장마다 정리하지 않도록 여유를 둠)
+_EVICT_TARGET_RATIO = 0.9
+
+_DATA_SUFFIX = ".parquet"
+_EMPTY_SUFFIX = ".empty"
+
+
+class FinstateCache:
+    """finstate_all 응답 디스크 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int, negative_ttl_seconds: float):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 캐시 최대 용량 (바이트)
+            negative_ttl_seconds: 빈 응답 캐시 유효 시간 (초)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._size_bytes = sum(path.stat().st_size for path in self._iter_files())
+
+    @staticmethod
+    def make_key(corp_code: str, year: int, reprt_code: str, fs_div: str) -> str:
+        """캐시 키 (요청 파라미터의 SHA-256 해시)"""
+        raw = f"{corp_code}:{year}:{reprt_code}:{fs_div}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _iter_files(self):
+        for suffix in (_DATA_SUFFIX, _EMPTY_SUFFIX):
+            yield from self.cache_dir.glob(f"*/*{suffix}")
+
+    def get(
+        self, corp_code: str, year: int, reprt_code: str, fs_div: str
+    ) -> tuple[bool, pd.DataFrame | None]:
+        """
+        캐시 조회
+
+        Args:
+            corp_code: DART 기업코드
+            year: 사업연도
+            reprt_code: 보고서 코드 (11011, 11012, 11013, 11014)
+            fs_div: CFS(연결) 또는 OFS(개별)
+
+        Returns:
+            (캐시 적중 여부, DataFrame)
+            - (True, DataFrame): 저장된 응답
+            - (True, None): 유효한 빈 응답 캐시
+            - (False, None): 캐시 없음 또는 만료 → API 조회 필요
+        """
+        key = self.make_key(corp_code, year, reprt_code, fs_div)
+        data_path = self._path(key, _DATA_SUFFIX)
+        empty_path = self._path(key, _EMPTY_SUFFIX)
+
+        try:
+            if data_path.exists():
+                df = pd.read_parquet(data_path)
+                os.utime(data_path)  # LRU 정리를 위해 사용 시각 갱신
+                with self._lock:
+                    self.hits += 1
+                return True, df
+
+            if empty_path.exists():
+                age = time.time() - empty_path.stat().st_mtime
+                if age < self.negative_ttl_seconds:
+                    with self._lock:
+                        self.negative_hits += 1
+                    return True, None
+                self._remove(empty_path)
+
+        except Exception as e:
+            # 손상된 파일은 지우고 새로 조회
+            logger.warning(f"재무제표 캐시 읽기 실패, 삭제 후 재조회: {data_path.name} - {e}")
+            self._remove(data_path)
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(
+        self,
+        corp_code: str,
+        year: int,
+        reprt_code: str,
+        fs_div: str,
+        df: pd.DataFrame | None
+    ) -> None:
+        """
+        응답 저장 (None/빈 DataFrame은 음성 캐시로 저장)
+
+        Args:
+            corp_code: DART 기업코드
+            year: 사업연도
+            reprt_code: 보고서 코드
+            fs_div: CFS(연결) 또는 OFS(개별)
+            df: finstate_all 응답
+        """
+        key = self.make_key(corp_code, year, reprt_code, fs_div)
+        is_empty = df is None or df.empty
+        path = self._path(key, _EMPTY_SUFFIX if is_empty else _DATA_SUFFIX)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if is_empty:
+                tmp_path.touch()
+            else:
+                df.to_parquet(tmp_path, compression="zstd", index=False)
+
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)  # 동시 쓰기 시에도 완전한 파일만 보이도록
+
+            with self._lock:
+                self._size_bytes += path.stat().st_size - old_size
+                over_limit = self._size_bytes > self.max_bytes
+
+            if over_limit:
+                self.evict()
+
+        except Exception as e:
+            logger.warning(
+                f"재무제표 캐시 저장 실패: {corp_code} {year} {reprt_code} {fs_div} - {e}"
+            )
+            self._remove(tmp_path)
+
+    def evict(self) -> int:
+        """
+        용량 상한 초과 시 오래 사용하지 않은 파일부터 삭제
+
+        Returns:
+            삭제한 파일 수
+        """
+        with self._lock:
+            entries = []
+            for path in self._iter_files():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * _EVICT_TARGET_RATIO
+            removed = 0
+
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+                removed += 1
+
+            self._size_bytes = total
+            self.evictions += removed
+
+        if removed:
+            logger.info(
+                f"재무제표 캐시 정리: {removed}개 파일 삭제 (현재 {total / 1024 / 1024:.1f}MB)"
+            )
+        return removed
+
+    def stats(self) -> dict:
+        """
+        캐시 통계
+
+        Returns:
+            {"hits", "negative_hits", "misses", "hit_rate", "evictions", "size_bytes"}
+        """
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            hit_rate = (self.hits + self.negative_hits) / lookups if lookups else 0.0
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_rate": round(hit_rate, 3),
+                "evictions": self.evictions,
+                "size_bytes": self._size_bytes,
+            }
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# 전역 캐시 인스턴스 (싱글톤)
+_finstate_cache: FinstateCache | None = None
+_finstate_cache_lock = threading.Lock()
+
+
+def get_finstate_cache() -> FinstateCache | None:
+    """
+    finstate_all 캐시 싱글톤 가져오기
+
+    Returns:
+        FinstateCache 인스턴스 또는 캐시 비활성화 시 None
+    """
+    global _finstate_cache
+    if not settings.dart_cache_enabled:
+        return None
+
+    with _finstate_cache_lock:
+        if _finstate_cache is None:
+            _finstate_cache = FinstateCache(
+                cache_dir=settings.dart_cache_dir,
+                max_bytes=settings.dart_cache_max_mb * 1024 * 1024,
+                negative_ttl_seconds=settings.dart_cache_negative_ttl_hours * 3600,
+            )
+            logger.info(f"재무제표 캐시 초기화: {settings.dart_cache_dir}")
+        return _finstate_cache
@@ -7,10 +7,13 @@ import logging
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
-import OpenDartReader
 
 from app.config import settings
+from app.data_sources.dart_cache import get_finstate_cache
+from app.data_sources.dart_corp_registry import get_dart_corp_registry
+from app.data_sources.symbol_directory import get_symbol_directory
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +152,438 @@ _ACCOUNT_MAP: dict[str, list[dict[str, Any]]] = {
     ],
 }
 
+# 표준계정코드가 없는 비표준 계정과목의 account_id
+_NON_STANDARD_ACCOUNT_ID = "-표준계정코드 미사용-"
+
+
+def _extract_amount(value: Any) -> int | None:
+    """
+    DART API 값을 정수로 변환 (원 단위 그대로)
+
+    DART API는 원(KRW) 단위로 값을 반환하며,
+    DB에도 원 단위 그대로 저장합니다.
+    프론트엔드에서 표시 시 억원 단위로 변환합니다.
+    """
+    try:
+        if isinstance(value, str):
+            value = value.replace(",", "")
+            return int(float(value)) if value else None
+        elif isinstance(value, (int, float)):
+            return int(value)
+        return None
+    except (ValueError, TypeError):
+        return None
+
+
+def _try_parse_strategy_rowwise(df: pd.DataFrame, strategy: dict[str, Any]) -> Any | None:
+    """
+    단일 파싱 전략을 행 단위로 시도 (참조 구현)
+
+    parse_statement_frame()의 결과 검증 및 디버깅에 사용합니다.
+
+    Args:
+        df: 재무제표 DataFrame
+        strategy: 파싱 전략 딕셔너리
+
+    Returns:
+        파싱된 값 또는 None
+    """
+    method = strategy["method"]
+    divs = strategy["divs"]
+
+    if method == "single_tag":
+        # 단일 account_id 조회
+        account_id = strategy["account_id"]
+        mask = (df["account_id"] == account_id) & (df["sj_div"].isin(divs))
+        rows = df[mask]
+        for _, row in rows.iterrows():
+            value = _extract_amount(row.get("thstrm_amount", 0))
+            if value is not None:
+                return value
+
+    elif method == "sum":
+        # 여러 account_id 합산 (금융업 매출액, CAPEX 세부 항목 등)
+        account_ids = strategy["account_ids"]
+        total = 0
+        found_any = False
+        for account_id in account_ids:
+            mask = (df["account_id"] == account_id) & (df["sj_div"].isin(divs))
+            rows = df[mask]
+            for _, row in rows.iterrows():
+                value = _extract_amount(row.get("thstrm_amount", 0))
+                if value is not None:
+                    total += value
+                    found_any = True
+                    break  # 첫 번째 유효 값만 사용
+
+        if found_any:
+            return total
+
+    elif method == "account_nm_match":
+        # account_nm 키워드 매칭 (비표준 계정과목)
+        keywords = strategy["keywords"]
+        mask = (df["account_id"] == _NON_STANDARD_ACCOUNT_ID) & (df["sj_div"].isin(divs))
+
+        # CAPEX는 절대값 처리
+        is_capex = any("유형자산" in kw for kw in keywords)
+
+        # net_income은 최하위 계층 사용
+        is_net_income = any("순이익" in kw for kw in keywords)
+
+        if is_net_income:
+            # 최하위 계층의 순이익 (마지막 행)
+            candidate_rows = []
+            for _, row in df[mask].iterrows():
+                nm = str(row.get("account_nm", "")).strip()
+                for keyword in keywords:
+                    if keyword in nm:
+                        val = _extract_amount(row.get("thstrm_amount", 0))
+                        if val is not None:
+                            candidate_rows.append(val)
+                            break
+
+            if candidate_rows:
+                return candidate_rows[-1]  # 마지막 행 (최하위)
+
+        else:
+            # 일반 매칭 (첫 번째 유효 값)
+            for _, row in df[mask].iterrows():
+                nm = str(row.get("account_nm", "")).strip()
+                for keyword in keywords:
+                    if keyword in nm:
+                        val = _extract_amount(row.get("thstrm_amount", 0))
+                        if val is not None:
+                            return abs(val) if is_capex else val
+
+    return None
+
+
+def parse_statement_frame_rowwise(df: pd.DataFrame) -> dict[str, Any]:
+    """
+    행 단위 참조 파서 (전략마다 전체 DataFrame을 다시 필터링)
+
+    parse_statement_frame()과 결과가 같아야 하며, 테스트·벤치마크 비교용으로 유지합니다.
+    """
+    if df is None or df.empty:
+        return {}
+
+    result = {}
+    for field, strategies in _ACCOUNT_MAP.items():
+        for strategy in sorted(strategies, key=lambda x: x["priority"]):
+            value = _try_parse_strategy_rowwise(df, strategy)
+            if value is not None:
+                result[field] = value
+                break
+    return result
+
+
+def _div_group(divs: set[str]) -> str:
+    return "|".join(sorted(divs))
+
+
+def _compile_account_map(account_map: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+    """
+    _ACCOUNT_MAP을 조회 테이블로 변환
+
+    sj_div 집합은 서로 겹치지 않으므로(BS / IS·CIS / CF) 각 sj_div를 그룹 하나로 매핑하고,
+    표준 계정은 (account_id, 그룹) 키 한 번 조회로 값을 찾도록 합니다.
+
+    Returns:
+        {
+            "div_groups": {sj_div: 그룹},
+            "div_list": 대상 sj_div 목록,
+            "account_id_list": 조회 대상 account_id 목록,
+            "fields": [(필드명, 우선순위순 전략 목록), ...]
+        }
+    """
+    div_groups: dict[str, str] = {}
+    account_ids: set[str] = set()
+    fields = []
+
+    for field, strategies in account_map.items():
+        compiled = []
+        for strategy in sorted(strategies, key=lambda x: x["priority"]):
+            group = _div_group(strategy["divs"])
+            for div in strategy["divs"]:
+                if div_groups.setdefault(div, group) != group:
+                    raise ValueError(f"sj_div 그룹이 겹칩니다: {div} ({div_groups[div]}, {group})")
+
+            entry = {**strategy, "group": group}
+            if strategy["method"] == "single_tag":
+                account_ids.add(strategy["account_id"])
+            elif strategy["method"] == "sum":
+                account_ids.update(strategy["account_ids"])
+            elif strategy["method"] == "account_nm_match":
+                keywords = strategy["keywords"]
+                entry["take_last"] = any("순이익" in kw for kw in keywords)  # 최하위 계층
+                entry["absolute"] = any("유형자산" in kw for kw in keywords)  # CAPEX 절대값
+            compiled.append(entry)
+
+        fields.append((field, compiled))
+
+    return {
+        "div_groups": div_groups,
+        "div_list": sorted(div_groups),
+        "account_id_list": sorted(account_ids),
+        "fields": fields,
+    }
+
+
+_COMPILED_ACCOUNT_MAP = _compile_account_map(_ACCOUNT_MAP)
+
+
+def _to_amounts(values: pd.Series) -> pd.Series:
+    """thstrm_amount 열을 한 번에 숫자로 변환 (변환 불가 값은 NaN, 소수점 이하 버림)"""
+    if pd.api.types.is_numeric_dtype(values):
+        numeric = values.astype("float64")
+    else:
+        numeric = pd.to_numeric(
+            values.astype(str).str.replace(",", "", regex=False), errors="coerce"
+        )
+    return np.trunc(numeric.where(np.isfinite(numeric)))
+
+
+def parse_statement_frame(df: pd.DataFrame) -> dict[str, Any]:
+    """
+    재무제표 DataFrame을 _ACCOUNT_MAP 필드 딕셔너리로 변환 (벡터화 파서)
+
+    전체 행에 대해 한 번만 마스킹해 관심 계정 행만 남기고, 금액을 일괄 변환한 뒤
+    (account_id, sj_div 그룹)별 첫 유효 값 색인과 미리 만든 조회 테이블로
+    모든 필드를 해석합니다.
+
+    Args:
+        df: finstate_all() 응답 DataFrame
+
+    Returns:
+        파싱된 재무 데이터 딕셔너리
+    """
+    if df is None or df.empty:
+        return {}
+
+    plan = _COMPILED_ACCOUNT_MAP
+
+    # 전체 행 대상 연산은 numpy 배열 마스킹 한 번뿐이고, 이후는 관심 계정 행만 다룸
+    account_ids = df["account_id"].to_numpy(dtype=object)
+    sj_divs = df["sj_div"].to_numpy(dtype=object)
+    is_nonstd = account_ids == _NON_STANDARD_ACCOUNT_ID
+    relevant = (
+        (np.isin(account_ids, plan["account_id_list"]) | is_nonstd)
+        & np.isin(sj_divs, plan["div_list"])
+    )
+    positions = np.flatnonzero(relevant)
+    if positions.size == 0:
+        return {}
+
+    if "thstrm_amount" in df.columns:
+        amounts = _to_amounts(pd.Series(df["thstrm_amount"].to_numpy()[positions]))
+    else:
+        amounts = pd.Series(0.0, index=range(positions.size))
+    valid = amounts.notna().to_numpy()
+
+    names = df["account_nm"].to_numpy()[positions] if "account_nm" in df.columns else None
+    div_groups = plan["div_groups"]
+
+    # 표준 계정: (account_id, 그룹)별 첫 번째 유효 값
+    # 비표준 계정: account_nm 키워드 매칭용 (그룹, 계정명, 금액) 목록
+    lookup: dict[tuple[str, str], int] = {}
+    nonstd: list[tuple[str, str, int]] = []
+
+    for i, amount in enumerate(amounts.tolist()):
+        if not valid[i]:
+            continue
+        row = positions[i]
+        group = div_groups[sj_divs[row]]
+        if is_nonstd[row]:
+            name = "" if names is None else str(names[i]).strip()
+            nonstd.append((group, name, int(amount)))
+        else:
+            lookup.setdefault((account_ids[row], group), int(amount))
+
+    result = {}
+    for field, strategies in plan["fields"]:
+        for strategy in strategies:
+            value = _resolve_strategy(strategy, lookup, nonstd)
+            if value is not None:
+                result[field] = value
+                logger.debug(
+                    f"{field} 파싱 성공: {value:,} "
+                    f"(전략: {strategy['method']}, {strategy.get('description', '')})"
+                )
+                break  # 성공하면 다음 fallback 시도 안 함
+
+    return result
+
+
+def _resolve_strategy(
+    strategy: dict[str, Any],
+    lookup: dict[tuple[str, str], int],
+    nonstd: list[tuple[str, str, int]]
+) -> int | None:
+    """컴파일된 전략 하나를 조회 테이블에서 해석"""
+    method = strategy["method"]
+    group = strategy["group"]
+
+    if method == "single_tag":
+        return lookup.get((strategy["account_id"], group))
+
+    if method == "sum":
+        values = [
+            lookup[(account_id, group)]
+            for account_id in strategy["account_ids"]
+            if (account_id, group) in lookup
+        ]
+        return sum(values) if values else None
+
+    if method == "account_nm_match":
+        keywords = strategy["keywords"]
+        matched = [
+            amount for row_group, name, amount in nonstd
+            if row_group == group and any(keyword in name for keyword in keywords)
+        ]
+        if not matched:
+            return None
+        if strategy["take_last"]:
+            return matched[-1]
+        return abs(matched[0]) if strategy["absolute"] else matched[0]
+
+    return None
+
+
+def _as_group_index(index: pd.Index, keys: list[str]) -> pd.MultiIndex:
+    """groupby/pivot_table 결과 인덱스를 그룹 MultiIndex로 통일 (키가 하나면 평범한 Index로 나옴)"""
+    if isinstance(index, pd.MultiIndex):
+        return index
+    return pd.MultiIndex.from_arrays([index], names=keys)
+
+
+def parse_statement_frames(
+    df: pd.DataFrame,
+    keys: tuple[str, ...] = ("corp_code", "bsns_year", "reprt_code")
+) -> pd.DataFrame:
+    """
+    여러 재무제표를 이어 붙인 long 형식 DataFrame을 한 번에 파싱 (일괄 파서)
+
+    각 그룹(기본값: 회사·연도·보고서)별 결과는 parse_statement_frame()과 같으며,
+    (account_id, sj_div 그룹)별 첫 유효 값을 pivot으로 펼친 뒤 필드별 전략을 열 단위로 적용합니다.
+
+    Args:
+        df: finstate_all() 응답들을 pd.concat한 DataFrame
+        keys: 그룹 구분 열 (finstate_all 응답의 corp_code/bsns_year/reprt_code 또는
+            호출자가 추가한 열)
+
+    Returns:
+        그룹 키를 인덱스로, _ACCOUNT_MAP 필드를 열(Int64, 값 없으면 <NA>)로 갖는 DataFrame
+        (파싱할 계정이 없는 그룹도 모든 값이 <NA>인 행으로 포함)
+    """
+    keys = list(keys)
+    plan = _COMPILED_ACCOUNT_MAP
+    field_names = [field for field, _ in plan["fields"]]
+
+    if df is None or df.empty:
+        empty_index = pd.MultiIndex.from_tuples([], names=keys)
+        return pd.DataFrame(index=empty_index, columns=field_names, dtype="Int64")
+
+    all_groups = pd.MultiIndex.from_frame(df[keys].drop_duplicates())
+
+    # 관심 계정 행만 남기고 금액 일괄 변환
+    is_nonstd = df["account_id"] == _NON_STANDARD_ACCOUNT_ID
+    relevant = (
+        (df["account_id"].isin(plan["account_id_list"]) | is_nonstd)
+        & df["sj_div"].isin(plan["div_list"])
+    )
+    rows = df.loc[relevant, keys + ["account_id"]].copy()
+    rows["group"] = df.loc[relevant, "sj_div"].map(plan["div_groups"])
+    rows["nonstd"] = is_nonstd[relevant]
+    if "thstrm_amount" in df.columns:
+        rows["amount"] = _to_amounts(df.loc[relevant, "thstrm_amount"])
+    else:
+        rows["amount"] = 0.0
+    if "account_nm" in df.columns:
+        rows["account_nm"] = df.loc[relevant, "account_nm"].astype(str).str.strip()
+    else:
+        rows["account_nm"] = ""
+    rows = rows[rows["amount"].notna()]
+
+    # 표준 계정: 그룹별 (account_id, sj_div 그룹) 첫 유효 값을 열로 펼침
+    tagged = rows[~rows["nonstd"]].drop_duplicates(keys + ["account_id", "group"], keep="first")
+    tags = tagged.pivot_table(
+        index=keys, columns=["account_id", "group"], values="amount", aggfunc="first"
+    )
+    tags.index = _as_group_index(tags.index, keys)
+    tags = tags.reindex(all_groups)
+    nonstd = rows[rows["nonstd"]]
+
+    result = pd.DataFrame(index=all_groups)
+    for field, strategies in plan["fields"]:
+        values = pd.Series(np.nan, index=all_groups)
+        for strategy in strategies:
+            resolved = _resolve_strategy_columns(strategy, tags, nonstd, keys, all_groups)
+            # 값이 모두 없는 Series의 combine_first는 pandas FutureWarning → 건너뜀
+            if resolved.isna().all():
+                continue
+            # 앞선(우선순위 높은) 전략에서 값을 못 찾은 그룹만 채움
+            values = resolved if values.isna().all() else values.combine_first(resolved)
+        result[field] = values.astype("Int64")
+
+    return result
+
+
+def _resolve_strategy_columns(
+    strategy: dict[str, Any],
+    tags: pd.DataFrame,
+    nonstd: pd.DataFrame,
+    keys: list[str],
+    all_groups: pd.MultiIndex
+) -> pd.Series:
+    """컴파일된 전략 하나를 모든 그룹에 대해 열 단위로 해석"""
+    method = strategy["method"]
+    group = strategy["group"]
+    missing = pd.Series(np.nan, index=all_groups)
+
+    if method == "single_tag":
+        column = (strategy["account_id"], group)
+        return tags[column] if column in tags.columns else missing
+
+    if method == "sum":
+        columns = [
+            (account_id, group) for account_id in strategy["account_ids"]
+            if (account_id, group) in tags.columns
+        ]
+        return tags[columns].sum(axis=1, min_count=1) if columns else missing
+
+    if method == "account_nm_match":
+        keywords = strategy["keywords"]
+        matched = nonstd[
+            (nonstd["group"] == group)
+            & nonstd["account_nm"].map(lambda name: any(kw in name for kw in keywords))
+        ]
+        if matched.empty:
+            return missing
+
+        grouped = matched.groupby(keys, sort=False)["amount"]
+        if strategy["take_last"]:
+            values = grouped.last()
+        else:
+            values = grouped.first()
+            if strategy["absolute"]:
+                values = values.abs()
+        values.index = _as_group_index(values.index, keys)
+        return values.reindex(all_groups)
+
+    return missing
+
+
+def parsed_frames_to_dicts(parsed: pd.DataFrame) -> dict[tuple, dict[str, int]]:
+    """
+    parse_statement_frames() 결과를 그룹별 딕셔너리로 변환
+
+    Returns:
+        {그룹 키 튜플: {필드: 값}} (값이 없는 필드는 제외, parse_statement_frame() 결과와 같은 형식)
+    """
+    records = {}
+    for key, row in zip(parsed.index, parsed.to_dict(orient="records")):
+        records[key] = {field: int(value) for field, value in row.items() if not pd.isna(value)}
+    return records
 
 
 class DARTClient:
@@ -163,7 +598,15 @@ class DARTClient:
         if not self.api_key:
             raise ValueError("DART_API_KEY가 설정되지 않았습니다")
 
-        self.client = OpenDartReader(self.api_key)
+        # 프로세스 전역 기업코드 레지스트리를 공유 (생성 시 기업코드 목록을 다시 읽지 않음)
+        self.corp_registry = get_dart_corp_registry(self.api_key)
+        self.client = self.corp_registry.reader()
+
+        # 속도 제한·일일 한도는 reader의 API 호출마다 적용됨 (같은 API 키끼리 공유)
+        self.rate_limiter = self.client.rate_limiter
+        self.daily_quota = self.client.daily_quota
+        # finstate_all 응답 로컬 캐시 (비활성화 시 None)
+        self.cache = get_finstate_cache()
         logger.info("DART 클라이언트 초기화 완료")
 
     def get_financial_statements(
@@ -208,22 +651,12 @@ class DARTClient:
                 )
 
                 # 1차: 연결재무제표(CFS) 시도
-                df = self.client.finstate_all(
-                    corp=corp_code,
-                    bsns_year=year,
-                    reprt_code=report_code,
-                    fs_div="CFS"
-                )
+                df = self._finstate_all(corp_code, year, report_code, "CFS")
 
                 # 2차: 연결재무제표가 없으면 개별재무제표(OFS) 시도
                 if df is None or df.empty:
                     logger.info(f"연결재무제표 없음, 개별재무제표(OFS) 시도: {corp_code} {year}")
-                    df = self.client.finstate_all(
-                        corp=corp_code,
-                        bsns_year=year,
-                        reprt_code=report_code,
-                        fs_div="OFS"
-                    )
+                    df = self._finstate_all(corp_code, year, report_code, "OFS")
 
                 if df is None or df.empty:
                     logger.warning(f"재무제표 데이터가 없습니다: {corp_code} {year} {report_type}")
@@ -243,6 +676,33 @@ class DARTClient:
 
         return None
 
+    def _finstate_all(
+        self, corp_code: str, year: int, report_code: str, fs_div: str
+    ) -> pd.DataFrame | None:
+        """
+        finstate_all 호출 (로컬 캐시 우선)
+
+        캐시에 있으면 API를 호출하지 않고, 없으면 조회한 뒤 저장합니다.
+        (속도 제한과 일일 한도 기록은 reader가 호출마다 처리)
+        빈 응답도 음성 캐시로 저장되어 TTL 동안 재조회하지 않습니다.
+        """
+        if self.cache is not None:
+            found, df = self.cache.get(corp_code, year, report_code, fs_div)
+            if found:
+                logger.debug(f"재무제표 캐시 적중: {corp_code} {year} {report_code} {fs_div}")
+                return df
+
+        df = self.client.finstate_all(
+            corp=corp_code,
+            bsns_year=year,
+            reprt_code=report_code,
+            fs_div=fs_div
+        )
+
+        if self.cache is not None:
+            self.cache.put(corp_code, year, report_code, fs_div, df)
+        return df
+
     def get_company_info(self, corp_code: str) -> dict[str, Any] | None:
         """
         기업 개황 조회
@@ -340,27 +800,18 @@ class DARTClient:
         Returns:
             DART 기업코드 또는 실패 시 None
         """
-        try:
-            logger.info(f"기업코드 조회: stock_code={stock_code}")
-
-            # corp_codes 속성에서 종목코드로 검색
-            corp_list = self.client.corp_codes
-
-            if corp_list is None or corp_list.empty:
-                logger.error("기업코드 목록을 가져올 수 없습니다")
-                return None
-
-            # 종목코드로 필터링
-            result = corp_list[corp_list["stock_code"] == stock_code]
+        # 심볼 디렉터리(DB 등록 회사 포함)에 있으면 그대로 사용
+        corp_code = get_symbol_directory().get_corp_code(stock_code, load=False)
+        if corp_code:
+            return corp_code
 
-            if result.empty:
+        try:
+            corp_code = self.corp_registry.get_corp_code(stock_code)
+            if not corp_code:
                 logger.warning(f"종목코드에 해당하는 기업을 찾을 수 없습니다: {stock_code}")
                 return None
 
-            corp_code = result.iloc[0]["corp_code"]
-            corp_name = result.iloc[0]["corp_name"]
-            logger.info(f"기업코드 조회 성공: {corp_name} ({corp_code})")
-
+            logger.info(f"기업코드 조회 성공: {stock_code} → {corp_code}")
             return corp_code
 
         except Exception as e:
@@ -369,7 +820,7 @@ class DARTClient:
 
     def _try_parse_strategy(self, df: pd.DataFrame, strategy: dict[str, Any]) -> Any | None:
         """
-        단일 파싱 전략 시도
+        단일 파싱 전략 시도 (행 단위 참조 구현, 디버깅용)
 
         Args:
             df: 재무제표 DataFrame
@@ -378,74 +829,7 @@ class DARTClient:
         Returns:
             파싱된 값 또는 None
         """
-        method = strategy["method"]
-        divs = strategy["divs"]
-
-        if method == "single_tag":
-            # 단일 account_id 조회
-            account_id = strategy["account_id"]
-            mask = (df["account_id"] == account_id) & (df["sj_div"].isin(divs))
-            rows = df[mask]
-            for _, row in rows.iterrows():
-                value = self._extract_value(row.get("thstrm_amount", 0))
-                if value is not None:
-                    return value
-
-        elif method == "sum":
-            # 여러 account_id 합산 (금융업 매출액, CAPEX 세부 항목 등)
-            account_ids = strategy["account_ids"]
-            total = 0
-            found_any = False
-            for account_id in account_ids:
-                mask = (df["account_id"] == account_id) & (df["sj_div"].isin(divs))
-                rows = df[mask]
-                for _, row in rows.iterrows():
-                    value = self._extract_value(row.get("thstrm_amount", 0))
-                    if value is not None:
-                        total += value
-                        found_any = True
-                        break  # 첫 번째 유효 값만 사용
-
-            if found_any:
-                return total
-
-        elif method == "account_nm_match":
-            # account_nm 키워드 매칭 (비표준 계정과목)
-            keywords = strategy["keywords"]
-            mask = (df["account_id"] == "-표준계정코드 미사용-") & (df["sj_div"].isin(divs))
-
-            # CAPEX는 절대값 처리
-            is_capex = any("유형자산" in kw for kw in keywords)
-
-            # net_income은 최하위 계층 사용
-            is_net_income = any("순이익" in kw for kw in keywords)
-
-            if is_net_income:
-                # 최하위 계층의 순이익 (마지막 행)
-                candidate_rows = []
-                for _, row in df[mask].iterrows():
-                    nm = str(row.get("account_nm", "")).strip()
-                    for keyword in keywords:
-                        if keyword in nm:
-                            val = self._extract_value(row.get("thstrm_amount", 0))
-                            if val is not None:
-                                candidate_rows.append(val)
-                                break
-
-                if candidate_rows:
-                    return candidate_rows[-1]  # 마지막 행 (최하위)
-
-            else:
-                # 일반 매칭 (첫 번째 유효 값)
-                for _, row in df[mask].iterrows():
-                    nm = str(row.get("account_nm", "")).strip()
-                    for keyword in keywords:
-                        if keyword in nm:
-                            val = self._extract_value(row.get("thstrm_amount", 0))
-                            if val is not None:
-                                return abs(val) if is_capex else val
-
-        return None
+        return _try_parse_strategy_rowwise(df, strategy)
 
     def parse_financial_data(self, df: pd.DataFrame) -> dict[str, Any]:
         """
@@ -460,46 +844,15 @@ class DARTClient:
         Returns:
             파싱된 재무 데이터 딕셔너리
         """
-        if df is None or df.empty:
-            return {}
-
-        result = {}
-
         try:
-            # 각 필드에 대해 전략 리스트 시도
-            for field, strategies in _ACCOUNT_MAP.items():
-                for strategy in sorted(strategies, key=lambda x: x["priority"]):
-                    value = self._try_parse_strategy(df, strategy)
-                    if value is not None:
-                        result[field] = value
-                        desc = strategy.get("description", "")
-                        logger.debug(
-                            f"{field} 파싱 성공: {value:,} "
-                            f"(전략: {strategy['method']}, {desc})"
-                        )
-                        break  # 성공하면 다음 fallback 시도 안 함
-
+            result = parse_statement_frame(df)
             logger.debug(f"재무 데이터 파싱 완료: {len(result)} 항목")
+            return result
 
         except Exception as e:
             logger.error(f"재무 데이터 파싱 오류: {e}", exc_info=True)
-
-        return result
+            return {}
 
     def _extract_value(self, value: Any) -> int | None:
-        """
-        DART API 값을 정수로 변환 (원 단위 그대로)
-
-        DART API는 원(KRW) 단위로 값을 반환하며,
-        DB에도 원 단위 그대로 저장합니다.
-        프론트엔드에서 표시 시 억원 단위로 변환합니다.
-        """
-        try:
-            if isinstance(value, str):
-                value = value.replace(",", "")
-                return int(float(value)) if value else None
-            elif isinstance(value, (int, float)):
-                return int(value)
-            return None
-        except (ValueError, TypeError):
-            return None
+        """DART API 값을 정수로 변환 (원 단위 그대로)"""
+        return _extract_amount(value)
@@ -0,0 +1,283 @@
+"""
+DART 기업코드 레지스트리
+
+OpenDartReader는 생성할 때마다 기업코드 목록(corpCode.xml, 약 10만 행)을 읽고,
+find_corp_code는 호출마다 DataFrame 전체를 훑습니다. 도구 호출·회사 등록·웹 스크래퍼가
+매번 OpenDartReader를 새로 만들면 이 비용이 반복되므로, 기업코드 목록을 프로세스당
+한 번만 읽고 공유합니다.
+
+- 목록은 로컬 Parquet 파일에 저장하고 하루 한 번(파일 날짜 기준) 다시 받습니다.
+  다운로드에 실패하면 이전 파일을 계속 사용합니다.
+- 종목코드·회사명·기업코드 → 기업코드 조회는 dict(O(1))로 처리합니다.
+- reader()는 목록을 다시 읽지 않는 OpenDartReader 핸들을 반환합니다 (생성 비용 없음).
+- 모든 DART API 호출(공시 검색·원문·재무제표·기업 개황·기업코드 목록)은 API 키별
+  속도 제한을 거치고 일일 한도에 기록됩니다.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+import OpenDartReader
+import pandas as pd
+
+from app.config import settings
+from app.data_sources.api_usage_store import get_api_usage_store
+from app.data_sources.rate_limiter import DailyQuota, get_daily_quota, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# 다운로드 실패 후 재시도까지 대기 시간
+_RETRY_AFTER_SECONDS = 600
+
+
+def _fetch_corp_codes(api_key: str) -> pd.DataFrame:
+    """DART corpCode.xml 다운로드 (OpenDartReader와 같은 형식의 DataFrame)"""
+    from OpenDartReader import dart_list
+
+    return dart_list.corp_codes(api_key)
+
+
+def get_dart_daily_quota(api_key: str | None = None) -> DailyQuota:
+    """
+    DART API 키의 일일 한도 카운터 (사용량 저장소 연결, 프로세스 전역 공유)
+
+    Args:
+        api_key: DART API 키 (기본값: settings.dart_api_key)
+    """
+    return get_daily_quota(
+        f"dart:{api_key or settings.dart_api_key}",
+        limit=settings.dart_daily_quota,
+        store=get_api_usage_store(),
+    )
+
+
+class SharedDartReader(OpenDartReader):
+    """
+    레지스트리의 기업코드 목록을 공유하는 OpenDartReader
+
+    OpenDartReader.__init__(기업코드 목록 로드)을 건너뛰고,
+    corp_codes·find_corp_code를 레지스트리로 연결합니다.
+    API 메서드(list·document·finstate_all·company)는 속도 제한과 일일 한도 기록을 거칩니다.
+    """
+
+    def __init__(self, registry: "DARTCorpRegistry"):
+        self.registry = registry
+        self.api_key = registry.api_key
+        # 같은 API 키를 쓰는 모든 클라이언트/스레드가 호출 한도를 공유
+        self.rate_limiter = get_rate_limiter(
+            f"dart:{self.api_key}",
+            rate=settings.dart_requests_per_second,
+        )
+        self.daily_quota = get_dart_daily_quota(self.api_key)
+
+    def _before_call(self) -> None:
+        self.rate_limiter.acquire()
+        self.daily_quota.record()
+
+    def list(self, *args, **kwargs):
+        self._before_call()
+        return super().list(*args, **kwargs)
+
+    def document(self, *args, **kwargs):
+        self._before_call()
+        return super().document(*args, **kwargs)
+
+    def finstate_all(self, *args, **kwargs):
+        self._before_call()
+        return super().finstate_all(*args, **kwargs)
+
+    def company(self, *args, **kwargs):
+        self._before_call()
+        return super().company(*args, **kwargs)
+
+    @property
+    def corp_codes(self) -> pd.DataFrame:
+        return self.registry.corp_codes
+
+    def find_corp_code(self, corp):
+        return self.registry.find_corp_code(corp)
+
+
+class DARTCorpRegistry:
+    """DART 기업코드 목록 (스레드 안전, 최초 사용 시 로드)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        path: str | Path | None = None,
+        fetcher: Callable[[str], pd.DataFrame] = _fetch_corp_codes
+    ):
+        """
+        Args:
+            api_key: DART API 키
+            path: 기업코드 목록 저장 파일 (None이면 메모리에만 보관)
+            fetcher: api_key → 기업코드 목록 DataFrame (corp_code, corp_name, stock_code, ...)
+        """
+        self.api_key = api_key
+        self.path = Path(path) if path else None
+        self.fetcher = fetcher
+
+        self._df: pd.DataFrame | None = None
+        self._loaded_on: date | None = None
+        self._by_stock_code: dict[str, str] = {}
+        self._by_name: dict[str, str] = {}
+        self._corp_codes: frozenset[str] = frozenset()
+        self._failed_at: float | None = None
+        self._downloads = 0
+        self._lock = threading.Lock()
+        self._reader = SharedDartReader(self)
+
+    @property
+    def corp_codes(self) -> pd.DataFrame:
+        """기업코드 목록 DataFrame (하루가 지났으면 다시 받음)"""
+        self._ensure_fresh()
+        return self._df
+
+    def reader(self) -> SharedDartReader:
+        """목록을 공유하는 OpenDartReader 핸들 (생성 비용 없음, 스레드 간 공유 가능)"""
+        return self._reader
+
+    def find_corp_code(self, corp: str) -> str | None:
+        """
+        OpenDartReader.find_corp_code와 같은 규칙의 O(1) 조회
+
+        Args:
+            corp: 6자리 종목코드, 8자리 기업코드 또는 회사명
+
+        Returns:
+            기업코드 또는 None
+        """
+        self._ensure_fresh()
+        if not corp.isdigit():
+            return self._by_name.get(corp)
+        if len(corp) == 6:
+            return self._by_stock_code.get(corp)
+        return corp if corp in self._corp_codes else None
+
+    def get_corp_code(self, stock_code: str) -> str | None:
+        """종목코드 → 기업코드"""
+        self._ensure_fresh()
+        return self._by_stock_code.get(stock_code)
+
+    def stats(self) -> dict:
+        """{"rows", "loaded_on", "downloads"}"""
+        with self._lock:
+            return {
+                "rows": 0 if self._df is None else len(self._df),
+                "loaded_on": self._loaded_on.isoformat() if self._loaded_on else None,
+                "downloads": self._downloads,
+            }
+
+    def _ensure_fresh(self) -> None:
+        today = date.today()
+        if self._loaded_on == today:
+            return
+
+        with self._lock:
+            if self._loaded_on == today:
+                return
+
+            # 오늘 저장한 파일이 있으면 다운로드 없이 사용 (다른 프로세스가 받은 경우 포함)
+            if self._file_date() == today and self._read_file():
+                return
+
+            if self._can_fetch():
+                try:
+                    self._reader._before_call()
+                    df = self.fetcher(self.api_key)
+                    self._downloads += 1
+                    self._failed_at = None
+                    self._set_frame(df, today)
+                    self._write_file(df)
+                    logger.info(f"DART 기업코드 목록 갱신: {len(df)}개")
+                    return
+                except Exception as e:
+                    self._failed_at = time.monotonic()
+                    logger.warning(f"DART 기업코드 목록 다운로드 실패: {e}")
+
+            # 다운로드 실패: 메모리 또는 이전 파일 목록 계속 사용
+            if self._df is None and not self._read_file():
+                raise RuntimeError("DART 기업코드 목록을 가져올 수 없습니다")
+
+    def _can_fetch(self) -> bool:
+        """최근 다운로드가 실패했으면 잠시 재시도를 쉼 (락 보유 상태)"""
+        return (
+            self._failed_at is None
+            or time.monotonic() - self._failed_at >= _RETRY_AFTER_SECONDS
+        )
+
+    def _set_frame(self, df: pd.DataFrame, loaded_on: date) -> None:
+        """목록 교체 및 조회용 dict 재구성 (락 보유 상태, 같은 키는 첫 행 우선)"""
+        stock_codes = df["stock_code"].fillna("").str.strip()
+        by_stock_code: dict[str, str] = {}
+        by_name: dict[str, str] = {}
+        for corp_code, corp_name, stock_code in zip(df["corp_code"], df["corp_name"], stock_codes):
+            if stock_code:
+                by_stock_code.setdefault(stock_code, corp_code)
+            by_name.setdefault(corp_name, corp_code)
+
+        self._by_stock_code = by_stock_code
+        self._by_name = by_name
+        self._corp_codes = frozenset(df["corp_code"])
+        self._df = df
+        self._loaded_on = loaded_on
+
+    def _file_date(self) -> date | None:
+        if not self.path or not self.path.exists():
+            return None
+        return datetime.fromtimestamp(self.path.stat().st_mtime).date()
+
+    def _read_file(self) -> bool:
+        """저장 파일 읽기 (락 보유 상태, 오늘 파일이 아니어도 읽되 재확인 대상으로 둠)"""
+        if not self.path or not self.path.exists():
+            return False
+        try:
+            df = pd.read_parquet(self.path)
+        except Exception as e:
+            logger.warning(f"DART 기업코드 목록 파일 읽기 실패: {self.path} - {e}")
+            return False
+
+        file_date = self._file_date()
+        # 이전 날짜 파일은 다음 조회 때 다시 다운로드를 시도하도록 loaded_on을 그대로 기록
+        self._set_frame(df, file_date)
+        logger.info(f"DART 기업코드 목록 로드: {self.path} ({file_date}, {len(df)}개)")
+        return True
+
+    def _write_file(self, df: pd.DataFrame) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"DART 기업코드 목록 저장 실패: {e}")
+
+
+# API 키별 레지스트리 (싱글톤)
+_registries: dict[str, DARTCorpRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_dart_corp_registry(api_key: str | None = None) -> DARTCorpRegistry:
+    """
+    DART 기업코드 레지스트리 가져오기
+
+    Args:
+        api_key: DART API 키 (기본값: settings.dart_api_key)
+    """
+    api_key = api_key or settings.dart_api_key
+    if not api_key:
+        raise ValueError("DART_API_KEY가 설정되지 않았습니다")
+
+    with _registries_lock:
+        registry = _registries.get(api_key)
+        if registry is None:
+            registry = DARTCorpRegistry(api_key, settings.dart_corp_code_path)
+            _registries[api_key] = registry
+        return registry
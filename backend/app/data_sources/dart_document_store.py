@@ -0,0 +1,199 @@
+"""
+DART 공시 원문 로컬 보관소
+
+접수번호(rcpNo)의 문서는 한 번 공시되면 바뀌지 않으므로, dart.document()로 받은
+XML을 zstd 압축 파일로 디스크에 보관하고 dart_documents 테이블에 색인합니다.
+
+- 파일 경로는 접수번호만으로 결정되므로 DB 없이도 문서를 읽을 수 있습니다.
+- 색인 테이블로 재파싱 대상 목록을 조회합니다. 접수번호 자체는 항상 DART 공시 검색으로
+  정하고(정정 공시 반영), 보관소는 이미 받은 접수번호의 원문 재다운로드를 건너뛰는 데 씁니다.
+"""
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+
+import zstandard
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.db.models import DartDocument
+from app.db.session import get_sync_session
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".xml.zst"
+
+
+class DARTDocumentStore:
+    """접수번호 단위 DART 문서 보관소 (스레드 안전)"""
+
+    def __init__(self, root_dir: str | Path, compression_level: int = 10):
+        """
+        Args:
+            root_dir: 문서 보관 디렉토리
+            compression_level: zstd 압축 레벨 (1~22)
+        """
+        self.root_dir = Path(root_dir)
+        self.compression_level = compression_level
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()  # zstd 압축기는 스레드 간 공유 불가
+
+    def _compressor(self) -> zstandard.ZstdCompressor:
+        if not hasattr(self._local, "compressor"):
+            self._local.compressor = zstandard.ZstdCompressor(level=self.compression_level)
+            self._local.decompressor = zstandard.ZstdDecompressor()
+        return self._local.compressor
+
+    def _decompressor(self) -> zstandard.ZstdDecompressor:
+        self._compressor()
+        return self._local.decompressor
+
+    def path_for(self, rcept_no: str) -> Path:
+        """접수번호 → 문서 파일 경로 (접수번호 앞 4자리 = 접수 연도별 디렉토리)"""
+        return self.root_dir / rcept_no[:4] / f"{rcept_no}{_SUFFIX}"
+
+    def exists(self, rcept_no: str) -> bool:
+        return self.path_for(rcept_no).exists()
+
+    def load(self, rcept_no: str) -> str | None:
+        """
+        보관된 문서 읽기
+
+        Args:
+            rcept_no: 접수번호
+
+        Returns:
+            XML 문서 문자열 또는 보관되지 않았으면 None
+        """
+        path = self.path_for(rcept_no)
+        if not path.exists():
+            return None
+
+        try:
+            return self._decompressor().decompress(path.read_bytes()).decode("utf-8")
+        except Exception as e:
+            logger.warning(f"보관 문서 읽기 실패: {rcept_no} - {e}")
+            return None
+
+    def save(
+        self,
+        rcept_no: str,
+        xml_content: str,
+        corp_code: str,
+        fiscal_year: int,
+        report_type: str = "annual"
+    ) -> Path | None:
+        """
+        문서 저장 및 색인 등록
+
+        Args:
+            rcept_no: 접수번호
+            xml_content: dart.document() 응답 XML
+            corp_code: DART 기업코드
+            fiscal_year: 회계연도
+            report_type: 보고서 유형
+
+        Returns:
+            저장된 파일 경로 또는 실패 시 None
+        """
+        path = self.path_for(rcept_no)
+        raw = xml_content.encode("utf-8")
+
+        try:
+            compressed = self._compressor().compress(raw)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"문서 보관 실패: {rcept_no} - {e}")
+            return None
+
+        logger.info(
+            f"문서 보관: {rcept_no} ({len(raw) / 1024 / 1024:.1f}MB → "
+            f"{len(compressed) / 1024 / 1024:.1f}MB)"
+        )
+
+        # 색인 등록 실패는 치명적이지 않음 (파일 경로는 접수번호로 결정됨)
+        try:
+            self._upsert_index(
+                rcept_no=rcept_no,
+                corp_code=corp_code,
+                fiscal_year=fiscal_year,
+                report_type=report_type,
+                file_path=str(path),
+                raw_bytes=len(raw),
+                compressed_bytes=len(compressed),
+                sha256=hashlib.sha256(raw).hexdigest(),
+            )
+        except Exception as e:
+            logger.warning(f"문서 색인 등록 실패: {rcept_no} - {e}")
+
+        return path
+
+    def _upsert_index(self, **values) -> None:
+        with get_sync_session() as session:
+            stmt = pg_insert(DartDocument).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["rcept_no"],
+                set_={key: stmt.excluded[key] for key in values if key != "rcept_no"},
+            )
+            session.execute(stmt)
+
+    def list_documents(
+        self,
+        corp_codes: list[str] | None = None,
+        years: list[int] | None = None,
+        report_type: str = "annual"
+    ) -> list[dict]:
+        """
+        색인된 문서 목록 조회 (재파싱 대상 선정용)
+
+        Args:
+            corp_codes: 특정 기업만 (None이면 전체)
+            years: 특정 연도만 (None이면 전체)
+            report_type: 보고서 유형
+
+        Returns:
+            [{"rcept_no", "corp_code", "fiscal_year", "file_path"}, ...]
+        """
+        query = select(
+            DartDocument.rcept_no,
+            DartDocument.corp_code,
+            DartDocument.fiscal_year,
+            DartDocument.file_path,
+        ).where(DartDocument.report_type == report_type).order_by(DartDocument.rcept_no)
+
+        if corp_codes:
+            query = query.where(DartDocument.corp_code.in_(corp_codes))
+        if years:
+            query = query.where(DartDocument.fiscal_year.in_(years))
+
+        with get_sync_session() as session:
+            return [dict(row._mapping) for row in session.execute(query)]
+
+
+# 전역 보관소 인스턴스 (싱글톤)
+_document_store: DARTDocumentStore | None = None
+_document_store_lock = threading.Lock()
+
+
+def get_document_store() -> DARTDocumentStore | None:
+    """
+    DART 문서 보관소 싱글톤 가져오기
+
+    Returns:
+        DARTDocumentStore 인스턴스 또는 보관 비활성화 시 None
+    """
+    global _document_store
+    if not settings.dart_document_archive_enabled:
+        return None
+
+    with _document_store_lock:
+        if _document_store is None:
+            _document_store = DARTDocumentStore(settings.dart_document_dir)
+            logger.info(f"DART 문서 보관소 초기화: {settings.dart_document_dir}")
+        return _document_store
@@ -4,11 +4,16 @@ DART 웹사이트 크롤러
 DART API에서 제공하지 않는 재무제표를 OpenDartReader의 list 메서드와
 DART API를 조합하여 가져옵니다.
 """
+import io
 import logging
+import re
+import threading
+import time
 from typing import Any
 
-import OpenDartReader
 from app.config import settings
+from app.data_sources.dart_corp_registry import get_dart_corp_registry
+from app.data_sources.dart_document_store import DARTDocumentStore, get_document_store
 
 logger = logging.getLogger(__name__)
 
@@ -208,458 +213,398 @@ class XMLTableFinder:
         return True
 
 
-class DARTWebScraper:
-    """DART 웹사이트 크롤러"""
+# 재무제표 섹션별 제목 패턴
+_SECTION_TITLE_PATTERNS = {
+    "income": re.compile(r"연결포괄손익계산서|포괄손익계산서|연결손익계산서", re.IGNORECASE),
+    "balance": re.compile(r"연결재무상태표|재무상태표|대차대조표", re.IGNORECASE),
+    "cash_flow": re.compile(r"연결현금흐름표|현금흐름표", re.IGNORECASE),
+}
 
-    def __init__(self):
-        self.dart = OpenDartReader(settings.dart_api_key)
-        logger.info("DARTWebScraper 초기화 완료")
+# 섹션별 필수 항목 (모두 찾으면 해당 섹션 탐색 중단)
+_SECTION_REQUIRED_KEYS = {
+    "income": ["revenue", "operating_income", "net_income"],
+    "balance": ["total_assets", "total_liabilities", "total_equity",
+                "current_assets", "current_liabilities", "inventories"],
+    "cash_flow": ["operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "capex"],
+}
 
-    def get_annual_report_rcpno(self, corp_code: str, year: int) -> str | None:
-        """
-        사업보고서 접수번호 조회 (OpenDartReader list 메서드 사용)
+_SECTION_NAMES = {"income": "손익계산서", "balance": "재무상태표", "cash_flow": "현금흐름표"}
 
-        Args:
-            corp_code: DART 기업코드
-            year: 회계연도
+# 메타데이터 unit_conversion 키
+_SECTION_META_KEYS = {
+    "income": "income_statement",
+    "balance": "balance_sheet",
+    "cash_flow": "cash_flow",
+}
 
-        Returns:
-            사업보고서 접수번호 또는 None
-        """
-        try:
-            # 사업보고서는 다음 해 3월경 제출되므로 year+1년 초에 검색
-            search_start = f"{year+1}0101"
-            search_end = f"{year+1}0630"
+# 요약/상세표/주석/영향 제목 제외
+_TITLE_EXCLUDE_KEYWORDS = ["요약", "상세", "주석", "영향", "변경"]
 
-            logger.info(f"DART 공시 검색: corp_code={corp_code}, year={year}")
+# 제목이 번호로 시작하면 (예: "②", "나.") 우선순위 높음
+_PRIMARY_TITLE_PATTERN = re.compile(r'^[①②③④⑤가나다라①-⑨]\.?\s')
 
-            # OpenDartReader의 list 메서드로 공시 검색
-            df = self.dart.list(
-                corp=corp_code,
-                start=search_start,
-                end=search_end,
-                kind="A",  # 사업보고서
-                final=True  # 최종보고서만
-            )
+_UNIT_PATTERN = re.compile(r'\(?\s*단위\s*[:：]?\s*(백만원|천원|원)\s*\)?', re.IGNORECASE)
 
-            if df is None or df.empty:
-                logger.warning(f"공시 목록이 비어있음: {corp_code} {year}년")
-                return None
+_CELL_TAGS = ("TD", "TH", "TU", "TE")
 
-            # 사업보고서 필터링 (제목에 "사업보고서" 포함 + 해당 연도)
-            # 제목 예: "사업보고서 (2022.12)"
-            for _, row in df.iterrows():
-                report_nm = row.get("report_nm", "")
-                if "사업보고서" in report_nm and f"({year}.12)" in report_nm:
-                    rcpNo = row.get("rcept_no")
-                    logger.info(f"사업보고서 발견: {year}년 (rcpNo={rcpNo})")
-                    return rcpNo
+# 제목 뒤에서 데이터 테이블을 찾을 최대 범위
+_MAX_TITLE_SIBLINGS = 15
+_MAX_TABLES_AFTER_TITLE = 30
+_MAX_UNIT_SIBLINGS = 5
 
-            logger.warning(f"사업보고서를 찾을 수 없음: {corp_code} {year}년")
-            return None
 
-        except Exception as e:
-            logger.error(f"DART 공시 검색 실패: {e}", exc_info=True)
-            return None
+def _local_name(tag) -> str | None:
+    """네임스페이스를 뗀 태그 이름 (주석/PI는 None)"""
+    if not isinstance(tag, str):
+        return None
+    return tag.rsplit("}", 1)[-1]
 
-    def get_financials_from_report(self, corp_code: str, year: int, rcpNo: str) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+
+def _element_text(elem) -> str:
+    """lxml 요소 텍스트 (BeautifulSoup get_text(strip=True)와 동일)"""
+    return "".join(text.strip() for text in elem.itertext())
+
+
+class DARTDocumentParser:
+    """
+    DART 사업보고서 XML 문서 파서 (네트워크 호출 없음)
+
+    문서에서 손익계산서·재무상태표·현금흐름표 테이블을 찾아 주요 항목을 추출합니다.
+    기본은 lxml.iterparse 기반 단일 패스 스트리밍 파서이며,
+    실패하면 BeautifulSoup 전체 트리 파서로 재시도합니다.
+    """
+
+    def parse_document(self, xml_content: str | bytes) -> tuple[dict[str, Any], dict[str, Any]]:
         """
-        사업보고서에서 재무제표 데이터 추출 (XML 파싱)
+        사업보고서 XML에서 재무제표 데이터 추출
+
+        스트리밍 파서로 먼저 읽고, 필수 항목을 하나도 찾지 못한 재무제표(예: 현금흐름표)가
+        있으면 그 재무제표만 BeautifulSoup 파서 결과로 보완합니다.
 
         Args:
-            corp_code: DART 기업코드
-            year: 회계연도
-            rcpNo: 접수번호
+            xml_content: dart.document()가 반환한 XML 문서
 
         Returns:
             (재무 데이터 딕셔너리, 메타데이터 딕셔너리) 튜플
-            실패 시 (None, {})
         """
         try:
-            from bs4 import BeautifulSoup
-            import re
-
-            logger.info(f"DART 문서 XML 파싱: rcpNo={rcpNo}")
-
-            # OpenDartReader의 document() 메서드로 전체 XML 가져오기
-            xml_content = self.dart.document(rcpNo)
+            sections = self._parse_sections_streaming(xml_content)
+        except Exception as e:
+            logger.warning(f"스트리밍 파싱 실패 → BeautifulSoup 파싱 재시도: {e}")
+            return self.parse_document_soup(xml_content)
 
-            if not xml_content:
-                logger.error(f"DART 문서를 가져올 수 없음: rcpNo={rcpNo}")
-                return None, {}
+        missing = [
+            section for section, (data, _) in sections.items()
+            if not any(key in data for key in _SECTION_REQUIRED_KEYS[section])
+        ]
+        if not missing:
+            return self._merge_sections(sections)
 
-            # XML 파싱 (lxml 사용)
-            soup = BeautifulSoup(xml_content, "xml")
+        names = ", ".join(_SECTION_NAMES[section] for section in missing)
+        if len(missing) == len(sections):
+            logger.info("스트리밍 파싱 결과 없음 → BeautifulSoup 파싱 재시도")
+        else:
+            logger.warning(f"스트리밍 파싱에서 {names} 누락 → BeautifulSoup 파싱으로 보완")
 
-            # 재무제표 파싱 (메타데이터 포함)
-            result = {}
-            metadata = {
-                "parsing_details": {},
-                "unit_conversion": {}
-            }
-
-            # 1. 손익계산서 파싱
-            is_data, is_meta = self._parse_income_statement_xml(soup)
-            result.update(is_data)
-            metadata["parsing_details"].update(is_meta.get("parsing_details", {}))
-            if "unit_conversion" in is_meta:
-                metadata["unit_conversion"]["income_statement"] = is_meta["unit_conversion"]
-
-            # 2. 재무상태표 파싱
-            bs_data, bs_meta = self._parse_balance_sheet_xml(soup)
-            result.update(bs_data)
-            metadata["parsing_details"].update(bs_meta.get("parsing_details", {}))
-            if "unit_conversion" in bs_meta:
-                metadata["unit_conversion"]["balance_sheet"] = bs_meta["unit_conversion"]
-
-            # 3. 현금흐름표 파싱
-            cf_data, cf_meta = self._parse_cash_flow_xml(soup)
-            result.update(cf_data)
-            metadata["parsing_details"].update(cf_meta.get("parsing_details", {}))
-            if "unit_conversion" in cf_meta:
-                metadata["unit_conversion"]["cash_flow"] = cf_meta["unit_conversion"]
+        from bs4 import BeautifulSoup
 
-            if result:
-                logger.info(f"XML 파싱 성공: {len(result)}개 항목")
-                return result, metadata
+        soup = BeautifulSoup(xml_content, "xml")
+        for section in missing:
+            data, metadata = self._parse_section_soup(soup, section)
+            if data:
+                sections[section] = (data, metadata)
+                logger.info(f"{_SECTION_NAMES[section]} BeautifulSoup 보완: {len(data)}개 항목")
             else:
-                logger.warning(f"XML 파싱 실패: 재무제표를 찾을 수 없음")
-                return None, {}
+                logger.warning(f"{_SECTION_NAMES[section]}: BeautifulSoup 파싱에서도 찾지 못함")
 
-        except Exception as e:
-            logger.error(f"XML 파싱 실패: {e}", exc_info=True)
-            return None, {}
+        return self._merge_sections(sections)
 
-    def _parse_income_statement_xml(self, soup) -> tuple[dict, dict]:
+    def parse_document_soup(
+        self,
+        xml_content: str | bytes
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
-        손익계산서 XML 파싱
+        BeautifulSoup으로 문서 전체를 트리로 읽어 재무제표 추출
+
+        Args:
+            xml_content: XML 문서
 
         Returns:
-            (data, metadata) 튜플
+            (재무 데이터 딕셔너리, 메타데이터 딕셔너리) 튜플
         """
-        result = {}
-        metadata = {"parsing_details": {}, "unit_conversion": {}}
+        from bs4 import BeautifulSoup
 
-        try:
-            import re
-
-            # DART XML에서 "포괄손익계산서" 제목을 포함하는 P 태그 찾기
-            # 그 다음에 나오는 TABLE에서 데이터 추출
-            title_pattern = re.compile(r"연결포괄손익계산서|포괄손익계산서|연결손익계산서", re.IGNORECASE)
+        # XML 파싱 (lxml 사용)
+        soup = BeautifulSoup(xml_content, "xml")
 
-            table_unit = None  # 테이블 단위
+        return self._merge_sections({
+            "income": self._parse_income_statement_xml(soup),
+            "balance": self._parse_balance_sheet_xml(soup),
+            "cash_flow": self._parse_cash_flow_xml(soup),
+        })
 
-            for p_tag in soup.find_all("P"):
-                p_text = p_tag.get_text(strip=True)
-
-                if not title_pattern.search(p_text):
-                    continue
-
-                # 요약/상세표/주석/영향 제외
-                if any(kw in p_text for kw in ["요약", "상세", "주석", "영향", "변경"]):
-                    continue
-
-                logger.debug(f"손익계산서 섹션 발견: {p_text}")
-
-                # 제목이 번호로 시작하면 (예: "②", "나.") 우선순위 높음
-                is_primary_section = bool(re.match(r'^[①②③④⑤가나다라①-⑨]\.?\s', p_text))
-
-                # 이 P 태그 다음의 TABLE 찾기 (sibling뿐만 아니라 모든 다음 요소)
-                table = None
-
-                # 1차 시도: siblings 중에서 찾기 (빠름)
-                next_elem = p_tag
-                for _ in range(15):
-                    next_elem = next_elem.find_next_sibling() if next_elem else None
-                    if not next_elem:
-                        break
-                    if next_elem.name == "TABLE":
-                        rows = next_elem.find_all("TR")
-                        min_rows = 5 if is_primary_section else 10
-                        if len(rows) > min_rows:
-                            table = next_elem
-                            logger.debug(f"  → 데이터 테이블 발견 (sibling), 행 수: {len(rows)}")
-                            break
-
-                # 2차 시도: 모든 다음 요소에서 찾기 (느리지만 확실)
-                if not table:
-                    current = p_tag
-                    for _ in range(30):  # 더 멀리 탐색
-                        current = current.find_next("TABLE")
-                        if not current:
-                            break
-                        rows = current.find_all("TR")
-                        min_rows = 5 if is_primary_section else 10
-                        if len(rows) > min_rows:
-                            table = current
-                            logger.debug(f"  → 데이터 테이블 발견 (find_next), 행 수: {len(rows)}")
-                            break
-
-                if not table:
-                    logger.debug("  → 데이터 테이블을 찾을 수 없음")
-                    continue
-
-                # 테이블에서 단위 추출 (다중 전략)
-                table_unit, detected_method = self._get_unit_for_table(p_tag, table)
-                if table_unit:
-                    logger.info(f"손익계산서 단위 감지: {table_unit} (방법: {detected_method})")
-                    metadata["unit_conversion"]["table_unit"] = table_unit
-                    metadata["unit_conversion"]["detected_method"] = detected_method
-                else:
-                    logger.warning("손익계산서 단위 미감지 → 휴리스틱 사용")
-                    metadata["unit_conversion"]["detected_method"] = detected_method
-
-                # 테이블 내 TR(행) 순회
-                for row in table.find_all("TR"):
-                    cells = row.find_all(["TD", "TH", "TU", "TE"])
-                    if len(cells) < 2:
-                        continue
+    def parse_document_streaming(
+        self, xml_content: str | bytes
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        lxml.iterparse로 문서를 한 번만 순방향으로 읽으며 재무제표 추출
 
-                    label = cells[0].get_text(strip=True)
-                    # 당기(마지막 열) 금액 - 제41기 (당기)는 마지막에서 2번째 열, 제40기 (전기)는 마지막 열
-                    # 보수적으로 마지막에서 2번째 열 사용 (당기 데이터)
-                    value_text = cells[-2].get_text(strip=True) if len(cells) >= 3 else (cells[-1].get_text(strip=True) if len(cells) >= 2 else "")
-
-                    # 매출액 또는 영업수익 (금융업) - 번호 prefix 무시
-                    if re.search(r"(매출액|영업수익|수익\(수수료\)|수수료수익)", label) and "revenue" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["revenue"] = value
-                            metadata["parsing_details"]["revenue"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  매출액 발견: {label} = {value:,}")
-
-                    # 영업이익
-                    if re.search(r"(영업이익|순영업손익)", label) and "operating_income" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["operating_income"] = value
-                            metadata["parsing_details"]["operating_income"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  영업이익 발견: {label} = {value:,}")
-
-                    # 당기순이익 (지배기업 소유주)
-                    if re.search(r"(지배기업|당사).*(당기순이익|분기순이익)", label) and "net_income" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value is not None:
-                            result["net_income"] = value
-                            metadata["parsing_details"]["net_income"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  당기순이익 발견: {label} = {value:,}")
-
-                    # 당기순이익 (일반)
-                    if "net_income" not in result and re.search(r"(당기순이익|분기순이익|반기순이익)", label):
-                        value = self._parse_amount(value_text, table_unit)
-                        if value is not None:
-                            result["net_income"] = value
-                            metadata["parsing_details"]["net_income"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "medium"
-                            }
-                            logger.debug(f"  당기순이익 발견: {label} = {value:,}")
+        Args:
+            xml_content: XML 문서
 
-                # 모두 찾았으면 중단
-                if "revenue" in result and "operating_income" in result and "net_income" in result:
-                    break
+        Returns:
+            (재무 데이터 딕셔너리, 메타데이터 딕셔너리) 튜플
+        """
+        return self._merge_sections(self._parse_sections_streaming(xml_content))
 
-        except Exception as e:
-            logger.debug(f"손익계산서 파싱 오류: {e}")
+    def _parse_sections_streaming(self, xml_content: str | bytes) -> dict[str, tuple[dict, dict]]:
+        """
+        스트리밍 파서 본체: 섹션별 (data, metadata)
 
-        return result, metadata
+        섹션 제목(P)을 만나면 대기 목록에 올리고, 이후 끝나는 TABLE 중 행 수 조건을 만족하는
+        첫 테이블을 그 제목의 데이터 테이블로 사용합니다. 처리가 끝난 요소는 즉시 비워
+        메모리에 문서 전체가 쌓이지 않게 하고, 세 재무제표를 모두 찾으면 읽기를 중단합니다.
 
-    def _parse_balance_sheet_xml(self, soup) -> tuple[dict, dict]:
-        """
-        재무상태표 XML 파싱
+        Args:
+            xml_content: XML 문서
 
         Returns:
-            (data, metadata) 튜플
+            {"income" | "balance" | "cash_flow": (data, metadata)}
         """
-        result = {}
-        metadata = {"parsing_details": {}, "unit_conversion": {}}
-        try:
-            import re
+        from lxml import etree
 
-            # DART XML에서 "재무상태표" 제목을 포함하는 P 태그 찾기
-            title_pattern = re.compile(r"연결재무상태표|재무상태표|대차대조표", re.IGNORECASE)
+        if isinstance(xml_content, str):
+            source, encoding = io.BytesIO(xml_content.encode("utf-8")), "utf-8"
+        else:
+            source, encoding = io.BytesIO(xml_content), None
 
-            table_unit = None
+        sections = {
+            section: ({}, {"parsing_details": {}, "unit_conversion": {}})
+            for section in _SECTION_TITLE_PATTERNS
+        }
+        done: set[str] = set()
+        pending: list[dict] = []  # 데이터 테이블을 기다리는 섹션 제목 (문서 순서)
+        table_depth = 0
+        table_starts: list[int] = []  # 열린 TABLE의 시작 순번
+        position = 0  # 요소 시작 순번 (문서 순서)
+
+        context = etree.iterparse(
+            source,
+            events=("start", "end"),
+            encoding=encoding,
+            recover=True,
+            huge_tree=True,
+            remove_comments=True,
+        )
+
+        for event, elem in context:
+            tag = _local_name(elem.tag)
+
+            if event == "start":
+                position += 1
+                if tag == "TABLE":
+                    table_depth += 1
+                    table_starts.append(position)
+                continue
 
-            for p_tag in soup.find_all("P"):
-                p_text = p_tag.get_text(strip=True)
+            parent = elem.getparent()
+            sibling_of = [title for title in pending if title["parent"] is parent]
+            for title in sibling_of:
+                title["siblings"] += 1
+
+            if tag == "P":
+                self._stream_on_paragraph(elem, parent, position, pending, done)
+
+            elif tag == "TABLE":
+                table_depth -= 1
+                started_at = table_starts.pop()
+                self._stream_on_table(elem, started_at, pending, sections, done)
+
+                if len(done) == len(_SECTION_TITLE_PATTERNS):
+                    break  # 세 재무제표를 모두 찾음
+
+            # 제목과 데이터 테이블 사이의 형제 요소: 단위 후보 텍스트 수집
+            for title in sibling_of:
+                if title in pending and title["siblings"] <= _MAX_UNIT_SIBLINGS:
+                    title["sibling_texts"].append(_element_text(elem))
+
+            # 테이블 밖에서 끝난 요소는 더 이상 필요 없으므로 비움
+            # (대기 중인 제목의 부모는 형제 판별에 필요하므로 유지)
+            if table_depth == 0 and not any(title["parent"] is elem for title in pending):
+                elem.clear(keep_tail=False)
+                if parent is not None and not any(title["parent"] is parent for title in pending):
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+        del context
+        return sections
+
+    def _stream_on_paragraph(
+        self,
+        elem,
+        parent,
+        position: int,
+        pending: list[dict],
+        done: set[str]
+    ):
+        """스트리밍 파서: P 요소가 끝나면 섹션 제목인지 확인하여 대기 목록에 추가"""
+        p_text = _element_text(elem)
+        if not p_text or any(kw in p_text for kw in _TITLE_EXCLUDE_KEYWORDS):
+            return
+
+        for section, pattern in _SECTION_TITLE_PATTERNS.items():
+            if section in done or not pattern.search(p_text):
+                continue
 
-                if not title_pattern.search(p_text):
-                    continue
+            logger.debug(f"{_SECTION_NAMES[section]} 섹션 발견: {p_text}")
+            pending.append({
+                "section": section,
+                "text": p_text,
+                "is_primary": bool(_PRIMARY_TITLE_PATTERN.match(p_text)),
+                "position": position,
+                "parent": parent,
+                "siblings": 0,
+                "sibling_texts": [],
+                "tables_seen": 0,
+            })
+
+    def _stream_on_table(
+        self, table, started_at: int, pending: list[dict], sections: dict, done: set[str]
+    ):
+        """스트리밍 파서: TABLE 요소가 끝나면 대기 중인 제목의 데이터 테이블인지 확인"""
+        if not pending:
+            return
+
+        tr_count = None
+        for title in list(pending):
+            if title not in pending or started_at <= title["position"]:
+                continue  # 이미 처리됐거나 제목보다 앞에서 시작한 테이블
+
+            title["tables_seen"] += 1
+            if tr_count is None:
+                tr_count = sum(1 for _ in table.iter("TR"))
+
+            min_rows = 5 if title["is_primary"] else 10
+            if tr_count <= min_rows:
+                if title["tables_seen"] >= _MAX_TABLES_AFTER_TITLE:
+                    pending.remove(title)
+                continue
 
-                # 요약/상세표/주석/영향 제외
-                if any(kw in p_text for kw in ["요약", "상세", "주석", "영향", "변경"]):
-                    continue
+            section = title["section"]
+            pending.remove(title)
+            logger.debug(f"  → 데이터 테이블 발견 (stream), 행 수: {tr_count}")
 
-                logger.debug(f"재무상태표 섹션 발견: {p_text}")
+            # 단위: 테이블 헤더 → 제목·제목과 테이블 사이 형제 요소
+            header_texts = (
+                _element_text(cell) for cell in table.iter()
+                if _local_name(cell.tag) in ("TH", "TD")
+            )
+            section_texts = [title["text"]] + title["sibling_texts"]
+            table_unit, detected_method = self._detect_unit(header_texts, section_texts)
 
-                # 제목이 번호로 시작하면 우선순위 높음
-                is_primary_section = bool(re.match(r'^[①②③④⑤가나다라①-⑨]\.?\s', p_text))
+            result, metadata = sections[section]
+            self._record_unit(section, table_unit, detected_method, metadata)
+            self._extract_section_fields(
+                section, self._table_rows_lxml(table), table_unit, result, metadata
+            )
 
-                # 이 P 태그 다음의 TABLE 찾기
-                table = None
+            if all(key in result for key in _SECTION_REQUIRED_KEYS[section]):
+                done.add(section)
+                pending[:] = [t for t in pending if t["section"] != section]
 
-                # 1차: siblings, 2차: 모든 다음 요소
-                next_elem = p_tag
-                for _ in range(15):
-                    next_elem = next_elem.find_next_sibling() if next_elem else None
-                    if not next_elem:
-                        break
-                    if next_elem.name == "TABLE":
-                        rows = next_elem.find_all("TR")
-                        min_rows = 5 if is_primary_section else 10
-                        if len(rows) > min_rows:
-                            table = next_elem
-                            logger.debug(f"  → 데이터 테이블 발견 (sibling), 행 수: {len(rows)}")
-                            break
+    @staticmethod
+    def _table_rows_lxml(table) -> list[tuple[str, str]]:
+        """lxml TABLE 요소 → [(계정명, 당기 금액 문자열)]"""
+        rows = []
+        for row in table.iter("TR"):
+            cells = [cell for cell in row.iter() if _local_name(cell.tag) in _CELL_TAGS]
+            if len(cells) < 2:
+                continue
+            label = _element_text(cells[0])
+            value_text = _element_text(cells[-2] if len(cells) >= 3 else cells[-1])
+            rows.append((label, value_text))
+        return rows
 
-                if not table:
-                    current = p_tag
-                    for _ in range(30):
-                        current = current.find_next("TABLE")
-                        if not current:
-                            break
-                        rows = current.find_all("TR")
-                        min_rows = 5 if is_primary_section else 10
-                        if len(rows) > min_rows:
-                            table = current
-                            logger.debug(f"  → 데이터 테이블 발견 (find_next), 행 수: {len(rows)}")
-                            break
+    @staticmethod
+    def _table_rows_soup(table) -> list[tuple[str, str]]:
+        """BeautifulSoup TABLE 요소 → [(계정명, 당기 금액 문자열)]"""
+        rows = []
+        for row in table.find_all("TR"):
+            cells = row.find_all(list(_CELL_TAGS))
+            if len(cells) < 2:
+                continue
+            label = cells[0].get_text(strip=True)
+            # 당기(마지막 열) 금액 - 제41기 (당기)는 마지막에서 2번째 열, 제40기 (전기)는 마지막 열
+            # 보수적으로 마지막에서 2번째 열 사용 (당기 데이터)
+            value_cell = cells[-2] if len(cells) >= 3 else cells[-1]
+            value_text = value_cell.get_text(strip=True)
+            rows.append((label, value_text))
+        return rows
 
-                if not table:
-                    logger.debug("  → 데이터 테이블을 찾을 수 없음")
-                    continue
+    @staticmethod
+    def _merge_sections(sections: dict) -> tuple[dict[str, Any], dict[str, Any]]:
+        """섹션별 (data, metadata) 결과를 하나로 합침"""
+        result = {}
+        metadata = {
+            "parsing_details": {},
+            "unit_conversion": {}
+        }
 
-                # 다중 전략으로 단위 추출
-                table_unit, detected_method = self._get_unit_for_table(p_tag, table)
-                if table_unit:
-                    logger.info(f"재무상태표 단위 감지: {table_unit} (방법: {detected_method})")
-                    metadata["unit_conversion"]["table_unit"] = table_unit
-                    metadata["unit_conversion"]["detected_method"] = detected_method
-                else:
-                    logger.warning("재무상태표 단위 미감지 → 휴리스틱 사용")
-                    metadata["unit_conversion"]["detected_method"] = detected_method
+        for section in ("income", "balance", "cash_flow"):
+            data, meta = sections[section]
+            result.update(data)
+            metadata["parsing_details"].update(meta.get("parsing_details", {}))
+            if "unit_conversion" in meta:
+                metadata["unit_conversion"][_SECTION_META_KEYS[section]] = meta["unit_conversion"]
 
-                for row in table.find_all("TR"):
-                    cells = row.find_all(["TD", "TH", "TU", "TE"])
-                    if len(cells) < 2:
-                        continue
+        return result, metadata
 
-                    label = cells[0].get_text(strip=True)
-                    value_text = cells[-2].get_text(strip=True) if len(cells) >= 3 else (cells[-1].get_text(strip=True) if len(cells) >= 2 else "")
-
-                    # 자산총계
-                    if re.search(r"^자산총계", label) and "total_assets" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["total_assets"] = value
-                            metadata["parsing_details"]["total_assets"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  자산총계 발견: {value:,}")
-
-                    # 유동자산
-                    if re.search(r"^유동자산", label) and "current_assets" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["current_assets"] = value
-                            metadata["parsing_details"]["current_assets"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  유동자산 발견: {value:,}")
-
-                    # 부채총계
-                    if re.search(r"^부채총계", label) and "total_liabilities" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["total_liabilities"] = value
-                            metadata["parsing_details"]["total_liabilities"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  부채총계 발견: {value:,}")
-
-                    # 유동부채
-                    if re.search(r"^유동부채", label) and "current_liabilities" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["current_liabilities"] = value
-                            metadata["parsing_details"]["current_liabilities"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  유동부채 발견: {value:,}")
-
-                    # 자본총계
-                    if re.search(r"^자본총계", label) and "total_equity" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["total_equity"] = value
-                            metadata["parsing_details"]["total_equity"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  자본총계 발견: {value:,}")
-
-                    # 재고자산
-                    if re.search(r"재고자산", label) and "inventories" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value:
-                            result["inventories"] = value
-                            metadata["parsing_details"]["inventories"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  재고자산 발견: {value:,}")
-
-                # 주요 항목을 모두 찾았으면 중단
-                required_keys = ["total_assets", "total_liabilities", "total_equity",
-                                 "current_assets", "current_liabilities", "inventories"]
-                if all(k in result for k in required_keys):
-                    break
+    def _find_table_after_title_soup(self, p_tag, is_primary_section: bool):
+        """BeautifulSoup: 섹션 제목 P 태그 다음의 데이터 TABLE 찾기"""
+        min_rows = 5 if is_primary_section else 10
 
-        except Exception as e:
-            logger.debug(f"재무상태표 파싱 오류: {e}")
+        # 1차 시도: siblings 중에서 찾기 (빠름)
+        next_elem = p_tag
+        for _ in range(_MAX_TITLE_SIBLINGS):
+            next_elem = next_elem.find_next_sibling() if next_elem else None
+            if not next_elem:
+                break
+            if next_elem.name == "TABLE":
+                rows = next_elem.find_all("TR")
+                if len(rows) > min_rows:
+                    logger.debug(f"  → 데이터 테이블 발견 (sibling), 행 수: {len(rows)}")
+                    return next_elem
 
-        return result, metadata
+        # 2차 시도: 모든 다음 요소에서 찾기 (느리지만 확실)
+        current = p_tag
+        for _ in range(_MAX_TABLES_AFTER_TITLE):  # 더 멀리 탐색
+            current = current.find_next("TABLE")
+            if not current:
+                break
+            rows = current.find_all("TR")
+            if len(rows) > min_rows:
+                logger.debug(f"  → 데이터 테이블 발견 (find_next), 행 수: {len(rows)}")
+                return current
 
-    def _parse_cash_flow_xml(self, soup) -> tuple[dict, dict]:
+        return None
+
+    def _parse_section_soup(self, soup, section: str) -> tuple[dict, dict]:
         """
-        현금흐름표 XML 파싱
+        BeautifulSoup: 섹션 제목 P 태그를 찾고 다음 TABLE에서 항목 추출
+
+        Args:
+            soup: BeautifulSoup 객체
+            section: "income", "balance", "cash_flow"
 
         Returns:
             (data, metadata) 튜플
         """
         result = {}
         metadata = {"parsing_details": {}, "unit_conversion": {}}
-        try:
-            import re
-
-            # DART XML에서 "현금흐름표" 제목을 포함하는 P 태그 찾기
-            title_pattern = re.compile(r"연결현금흐름표|현금흐름표", re.IGNORECASE)
+        section_name = _SECTION_NAMES[section]
 
-            table_unit = None
+        try:
+            title_pattern = _SECTION_TITLE_PATTERNS[section]
 
             for p_tag in soup.find_all("P"):
                 p_text = p_tag.get_text(strip=True)
@@ -668,227 +613,256 @@ class DARTWebScraper:
                     continue
 
                 # 요약/상세표/주석/영향 제외
-                if any(kw in p_text for kw in ["요약", "상세", "주석", "영향", "변경"]):
+                if any(kw in p_text for kw in _TITLE_EXCLUDE_KEYWORDS):
                     continue
 
-                logger.debug(f"현금흐름표 섹션 발견: {p_text}")
+                logger.debug(f"{section_name} 섹션 발견: {p_text}")
 
-                # 제목이 번호로 시작하면 우선순위 높음
-                is_primary_section = bool(re.match(r'^[①②③④⑤가나다라①-⑨]\.?\s', p_text))
-
-                # 이 P 태그 다음의 TABLE 찾기
-                table = None
-
-                # 1차: siblings, 2차: 모든 다음 요소
-                next_elem = p_tag
-                for _ in range(15):
-                    next_elem = next_elem.find_next_sibling() if next_elem else None
-                    if not next_elem:
-                        break
-                    if next_elem.name == "TABLE":
-                        rows = next_elem.find_all("TR")
-                        min_rows = 5 if is_primary_section else 10
-                        if len(rows) > min_rows:
-                            table = next_elem
-                            logger.debug(f"  → 데이터 테이블 발견 (sibling), 행 수: {len(rows)}")
-                            break
-
-                if not table:
-                    current = p_tag
-                    for _ in range(30):
-                        current = current.find_next("TABLE")
-                        if not current:
-                            break
-                        rows = current.find_all("TR")
-                        min_rows = 5 if is_primary_section else 10
-                        if len(rows) > min_rows:
-                            table = current
-                            logger.debug(f"  → 데이터 테이블 발견 (find_next), 행 수: {len(rows)}")
-                            break
+                is_primary_section = bool(_PRIMARY_TITLE_PATTERN.match(p_text))
+                table = self._find_table_after_title_soup(p_tag, is_primary_section)
 
                 if not table:
                     logger.debug("  → 데이터 테이블을 찾을 수 없음")
                     continue
 
-                # 다중 전략으로 단위 추출
+                # 테이블에서 단위 추출 (다중 전략)
                 table_unit, detected_method = self._get_unit_for_table(p_tag, table)
-                if table_unit:
-                    logger.info(f"현금흐름표 단위 감지: {table_unit} (방법: {detected_method})")
-                    metadata["unit_conversion"]["table_unit"] = table_unit
-                    metadata["unit_conversion"]["detected_method"] = detected_method
-                else:
-                    logger.warning("현금흐름표 단위 미감지 → 휴리스틱 사용")
-                    metadata["unit_conversion"]["detected_method"] = detected_method
-
-                for row in table.find_all("TR"):
-                    cells = row.find_all(["TD", "TH", "TU", "TE"])
-                    if len(cells) < 2:
-                        continue
+                self._record_unit(section, table_unit, detected_method, metadata)
 
-                    label = cells[0].get_text(strip=True)
-                    value_text = cells[-2].get_text(strip=True) if len(cells) >= 3 else (cells[-1].get_text(strip=True) if len(cells) >= 2 else "")
-
-                    # 영업활동현금흐름
-                    if re.search(r"영업활동.*현금흐름", label) and "operating_cash_flow" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value is not None:
-                            result["operating_cash_flow"] = value
-                            metadata["parsing_details"]["operating_cash_flow"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  영업활동현금흐름 발견: {value:,}")
-
-                    # 투자활동현금흐름
-                    if re.search(r"투자활동.*현금흐름", label) and "investing_cash_flow" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value is not None:
-                            result["investing_cash_flow"] = value
-                            metadata["parsing_details"]["investing_cash_flow"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  투자활동현금흐름 발견: {value:,}")
-
-                    # 재무활동현금흐름
-                    if re.search(r"재무활동.*현금흐름", label) and "financing_cash_flow" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value is not None:
-                            result["financing_cash_flow"] = value
-                            metadata["parsing_details"]["financing_cash_flow"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  재무활동현금흐름 발견: {value:,}")
-
-                    # CAPEX (유형자산의 취득)
-                    if re.search(r"유형자산.*취득", label) and "capex" not in result:
-                        value = self._parse_amount(value_text, table_unit)
-                        if value is not None:
-                            result["capex"] = value
-                            metadata["parsing_details"]["capex"] = {
-                                "method": "regex_match",
-                                "pattern": label,
-                                "confidence": "high"
-                            }
-                            logger.debug(f"  CAPEX (유형자산 취득) 발견: {value:,}")
+                self._extract_section_fields(
+                    section, self._table_rows_soup(table), table_unit, result, metadata
+                )
 
                 # 모두 찾았으면 중단
-                required_keys = ["operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "capex"]
-                if all(k in result for k in required_keys):
+                if all(k in result for k in _SECTION_REQUIRED_KEYS[section]):
                     break
 
         except Exception as e:
-            logger.debug(f"현금흐름표 파싱 오류: {e}")
+            logger.debug(f"{section_name} 파싱 오류: {e}")
 
         return result, metadata
 
-    def _extract_unit_from_table(self, table) -> str | None:
+    def _record_unit(
+        self,
+        section: str,
+        table_unit: str | None,
+        detected_method: str,
+        metadata: dict
+    ):
+        """감지한 단위를 섹션 메타데이터에 기록"""
+        section_name = _SECTION_NAMES[section]
+        if table_unit:
+            logger.info(f"{section_name} 단위 감지: {table_unit} (방법: {detected_method})")
+            metadata["unit_conversion"]["table_unit"] = table_unit
+            metadata["unit_conversion"]["detected_method"] = detected_method
+        else:
+            logger.warning(f"{section_name} 단위 미감지 → 휴리스틱 사용")
+            metadata["unit_conversion"]["detected_method"] = detected_method
+
+    def _extract_section_fields(
+        self,
+        section: str,
+        rows: list[tuple[str, str]],
+        table_unit: str | None,
+        result: dict,
+        metadata: dict
+    ):
+        """섹션 종류에 맞는 항목 추출기로 테이블 행 처리"""
+        extractors = {
+            "income": self._extract_income_fields,
+            "balance": self._extract_balance_fields,
+            "cash_flow": self._extract_cash_flow_fields,
+        }
+        extractors[section](rows, table_unit, result, metadata)
+
+    def _parse_income_statement_xml(self, soup) -> tuple[dict, dict]:
         """
-        테이블 헤더에서 단위 추출
+        손익계산서 XML 파싱
 
-        Args:
-            table: BeautifulSoup 테이블 객체
+        Returns:
+            (data, metadata) 튜플
+        """
+        return self._parse_section_soup(soup, "income")
+
+    def _parse_balance_sheet_xml(self, soup) -> tuple[dict, dict]:
+        """
+        재무상태표 XML 파싱
 
         Returns:
-            단위 문자열 ("백만원", "천원", "원") 또는 None
+            (data, metadata) 튜플
+        """
+        return self._parse_section_soup(soup, "balance")
 
-        Examples:
-            "매출액(단위: 백만원)" → "백만원"
-            "(단위:백만원)" → "백만원"
-            "단위:원" → "원"
+    def _parse_cash_flow_xml(self, soup) -> tuple[dict, dict]:
         """
-        import re
+        현금흐름표 XML 파싱
 
-        # 테이블의 모든 헤더 행(TH, TD)에서 단위 찾기
-        for elem in table.find_all(["TH", "TD"]):
-            text = elem.get_text(strip=True)
-            # 정규식 (완화): 괄호/콜론 선택적
-            match = re.search(r'\(?\s*단위\s*[:：]?\s*(백만원|천원|원)\s*\)?', text, re.IGNORECASE)
-            if match:
-                unit = match.group(1)
-                logger.debug(f"테이블 헤더에서 단위 추출: '{unit}' (원문: '{text}')")
-                return unit
+        Returns:
+            (data, metadata) 튜플
+        """
+        return self._parse_section_soup(soup, "cash_flow")
+
+    def _extract_income_fields(
+        self, rows: list[tuple[str, str]], table_unit: str | None, result: dict, metadata: dict
+    ):
+        """손익계산서 테이블 행에서 매출액·영업이익·당기순이익 추출"""
+        for label, value_text in rows:
+            # 매출액 또는 영업수익 (금융업) - 번호 prefix 무시
+            if (
+                re.search(r"(매출액|영업수익|수익\(수수료\)|수수료수익)", label)
+                and "revenue" not in result
+            ):
+                value = self._parse_amount(value_text, table_unit)
+                if value:
+                    result["revenue"] = value
+                    metadata["parsing_details"]["revenue"] = {
+                        "method": "regex_match",
+                        "pattern": label,
+                        "confidence": "high"
+                    }
+                    logger.debug(f"  매출액 발견: {label} = {value:,}")
+
+            # 영업이익
+            if re.search(r"(영업이익|순영업손익)", label) and "operating_income" not in result:
+                value = self._parse_amount(value_text, table_unit)
+                if value:
+                    result["operating_income"] = value
+                    metadata["parsing_details"]["operating_income"] = {
+                        "method": "regex_match",
+                        "pattern": label,
+                        "confidence": "high"
+                    }
+                    logger.debug(f"  영업이익 발견: {label} = {value:,}")
+
+            # 당기순이익 (지배기업 소유주)
+            if (
+                re.search(r"(지배기업|당사).*(당기순이익|분기순이익)", label)
+                and "net_income" not in result
+            ):
+                value = self._parse_amount(value_text, table_unit)
+                if value is not None:
+                    result["net_income"] = value
+                    metadata["parsing_details"]["net_income"] = {
+                        "method": "regex_match",
+                        "pattern": label,
+                        "confidence": "high"
+                    }
+                    logger.debug(f"  당기순이익 발견: {label} = {value:,}")
+
+            # 당기순이익 (일반)
+            if "net_income" not in result and re.search(
+                r"(당기순이익|분기순이익|반기순이익)", label
+            ):
+                value = self._parse_amount(value_text, table_unit)
+                if value is not None:
+                    result["net_income"] = value
+                    metadata["parsing_details"]["net_income"] = {
+                        "method": "regex_match",
+                        "pattern": label,
+                        "confidence": "medium"
+                    }
+                    logger.debug(f"  당기순이익 발견: {label} = {value:,}")
+
+    def _extract_balance_fields(
+        self, rows: list[tuple[str, str]], table_unit: str | None, result: dict, metadata: dict
+    ):
+        """재무상태표 테이블 행에서 자산·부채·자본 항목 추출"""
+        # (정규식, 필드, 로그 이름)
+        patterns = [
+            (r"^자산총계", "total_assets", "자산총계"),
+            (r"^유동자산", "current_assets", "유동자산"),
+            (r"^부채총계", "total_liabilities", "부채총계"),
+            (r"^유동부채", "current_liabilities", "유동부채"),
+            (r"^자본총계", "total_equity", "자본총계"),
+            (r"재고자산", "inventories", "재고자산"),
+        ]
 
-        return None
+        for label, value_text in rows:
+            for pattern, field, name in patterns:
+                if re.search(pattern, label) and field not in result:
+                    value = self._parse_amount(value_text, table_unit)
+                    if value:
+                        result[field] = value
+                        metadata["parsing_details"][field] = {
+                            "method": "regex_match",
+                            "pattern": label,
+                            "confidence": "high"
+                        }
+                        logger.debug(f"  {name} 발견: {value:,}")
+
+    def _extract_cash_flow_fields(
+        self, rows: list[tuple[str, str]], table_unit: str | None, result: dict, metadata: dict
+    ):
+        """현금흐름표 테이블 행에서 활동별 현금흐름·CAPEX 추출"""
+        # (정규식, 필드, 로그 이름)
+        patterns = [
+            (r"영업활동.*현금흐름", "operating_cash_flow", "영업활동현금흐름"),
+            (r"투자활동.*현금흐름", "investing_cash_flow", "투자활동현금흐름"),
+            (r"재무활동.*현금흐름", "financing_cash_flow", "재무활동현금흐름"),
+            (r"유형자산.*취득", "capex", "CAPEX (유형자산 취득)"),
+        ]
 
-    def _extract_unit_from_section(self, p_tag, table) -> str | None:
+        for label, value_text in rows:
+            for pattern, field, name in patterns:
+                if re.search(pattern, label) and field not in result:
+                    value = self._parse_amount(value_text, table_unit)
+                    if value is not None:
+                        result[field] = value
+                        metadata["parsing_details"][field] = {
+                            "method": "regex_match",
+                            "pattern": label,
+                            "confidence": "high"
+                        }
+                        logger.debug(f"  {name} 발견: {value:,}")
+
+    def _detect_unit(self, header_texts, section_texts: list[str]) -> tuple[str | None, str]:
         """
-        섹션 제목(P 태그)과 테이블 사이에서 단위 추출
+        텍스트 목록에서 단위 감지 (테이블 헤더 → 섹션 설명 순)
 
         Args:
-            p_tag: 섹션 제목 P 태그
-            table: BeautifulSoup 테이블 객체
+            header_texts: 테이블 TH/TD 셀 텍스트 (문서 순서)
+            section_texts: 섹션 제목 텍스트와 제목~테이블 사이 요소 텍스트
 
         Returns:
-            단위 문자열 ("백만원", "천원", "원") 또는 None
-
-        Examples:
-            "1. 손익계산서 (단위: 백만원)" → "백만원"
-            "가. 재무상태표 (단위 : 천원)" → "천원"
-            "(단위:원)" → "원"
+            (단위 문자열, 감지 방법) 튜플
         """
-        import re
-
-        # 1. P 태그 자체에서 단위 찾기
-        p_text = p_tag.get_text(strip=True)
-        match = re.search(r'\(?\s*단위\s*[:：]?\s*(백만원|천원|원)\s*\)?', p_text, re.IGNORECASE)
-        if match:
-            unit = match.group(1)
-            logger.debug(f"P 태그에서 단위 추출: '{unit}' (원문: '{p_text}')")
-            return unit
-
-        # 2. P와 TABLE 사이의 모든 요소 검색 (최대 5개)
-        current = p_tag
-        for _ in range(5):
-            current = current.find_next_sibling()
-            if not current:
-                break
-            if current == table:
-                break  # 테이블 도달
-
-            text = current.get_text(strip=True)
-            if not text:
-                continue
+        for text in header_texts:
+            match = _UNIT_PATTERN.search(text)
+            if match:
+                logger.info(f"단위 감지: 테이블 헤더 → {match.group(1)}")
+                return match.group(1), "header_parse"
 
-            match = re.search(r'\(?\s*단위\s*[:：]?\s*(백만원|천원|원)\s*\)?', text, re.IGNORECASE)
+        for text in section_texts:
+            match = _UNIT_PATTERN.search(text)
             if match:
-                unit = match.group(1)
-                logger.debug(f"P-TABLE 사이 요소에서 단위 추출: '{unit}' (원문: '{text}')")
-                return unit
+                logger.info(f"단위 감지: 섹션 설명 → {match.group(1)}")
+                return match.group(1), "section_parse"
 
-        return None
+        logger.warning("단위 미감지 → 휴리스틱 사용")
+        return None, "heuristic"
 
     def _get_unit_for_table(self, p_tag, table) -> tuple[str | None, str]:
         """
-        다중 전략으로 테이블 단위 추출
+        BeautifulSoup: 테이블 헤더 → 섹션 제목·제목과 테이블 사이 형제 요소 순으로 단위 감지
 
         Args:
             p_tag: 섹션 제목 P 태그
             table: BeautifulSoup 테이블 객체
 
         Returns:
-            (단위 문자열, 감지 방법) 튜플
-            감지 방법: "header_parse", "section_parse", "none"
+            (단위 문자열, 감지 방법) 튜플 (_detect_unit과 같음)
         """
-        # 1차: 테이블 헤더에서 (기존 로직)
-        unit = self._extract_unit_from_table(table)
-        if unit:
-            logger.info(f"단위 감지: 테이블 헤더 → {unit}")
-            return unit, "header_parse"
+        header_texts = (cell.get_text(strip=True) for cell in table.find_all(["TH", "TD"]))
 
-        # 2차: P 태그와 테이블 사이
-        unit = self._extract_unit_from_section(p_tag, table)
-        if unit:
-            logger.info(f"단위 감지: 섹션 설명 → {unit}")
-            return unit, "section_parse"
+        section_texts = [p_tag.get_text(strip=True)]
+        current = p_tag
+        for _ in range(_MAX_UNIT_SIBLINGS):
+            current = current.find_next_sibling()
+            if current is None or current is table:
+                break
+            section_texts.append(current.get_text(strip=True))
 
-        # 3차: 실패
-        logger.warning("단위 미감지 → 휴리스틱 사용")
-        return None, "heuristic"
+        return self._detect_unit(header_texts, section_texts)
 
     def _normalize_to_krw(self, value: int, unit: str | None) -> tuple[int, str]:
         """
@@ -965,6 +939,147 @@ class DARTWebScraper:
         except (ValueError, TypeError):
             return None
 
+
+# (corp_code, 연도) → (사업보고서 접수번호, 기록 시각) (프로세스 전역 메모이제이션)
+# 정정 공시가 나오면 최종 접수번호가 바뀌므로 TTL이 지나면 공시 검색으로 다시 확인
+_rcpno_memo: dict[tuple[str, int], tuple[str, float]] = {}
+_rcpno_memo_lock = threading.Lock()
+_RCPNO_MEMO_TTL_SECONDS = 6 * 3600
+
+
+class DARTWebScraper(DARTDocumentParser):
+    """DART 웹사이트 크롤러"""
+
+    def __init__(self, document_store: DARTDocumentStore | None = None):
+        """
+        Args:
+            document_store: 문서 보관소 (기본값: 전역 보관소, 비활성화 시 None)
+        """
+        # 기업코드 목록을 공유하는 OpenDartReader (생성 시 목록을 다시 읽지 않음)
+        self.dart = get_dart_corp_registry(settings.dart_api_key).reader()
+        self.document_store = document_store or get_document_store()
+        logger.info("DARTWebScraper 초기화 완료")
+
+    def get_annual_report_rcpno(self, corp_code: str, year: int) -> str | None:
+        """
+        사업보고서 접수번호 조회 (OpenDartReader list 메서드 사용)
+
+        Args:
+            corp_code: DART 기업코드
+            year: 회계연도
+
+        Returns:
+            사업보고서 접수번호 또는 None
+        """
+        # 메모이제이션(TTL 이내) → DART 공시 검색(최종보고서, 정정 공시 반영)
+        # 문서 보관소는 접수번호를 찾은 뒤 원문 재다운로드를 건너뛰는 데만 사용 (get_document)
+        with _rcpno_memo_lock:
+            memoized = _rcpno_memo.get((corp_code, year))
+        if memoized and time.monotonic() - memoized[1] < _RCPNO_MEMO_TTL_SECONDS:
+            return memoized[0]
+
+        try:
+            # 사업보고서는 다음 해 3월경 제출되고, 정정 공시는 그 이후에도 나오므로
+            # 다음 해 초부터 그다음 해 말까지 검색 (final=True면 정정 후 최종본만 반환)
+            search_start = f"{year+1}0101"
+            search_end = f"{year+2}1231"
+
+            logger.info(f"DART 공시 검색: corp_code={corp_code}, year={year}")
+
+            # OpenDartReader의 list 메서드로 공시 검색
+            df = self.dart.list(
+                corp=corp_code,
+                start=search_start,
+                end=search_end,
+                kind="A",  # 사업보고서
+                final=True  # 최종보고서만
+            )
+
+            if df is None or df.empty:
+                logger.warning(f"공시 목록이 비어있음: {corp_code} {year}년")
+                return None
+
+            # 사업보고서 필터링 (제목에 "사업보고서" 포함 + 해당 연도)
+            # 제목 예: "사업보고서 (2022.12)", "[기재정정]사업보고서 (2022.12)"
+            for _, row in df.iterrows():
+                report_nm = row.get("report_nm", "")
+                if "사업보고서" in report_nm and f"({year}.12)" in report_nm:
+                    rcpNo = row.get("rcept_no")
+                    logger.info(f"사업보고서 발견: {year}년 (rcpNo={rcpNo})")
+                    with _rcpno_memo_lock:
+                        _rcpno_memo[(corp_code, year)] = (rcpNo, time.monotonic())
+                    return rcpNo
+
+            logger.warning(f"사업보고서를 찾을 수 없음: {corp_code} {year}년")
+            return None
+
+        except Exception as e:
+            logger.error(f"DART 공시 검색 실패: {e}", exc_info=True)
+            return None
+
+    def get_document(self, corp_code: str, year: int, rcept_no: str) -> str | None:
+        """
+        공시 원문 XML 가져오기 (보관소 우선, 없으면 다운로드 후 보관)
+
+        Args:
+            corp_code: DART 기업코드
+            year: 회계연도
+            rcept_no: 접수번호
+
+        Returns:
+            XML 문서 문자열 또는 None
+        """
+        if self.document_store:
+            archived = self.document_store.load(rcept_no)
+            if archived:
+                logger.info(f"보관된 문서 사용: rcept_no={rcept_no}")
+                return archived
+
+        # OpenDartReader의 document() 메서드로 전체 XML 가져오기
+        xml_content = self.dart.document(rcept_no)
+
+        if xml_content and self.document_store:
+            self.document_store.save(rcept_no, xml_content, corp_code=corp_code, fiscal_year=year)
+
+        return xml_content
+
+    def get_financials_from_report(self, corp_code: str, year: int, rcpNo: str) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """
+        사업보고서에서 재무제표 데이터 추출 (XML 파싱)
+
+        Args:
+            corp_code: DART 기업코드
+            year: 회계연도
+            rcpNo: 접수번호
+
+        Returns:
+            (재무 데이터 딕셔너리, 메타데이터 딕셔너리) 튜플
+            실패 시 (None, {})
+        """
+        try:
+            logger.info(f"DART 문서 XML 파싱: rcpNo={rcpNo}")
+
+            xml_content = self.get_document(corp_code, year, rcpNo)
+
+            if not xml_content:
+                logger.error(f"DART 문서를 가져올 수 없음: rcpNo={rcpNo}")
+                return None, {}
+
+            # 재무제표 파싱 (메타데이터 포함)
+            result, metadata = self.parse_document(xml_content)
+
+            if result:
+                logger.info(f"XML 파싱 성공: {len(result)}개 항목")
+                return result, metadata
+            else:
+                logger.warning(f"XML 파싱 실패: 재무제표를 찾을 수 없음")
+                return None, {}
+
+        except Exception as e:
+            logger.error(f"XML 파싱 실패: {e}", exc_info=True)
+            return None, {}
+
+
 # 편의 함수
 def get_dart_web_financials(corp_code: str, year: int) -> tuple[dict[str, Any] | None, dict[str, Any]]:
     """
@@ -0,0 +1,180 @@
+"""
+KRX 세션 관리자
+
+data.krx.co.kr은 www.krx.co.kr의 세션 쿠키(SCOUTER)가 없으면 403을 반환합니다.
+pykrx의 모든 요청이 이 모듈의 공유 세션을 거치도록 하여,
+
+- 연결 풀(keep-alive)을 여러 스레드가 재사용하고,
+- 쿠키 만료로 여러 스레드가 동시에 403을 받아도 쿠키 갱신은 한 번만 하며,
+- asyncio 코드에서는 run_krx()로 pykrx 호출을 전용 스레드 풀에서 실행합니다.
+"""
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_KRX_HOME_URL = "https://www.krx.co.kr/"
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class KRXSessionManager:
+    """스레드 안전 KRX 세션 (연결 풀 + 조율된 쿠키 갱신)"""
+
+    def __init__(self, pool_size: int = 8, timeout: float = 10.0, home_url: str = _KRX_HOME_URL):
+        """
+        Args:
+            pool_size: 호스트당 유지할 keep-alive 연결 수 (= 최대 동시 요청 수)
+            timeout: 요청 타임아웃 (초)
+            home_url: 세션 쿠키를 발급받을 페이지
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.home_url = home_url
+
+        self.requests = 0
+        self.refreshes = 0
+
+        self._session = self._create_session()
+        self._generation = 0  # 쿠키 갱신 세대 (갱신할 때마다 증가)
+        self._initialized = False
+        self._refresh_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"User-Agent": _USER_AGENT, "Connection": "keep-alive"})
+
+        # 풀이 가득 차면 새 연결을 만들지 않고 반환을 기다림 (pool_block)
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=self.pool_size, pool_block=True
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def refresh(self, seen_generation: int | None = None) -> int:
+        """
+        www.krx.co.kr을 방문하여 SCOUTER 쿠키를 다시 받습니다.
+
+        여러 스레드가 같은 세대의 쿠키로 403을 받은 경우, 처음 락을 얻은 스레드만
+        갱신하고 나머지는 갱신된 쿠키로 바로 재시도합니다.
+
+        Args:
+            seen_generation: 403을 받은 요청이 사용한 세대 (None이면 무조건 갱신)
+
+        Returns:
+            갱신 후 세대
+        """
+        with self._refresh_lock:
+            if seen_generation is not None and seen_generation != self._generation:
+                return self._generation  # 다른 스레드가 이미 갱신함
+
+            self._session.cookies.clear()
+            try:
+                self._session.get(self.home_url, timeout=self.timeout)
+                logger.info("KRX 세션 초기화 완료 (SCOUTER cookie 획득)")
+            except Exception as e:
+                logger.warning(f"KRX 세션 초기화 실패: {e}")
+
+            self._generation += 1
+            self._initialized = True
+            with self._stats_lock:
+                self.refreshes += 1
+            return self._generation
+
+    def post(
+        self, url: str, headers: dict | None = None, data: dict | None = None
+    ) -> requests.Response:
+        """
+        세션 기반 POST 요청 (403 시 쿠키 갱신 후 1회 재시도)
+
+        Args:
+            url: 요청 URL
+            headers: 요청 헤더
+            data: 폼 데이터
+
+        Returns:
+            응답 객체
+        """
+        if not self._initialized:
+            self.refresh(seen_generation=0)
+
+        generation = self._generation
+        with self._stats_lock:
+            self.requests += 1
+
+        resp = self._session.post(url, headers=headers, data=data, timeout=self.timeout)
+        if resp.status_code == 403:
+            logger.warning("KRX 403 응답 — 세션 갱신 후 재시도")
+            self.refresh(seen_generation=generation)
+            resp = self._session.post(url, headers=headers, data=data, timeout=self.timeout)
+        return resp
+
+    def stats(self) -> dict:
+        """
+        세션 통계
+
+        Returns:
+            {"requests", "refreshes", "pool_size"}
+        """
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "refreshes": self.refreshes,
+                "pool_size": self.pool_size,
+            }
+
+
+# 전역 세션 인스턴스 (싱글톤)
+_krx_session: KRXSessionManager | None = None
+_krx_session_lock = threading.Lock()
+
+
+def get_krx_session() -> KRXSessionManager:
+    """KRX 세션 관리자 싱글톤 가져오기"""
+    global _krx_session
+    with _krx_session_lock:
+        if _krx_session is None:
+            _krx_session = KRXSessionManager(
+                pool_size=settings.krx_pool_size,
+                timeout=settings.krx_timeout_seconds,
+            )
+        return _krx_session
+
+
+# KRX 조회 워커 풀 (pykrx는 동기 I/O이므로 이벤트 루프 밖에서 실행)
+# 연결 풀 크기와 같게 두어 워커가 연결을 기다리며 쌓이지 않도록 함
+_krx_executor = ThreadPoolExecutor(
+    max_workers=settings.krx_pool_size,
+    thread_name_prefix="krx-fetch"
+)
+
+
+async def run_krx(func, *args, **kwargs):
+    """
+    pykrx(또는 StockClient) 호출을 KRX 워커 풀에서 실행합니다.
+
+    Usage:
+        df = await run_krx(stock.get_market_cap_by_date, start, end, "005930")
+        results = await asyncio.gather(*(run_krx(client.get_ohlcv, c, s, e) for c in codes))
+
+    Args:
+        func: 동기 함수
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        함수 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_krx_executor, functools.partial(func, *args, **kwargs))
@@ -0,0 +1,180 @@
+"""
+금융위원회 시가총액 조회 결과 저장소 (market_cap_points 테이블)
+
+PublicDataClient의 (종목코드, 기준일) 단위 조회 결과를 DB에 보관하여
+API 서버 재시작이나 배치 스크립트 등 여러 프로세스가 같은 결과를 공유합니다.
+
+- 조회 성공(status="ok")은 과거 시세가 바뀌지 않으므로 긴 TTL로 보관합니다.
+- "데이터 없음"(status="missing")은 짧은 TTL 후 재조회합니다.
+  (공공데이터 API는 하루 이틀 늦게 반영되므로 최근 날짜는 나중에 생길 수 있음)
+- API 호출 오류는 저장하지 않습니다.
+- DB를 쓸 수 없으면 경고만 남기고 캐시 미스로 처리합니다.
+"""
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.db.models import MarketCapPoint
+from app.db.session import get_sync_session
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_MISSING = "missing"
+
+# 시가총액 데이터 필드 (PublicDataClient 응답 dict = market_cap_points 컬럼)
+VALUE_FIELDS = ("market_cap", "close_price", "listed_shares")
+
+
+class MarketCapCache:
+    """market_cap_points 테이블 읽기/쓰기 (스레드 안전)"""
+
+    def __init__(self, success_ttl: timedelta, failure_ttl: timedelta):
+        """
+        Args:
+            success_ttl: 조회 성공 결과 보관 기간
+            failure_ttl: "데이터 없음" 결과 보관 기간
+        """
+        self.success_ttl = success_ttl
+        self.failure_ttl = failure_ttl
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def get_many(self, stock_code: str, dates: list[str]) -> dict[str, dict | None]:
+        """
+        여러 기준일 결과를 한 번에 조회
+
+        Args:
+            stock_code: 종목코드
+            dates: YYYYMMDD 형식 기준일 목록
+
+        Returns:
+            {date: 시가총액 데이터 또는 None("데이터 없음")}
+            (저장되지 않았거나 TTL이 지난 날짜는 제외)
+        """
+        dates = list(dict.fromkeys(dates))
+        if not dates:
+            return {}
+
+        try:
+            rows = self._select(stock_code, dates)
+        except Exception as e:
+            logger.warning(f"시가총액 캐시 조회 실패 ({stock_code}): {e}")
+            rows = []
+
+        now = datetime.now()
+        results = {}
+        for row in rows:
+            ok = row["status"] == STATUS_OK
+            ttl = self.success_ttl if ok else self.failure_ttl
+            if now - row["fetched_at"] > ttl:
+                continue
+            results[row["base_date"]] = (
+                {"date": row["base_date"], **{field: row[field] for field in VALUE_FIELDS}}
+                if ok else None
+            )
+
+        with self._lock:
+            self._hits += len(results)
+            self._misses += len(dates) - len(results)
+        return results
+
+    def put_many(self, stock_code: str, entries: dict[str, dict | None]) -> None:
+        """
+        조회 결과 일괄 저장 (같은 기준일은 덮어씀)
+
+        Args:
+            stock_code: 종목코드
+            entries: {date: 시가총액 데이터 또는 None("데이터 없음")}
+        """
+        if not entries:
+            return
+
+        fetched_at = datetime.now()
+        records = [
+            {
+                "stock_code": stock_code,
+                "base_date": base_date,
+                "status": STATUS_OK if data else STATUS_MISSING,
+                **{field: (data or {}).get(field) for field in VALUE_FIELDS},
+                "fetched_at": fetched_at,
+            }
+            for base_date, data in entries.items()
+        ]
+
+        try:
+            self._upsert(records)
+        except Exception as e:
+            logger.warning(f"시가총액 캐시 저장 실패 ({stock_code}): {e}")
+            return
+
+        with self._lock:
+            self._writes += len(records)
+
+    def stats(self) -> dict:
+        """누적 조회 통계 {"hits", "misses", "writes"}"""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "writes": self._writes}
+
+    def _select(self, stock_code: str, dates: list[str]) -> list[dict]:
+        """(stock_code, base_date IN dates) 행 조회"""
+        with get_sync_session() as session:
+            rows = session.execute(
+                select(
+                    MarketCapPoint.base_date,
+                    MarketCapPoint.status,
+                    MarketCapPoint.market_cap,
+                    MarketCapPoint.close_price,
+                    MarketCapPoint.listed_shares,
+                    MarketCapPoint.fetched_at,
+                ).where(
+                    MarketCapPoint.stock_code == stock_code,
+                    MarketCapPoint.base_date.in_(dates),
+                )
+            ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def _upsert(self, records: list[dict]) -> None:
+        """(stock_code, base_date) 기준 upsert"""
+        stmt = pg_insert(MarketCapPoint).values(records)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_market_cap_point_date",
+            set_={
+                column: stmt.excluded[column]
+                for column in ("status", *VALUE_FIELDS, "fetched_at")
+            },
+        )
+        with get_sync_session() as session:
+            session.execute(stmt)
+
+
+# 전역 캐시 인스턴스 (싱글톤)
+_market_cap_cache: MarketCapCache | None = None
+_market_cap_cache_lock = threading.Lock()
+
+
+def get_market_cap_cache() -> MarketCapCache | None:
+    """
+    시가총액 캐시 싱글톤 가져오기
+
+    Returns:
+        MarketCapCache 또는 None (settings.public_data_cache_enabled=False)
+    """
+    global _market_cap_cache
+    if not settings.public_data_cache_enabled:
+        return None
+
+    with _market_cap_cache_lock:
+        if _market_cap_cache is None:
+            _market_cap_cache = MarketCapCache(
+                success_ttl=timedelta(days=settings.public_data_cache_success_ttl_days),
+                failure_ttl=timedelta(hours=settings.public_data_cache_failure_ttl_hours),
+            )
+        return _market_cap_cache
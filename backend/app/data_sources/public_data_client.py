@@ -2,15 +2,64 @@
 금융위원회 공공데이터 API 클라이언트
 
 주식시세정보 API를 통해 과거 시가총액 데이터를 조회합니다.
+조회 결과는 market_cap_points 테이블(MarketCapCache)에 보관하여 프로세스 간 공유하고,
+여러 기준일은 prefetch_market_caps()로 캐시를 한 번에 확인한 뒤 새 날짜만 API를 호출합니다.
+비동기 버전(aget_market_cap_batch)은 공유 httpx.AsyncClient로 새 날짜를 동시에 조회합니다.
 """
+import asyncio
 import logging
+import threading
 from datetime import datetime, timedelta
-from functools import lru_cache
 
+import httpx
 import requests
 
+from app.config import settings
+from app.data_sources.market_cap_cache import MarketCapCache, get_market_cap_cache
+from app.data_sources.symbol_directory import get_symbol_directory
+from app.data_sources.trading_calendar import get_trading_calendar
+
 logger = logging.getLogger(__name__)
 
+# 재시도할 HTTP 상태 코드 (호출 한도 초과, 일시적 서버 오류)
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 이벤트 루프별 공유 httpx.AsyncClient (keep-alive 연결 재사용)와 동시 요청 제한
+_async_http: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient, asyncio.Semaphore] | None = None
+_async_http_lock = threading.Lock()
+
+
+def _get_async_http() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    """
+    현재 이벤트 루프의 공유 AsyncClient와 세마포어
+
+    httpx 연결은 생성한 이벤트 루프에 묶이므로, 스크립트처럼 asyncio.run()이
+    여러 번 실행되면 루프마다 새로 만듭니다.
+    """
+    global _async_http
+    loop = asyncio.get_running_loop()
+    with _async_http_lock:
+        if _async_http is None or _async_http[0] is not loop:
+            concurrency = settings.public_data_concurrency
+            client = httpx.AsyncClient(
+                timeout=settings.public_data_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=concurrency,
+                    max_keepalive_connections=concurrency
+                )
+            )
+            _async_http = (loop, client, asyncio.Semaphore(concurrency))
+        return _async_http[1], _async_http[2]
+
+
+async def close_async_http() -> None:
+    """공유 AsyncClient 종료 (애플리케이션 종료 시 호출)"""
+    global _async_http
+    with _async_http_lock:
+        current, _async_http = _async_http, None
+    if current is not None and current[0] is asyncio.get_running_loop():
+        await current[1].aclose()
+
 
 class PublicDataAPIError(Exception):
     """금융위원회 공공데이터 API 에러"""
@@ -22,19 +71,21 @@ class PublicDataClient:
 
     BASE_URL = "http://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService"
 
-    def __init__(self, service_key: str):
+    def __init__(self, service_key: str, cache: MarketCapCache | None = None):
         """
         Args:
             service_key: 공공데이터포털에서 발급받은 서비스 키
+            cache: 조회 결과 저장소 (None이면 get_market_cap_cache(), 비활성화 시 캐시 없이 조회)
         """
         self.service_key = service_key
+        self.cache = cache if cache is not None else get_market_cap_cache()
 
     def get_market_cap(self, stock_code: str, date: str) -> dict | None:
         """
         특정 일자의 시가총액 조회 (휴장일 자동 fallback)
 
         분기말/연말이 휴장일(토/일/공휴일)인 경우,
-        가장 가까운 이전 영업일의 데이터를 자동으로 조회합니다.
+        거래일 캘린더로 찾은 직전 거래일의 데이터를 한 번에 조회합니다.
 
         Args:
             stock_code: 종목코드 (예: "005930")
@@ -50,6 +101,21 @@ class PublicDataClient:
             }
             또는 None (데이터 없음)
         """
+        trading_day = get_trading_calendar().last_trading_day(date)
+        if trading_day is not None:
+            actual_date = trading_day.strftime("%Y%m%d")
+            result = self._fetch_market_data(stock_code, actual_date)
+            if not result:
+                logger.warning(f"시가총액 조회 실패: {stock_code}, {date} (거래일 {actual_date})")
+                return None
+
+            if actual_date != date:
+                logger.info(f"✓ 휴장일 fallback: {date} → {actual_date}")
+            result["actual_date"] = actual_date
+            result["date"] = date  # 원래 요청한 날짜 유지
+            return result
+
+        # 캘린더를 쓸 수 없으면(KRX 접속 불가 등) 하루씩 당겨가며 탐색
         # 1차: 정확한 날짜로 시도
         result = self._fetch_market_data(stock_code, date)
         if result:
@@ -89,10 +155,117 @@ class PublicDataClient:
                 ...
             }
         """
+        # 거래일 캘린더로 실제 조회 날짜를 먼저 정하고 캐시·API를 한 번에 처리
+        calendar = get_trading_calendar()
+        actual_dates = {}
+        for date in dates:
+            trading_day = calendar.last_trading_day(date)
+            if trading_day is not None:
+                actual_dates[date] = trading_day.strftime("%Y%m%d")
+
+        fetched = self.prefetch_market_caps(stock_code, list(actual_dates.values()))
+
+        results = {}
+        for date in dates:
+            actual_date = actual_dates.get(date)
+            try:
+                if actual_date is None:
+                    # 캘린더를 쓸 수 없는 날짜는 하루씩 당겨가며 탐색
+                    data = self.get_market_cap(stock_code, date)
+                else:
+                    data = fetched.get(actual_date)
+                    if data:
+                        data = {**data, "date": date, "actual_date": actual_date}
+                if data:
+                    results[date] = data
+            except PublicDataAPIError as e:
+                logger.warning(f"시가총액 조회 실패 ({stock_code}, {date}): {e}")
+                continue
+
+        return results
+
+    def prefetch_market_caps(self, stock_code: str, dates: list[str]) -> dict[str, dict | None]:
+        """
+        여러 거래일의 시가총액을 캐시 우선으로 일괄 조회
+
+        캐시를 한 번에 확인하고 없는(또는 TTL이 지난) 날짜만 API를 호출한 뒤
+        결과를 한 번에 저장합니다. 전체 종목 PER/PBR 재계산 시 이미 조회한
+        분기말 데이터는 네트워크 요청 없이 재사용됩니다.
+
+        Args:
+            stock_code: 종목코드
+            dates: YYYYMMDD 형식 거래일 목록 (휴장일 보정은 호출 측에서)
+
+        Returns:
+            {date: 시가총액 데이터 또는 None(데이터 없음)}
+            (API 호출 오류가 난 날짜는 제외)
+        """
+        dates = list(dict.fromkeys(dates))
+        results = self.cache.get_many(stock_code, dates) if self.cache else {}
+
+        fetched = {}
+        for date in dates:
+            if date in results:
+                continue
+            try:
+                fetched[date] = self._request_market_data(stock_code, date)
+            except PublicDataAPIError as e:
+                logger.warning(f"시가총액 조회 실패 ({stock_code}, {date}): {e}")
+
+        if fetched and self.cache:
+            self.cache.put_many(stock_code, fetched)
+
+        if dates:
+            logger.debug(
+                f"시가총액 조회: {stock_code} {len(dates)}건 중 캐시 {len(results)}건, "
+                f"API {len(fetched)}건"
+            )
+        results.update(fetched)
+        return {date: dict(data) if data else data for date, data in results.items()}
+
+    async def aget_market_cap_batch(
+        self,
+        stock_code: str,
+        dates: list[str]
+    ) -> dict[str, dict]:
+        """
+        여러 일자의 시가총액 배치 조회 (비동기)
+
+        get_market_cap_batch와 같은 결과를 반환하되, 캐시에 없는 날짜를
+        공유 httpx.AsyncClient(keep-alive)로 동시에 조회합니다.
+        이벤트 루프를 막지 않으므로 코루틴에서 바로 await할 수 있습니다.
+
+        Args:
+            stock_code: 종목코드
+            dates: ["20240331", "20240630", ...] 형식
+
+        Returns:
+            {"20240630": {"market_cap": 123..., "close_price": 50000, ...}, ...}
+        """
+        # 거래일 캘린더는 확장 시 KRX를 조회하므로 워커 스레드에서 해석
+        calendar = get_trading_calendar()
+        trading_days = await asyncio.gather(
+            *(asyncio.to_thread(calendar.last_trading_day, date) for date in dates)
+        )
+        actual_dates = {
+            date: trading_day.strftime("%Y%m%d")
+            for date, trading_day in zip(dates, trading_days)
+            if trading_day is not None
+        }
+
+        fetched = await self.aprefetch_market_caps(stock_code, list(actual_dates.values()))
+
         results = {}
         for date in dates:
+            actual_date = actual_dates.get(date)
             try:
-                data = self.get_market_cap(stock_code, date)
+                if actual_date is None:
+                    # 캘린더를 쓸 수 없는 날짜는 동기 탐색 (하루씩 당겨가며 조회)
+                    data = await asyncio.to_thread(self.get_market_cap, stock_code, date)
+                else:
+                    data = fetched.get(actual_date)
+                    if data:
+                        data = {**data, "date": date, "actual_date": actual_date}
                 if data:
                     results[date] = data
             except PublicDataAPIError as e:
@@ -101,12 +274,129 @@ class PublicDataClient:
 
         return results
 
-    @lru_cache(maxsize=5000)
+    async def aprefetch_market_caps(
+        self,
+        stock_code: str,
+        dates: list[str]
+    ) -> dict[str, dict | None]:
+        """
+        prefetch_market_caps의 비동기 버전 (캐시에 없는 날짜를 동시에 API 호출)
+
+        Args:
+            stock_code: 종목코드
+            dates: YYYYMMDD 형식 거래일 목록
+
+        Returns:
+            {date: 시가총액 데이터 또는 None(데이터 없음)}
+            (API 호출 오류가 난 날짜는 제외)
+        """
+        dates = list(dict.fromkeys(dates))
+        results = (
+            await asyncio.to_thread(self.cache.get_many, stock_code, dates)
+            if self.cache and dates else {}
+        )
+
+        pending = [date for date in dates if date not in results]
+        fetched = {}
+        if pending:
+            stock_name = await asyncio.to_thread(self._get_stock_name, stock_code)
+            if not stock_name:
+                logger.warning(f"종목명 조회 실패: {stock_code}")
+                fetched = dict.fromkeys(pending)
+            else:
+                responses = await asyncio.gather(
+                    *(self._arequest_market_data(stock_name, date) for date in pending),
+                    return_exceptions=True
+                )
+                for date, response in zip(pending, responses):
+                    if isinstance(response, PublicDataAPIError):
+                        logger.warning(f"시가총액 조회 실패 ({stock_code}, {date}): {response}")
+                    elif isinstance(response, BaseException):
+                        raise response
+                    else:
+                        fetched[date] = response
+
+        if fetched and self.cache:
+            await asyncio.to_thread(self.cache.put_many, stock_code, fetched)
+
+        if dates:
+            logger.debug(
+                f"시가총액 조회: {stock_code} {len(dates)}건 중 캐시 {len(results)}건, "
+                f"API {len(fetched)}건"
+            )
+        results.update(fetched)
+        return {date: dict(data) if data else data for date, data in results.items()}
+
+    async def _arequest_market_data(self, stock_name: str, date: str) -> dict | None:
+        """
+        내부 API 호출 (비동기, 재시도 포함)
+
+        연결 오류·타임아웃·429/5xx 응답은 지수 백오프로 재시도하고,
+        settings.public_data_max_retries회 모두 실패하면 PublicDataAPIError를 발생시킵니다.
+
+        Args:
+            stock_name: 종목명 (API 파라미터)
+            date: YYYYMMDD 형식
+
+        Returns:
+            시가총액 데이터 또는 None
+        """
+        client, semaphore = _get_async_http()
+        params = self._build_params(stock_name, date)
+        attempts = settings.public_data_max_retries + 1
+
+        for attempt in range(attempts):
+            last_attempt = attempt + 1 >= attempts
+            try:
+                async with semaphore:
+                    response = await client.get(self._endpoint(), params=params)
+                response.raise_for_status()
+                return self._parse_market_data(response.json(), date)
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _RETRY_STATUS_CODES or last_attempt:
+                    raise PublicDataAPIError(f"API 호출 실패: {e}")
+                error = e
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise PublicDataAPIError(f"API 호출 실패: {e}")
+                error = e
+            except (KeyError, ValueError, TypeError) as e:
+                raise PublicDataAPIError(f"응답 파싱 실패: {e}")
+
+            logger.debug(f"공공데이터 API 재시도 {attempt + 1}/{attempts - 1} ({date}): {error}")
+            await asyncio.sleep(settings.public_data_retry_backoff_seconds * (2 ** attempt))
+
     def _fetch_market_data(self, stock_code: str, date: str) -> dict | None:
         """
-        내부 API 호출 (LRU 캐싱)
+        단일 기준일 조회 (캐시 우선)
 
-        과거 데이터는 불변이므로 영구 캐싱
+        "데이터 없음"도 캐시하여 휴장일 탐색 시 같은 날짜를 반복 호출하지 않습니다.
+
+        Args:
+            stock_code: 종목코드
+            date: YYYYMMDD 형식
+
+        Returns:
+            시가총액 데이터 또는 None
+
+        Raises:
+            PublicDataAPIError: API 호출 실패 (캐시하지 않음)
+        """
+        if self.cache:
+            cached = self.cache.get_many(stock_code, [date])
+            if date in cached:
+                data = cached[date]
+                return dict(data) if data else None
+
+        data = self._request_market_data(stock_code, date)
+        if self.cache:
+            self.cache.put_many(stock_code, {date: data})
+        return dict(data) if data else None
+
+    def _request_market_data(self, stock_code: str, date: str) -> dict | None:
+        """
+        내부 API 호출
 
         Args:
             stock_code: 종목코드
@@ -121,7 +411,23 @@ class PublicDataClient:
             logger.warning(f"종목명 조회 실패: {stock_code}")
             return None
 
-        params = {
+        try:
+            response = requests.get(
+                self._endpoint(), params=self._build_params(stock_name, date), timeout=10
+            )
+            response.raise_for_status()
+            return self._parse_market_data(response.json(), date)
+
+        except requests.RequestException as e:
+            raise PublicDataAPIError(f"API 호출 실패: {e}")
+        except (KeyError, ValueError, TypeError) as e:
+            raise PublicDataAPIError(f"응답 파싱 실패: {e}")
+
+    def _endpoint(self) -> str:
+        return f"{self.BASE_URL}/getStockPriceInfo"
+
+    def _build_params(self, stock_name: str, date: str) -> dict:
+        return {
             "serviceKey": self.service_key,
             "numOfRows": 1,
             "pageNo": 1,
@@ -130,54 +436,46 @@ class PublicDataClient:
             "itmsNm": stock_name
         }
 
-        endpoint = f"{self.BASE_URL}/getStockPriceInfo"
-
-        try:
-            response = requests.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # 응답 구조: response.body.items.item
-            body = data.get("response", {}).get("body", {})
-            items = body.get("items", {})
+    @staticmethod
+    def _parse_market_data(data: dict, date: str) -> dict | None:
+        """
+        getStockPriceInfo 응답 → 시가총액 데이터
 
-            # items가 빈 경우 처리
-            if not items:
-                return None
+        Raises:
+            KeyError, ValueError, TypeError: 응답 형식 오류
+        """
+        # 응답 구조: response.body.items.item
+        body = data.get("response", {}).get("body", {})
+        items = body.get("items", {})
 
-            item_data = items.get("item", [])
+        # items가 빈 경우 처리
+        if not items:
+            return None
 
-            # item이 없거나 빈 리스트인 경우
-            if not item_data:
-                return None
+        item_data = items.get("item", [])
 
-            # item이 리스트일 수도 dict일 수도 있음
-            item = item_data[0] if isinstance(item_data, list) else item_data
+        # item이 없거나 빈 리스트인 경우
+        if not item_data:
+            return None
 
-            # 시가총액: mrktTotAmt (이미 원 단위)
-            market_cap = item.get("mrktTotAmt")
-            if not market_cap:
-                return None
+        # item이 리스트일 수도 dict일 수도 있음
+        item = item_data[0] if isinstance(item_data, list) else item_data
 
-            return {
-                "date": date,
-                "market_cap": int(market_cap),  # 이미 원 단위
-                "close_price": int(item.get("clpr", 0)),
-                "listed_shares": int(item.get("lstgStCnt", 0))
-            }
+        # 시가총액: mrktTotAmt (이미 원 단위)
+        market_cap = item.get("mrktTotAmt")
+        if not market_cap:
+            return None
 
-        except requests.RequestException as e:
-            raise PublicDataAPIError(f"API 호출 실패: {e}")
-        except (KeyError, ValueError, TypeError) as e:
-            raise PublicDataAPIError(f"응답 파싱 실패: {e}")
+        return {
+            "date": date,
+            "market_cap": int(market_cap),  # 이미 원 단위
+            "close_price": int(item.get("clpr", 0)),
+            "listed_shares": int(item.get("lstgStCnt", 0))
+        }
 
     def _get_stock_name(self, stock_code: str) -> str | None:
         """
-        종목코드 → 종목명 변환
-
-        TODO: DB에서 조회하도록 개선 필요
-        현재는 하드코딩된 매핑 사용
+        종목코드 → 종목명 변환 (심볼 디렉터리 조회)
 
         Args:
             stock_code: 종목코드
@@ -185,49 +483,7 @@ class PublicDataClient:
         Returns:
             종목명 또는 None
         """
-        # 주요 종목 매핑 (임시)
-        stock_names = {
-            "005930": "삼성전자",
-            "000660": "SK하이닉스",
-            "051910": "LG화학",
-            "006400": "삼성SDI",
-            "034730": "SK",
-            "005380": "현대차",
-            "000270": "기아",
-            "035420": "NAVER",
-            "035720": "카카오",
-            "068270": "셀트리온",
-            "005490": "POSCO홀딩스",
-            "207940": "삼성바이오로직스",
-            "373220": "LG에너지솔루션",
-            "003670": "포스코퓨처엠",
-        }
-
-        name = stock_names.get(stock_code)
-
-        if not name:
-            # DB에서 조회 시도
-            try:
-                from app.db.session import sync_session_factory
-                from app.db.models import Company
-                from sqlalchemy import select
-
-                with sync_session_factory() as session:
-                    result = session.execute(
-                        select(Company.company_name)
-                        .where(Company.stock_code == stock_code)
-                    )
-                    company = result.scalar_one_or_none()
-
-                    if company:
-                        # 캐싱을 위해 딕셔너리에 추가
-                        stock_names[stock_code] = company
-                        return company
-
-            except Exception as e:
-                logger.warning(f"DB에서 종목명 조회 실패 ({stock_code}): {e}")
-
-        return name
+        return get_symbol_directory().get_name(stock_code)
 
     @staticmethod
     def _subtract_days(date_str: str, days: int) -> str:
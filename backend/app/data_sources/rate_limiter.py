@@ -0,0 +1,215 @@
+"""
+API 호출 속도 제한기 및 일일 한도 카운터
+
+DART 등 외부 API는 키 단위로 호출 빈도를 제한하므로,
+여러 스레드가 같은 키로 동시에 호출해도 한도를 넘지 않도록 조율합니다.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+# DART 일일 한도는 한국 시간 자정에 초기화됨
+_KST = ZoneInfo("Asia/Seoul")
+
+# 사용량 저장소 오류 후 재시도까지 대기 시간
+_STORE_RETRY_SECONDS = 60
+
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 호출 수
+            burst: 순간적으로 허용할 최대 호출 수 (버킷 크기)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개를 획득할 때까지 대기합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                sleep_for = (1 - self._tokens) / self.rate
+
+            time.sleep(sleep_for)
+            waited += sleep_for
+
+
+class DailyQuota:
+    """
+    스레드 안전 일일 호출 한도 카운터 (한국 시간 자정 초기화)
+
+    store가 있으면 사용량을 저장소에 누적하고 날짜가 바뀔 때 저장된 사용량을 읽으므로,
+    재시작 후에도, 같은 키를 쓰는 다른 프로세스와도 오늘 사용량을 함께 셉니다.
+    저장소 오류 시에는 메모리 카운터로 계속 세고, 잠시 후 못 쓴 사용량과 함께 다시 기록합니다.
+    """
+
+    def __init__(self, limit: int, key: str | None = None, store=None):
+        """
+        Args:
+            limit: 하루 최대 호출 수
+            key: 저장소 기록 키 (예: "dart:<api_key>")
+            store: 사용량 저장소 (get(key, day) → int, add(key, day, count) → 누적 사용량),
+                None이면 메모리에만 기록
+        """
+        self.limit = limit
+        self.key = key
+        self.store = store if key else None
+        self._used = 0
+        self._day = None  # 최초 조회 시 저장된 사용량을 읽음
+        self._unsaved = 0  # 저장소 오류로 아직 기록하지 못한 호출 수
+        self._store_failed_at: float | None = None
+        self._lock = threading.Lock()
+
+    def _store_available(self) -> bool:
+        return self.store is not None and (
+            self._store_failed_at is None
+            or time.monotonic() - self._store_failed_at >= _STORE_RETRY_SECONDS
+        )
+
+    def _store_failed(self, e: Exception) -> None:
+        self._store_failed_at = time.monotonic()
+        name = self.key.split(":")[0]  # API 키는 로그에 남기지 않음
+        logger.warning(f"일일 사용량 저장소 오류, 메모리 카운터로 계속: {name} - {e}")
+
+    def _roll_over(self) -> None:
+        """날짜가 바뀌었으면 카운터 초기화 (락 보유 상태, 저장된 사용량이 있으면 이어서 셈)"""
+        today = datetime.now(_KST).date()
+        if today == self._day:
+            return
+
+        self._day = today
+        self._used = 0
+        self._unsaved = 0
+        if self._store_available():
+            try:
+                self._used = self.store.get(self.key, today)
+                self._store_failed_at = None
+            except Exception as e:
+                self._store_failed(e)
+
+    def record(self, count: int = 1) -> None:
+        """호출 수를 기록합니다."""
+        with self._lock:
+            self._roll_over()
+            self._used += count
+            day = self._day
+            pending = self._unsaved + count
+            self._unsaved = 0
+            save = self._store_available()
+            if not save:
+                self._unsaved = pending
+
+        if save:
+            # 다른 프로세스 사용량까지 포함한 누적값으로 맞춤 (저장소 I/O는 락 밖에서)
+            try:
+                total = self.store.add(self.key, day, pending)
+            except Exception as e:
+                total = None
+                with self._lock:
+                    self._store_failed(e)
+                    if self._day == day:
+                        self._unsaved += pending
+
+            if total is not None:
+                with self._lock:
+                    self._store_failed_at = None
+                    if self._day == day:
+                        self._used = max(self._used, total)
+
+        with self._lock:
+            used = self._used
+        if used - count < self.limit <= used:
+            logger.warning(f"일일 호출 한도 도달: {used}/{self.limit}")
+
+    @property
+    def used(self) -> int:
+        """오늘 사용한 호출 수"""
+        with self._lock:
+            self._roll_over()
+            return self._used
+
+    def remaining(self) -> int:
+        """오늘 남은 호출 수"""
+        with self._lock:
+            self._roll_over()
+            return max(0, self.limit - self._used)
+
+
+# 키별 속도 제한기 레지스트리 (프로세스 전역)
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, rate: float, burst: int = 1) -> RateLimiter:
+    """
+    키별 공유 속도 제한기 가져오기
+
+    같은 키(예: API 키)로 생성된 클라이언트는 모두 같은 제한기를 공유합니다.
+
+    Args:
+        key: 제한 단위 키 (예: "dart:<api_key>")
+        rate: 초당 허용 호출 수 (최초 생성 시에만 적용)
+        burst: 버킷 크기 (최초 생성 시에만 적용)
+
+    Returns:
+        RateLimiter 인스턴스
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(rate=rate, burst=burst)
+            _limiters[key] = limiter
+            logger.debug(f"속도 제한기 생성: rate={rate}/s, burst={burst}")
+        return limiter
+
+
+# 키별 일일 한도 레지스트리 (프로세스 전역)
+_quotas: dict[str, DailyQuota] = {}
+
+
+def get_daily_quota(key: str, limit: int, store=None) -> DailyQuota:
+    """
+    키별 공유 일일 한도 카운터 가져오기
+
+    Args:
+        key: 한도 단위 키 (예: "dart:<api_key>")
+        limit: 하루 최대 호출 수 (최초 생성 시에만 적용)
+        store: 사용량 저장소 (최초 생성 시에만 적용, None이면 메모리에만 기록)
+
+    Returns:
+        DailyQuota 인스턴스
+    """
+    with _limiters_lock:
+        quota = _quotas.get(key)
+        if quota is None:
+            quota = DailyQuota(limit=limit, key=key, store=store)
+            _quotas[key] = quota
+        return quota
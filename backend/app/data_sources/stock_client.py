@@ -4,65 +4,53 @@
 pykrx를 사용하여 한국 주식시장(KOSPI/KOSDAQ)의 주가 및 시가총액 데이터를 조회합니다.
 """
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import pandas as pd
-import requests as _requests
 from pykrx import stock
 from pykrx.website.krx.krxio import Post as _KrxPost
 
+from app.config import settings
+from app.data_sources.krx_session import get_krx_session, run_krx
+from app.data_sources.stock_price_store import StockPriceStore, get_stock_price_store
+from app.data_sources.trading_calendar import get_trading_calendar
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # KRX WAF 우회 패치
 # data.krx.co.kr은 www.krx.co.kr의 세션 쿠키(SCOUTER)가 없으면 403을 반환합니다.
 # pykrx의 Post 클래스는 세션 없이 raw requests.post()를 사용하므로,
-# Post.read를 monkey-patch하여 세션 기반 요청으로 바꾸면 정상 작동합니다.
+# Post.read를 monkey-patch하여 공유 세션(연결 풀 + 조율된 쿠키 갱신)을 거치게 합니다.
 # ---------------------------------------------------------------------------
-_krx_session: _requests.Session | None = None
-
-
-def _init_krx_session() -> _requests.Session:
-    """www.krx.co.kr을 방문하여 SCOUTER 쿠키를 획득하고 세션을 (re)초기화한다."""
-    global _krx_session
-    _krx_session = _requests.Session()
-    _krx_session.headers.update({
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-    })
-    try:
-        _krx_session.get("https://www.krx.co.kr/", timeout=10)
-        logger.info("KRX 세션 초기화 완료 (SCOUTER cookie 획득)")
-    except Exception as e:
-        logger.warning(f"KRX 세션 초기화 실패: {e}")
-    return _krx_session
-
-
 def _krx_patched_read(self, **params):
     """세션 기반 POST 요청 — KRX WAF 우회 및 403 시 자동 세션 갱신."""
-    global _krx_session
-    if _krx_session is None:
-        _init_krx_session()
-    resp = _krx_session.post(self.url, headers=self.headers, data=params)
-    if resp.status_code == 403:
-        logger.warning("KRX 403 응답 — 세션 갱신 후 재시도")
-        _init_krx_session()
-        resp = _krx_session.post(self.url, headers=self.headers, data=params)
-    return resp
+    return get_krx_session().post(self.url, headers=self.headers, data=params)
 
 
 _KrxPost.read = _krx_patched_read
 # ---------------------------------------------------------------------------
 
 
+# read-through 시 저장된 첫 거래일이 요청 시작일보다 이만큼 늦으면
+# 앞 구간이 적재되지 않은 것으로 판단 (연휴 최대 길이보다 길게)
+_STORE_HEAD_GAP_DAYS = 10
+
+
 class StockClient:
     """pykrx 기반 주가 데이터 클라이언트"""
 
-    def __init__(self):
-        logger.info("StockClient 초기화 완료")
+    def __init__(self, read_through: bool | None = None):
+        """
+        Args:
+            read_through: True면 과거 주가는 stock_prices 테이블에서 읽고 이후 구간만 KRX에서 조회
+                          (기본값: settings.stock_price_read_through)
+        """
+        self.read_through = (
+            settings.stock_price_read_through if read_through is None else read_through
+        )
+        logger.info(f"StockClient 초기화 완료 (read_through={self.read_through})")
 
     def get_ohlcv(
         self,
@@ -173,6 +161,188 @@ class StockClient:
             logger.error(f"시가총액 조회 실패: {e}", exc_info=True)
             return None
 
+    def _fetch_price_history(self, stock_code: str, start: str, end: str) -> pd.DataFrame | None:
+        """KRX에서 OHLCV와 시가총액을 조회하여 결합"""
+        ohlcv_df = self.get_ohlcv(stock_code, start, end)
+        cap_df = self.get_market_cap(stock_code, start, end)
+
+        if ohlcv_df is None or cap_df is None:
+            return None
+
+        return pd.merge(
+            ohlcv_df,
+            cap_df[["market_cap", "shares_outstanding"]],
+            left_index=True,
+            right_index=True,
+            how="inner"
+        )
+
+    @staticmethod
+    def _first_missing_trading_day(stored: pd.DataFrame) -> date | None:
+        """저장 구간 중간에 빠진 첫 거래일 (거래일 캘린더로 확인, 확인할 수 없으면 None)"""
+        first = stored.index[0].date()
+        last = min(stored.index[-1].date(), date.today() - timedelta(days=1))
+        if first > last:
+            return None
+
+        trading_days = get_trading_calendar().trading_days(first, last)
+        if trading_days is None:
+            return None
+
+        stored_days = set(stored.index.date)
+        return next((day for day in trading_days if day not in stored_days), None)
+
+    def _read_through_price_history(
+        self,
+        stock_code: str,
+        start: str,
+        end: str
+    ) -> pd.DataFrame | None:
+        """
+        저장된 수정주가 구간은 DB에서 읽고, 확인되지 않은 구간만 KRX에서 수정주가로 받아 저장
+
+        확인되지 않은 구간: 마지막 저장일 이후(오늘 포함), 원주가(스냅샷) 행, 중간에 빠진 거래일.
+        그 직전 저장일 하루를 겹쳐 조회하여 종가가 다르면(액면분할·배당 등으로 수정주가가 바뀜)
+        요청 구간 밖을 포함한 저장 기간 전체를 다시 받아 덮어씁니다 (스냅샷 지표 컬럼은 유지).
+        """
+        store = get_stock_price_store()
+        company_id = store.get_company_id(stock_code)
+        if company_id is None:
+            return self._fetch_price_history(stock_code, start, end)
+
+        start_date = datetime.strptime(start, "%Y%m%d").date()
+        end_date = datetime.strptime(end, "%Y%m%d").date()
+        stored = store.load(company_id, start_date, end_date)
+
+        head_gap = timedelta(days=_STORE_HEAD_GAP_DAYS)
+        if stored.empty or stored.index[0].date() > start_date + head_gap:
+            # 앞 구간이 적재되지 않음 → 전체 기간 조회
+            return self._refetch_price_history(store, company_id, stock_code, start, end)
+
+        # 오늘 시세는 장중에 바뀌므로 저장돼 있어도 다시 조회
+        candidates = [stored.index[-1].date() + timedelta(days=1), date.today()]
+        # 시장 전체 스냅샷으로 적재된 원주가 행부터는 수정주가로 다시 조회하여 기준 통일
+        raw_dates = stored.index[~stored["adjusted"]]
+        if len(raw_dates):
+            candidates.append(raw_dates[0].date())
+        missing_day = self._first_missing_trading_day(stored)
+        if missing_day is not None:
+            candidates.append(missing_day)
+        unverified = min(candidates)
+
+        stored = stored[stored.index < pd.Timestamp(unverified)].drop(columns="adjusted")
+        if stored.empty:
+            return self._refetch_price_history(store, company_id, stock_code, start, end)
+
+        # 확인된 마지막 저장일을 겹쳐 조회 (수정주가 기준 확인)
+        overlap_day = stored.index[-1]
+        fetch_start = overlap_day.strftime("%Y%m%d")
+        fetched = self._fetch_price_history(stock_code, fetch_start, end)
+        if fetched is None or fetched.empty:
+            logger.warning(f"주가 KRX 조회 실패, 저장된 구간만 반환: {stock_code}")
+            return stored
+
+        stored_close = stored.at[overlap_day, "close"]
+        fetched_close = (
+            fetched.at[overlap_day, "close"] if overlap_day in fetched.index else stored_close
+        )
+        if fetched_close != stored_close:
+            logger.warning(
+                f"수정주가 변경 감지 ({stock_code} {overlap_day.date()} 종가 "
+                f"{stored_close} → {fetched_close}), 전체 재적재"
+            )
+            return self._refetch_stored_range(store, company_id, stock_code, start_date, end_date)
+
+        store.upsert(company_id, fetched)
+        stored = pd.concat([stored[stored.index < fetched.index[0]], fetched])
+
+        logger.info(
+            f"주가 DB 조회: {stock_code} {len(stored)} 일 "
+            f"(KRX 조회 {fetch_start}~{end})"
+        )
+        return stored
+
+    def _refetch_price_history(
+        self,
+        store: StockPriceStore,
+        company_id: int,
+        stock_code: str,
+        start: str,
+        end: str
+    ) -> pd.DataFrame | None:
+        """전체 기간을 KRX에서 수정주가로 받아 저장"""
+        fetched = self._fetch_price_history(stock_code, start, end)
+        if fetched is None or fetched.empty:
+            return None
+
+        store.upsert(company_id, fetched)
+        logger.info(f"주가 KRX 전체 조회: {stock_code} {len(fetched)} 일 ({start}~{end})")
+        return fetched
+
+    def _refetch_stored_range(
+        self,
+        store: StockPriceStore,
+        company_id: int,
+        stock_code: str,
+        start_date: date,
+        end_date: date
+    ) -> pd.DataFrame | None:
+        """
+        수정주가 기준이 바뀐 종목의 저장 기간 전체를 다시 받아 덮어쓰고 요청 구간만 반환
+
+        요청 구간 밖에 저장된 행도 새 기준으로 덮어써야 이후 조회에서 기준이 섞이지 않습니다.
+        """
+        stored_range = store.get_trade_date_range(company_id)
+        if stored_range is not None:
+            fetch_start = min(stored_range[0], start_date)
+            fetch_end = max(stored_range[1], end_date)
+        else:
+            fetch_start, fetch_end = start_date, end_date
+
+        fetched = self._refetch_price_history(
+            store, company_id, stock_code,
+            fetch_start.strftime("%Y%m%d"), fetch_end.strftime("%Y%m%d")
+        )
+        if fetched is None:
+            return None
+
+        return fetched[
+            (fetched.index >= pd.Timestamp(start_date))
+            & (fetched.index <= pd.Timestamp(end_date))
+        ]
+
+    def get_price_history(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str
+    ) -> pd.DataFrame | None:
+        """
+        기간 주가 조회 (OHLCV + 시가총액 결합)
+
+        read-through 모드에서는 stock_prices 테이블에 저장된 구간을 DB에서 읽고
+        나머지 구간만 KRX에서 조회하여 저장합니다. DB 오류 시 KRX에서 직접 조회합니다.
+
+        Args:
+            stock_code: 종목코드
+            start_date: 시작일 (YYYYMMDD 또는 YYYY-MM-DD)
+            end_date: 종료일 (YYYYMMDD 또는 YYYY-MM-DD)
+
+        Returns:
+            주가 DataFrame (인덱스: 날짜) 또는 실패 시 None
+            컬럼: open, high, low, close, volume, market_cap, shares_outstanding
+        """
+        start = start_date.replace("-", "")
+        end = end_date.replace("-", "")
+
+        if self.read_through:
+            try:
+                return self._read_through_price_history(stock_code, start, end)
+            except Exception as e:
+                logger.warning(f"주가 DB 조회 실패, KRX 직접 조회: {stock_code} - {e}")
+
+        return self._fetch_price_history(stock_code, start, end)
+
     def get_recent_price(self, stock_code: str, days: int = 30) -> pd.DataFrame | None:
         """
         최근 N일간 주가 데이터 조회
@@ -193,22 +363,11 @@ class StockClient:
 
             logger.info(f"최근 {days}일 주가 조회: {stock_code}")
 
-            # OHLCV와 시가총액 동시 조회
-            ohlcv_df = self.get_ohlcv(stock_code, start_str, end_str)
-            cap_df = self.get_market_cap(stock_code, start_str, end_str)
+            merged = self.get_price_history(stock_code, start_str, end_str)
 
-            if ohlcv_df is None or cap_df is None:
+            if merged is None:
                 return None
 
-            # 두 DataFrame 병합
-            merged = pd.merge(
-                ohlcv_df,
-                cap_df[["market_cap", "shares_outstanding"]],
-                left_index=True,
-                right_index=True,
-                how="inner"
-            )
-
             # 최근 N일만 반환
             result = merged.tail(days)
 
@@ -219,6 +378,80 @@ class StockClient:
             logger.error(f"최근 주가 조회 실패: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _merge_market_snapshot(
+        ohlcv_df: pd.DataFrame,
+        cap_df: pd.DataFrame | None,
+        fundamental_df: pd.DataFrame | None
+    ) -> pd.DataFrame:
+        """시장 전체 OHLCV·시가총액·지표 DataFrame을 종목코드 기준으로 결합"""
+        df = ohlcv_df.rename(columns={
+            "시가": "open", "고가": "high", "저가": "low", "종가": "close", "거래량": "volume",
+        })[["open", "high", "low", "close", "volume"]]
+
+        if cap_df is not None and not cap_df.empty:
+            cap = cap_df.rename(
+                columns={"시가총액": "market_cap", "상장주식수": "shares_outstanding"}
+            )
+            df = df.join(cap[["market_cap", "shares_outstanding"]], how="left")
+
+        if fundamental_df is not None and not fundamental_df.empty:
+            fundamental = fundamental_df.rename(columns={
+                "PER": "per", "PBR": "pbr", "EPS": "eps", "BPS": "bps", "DIV": "dividend_yield",
+            })
+            df = df.join(fundamental[["per", "pbr", "eps", "bps", "dividend_yield"]], how="left")
+
+        df.index.name = "stock_code"
+        return df
+
+    def get_market_snapshot(self, date: str) -> pd.DataFrame | None:
+        """
+        특정 거래일의 KOSPI+KOSDAQ 전 종목 주가·시가총액·지표 조회
+
+        종목별 기간 조회 대신 시장 전체 조회 API 3건으로 하루치 데이터를 가져옵니다.
+        가격은 당일 원주가(수정주가 아님)이므로 저장 시 adjusted=False로 기록합니다.
+
+        Args:
+            date: 거래일 (YYYYMMDD 또는 YYYY-MM-DD)
+
+        Returns:
+            DataFrame (인덱스: 종목코드) 또는 휴장일이면 None
+            컬럼: open, high, low, close, volume, market_cap, shares_outstanding,
+                  per, pbr, eps, bps, dividend_yield
+
+        Raises:
+            RuntimeError: 거래일인데 시가총액·지표 응답이 비어 있을 때
+            Exception: KRX 조회 실패 (휴장일과 구분하여 적재 작업이 다시 시도하도록 전파)
+        """
+        date_str = date.replace("-", "")
+        logger.info(f"시장 전체 스냅샷 조회: {date_str}")
+
+        ohlcv_df = stock.get_market_ohlcv_by_ticker(date_str, market="ALL")
+        is_trading_day = (
+            ohlcv_df is not None and not ohlcv_df.empty and ohlcv_df["거래량"].any()
+        )
+
+        # 시장 전체 거래 여부 = 거래일 여부 (오늘은 장중일 수 있어 캘린더에 반영하지 않음)
+        if date_str < datetime.now().strftime("%Y%m%d"):
+            trading_days = [date_str] if is_trading_day else []
+            get_trading_calendar().learn(trading_days, date_str, date_str)
+
+        if not is_trading_day:
+            logger.info(f"거래 데이터 없음 (휴장일): {date_str}")
+            return None
+
+        # pykrx는 조회 오류 시 빈 DataFrame을 반환하므로 거래일의 빈 응답은 실패로 처리
+        cap_df = stock.get_market_cap_by_ticker(date_str, market="ALL")
+        if cap_df is None or cap_df.empty:
+            raise RuntimeError(f"시장 전체 시가총액 응답 없음: {date_str}")
+        fundamental_df = stock.get_market_fundamental_by_ticker(date_str, market="ALL")
+        if fundamental_df is None or fundamental_df.empty:
+            raise RuntimeError(f"시장 전체 지표 응답 없음: {date_str}")
+
+        df = self._merge_market_snapshot(ohlcv_df, cap_df, fundamental_df)
+        logger.info(f"시장 전체 스냅샷 조회 성공: {date_str} {len(df)}개 종목")
+        return df
+
     def get_fundamentals_range(
         self,
         stock_code: str,
@@ -304,6 +537,42 @@ class StockClient:
             logger.error(f"펀더멘털 데이터 조회 실패: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _compute_change_rates(df: pd.DataFrame) -> dict[str, float]:
+        """종가 데이터로 기간별 수익률 계산 (데이터가 부족한 기간은 제외)"""
+        current_price = df["close"].iloc[-1]
+
+        periods = {
+            "1m": 20,   # 약 1개월
+            "3m": 60,   # 약 3개월
+            "6m": 120,  # 약 6개월
+            "1y": 252,  # 약 1년
+        }
+
+        result = {}
+        for period_name, period_days in periods.items():
+            if len(df) >= period_days:
+                past_price = df["close"].iloc[-period_days]
+                change_rate = ((current_price - past_price) / past_price) * 100
+                result[period_name] = round(change_rate, 2)
+        return result
+
+    @staticmethod
+    def _compute_52week_high_low(df: pd.DataFrame) -> dict[str, Any]:
+        """최근 252거래일 데이터로 52주 최고가/최저가 및 현재가 위치 계산"""
+        df = df.tail(252)
+        current_price = df["close"].iloc[-1]
+        week_52_high = df["high"].max()
+        week_52_low = df["low"].min()
+
+        return {
+            "current_price": int(current_price),
+            "week_52_high": int(week_52_high),
+            "week_52_low": int(week_52_low),
+            "high_ratio": round((current_price / week_52_high) * 100, 2),  # 52주 최고가 대비 %
+            "low_ratio": round((current_price / week_52_low) * 100, 2),    # 52주 최저가 대비 %
+        }
+
     def get_price_change_rate(self, stock_code: str, days: int = 252) -> dict[str, float] | None:
         """
         수익률 계산 (1개월, 3개월, 6개월, 1년)
@@ -322,24 +591,7 @@ class StockClient:
                 logger.warning(f"수익률 계산을 위한 데이터가 부족합니다: {stock_code}")
                 return None
 
-            current_price = df["close"].iloc[-1]
-
-            # 기간별 수익률 계산
-            result = {}
-
-            periods = {
-                "1m": 20,   # 약 1개월
-                "3m": 60,   # 약 3개월
-                "6m": 120,  # 약 6개월
-                "1y": 252,  # 약 1년
-            }
-
-            for period_name, period_days in periods.items():
-                if len(df) >= period_days:
-                    past_price = df["close"].iloc[-period_days]
-                    change_rate = ((current_price - past_price) / past_price) * 100
-                    result[period_name] = round(change_rate, 2)
-
+            result = self._compute_change_rates(df)
             logger.info(f"수익률 계산 완료: {result}")
             return result
 
@@ -363,25 +615,82 @@ class StockClient:
             if df is None or df.empty:
                 return None
 
-            current_price = df["close"].iloc[-1]
-            week_52_high = df["high"].max()
-            week_52_low = df["low"].min()
+            result = self._compute_52week_high_low(df)
+            logger.info(f"52주 최고가/최저가 조회 완료: {result}")
+            return result
+
+        except Exception as e:
+            logger.error(f"52주 최고가/최저가 조회 실패: {e}", exc_info=True)
+            return None
+
+    def get_price_snapshot(self, stock_code: str, days: int = 252) -> dict[str, Any] | None:
+        """
+        주가 요약 (현재가·평균·최고/최저·시가총액·수익률·52주 범위)
+
+        get_recent_price를 한 번만 호출하고 같은 데이터로 모든 지표를 계산합니다.
+        (get_price_change_rate, get_52week_high_low를 따로 부르면 매번 다시 조회함)
+
+        Args:
+            stock_code: 종목코드
+            days: 통계·수익률 기간 (기본값: 252일 = 약 1년)
+
+        Returns:
+            {
+                "days", "current_price", "avg_price", "high", "low", "market_cap",
+                "change_rates": dict | None, "week_52": dict
+            }
+            또는 실패 시 None
+        """
+        try:
+            # 52주 범위도 같은 데이터에서 계산하도록 최소 252일 조회
+            df = self.get_recent_price(stock_code, days=max(days, 252))
 
-            # 현재가의 52주 최고가/최저가 대비 위치 (%)
-            high_ratio = (current_price / week_52_high) * 100
-            low_ratio = (current_price / week_52_low) * 100
+            if df is None or df.empty:
+                return None
 
+            period_df = df.tail(days)
             result = {
-                "current_price": int(current_price),
-                "week_52_high": int(week_52_high),
-                "week_52_low": int(week_52_low),
-                "high_ratio": round(high_ratio, 2),  # 52주 최고가 대비 %
-                "low_ratio": round(low_ratio, 2),    # 52주 최저가 대비 %
+                "days": days,
+                "current_price": int(period_df["close"].iloc[-1]),
+                "avg_price": int(period_df["close"].mean()),
+                "high": int(period_df["high"].max()),
+                "low": int(period_df["low"].min()),
+                "market_cap": float(period_df["market_cap"].iloc[-1]),
+                "change_rates": (
+                    self._compute_change_rates(period_df) if len(period_df) >= 20 else None
+                ),
+                "week_52": self._compute_52week_high_low(df),
             }
 
-            logger.info(f"52주 최고가/최저가 조회 완료: {result}")
+            logger.info(f"주가 요약 완료: {stock_code} ({len(period_df)} 일)")
             return result
 
         except Exception as e:
-            logger.error(f"52주 최고가/최저가 조회 실패: {e}", exc_info=True)
+            logger.error(f"주가 요약 실패: {e}", exc_info=True)
             return None
+
+
+class AsyncStockClient:
+    """
+    StockClient의 asyncio 래퍼
+
+    모든 조회 메서드를 KRX 워커 풀에서 실행하는 코루틴으로 노출하여,
+    이벤트 루프를 막지 않고 여러 종목을 동시에 조회할 수 있습니다.
+
+    Usage:
+        client = AsyncStockClient()
+        frames = await asyncio.gather(*(client.get_recent_price(code) for code in codes))
+    """
+
+    def __init__(self, client: StockClient | None = None):
+        self._client = client or StockClient()
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+        if not callable(method):
+            return method
+
+        async def _call(*args, **kwargs):
+            return await run_krx(method, *args, **kwargs)
+
+        return _call
@@ -0,0 +1,271 @@
+"""
+일별 주가 로컬 저장소 (stock_prices 테이블)
+
+KRX에서 받은 OHLCV + 시가총액을 회사·거래일 단위로 저장하고,
+StockClient의 read-through 모드와 일별 주가 적재 작업에서 사용합니다.
+
+DataFrame 형식은 StockClient.get_recent_price와 같습니다.
+(인덱스: 거래일, 컬럼: open, high, low, close, volume, market_cap, shares_outstanding)
+
+행마다 가격 기준(adjusted)을 기록합니다. 종목별 조회(get_ohlcv)는 수정주가, 시장 전체
+스냅샷은 당일 원주가이므로, 이후 액면분할·배당 등으로 수정주가가 바뀌면 두 기준이 섞일 수 있습니다.
+load()는 이 기준을 adjusted 컬럼으로 함께 반환합니다.
+"""
+import logging
+import threading
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.db.models import Company, StockPrice
+from app.db.session import get_sync_session
+
+logger = logging.getLogger(__name__)
+
+# DataFrame 컬럼 → stock_prices 컬럼
+PRICE_COLUMNS = {
+    "open": "open_price",
+    "high": "high_price",
+    "low": "low_price",
+    "close": "close_price",
+    "volume": "volume",
+    "market_cap": "market_cap",
+    "shares_outstanding": "shares_outstanding",
+}
+
+# 시장 전체 스냅샷에만 있는 일별 지표 (DataFrame 컬럼 = stock_prices 컬럼)
+FUNDAMENTAL_COLUMNS = ("per", "pbr", "eps", "bps", "dividend_yield")
+
+# 한 번의 INSERT에 담을 최대 행 수 (PostgreSQL 바인드 파라미터 한도 65535 이내)
+_UPSERT_CHUNK_ROWS = 4000
+
+
+def _to_int(value) -> int | None:
+    return None if pd.isna(value) else int(value)
+
+
+def _to_float(value) -> float | None:
+    return None if pd.isna(value) else float(value)
+
+
+class StockPriceStore:
+    """stock_prices 테이블 읽기/쓰기 (스레드 안전)"""
+
+    def __init__(self):
+        self._company_ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_company_id(self, stock_code: str) -> int | None:
+        """
+        종목코드 → Company.id (조회 결과는 메모리에 보관)
+
+        Returns:
+            Company.id 또는 등록되지 않은 종목이면 None
+        """
+        with self._lock:
+            if stock_code in self._company_ids:
+                return self._company_ids[stock_code]
+
+        with get_sync_session() as session:
+            company_id = session.execute(
+                select(Company.id).where(Company.stock_code == stock_code)
+            ).scalar_one_or_none()
+
+        if company_id is not None:
+            with self._lock:
+                self._company_ids[stock_code] = company_id
+        return company_id
+
+    def get_company_ids(self) -> dict[str, int]:
+        """
+        전체 종목코드 → Company.id
+
+        Returns:
+            {stock_code: company_id}
+        """
+        with get_sync_session() as session:
+            company_ids = dict(session.execute(select(Company.stock_code, Company.id)).all())
+
+        with self._lock:
+            self._company_ids.update(company_ids)
+        return company_ids
+
+    def get_trade_dates(self, start: date, end: date) -> set[date]:
+        """
+        기간 내 한 종목이라도 저장된 거래일
+
+        Args:
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+
+        Returns:
+            저장된 거래일 집합
+        """
+        with get_sync_session() as session:
+            rows = session.execute(
+                select(StockPrice.trade_date)
+                .where(StockPrice.trade_date >= start, StockPrice.trade_date <= end)
+                .distinct()
+            ).scalars()
+            return set(rows)
+
+    def get_last_trade_dates(self, company_ids: list[int]) -> dict[int, date]:
+        """
+        회사별 저장된 마지막 거래일
+
+        Returns:
+            {company_id: 마지막 거래일} (저장된 데이터가 없는 회사는 제외)
+        """
+        if not company_ids:
+            return {}
+
+        with get_sync_session() as session:
+            rows = session.execute(
+                select(StockPrice.company_id, func.max(StockPrice.trade_date))
+                .where(StockPrice.company_id.in_(company_ids))
+                .group_by(StockPrice.company_id)
+            )
+            return {company_id: last_date for company_id, last_date in rows}
+
+    def load(self, company_id: int, start: date, end: date) -> pd.DataFrame:
+        """
+        기간 주가 조회
+
+        Args:
+            company_id: Company.id
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+
+        Returns:
+            주가 DataFrame + adjusted 컬럼 (데이터가 없으면 빈 DataFrame)
+        """
+        columns = [getattr(StockPrice, column) for column in PRICE_COLUMNS.values()]
+        with get_sync_session() as session:
+            rows = session.execute(
+                select(StockPrice.trade_date, *columns, StockPrice.adjusted)
+                .where(
+                    StockPrice.company_id == company_id,
+                    StockPrice.trade_date >= start,
+                    StockPrice.trade_date <= end,
+                )
+                .order_by(StockPrice.trade_date)
+            ).all()
+
+        df = pd.DataFrame(rows, columns=["trade_date", *PRICE_COLUMNS, "adjusted"])
+        df.index = pd.DatetimeIndex(df.pop("trade_date"), name="날짜")
+        adjusted = df.pop("adjusted").astype(bool)
+        df = df.apply(pd.to_numeric)
+        df["adjusted"] = adjusted
+        return df
+
+    def get_trade_date_range(self, company_id: int) -> tuple[date, date] | None:
+        """
+        회사의 저장된 첫 거래일과 마지막 거래일
+
+        Returns:
+            (첫 거래일, 마지막 거래일) 또는 저장된 데이터가 없으면 None
+        """
+        with get_sync_session() as session:
+            first, last = session.execute(
+                select(func.min(StockPrice.trade_date), func.max(StockPrice.trade_date))
+                .where(StockPrice.company_id == company_id)
+            ).one()
+        return None if first is None else (first, last)
+
+    def upsert(self, company_id: int, df: pd.DataFrame) -> int:
+        """
+        수정주가 DataFrame 일괄 저장 (같은 거래일은 덮어씀)
+
+        Args:
+            company_id: Company.id
+            df: 수정주가 DataFrame (StockClient.get_ohlcv(adjust_price=True) 기준, 없는 컬럼은 NULL)
+
+        Returns:
+            저장한 행 수
+        """
+        if df is None or df.empty:
+            return 0
+
+        records = [
+            {
+                "company_id": company_id,
+                "trade_date": trade_date.date(),
+                **{
+                    column: _to_int(row.get(frame_column))
+                    for frame_column, column in PRICE_COLUMNS.items()
+                },
+                "adjusted": True,
+            }
+            for trade_date, row in df.iterrows()
+        ]
+        return self._upsert_records(records, [*PRICE_COLUMNS.values(), "adjusted"])
+
+    def upsert_snapshot(
+        self,
+        trade_date: date,
+        df: pd.DataFrame,
+        company_ids: dict[str, int]
+    ) -> int:
+        """
+        시장 전체 스냅샷을 회사별 행으로 나눠 일괄 저장 (원주가, adjusted=False)
+
+        Args:
+            trade_date: 거래일
+            df: 시장 스냅샷 DataFrame (인덱스: 종목코드, 주가 컬럼 + 지표 컬럼)
+            company_ids: {stock_code: company_id} (등록되지 않은 종목은 건너뜀)
+
+        Returns:
+            저장한 행 수
+        """
+        if df is None or df.empty:
+            return 0
+
+        records = [
+            {
+                "company_id": company_ids[stock_code],
+                "trade_date": trade_date,
+                **{
+                    column: _to_int(row.get(frame_column))
+                    for frame_column, column in PRICE_COLUMNS.items()
+                },
+                **{column: _to_float(row.get(column)) for column in FUNDAMENTAL_COLUMNS},
+                "adjusted": False,
+            }
+            for stock_code, row in df.iterrows()
+            if stock_code in company_ids
+        ]
+        return self._upsert_records(
+            records, [*PRICE_COLUMNS.values(), *FUNDAMENTAL_COLUMNS, "adjusted"]
+        )
+
+    def _upsert_records(self, records: list[dict], update_columns: list[str]) -> int:
+        """(company_id, trade_date) 기준 upsert (update_columns만 덮어씀)"""
+        if not records:
+            return 0
+
+        with get_sync_session() as session:
+            for offset in range(0, len(records), _UPSERT_CHUNK_ROWS):
+                stmt = pg_insert(StockPrice).values(records[offset:offset + _UPSERT_CHUNK_ROWS])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["company_id", "trade_date"],
+                    set_={column: stmt.excluded[column] for column in update_columns},
+                )
+                session.execute(stmt)
+
+        return len(records)
+
+
+# 전역 저장소 인스턴스 (싱글톤)
+_stock_price_store: StockPriceStore | None = None
+_stock_price_store_lock = threading.Lock()
+
+
+def get_stock_price_store() -> StockPriceStore:
+    """일별 주가 저장소 싱글톤 가져오기"""
+    global _stock_price_store
+    with _stock_price_store_lock:
+        if _stock_price_store is None:
+            _stock_price_store = StockPriceStore()
+        return _stock_price_store
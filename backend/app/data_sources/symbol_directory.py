@@ -0,0 +1,419 @@
+"""
+종목 심볼 디렉터리
+
+종목코드 ↔ 종목명 ↔ DART 기업코드 ↔ 시장 매핑을 프로세스 전역 메모리에 보관합니다.
+PublicDataClient(종목명 파라미터), DARTClient(기업코드 조회), /stocks/search가 함께 사용합니다.
+
+출처별로 목록을 따로 보관하고, 어느 출처가 갱신되면 전체 색인을 새로 만든 뒤
+참조 하나만 바꿔 끼웁니다(atomic swap). 조회는 락 없이 현재 색인을 읽습니다.
+
+- dart: DART 기업코드 목록 (상장사 전체, 시장 정보 없음)
+- krx: KRX 상장 종목 목록 (종목명·시장, 시장별 일괄 조회 1건씩)
+- companies: DB에 등록된 회사 (가장 우선)
+
+출처 목록은 로컬 JSON 파일에 저장하여 재시작 직후에도 바로 사용하고,
+오래된 출처는 기존 목록으로 응답하는 동안 백그라운드에서 다시 받습니다(stale-while-revalidate).
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+from sqlalchemy import select
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 출처 우선순위 (뒤쪽 출처의 값이 앞쪽을 덮어씀)
+SOURCES = ("dart", "krx", "companies")
+
+# 항목 필드
+FIELDS = ("stock_code", "company_name", "corp_code", "market")
+
+# 미등록 종목 조회 시 companies 재로드 최소 간격 (새로 등록된 회사 반영)
+_MISS_RELOAD_SECONDS = 60
+
+# KRX 상장 종목 조회 시장
+_KRX_MARKETS = ("KOSPI", "KOSDAQ")
+
+# 주기적 갱신 시 나이와 관계없이 매번 다시 읽는 출처 (DB 조회라 가벼움)
+_ALWAYS_REFRESH = ("companies",)
+
+
+def corp_code_entries(corp_codes: pd.DataFrame) -> list[dict]:
+    """
+    DART 기업코드 목록(DARTCorpRegistry.corp_codes) → 디렉터리 항목 (종목코드가 있는 상장사만)
+
+    같은 종목코드는 DARTCorpRegistry.get_corp_code와 같은 기업코드(첫 행)로 정합니다.
+
+    Args:
+        corp_codes: corp_code, corp_name, stock_code 컬럼을 가진 DataFrame
+
+    Returns:
+        [{"stock_code", "company_name", "corp_code", "market"}, ...]
+    """
+    stock_codes = corp_codes["stock_code"].fillna("").str.strip()
+    listed = corp_codes.assign(stock_code=stock_codes)[stock_codes != ""]
+    # 같은 종목코드가 여러 행이면 DARTCorpRegistry 조회와 같이 첫 행 우선
+    listed = listed.drop_duplicates(subset=["stock_code"], keep="first")
+    return [
+        {
+            "stock_code": row["stock_code"],
+            "company_name": row["corp_name"],
+            "corp_code": row["corp_code"],
+            "market": "",
+        }
+        for _, row in listed.iterrows()
+    ]
+
+
+def _load_companies() -> list[dict]:
+    """DB companies 테이블"""
+    from app.db.models import Company
+    from app.db.session import get_sync_session
+
+    with get_sync_session() as session:
+        rows = session.execute(
+            select(Company.stock_code, Company.company_name, Company.corp_code, Company.market)
+        ).all()
+    return [dict(zip(FIELDS, row)) for row in rows]
+
+
+def _load_dart_corp_codes() -> list[dict] | None:
+    """DART 기업코드 목록 (API 키 미설정 시 None)"""
+    if not settings.dart_api_key:
+        return None
+
+    from app.data_sources.dart_corp_registry import get_dart_corp_registry
+
+    return corp_code_entries(get_dart_corp_registry().corp_codes)
+
+
+def _load_krx_listing() -> list[dict]:
+    """
+    KRX 상장 종목 (시장별 종목코드·종목명 일괄 조회를 동시에 실행)
+
+    Raises:
+        ValueError: 한 시장이라도 목록이 비어 있을 때 (pykrx는 조회 오류 시 빈 DataFrame을
+            반환하므로, 일부 시장이 빠진 목록으로 기존 목록을 대체하지 않도록 실패 처리)
+    """
+    from pykrx import stock
+    from pykrx.website import krx
+
+    # stock_client 임포트는 pykrx Post.read 세션 패치를 적용합니다 (KRX WAF 우회).
+    import app.data_sources.stock_client  # noqa: F401
+    from app.data_sources.trading_calendar import get_trading_calendar
+
+    # 오늘 시세는 장 시작 전에 비어 있으므로 어제 이전 마지막 거래일 기준
+    trading_day = get_trading_calendar().last_trading_day(date.today() - timedelta(days=1))
+    base_date = (
+        trading_day.strftime("%Y%m%d") if trading_day
+        else stock.get_nearest_business_day_in_a_week()
+    )
+
+    with ThreadPoolExecutor(max_workers=len(_KRX_MARKETS)) as pool:
+        listings = list(pool.map(
+            lambda market: krx.get_market_ticker_and_name(base_date, market), _KRX_MARKETS
+        ))
+
+    empty_markets = [
+        market for market, names in zip(_KRX_MARKETS, listings) if names is None or len(names) == 0
+    ]
+    if empty_markets:
+        raise ValueError(
+            f"KRX 상장 종목 목록이 비어 있음: {', '.join(empty_markets)} ({base_date})"
+        )
+
+    return [
+        {"stock_code": code, "company_name": name, "corp_code": None, "market": market}
+        for market, names in zip(_KRX_MARKETS, listings)
+        for code, name in names.items()
+    ]
+
+
+class SymbolDirectory:
+    """종목 심볼 디렉터리 (스레드 안전)"""
+
+    def __init__(
+        self,
+        loaders: dict[str, Callable[[], list[dict] | None]] | None = None,
+        path: str | Path | None = None
+    ):
+        """
+        Args:
+            loaders: {출처: 목록 로더} (refresh 시 호출, None을 반환하면 해당 출처 건너뜀)
+                     기본값: companies(DB), krx(KRX 상장 종목), dart(DART 기업코드 목록)
+            path: 출처 목록 저장 파일 (None이면 메모리에만 보관)
+        """
+        self.loaders = loaders if loaders is not None else {
+            "companies": _load_companies,
+            "krx": _load_krx_listing,
+            "dart": _load_dart_corp_codes,
+        }
+        self.path = Path(path) if path else None
+
+        self._sources: dict[str, list[dict]] = {}
+        self._loaded_at: dict[str, datetime] = {}
+        self._index: dict = {"by_code": {}, "by_corp": {}, "listed": []}
+        self._loaded = False
+        self._miss_reloaded_at: float | None = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.RLock()
+
+        if self.path and self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        """저장 파일에서 출처 목록 복원 (오래된 목록이라도 우선 사용)"""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for source, saved in data["sources"].items():
+                if source not in SOURCES:
+                    continue
+                self._sources[source] = [dict(zip(FIELDS, row)) for row in saved["entries"]]
+                self._loaded_at[source] = datetime.fromisoformat(saved["loaded_at"])
+            self._index = self._build_index(self._sources)
+            self._loaded = bool(self._sources)
+            logger.info(f"심볼 디렉터리 로드: {self.path} ({len(self._index['by_code'])}개)")
+        except Exception as e:
+            logger.warning(f"심볼 디렉터리 파일 읽기 실패, 새로 구성: {self.path} - {e}")
+            self._sources, self._loaded_at = {}, {}
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+
+        with self._lock:
+            data = {
+                "sources": {
+                    source: {
+                        "loaded_at": self._loaded_at[source].isoformat(),
+                        "entries": [[entry[field] for field in FIELDS] for entry in entries],
+                    }
+                    for source, entries in self._sources.items()
+                }
+            }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"심볼 디렉터리 저장 실패: {e}")
+
+    def update_source(self, source: str, entries: list[dict], save: bool = True) -> None:
+        """
+        출처 목록 교체 후 색인 재구성
+
+        Args:
+            source: SOURCES 중 하나
+            entries: [{"stock_code", "company_name", "corp_code", "market"}, ...]
+            save: 저장 파일에 반영
+        """
+        if source not in SOURCES:
+            raise ValueError(f"알 수 없는 출처: {source}")
+
+        entries = [{field: entry.get(field) for field in FIELDS} for entry in entries]
+        with self._lock:
+            self._sources[source] = entries
+            self._loaded_at[source] = datetime.now()
+            self._index = self._build_index(self._sources)
+        if save:
+            self._save()
+
+    @staticmethod
+    def _build_index(sources: dict[str, list[dict]]) -> dict:
+        by_code: dict[str, dict] = {}
+        for source in SOURCES:
+            for entry in sources.get(source, []):
+                code = entry["stock_code"]
+                if not code:
+                    continue
+                merged = by_code.get(code) or {field: None for field in FIELDS}
+                by_code[code] = {
+                    **merged,
+                    **{field: value for field, value in entry.items() if value},
+                }
+
+        by_corp = {entry["corp_code"]: entry for entry in by_code.values() if entry["corp_code"]}
+
+        # 상장 종목 목록: KRX 목록이 있으면 그 순서, 없으면 전체
+        if "krx" in sources:
+            listed = [
+                by_code[entry["stock_code"]] for entry in sources["krx"] if entry["stock_code"]
+            ]
+        else:
+            listed = list(by_code.values())
+
+        return {"by_code": by_code, "by_corp": by_corp, "listed": listed}
+
+    def refresh(
+        self,
+        sources: list[str] | None = None,
+        max_age: timedelta | None = None
+    ) -> dict[str, int]:
+        """
+        로더로 출처 목록 다시 읽기 (실패한 출처는 이전 목록 유지)
+
+        갱신하는 동안에도 조회는 기존 색인으로 응답합니다.
+
+        Args:
+            sources: 갱신할 출처 (None이면 로더가 있는 전체)
+            max_age: 지정하면 마지막 갱신이 이보다 오래된 출처만 (companies는 항상)
+
+        Returns:
+            {출처: 항목 수} (갱신에 성공한 출처만)
+        """
+        counts = {}
+        with self._refresh_lock:
+            for source, loader in self.loaders.items():
+                if sources is not None and source not in sources:
+                    continue
+                loaded_at = self._loaded_at.get(source)
+                if (
+                    max_age is not None
+                    and source not in _ALWAYS_REFRESH
+                    and loaded_at is not None
+                    and datetime.now() - loaded_at < max_age
+                ):
+                    continue
+                try:
+                    entries = loader()
+                except Exception as e:
+                    logger.warning(f"심볼 디렉터리 {source} 로드 실패: {e}")
+                    continue
+                if entries is None:
+                    continue
+                self.update_source(source, entries, save=False)
+                counts[source] = len(entries)
+
+            with self._lock:
+                self._loaded = True
+            if counts:
+                self._save()
+
+        if counts:
+            logger.info(f"심볼 디렉터리 갱신: {counts} (전체 {len(self._index['by_code'])}개)")
+        return counts
+
+    def ensure_loaded(self) -> None:
+        """
+        한 번도 로드하지 않았으면 지금 로드
+
+        저장 파일이 있으면 즉시 반환합니다. 백그라운드 갱신이 첫 로드 중이면 끝날 때까지 기다립니다.
+        """
+        if self._loaded:
+            return
+        with self._refresh_lock:
+            if not self._loaded:
+                self.refresh()
+
+    def get(self, stock_code: str, load: bool = True) -> dict | None:
+        """
+        종목코드 → 항목
+
+        Args:
+            stock_code: 종목코드
+            load: 아직 로드하지 않았으면 로드 후 조회
+
+        Returns:
+            {"stock_code", "company_name", "corp_code", "market"} 또는 None
+        """
+        if load:
+            self.ensure_loaded()
+        return self._index["by_code"].get(stock_code)
+
+    def lookup(self, stock_code: str) -> dict | None:
+        """
+        종목코드 → 항목 (없으면 companies만 다시 읽고 재조회, 최소 간격 제한)
+
+        새로 등록된 회사를 다음 정기 갱신 전에도 찾기 위한 용도입니다.
+        """
+        entry = self.get(stock_code)
+        if entry is not None or "companies" not in self.loaders:
+            return entry
+
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._miss_reloaded_at is not None
+                and now - self._miss_reloaded_at < _MISS_RELOAD_SECONDS
+            ):
+                return None
+            self._miss_reloaded_at = now
+
+        self.refresh(["companies"])
+        return self.get(stock_code, load=False)
+
+    def get_name(self, stock_code: str) -> str | None:
+        """종목코드 → 종목명"""
+        entry = self.lookup(stock_code)
+        return entry["company_name"] if entry else None
+
+    def get_corp_code(self, stock_code: str, load: bool = True) -> str | None:
+        """종목코드 → DART 기업코드"""
+        entry = self.get(stock_code, load=load)
+        return entry["corp_code"] if entry else None
+
+    def get_by_corp_code(self, corp_code: str) -> dict | None:
+        """DART 기업코드 → 항목"""
+        self.ensure_loaded()
+        return self._index["by_corp"].get(corp_code)
+
+    def listed(self) -> list[dict]:
+        """상장 종목 목록 (KRX 목록 순서, 없으면 전체 항목)"""
+        self.ensure_loaded()
+        return self._index["listed"]
+
+    def loaded_at(self, source: str) -> datetime | None:
+        """출처 마지막 갱신 시각"""
+        return self._loaded_at.get(source)
+
+    def stats(self) -> dict:
+        """{"total", "sources": {출처: 항목 수}}"""
+        with self._lock:
+            return {
+                "total": len(self._index["by_code"]),
+                "sources": {source: len(entries) for source, entries in self._sources.items()},
+            }
+
+
+# 전역 디렉터리 인스턴스 (싱글톤)
+_symbol_directory: SymbolDirectory | None = None
+_symbol_directory_lock = threading.Lock()
+
+
+def get_symbol_directory() -> SymbolDirectory:
+    """종목 심볼 디렉터리 싱글톤 가져오기"""
+    global _symbol_directory
+    with _symbol_directory_lock:
+        if _symbol_directory is None:
+            _symbol_directory = SymbolDirectory(path=settings.symbol_directory_path)
+        return _symbol_directory
+
+
+async def run_symbol_directory_refresh() -> None:
+    """
+    심볼 디렉터리 주기적 갱신 (애플리케이션 시작 시 백그라운드 태스크로 실행)
+
+    시작 직후 한 번, 이후 settings.symbol_directory_refresh_minutes마다 실행합니다.
+    KRX·DART 목록은 settings.symbol_listing_ttl_hours보다 오래됐을 때만 다시 받고,
+    그동안 조회는 저장 파일에서 읽은 기존 목록으로 응답합니다.
+    """
+    directory = get_symbol_directory()
+    max_age = timedelta(hours=settings.symbol_listing_ttl_hours)
+    while True:
+        try:
+            await asyncio.to_thread(directory.refresh, None, max_age)
+        except Exception as e:
+            logger.error(f"심볼 디렉터리 갱신 실패: {e}", exc_info=True)
+        await asyncio.sleep(settings.symbol_directory_refresh_minutes * 60)
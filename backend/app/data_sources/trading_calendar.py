@@ -0,0 +1,265 @@
+"""
+KRX 거래일 캘린더
+
+"D 당일 또는 그 이전 마지막 거래일"을 이분 탐색(O(log n))으로 찾아,
+분기말·연말이 휴장일일 때 하루씩 당겨가며 API를 다시 호출하지 않도록 합니다.
+
+- 거래일 목록은 이미 조회한 가격 데이터의 날짜 인덱스(시장 전체 스냅샷,
+  KOSPI 지수 일별 시세)에서 만들고, 로컬 JSON 파일로 저장해 재시작 후에도 재사용합니다.
+- 캘린더는 연속된 확인 구간(coverage)만 신뢰하며, 구간 밖 날짜를 조회하면
+  모자란 구간의 KOSPI 지수 시세를 한 번 받아 확장합니다.
+"""
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 휴장일이 이어질 수 있는 최대 기간 (연휴 + 연말 휴장) — 조회 시 확인 구간 여유
+_LOOKBACK_DAYS = 30
+
+# 확장 조회 실패 후 재시도까지 대기 시간 (KRX 접속 불가 시 매 조회마다 재시도하지 않도록)
+_RETRY_AFTER_SECONDS = 600
+
+# KOSPI 지수 티커 (지수는 거래정지가 없으므로 거래일 판정에 사용)
+_KOSPI_INDEX_TICKER = "1001"
+
+
+def _fetch_kospi_trading_days(start: date, end: date) -> list[date]:
+    """KOSPI 지수 일별 시세의 날짜 인덱스 = 기간 내 거래일"""
+    from pykrx import stock
+
+    # stock_client 임포트는 pykrx Post.read 세션 패치를 적용합니다 (KRX WAF 우회).
+    import app.data_sources.stock_client  # noqa: F401
+
+    df = stock.get_index_ohlcv_by_date(
+        start.strftime("%Y%m%d"), end.strftime("%Y%m%d"), _KOSPI_INDEX_TICKER
+    )
+    if df is None:
+        raise ValueError("KOSPI 지수 시세 응답 없음")
+    return [ts.date() for ts in df.index]
+
+
+def _to_date(value: date | datetime | str) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value.replace("-", ""), "%Y%m%d").date()
+
+
+class TradingCalendar:
+    """KRX 거래일 캘린더 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        fetcher: Callable[[date, date], list[date]] = _fetch_kospi_trading_days
+    ):
+        """
+        Args:
+            path: 캘린더 저장 파일 (None이면 메모리에만 보관)
+            fetcher: (시작일, 종료일) → 기간 내 거래일 목록 (확인 구간 확장 시 호출)
+        """
+        self.path = Path(path) if path else None
+        self.fetcher = fetcher
+
+        self._days: list[date] = []  # 정렬된 거래일
+        self._coverage: tuple[date, date] | None = None  # 거래일 여부가 확인된 연속 구간
+        self._failed_at: float | None = None
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._days = sorted(date.fromisoformat(d) for d in data["days"])
+            start, end = data["coverage"]
+            self._coverage = (date.fromisoformat(start), date.fromisoformat(end))
+            logger.info(f"거래일 캘린더 로드: {start}~{end} ({len(self._days)}일)")
+        except Exception as e:
+            logger.warning(f"거래일 캘린더 파일 읽기 실패, 새로 구성: {self.path} - {e}")
+            self._days, self._coverage = [], None
+
+    def _save(self) -> None:
+        if not self.path or not self._coverage:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps({
+                "coverage": [self._coverage[0].isoformat(), self._coverage[1].isoformat()],
+                "days": [d.isoformat() for d in self._days],
+            }), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"거래일 캘린더 저장 실패: {e}")
+
+    def _merge(self, trading_days: Iterable[date], start: date, end: date) -> bool:
+        """확인 구간 [start, end]의 거래일 반영 (기존 구간과 이어질 때만, 락 보유 상태)"""
+        if self._coverage:
+            cov_start, cov_end = self._coverage
+            if start > cov_end + timedelta(days=1) or end < cov_start - timedelta(days=1):
+                return False  # 떨어진 구간은 중간 확인이 안 되므로 반영하지 않음
+            start, end = min(start, cov_start), max(end, cov_end)
+
+        days = set(self._days)
+        days.update(d for d in trading_days if start <= d <= end)
+        self._days = sorted(days)
+        self._coverage = (start, end)
+        return True
+
+    def learn(self, trading_days: Iterable[date | datetime], start, end) -> None:
+        """
+        이미 조회한 가격 데이터로 캘린더 보강
+
+        Args:
+            trading_days: [start, end] 구간의 거래일 전체 (예: 시장 전체 시세의 날짜 인덱스)
+            start: 구간 시작일
+            end: 구간 종료일
+        """
+        start, end = _to_date(start), _to_date(end)
+        with self._lock:
+            if self._merge((_to_date(d) for d in trading_days), start, end):
+                self._save()
+
+    def _ensure_coverage(self, start: date, end: date) -> None:
+        """[start, end]가 확인 구간에 포함되도록 모자란 구간 조회 (락 보유 상태)"""
+        # 오늘 시세는 장 시작 전에는 없으므로 어제까지만 확정
+        end = min(end, date.today() - timedelta(days=1))
+        if start > end:
+            return
+
+        if self._coverage:
+            cov_start, cov_end = self._coverage
+            gaps = []
+            if start < cov_start:
+                gaps.append((start, cov_start - timedelta(days=1)))
+            if end > cov_end:
+                gaps.append((cov_end + timedelta(days=1), end))
+        else:
+            gaps = [(start, end)]
+
+        for gap_start, gap_end in gaps:
+            self._merge(self.fetcher(gap_start, gap_end), gap_start, gap_end)
+            logger.info(f"거래일 캘린더 확장: {gap_start}~{gap_end}")
+
+        if gaps:
+            self._save()
+
+    def last_trading_day(self, day: date | datetime | str) -> date | None:
+        """
+        D 당일 또는 그 이전의 마지막 거래일
+
+        Args:
+            day: 기준일 (date 또는 YYYYMMDD / YYYY-MM-DD)
+
+        Returns:
+            거래일 또는 확인할 수 없으면 None (KRX 조회 실패 등)
+        """
+        day = _to_date(day)
+
+        with self._lock:
+            result = self._lookup(day)
+            if result is None and self._can_fetch():
+                # 확인 구간 밖이거나 구간 시작 이전에 거래일이 없으면 앞쪽 여유를 두고 확장
+                try:
+                    self._ensure_coverage(day - timedelta(days=_LOOKBACK_DAYS), day)
+                    self._failed_at = None
+                except Exception as e:
+                    self._failed_at = time.monotonic()
+                    logger.warning(f"거래일 캘린더 확장 실패: {day} - {e}")
+                result = self._lookup(day)
+            return result
+
+    def _can_fetch(self) -> bool:
+        """최근 확장 조회가 실패했으면 잠시 KRX 조회를 쉼 (락 보유 상태)"""
+        return (
+            self._failed_at is None
+            or time.monotonic() - self._failed_at >= _RETRY_AFTER_SECONDS
+        )
+
+    def _lookup(self, day: date) -> date | None:
+        """확인 구간 안에서 이분 탐색 (락 보유 상태)"""
+        if not self._coverage:
+            return None
+
+        cov_start, cov_end = self._coverage
+        if not cov_start <= day <= cov_end:
+            return None
+
+        index = bisect.bisect_right(self._days, day)
+        if index == 0:
+            return None
+        return self._days[index - 1]
+
+    def trading_days(
+        self,
+        start: date | datetime | str,
+        end: date | datetime | str
+    ) -> list[date] | None:
+        """
+        기간 내 거래일 목록
+
+        Args:
+            start: 시작일 (포함)
+            end: 종료일 (포함, 어제까지만 확정)
+
+        Returns:
+            거래일 목록 또는 확인할 수 없으면 None (KRX 조회 실패 등)
+        """
+        start, end = _to_date(start), _to_date(end)
+
+        with self._lock:
+            if self._can_fetch():
+                try:
+                    self._ensure_coverage(start, end)
+                    self._failed_at = None
+                except Exception as e:
+                    self._failed_at = time.monotonic()
+                    logger.warning(f"거래일 캘린더 확장 실패: {start}~{end} - {e}")
+
+            if not self._coverage or start < self._coverage[0] or end > self._coverage[1]:
+                return None
+
+            lo = bisect.bisect_left(self._days, start)
+            hi = bisect.bisect_right(self._days, end)
+            return self._days[lo:hi]
+
+    def is_trading_day(self, day: date | datetime | str) -> bool | None:
+        """
+        거래일 여부
+
+        Returns:
+            True/False 또는 확인할 수 없으면 None
+        """
+        day = _to_date(day)
+        last = self.last_trading_day(day)
+        if last is None:
+            return None
+        return last == day
+
+
+# 전역 캘린더 인스턴스 (싱글톤)
+_trading_calendar: TradingCalendar | None = None
+_trading_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """KRX 거래일 캘린더 싱글톤 가져오기"""
+    global _trading_calendar
+    with _trading_calendar_lock:
+        if _trading_calendar is None:
+            _trading_calendar = TradingCalendar(settings.trading_calendar_path)
+        return _trading_calendar
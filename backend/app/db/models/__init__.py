@@ -1,7 +1,11 @@
 from app.db.models.analysis_run import AnalysisRun
+from app.db.models.api_daily_usage import ApiDailyUsage
 from app.db.models.company import Company
+from app.db.models.dart_document import DartDocument
 from app.db.models.financial import FinancialStatement
+from app.db.models.market_cap_point import MarketCapPoint
 from app.db.models.news import NewsArticle
+from app.db.models.refresh_checkpoint import RefreshCheckpoint
 from app.db.models.report import AnalysisReport
 from app.db.models.stock_price import StockPrice
 from app.db.models.valuation import ValuationMetric
@@ -16,4 +20,8 @@ __all__ = [
     "ValuationMetric",
     "AnalysisReport",
     "Watchlist",
+    "RefreshCheckpoint",
+    "DartDocument",
+    "MarketCapPoint",
+    "ApiDailyUsage",
 ]
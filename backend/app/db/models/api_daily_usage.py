@@ -0,0 +1,21 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class ApiDailyUsage(Base):
+    __tablename__ = "api_daily_usage"
+    __table_args__ = (
+        UniqueConstraint("quota_key", "usage_date", name="uq_api_daily_usage_key_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    quota_key: Mapped[str] = mapped_column(String(64), nullable=False)  # 예: dart:<API 키 해시>
+    usage_date: Mapped[date] = mapped_column(Date, nullable=False)  # 한도 기준일 (한국 시간)
+    used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
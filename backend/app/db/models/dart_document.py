@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class DartDocument(Base):
+    __tablename__ = "dart_documents"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    rcept_no: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
+    corp_code: Mapped[str] = mapped_column(String(8), nullable=False, index=True)
+    fiscal_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    report_type: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="annual"
+    )  # annual
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    raw_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    compressed_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class MarketCapPoint(Base):
+    __tablename__ = "market_cap_points"
+    __table_args__ = (
+        UniqueConstraint("stock_code", "base_date", name="uq_market_cap_point_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    stock_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    base_date: Mapped[str] = mapped_column(String(8), nullable=False)  # YYYYMMDD (API basDt)
+    status: Mapped[str] = mapped_column(String(10), nullable=False)  # ok|missing
+    market_cap: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    close_price: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    listed_shares: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
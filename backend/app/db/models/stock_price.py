@@ -1,6 +1,17 @@
 from datetime import date, datetime
 
-from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+    false,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
@@ -14,13 +25,24 @@ class StockPrice(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     company_id: Mapped[int] = mapped_column(Integer, ForeignKey("companies.id"), nullable=False)
-    trade_date: Mapped[date] = mapped_column(Date, nullable=False)
+    trade_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     open_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     high_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     low_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     close_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     volume: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     market_cap: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    shares_outstanding: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # 가격 기준: True = 수정주가(종목별 조회), False = 당일 원주가(시장 전체 스냅샷)
+    adjusted: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=false())
+
+    # Fundamentals (KRX 일별 지표, 시장 전체 스냅샷 적재 시에만 채워짐)
+    per: Mapped[float | None] = mapped_column(Float, nullable=True)
+    pbr: Mapped[float | None] = mapped_column(Float, nullable=True)
+    eps: Mapped[float | None] = mapped_column(Float, nullable=True)
+    bps: Mapped[float | None] = mapped_column(Float, nullable=True)
+    dividend_yield: Mapped[float | None] = mapped_column(Float, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
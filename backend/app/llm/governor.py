@@ -0,0 +1,313 @@
+"""
+LLM 호출 속도 제한 (모델별 토큰 버킷)
+
+분석 파이프라인의 스레드(동기 그래프)와 태스크(비동기 그래프)가 같은 LLM 한도를 나눠 쓰므로,
+모델별로 분당 요청 수(RPM)와 분당 토큰 수(TPM) 버킷을 두고 호출 전에 자리를 예약합니다.
+
+- 예약은 락 안에서 도착 순서대로 처리되고, 버킷이 비면 앞선 예약이 모두 처리될 시점까지
+  기다립니다 (선착순, 기아 없음). 동기 호출은 time.sleep, 비동기 호출은 asyncio.sleep으로
+  대기합니다.
+- 토큰은 (입력 토큰 추정치 + max_tokens)로 예약하고, 응답의 실제 사용량으로 정산합니다.
+- 429(RateLimitError)를 받으면 Retry-After 동안 해당 모델의 새 호출을 모두 멈추고,
+  호출한 쪽은 지터를 더한 지수 백오프 후 재시도합니다.
+- stats()로 모델별 대기 중인 호출 수, 대기 시간, 429 횟수를 확인할 수 있습니다.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_prompt_tokens(model: str, messages: list[dict]) -> int:
+    """입력 토큰 수 추정 (litellm 토크나이저, 실패 시 글자 수 기준)"""
+    try:
+        from litellm import token_counter
+
+        return token_counter(model=model, messages=messages)
+    except Exception:
+        return sum(len(str(message.get("content", ""))) for message in messages) // 2 + 1
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """RateLimitError 응답 헤더의 Retry-After(초) 또는 retry-after-ms"""
+    headers = getattr(error, "headers", None) or {}
+    response = getattr(error, "response", None)
+    if not headers and response is not None:
+        headers = getattr(response, "headers", None) or {}
+
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return float(value) / 1000
+        value = headers.get("retry-after")
+        if value is not None:
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class ModelRateLimiter:
+    """모델 하나의 RPM·TPM 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, model: str, rpm: int, tpm: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            model: 모델 이름
+            rpm: 분당 요청 수 한도
+            tpm: 분당 토큰 수 한도 (입력 + 출력)
+            clock: 단조 시계 (테스트에서 교체)
+        """
+        self.model = model
+        self.rpm = rpm
+        self.tpm = tpm
+        self.clock = clock
+
+        # 버킷 잔량 (예약이 몰리면 음수 = 앞선 예약의 대기열)
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._requests_total = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._rate_limited = 0
+
+    def reserve(self, tokens: int) -> float:
+        """
+        요청 1건과 토큰 예약
+
+        Args:
+            tokens: 예약할 토큰 수 (한도보다 크면 한도로 제한)
+
+        Returns:
+            호출 전 기다려야 할 시간 (초)
+        """
+        with self._lock:
+            now = self._refill()
+            self._requests -= 1
+            self._tokens -= min(tokens, self.tpm)
+            self._requests_total += 1
+
+            wait = max(
+                -self._requests / (self.rpm / 60) if self._requests < 0 else 0.0,
+                -self._tokens / (self.tpm / 60) if self._tokens < 0 else 0.0,
+                self._blocked_until - now,
+            )
+            return max(wait, 0.0)
+
+    def settle(self, reserved: int, actual: int) -> None:
+        """예약한 토큰과 실제 사용량의 차이 정산 (남으면 반환, 넘으면 추가 차감)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self.tpm), self._tokens + min(reserved, self.tpm) - actual)
+
+    def penalize(self, seconds: float) -> None:
+        """429 응답: seconds 동안 새 호출 중지"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self.clock() + seconds)
+            self._rate_limited += 1
+
+    def blocked_for(self) -> float:
+        """남은 호출 중지 시간 (초)"""
+        with self._lock:
+            return max(self._blocked_until - self.clock(), 0.0)
+
+    def wait_started(self) -> None:
+        with self._lock:
+            self._waiting += 1
+
+    def wait_finished(self, seconds: float) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self._waits += 1
+            self._wait_seconds += seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {"rpm", "tpm", "queue_depth", "requests", "waits", "avg_wait_seconds",
+             "max_wait_seconds", "rate_limited", "blocked_for_seconds"}
+        """
+        with self._lock:
+            self._refill()
+            avg_wait = self._wait_seconds / self._waits if self._waits else 0.0
+            return {
+                "rpm": self.rpm,
+                "tpm": self.tpm,
+                "queue_depth": self._waiting,
+                "requests": self._requests_total,
+                "waits": self._waits,
+                "avg_wait_seconds": round(avg_wait, 3),
+                "max_wait_seconds": round(self._max_wait_seconds, 3),
+                "rate_limited": self._rate_limited,
+                "blocked_for_seconds": round(max(self._blocked_until - self.clock(), 0.0), 3),
+            }
+
+    def _refill(self) -> float:
+        """경과 시간만큼 버킷 충전 (락 보유 상태), 현재 시각 반환"""
+        now = self.clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60)
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60)
+            self._updated = now
+        return now
+
+
+class LLMGovernor:
+    """모델별 속도 제한기 모음 및 대기·백오프"""
+
+    def __init__(
+        self,
+        limits: dict[str, dict[str, int]] | None = None,
+        default_rpm: int = 500,
+        default_tpm: int = 200_000,
+        backoff_seconds: float = 2.0,
+        max_backoff_seconds: float = 60.0
+    ):
+        """
+        Args:
+            limits: 모델별 한도 {"gpt-4o": {"rpm": 500, "tpm": 30000}, ...}
+            default_rpm: limits에 없는 모델의 RPM
+            default_tpm: limits에 없는 모델의 TPM
+            backoff_seconds: 429 재시도 첫 대기 (Retry-After가 없을 때, 회차마다 2배)
+            max_backoff_seconds: 재시도 대기 상한
+        """
+        self.limits = limits or {}
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self._limiters: dict[str, ModelRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, model: str) -> ModelRateLimiter:
+        with self._lock:
+            limiter = self._limiters.get(model)
+            if limiter is None:
+                limit = self.limits.get(model, {})
+                limiter = ModelRateLimiter(
+                    model,
+                    rpm=limit.get("rpm", self.default_rpm),
+                    tpm=limit.get("tpm", self.default_tpm),
+                )
+                self._limiters[model] = limiter
+            return limiter
+
+    def acquire(self, model: str, tokens: int) -> float:
+        """
+        호출 자리 예약 후 차례가 올 때까지 대기 (동기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        limiter = self.limiter(model)
+        wait = limiter.reserve(tokens)
+        if wait <= 0:
+            return 0.0
+
+        started = time.monotonic()
+        limiter.wait_started()
+        try:
+            while wait > 0:
+                time.sleep(wait)
+                # 대기 중 429로 호출이 중지됐으면 중지가 풀릴 때까지 더 기다림
+                wait = limiter.blocked_for()
+        finally:
+            waited = time.monotonic() - started
+            limiter.wait_finished(waited)
+        return waited
+
+    async def aacquire(self, model: str, tokens: int) -> float:
+        """
+        호출 자리 예약 후 차례가 올 때까지 대기 (비동기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        limiter = self.limiter(model)
+        wait = limiter.reserve(tokens)
+        if wait <= 0:
+            return 0.0
+
+        started = time.monotonic()
+        limiter.wait_started()
+        try:
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = limiter.blocked_for()
+        finally:
+            waited = time.monotonic() - started
+            limiter.wait_finished(waited)
+        return waited
+
+    def settle(self, model: str, reserved: int, actual: int) -> None:
+        self.limiter(model).settle(reserved, actual)
+
+    def rate_limited(self, model: str, error: Any, attempt: int) -> float:
+        """
+        429 응답 처리: 모델 호출 중지 기록 후 재시도 대기 시간 계산
+
+        Args:
+            model: 모델 이름
+            error: RateLimitError (Retry-After 헤더 확인)
+            attempt: 재시도 회차 (0부터)
+
+        Returns:
+            재시도 전 대기 시간 (초, Retry-After 또는 지수 백오프 + 지터)
+        """
+        retry_after = retry_after_seconds(error)
+        base = retry_after if retry_after is not None else self.backoff_seconds * (2 ** attempt)
+        base = min(base, self.max_backoff_seconds)
+        # 여러 호출이 같은 순간에 다시 몰리지 않도록 지터 추가
+        delay = base + random.uniform(0, base * 0.25)
+
+        self.limiter(model).penalize(base)
+        return delay
+
+    def stats(self) -> dict[str, dict]:
+        """모델별 속도 제한 통계"""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.model: limiter.stats() for limiter in limiters}
+
+
+# 전역 인스턴스 (싱글톤)
+_governor: LLMGovernor | None = None
+_governor_lock = threading.Lock()
+
+
+def get_llm_governor() -> LLMGovernor | None:
+    """
+    LLM 속도 제한기 싱글톤 가져오기
+
+    Returns:
+        LLMGovernor 또는 None (settings.llm_governor_enabled=False)
+    """
+    global _governor
+    if not settings.llm_governor_enabled:
+        return None
+
+    with _governor_lock:
+        if _governor is None:
+            _governor = LLMGovernor(
+                limits=settings.llm_rate_limits,
+                default_rpm=settings.llm_default_rpm,
+                default_tpm=settings.llm_default_tpm,
+                backoff_seconds=settings.llm_rate_limit_backoff_seconds,
+                max_backoff_seconds=settings.llm_rate_limit_max_backoff_seconds,
+            )
+        return _governor
@@ -2,11 +2,31 @@
 LLM 프로바이더
 
 LiteLLM을 사용하여 OpenAI, Anthropic 등 여러 LLM 프로바이더를 통합합니다.
+
+프롬프트 캐싱: system 메시지는 호출 간에 바뀌지 않는 고정 prefix(역할·투자 철학·응답 형식)로
+작성하고, 회사별 내용은 user 메시지에 둡니다. OpenAI는 같은 prefix를 자동으로 캐시하고,
+Anthropic(Claude)은 system 메시지에 cache_control을 붙여 캐시를 요청합니다.
+캐시된 입력 토큰 수는 호출마다 로깅하고, track_llm_usage() 범위(분석 실행 1건)별로 합산합니다.
+
+속도 제한: 모든 API 호출은 app.llm.governor의 모델별 RPM·TPM 버킷을 거치고,
+429 응답은 Retry-After(없으면 지수 백오프 + 지터)만큼 기다린 뒤 재시도합니다.
+
+응답 캐시(선택): settings.llm_response_cache_enabled이면 같은 요청의 응답을
+app.llm.response_cache에 저장해 두고 API 호출 없이 반환합니다. 키는 메인 모델 기준이므로
+메인 모델의 응답만 저장하고, 폴백 모델의 응답은 저장하지 않습니다 (다음 호출에서 메인 모델 재시도).
+
+스트리밍: stream/astream은 생성되는 텍스트 조각을 바로 넘겨줍니다 (긴 보고서 생성용).
+스트림 요청의 토큰 예약은 추정치로 정산되고, 사용량은 마지막 청크(include_usage)로 기록합니다.
 """
+import asyncio
 import logging
-from typing import Any
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 
-from litellm import completion, acompletion
+from litellm import acompletion, completion
 from litellm.exceptions import (
     APIConnectionError,
     RateLimitError,
@@ -15,9 +35,105 @@ from litellm.exceptions import (
 )
 
 from app.config import settings
+from app.llm.governor import estimate_prompt_tokens, get_llm_governor
+from app.llm.response_cache import LLMResponseCache, get_llm_response_cache
 
 logger = logging.getLogger(__name__)
 
+USAGE_FIELDS = (
+    "calls",
+    "prompt_tokens",
+    "completion_tokens",
+    "cached_tokens",
+    "cache_write_tokens",
+    "response_cache_hits",
+)
+
+# 현재 실행(분석 1건)의 사용량 합계 (track_llm_usage로 설정, 노드 스레드·태스크에 전파됨)
+_run_usage: ContextVar[dict | None] = ContextVar("llm_run_usage", default=None)
+_usage_lock = threading.Lock()
+
+# 응답 캐시 우회 범위 (bypass_llm_response_cache로 설정)
+_cache_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+def add_usage(total: dict, usage: dict) -> dict:
+    """사용량 dict 합산 (total을 갱신하여 반환)"""
+    with _usage_lock:
+        for field in USAGE_FIELDS:
+            total[field] = total.get(field, 0) + usage.get(field, 0)
+    return total
+
+
+def format_usage(usage: dict) -> str:
+    """로그용 사용량 요약 (캐시 적중률 = 캐시된 입력 토큰 / 입력 토큰)"""
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    cached_tokens = usage.get("cached_tokens", 0)
+    hit_rate = cached_tokens / prompt_tokens * 100 if prompt_tokens else 0.0
+    return (
+        f"calls={usage.get('calls', 0)}, prompt_tokens={prompt_tokens}, "
+        f"completion_tokens={usage.get('completion_tokens', 0)}, "
+        f"cached_tokens={cached_tokens} ({hit_rate:.0f}%), "
+        f"cache_write_tokens={usage.get('cache_write_tokens', 0)}, "
+        f"response_cache_hits={usage.get('response_cache_hits', 0)}"
+    )
+
+
+@contextmanager
+def track_llm_usage() -> Iterator[dict]:
+    """
+    범위 안의 LLM 호출 사용량 합산
+
+    Usage:
+        with track_llm_usage() as usage:
+            final_state = await async_analysis_graph.ainvoke(initial_state)
+        logger.info(format_usage(usage))
+    """
+    usage = {field: 0 for field in USAGE_FIELDS}
+    token = _run_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _run_usage.reset(token)
+
+
+@contextmanager
+def bypass_llm_response_cache() -> Iterator[None]:
+    """
+    범위 안의 LLM 호출은 응답 캐시를 조회하지 않고 새로 호출 (새 응답으로 캐시 갱신)
+
+    Usage:
+        with bypass_llm_response_cache():
+            final_state = analysis_graph.invoke(initial_state)
+    """
+    token = _cache_bypass.set(True)
+    try:
+        yield
+    finally:
+        _cache_bypass.reset(token)
+
+
+def _bypass_requested(bypass_cache: bool) -> bool:
+    return bypass_cache or _cache_bypass.get()
+
+
+def _record_cache_hit(model: str) -> None:
+    logger.info(f"LLM 응답 캐시 적중: model={model}")
+    run_usage = _run_usage.get()
+    if run_usage is not None:
+        add_usage(run_usage, {"response_cache_hits": 1})
+
+
+def _total_tokens(response: Any, default: int) -> int:
+    """응답의 실제 사용 토큰 수 (사용량이 없으면 default)"""
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", None) or default
+
+
+def supports_cache_control(model: str) -> bool:
+    """cache_control 블록으로 프롬프트 캐싱을 요청해야 하는 모델인지 (Anthropic)"""
+    return "claude" in model.lower()
+
 
 class LLMProvider:
     """LiteLLM 기반 LLM 프로바이더"""
@@ -52,19 +168,21 @@ class LLMProvider:
         messages: list[dict[str, str]],
         temperature: float | None = None,
         max_tokens: int | None = None,
+        bypass_cache: bool = False,
         **kwargs
     ) -> str | None:
         """
         동기 completion (LangGraph에서 주로 사용)
 
         Args:
-            messages: 메시지 리스트
+            messages: 메시지 리스트 (system은 캐시 가능한 고정 prefix로 취급)
                 [
                     {"role": "system", "content": "..."},
                     {"role": "user", "content": "..."}
                 ]
             temperature: 생성 온도 (None이면 기본값 사용)
             max_tokens: 최대 토큰 수 (None이면 기본값 사용)
+            bypass_cache: True면 응답 캐시를 조회하지 않고 새로 호출 (결과는 저장)
             **kwargs: 추가 인자 (top_p, stop, etc.)
 
         Returns:
@@ -73,6 +191,14 @@ class LLMProvider:
         temp = temperature if temperature is not None else self.temperature
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
 
+        # 응답 캐시 조회
+        cache, key = self._cache_key(messages, temp, max_tok, kwargs)
+        if cache is not None and not _bypass_requested(bypass_cache):
+            cached = cache.get(key)
+            if cached is not None:
+                _record_cache_hit(self.model)
+                return cached
+
         # 메인 모델 시도
         result = self._try_completion(
             model=self.model,
@@ -83,6 +209,8 @@ class LLMProvider:
         )
 
         if result:
+            if cache is not None:
+                cache.put(key, self.model, result)
             return result
 
         # 폴백 모델 시도
@@ -96,6 +224,7 @@ class LLMProvider:
                 **kwargs
             )
             if result:
+                # 폴백 응답은 메인 모델 키로 캐시하지 않음
                 return result
 
         logger.error("모든 모델에서 completion 실패")
@@ -106,6 +235,7 @@ class LLMProvider:
         messages: list[dict[str, str]],
         temperature: float | None = None,
         max_tokens: int | None = None,
+        bypass_cache: bool = False,
         **kwargs
     ) -> str | None:
         """
@@ -115,6 +245,7 @@ class LLMProvider:
             messages: 메시지 리스트
             temperature: 생성 온도
             max_tokens: 최대 토큰 수
+            bypass_cache: True면 응답 캐시를 조회하지 않고 새로 호출 (결과는 저장)
             **kwargs: 추가 인자
 
         Returns:
@@ -123,6 +254,14 @@ class LLMProvider:
         temp = temperature if temperature is not None else self.temperature
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
 
+        # 응답 캐시 조회 (SQLite 조회는 워커 스레드에서)
+        cache, key = self._cache_key(messages, temp, max_tok, kwargs)
+        if cache is not None and not _bypass_requested(bypass_cache):
+            cached = await asyncio.to_thread(cache.get, key)
+            if cached is not None:
+                _record_cache_hit(self.model)
+                return cached
+
         # 메인 모델 시도
         result = await self._try_acompletion(
             model=self.model,
@@ -133,6 +272,8 @@ class LLMProvider:
         )
 
         if result:
+            if cache is not None:
+                await asyncio.to_thread(cache.put, key, self.model, result)
             return result
 
         # 폴백 모델 시도
@@ -146,11 +287,137 @@ class LLMProvider:
                 **kwargs
             )
             if result:
+                # 폴백 응답은 메인 모델 키로 캐시하지 않음
                 return result
 
         logger.error("모든 모델에서 비동기 completion 실패")
         return None
 
+    def stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        bypass_cache: bool = False,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        동기 스트리밍 completion (생성되는 대로 텍스트 조각 반환)
+
+        스트림을 열지 못하면 폴백 모델을 시도하고, 스트림 도중의 오류는 이미 보낸 조각을
+        되돌릴 수 없으므로 폴백하지 않고 그대로 전달합니다. 응답 캐시에 있으면 한 번에 반환합니다.
+
+        Args:
+            messages: 메시지 리스트
+            temperature: 생성 온도 (None이면 기본값 사용)
+            max_tokens: 최대 토큰 수 (None이면 기본값 사용)
+            bypass_cache: True면 응답 캐시를 조회하지 않고 새로 호출 (결과는 저장)
+            **kwargs: 추가 인자
+
+        Yields:
+            생성된 텍스트 조각 (모든 모델 실패 시 아무것도 반환하지 않음)
+        """
+        temp = temperature if temperature is not None else self.temperature
+        max_tok = max_tokens if max_tokens is not None else self.max_tokens
+
+        # 응답 캐시 조회 (complete와 같은 키)
+        cache, key = self._cache_key(messages, temp, max_tok, kwargs)
+        if cache is not None and not _bypass_requested(bypass_cache):
+            cached = cache.get(key)
+            if cached is not None:
+                _record_cache_hit(self.model)
+                yield cached
+                return
+
+        for model in [self.model, *self.fallback_models]:
+            if model != self.model:
+                logger.warning(f"폴백 모델 시도: {model}")
+
+            response = self._try_stream(model, messages, temp, max_tok, **kwargs)
+            if response is None:
+                continue
+
+            parts = []
+            for chunk in response:
+                text = self._stream_text(model, chunk, "LLM 스트리밍 사용량")
+                if text:
+                    parts.append(text)
+                    yield text
+
+            # 메인 모델 응답만 캐시 (폴백 응답은 메인 모델 키로 저장하지 않음)
+            if parts and cache is not None and model == self.model:
+                cache.put(key, self.model, "".join(parts))
+            return
+
+        logger.error("모든 모델에서 스트리밍 실패")
+
+    async def astream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        bypass_cache: bool = False,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        비동기 스트리밍 completion (stream과 동일한 규칙)
+
+        Args:
+            messages: 메시지 리스트
+            temperature: 생성 온도
+            max_tokens: 최대 토큰 수
+            bypass_cache: True면 응답 캐시를 조회하지 않고 새로 호출 (결과는 저장)
+            **kwargs: 추가 인자
+
+        Yields:
+            생성된 텍스트 조각 (모든 모델 실패 시 아무것도 반환하지 않음)
+        """
+        temp = temperature if temperature is not None else self.temperature
+        max_tok = max_tokens if max_tokens is not None else self.max_tokens
+
+        cache, key = self._cache_key(messages, temp, max_tok, kwargs)
+        if cache is not None and not _bypass_requested(bypass_cache):
+            cached = await asyncio.to_thread(cache.get, key)
+            if cached is not None:
+                _record_cache_hit(self.model)
+                yield cached
+                return
+
+        for model in [self.model, *self.fallback_models]:
+            if model != self.model:
+                logger.warning(f"폴백 모델 시도: {model}")
+
+            response = await self._try_astream(model, messages, temp, max_tok, **kwargs)
+            if response is None:
+                continue
+
+            parts = []
+            async for chunk in response:
+                text = self._stream_text(model, chunk, "비동기 LLM 스트리밍 사용량")
+                if text:
+                    parts.append(text)
+                    yield text
+
+            # 메인 모델 응답만 캐시 (폴백 응답은 메인 모델 키로 저장하지 않음)
+            if parts and cache is not None and model == self.model:
+                await asyncio.to_thread(cache.put, key, self.model, "".join(parts))
+            return
+
+        logger.error("모든 모델에서 비동기 스트리밍 실패")
+
+    def _cache_key(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        kwargs: dict
+    ) -> tuple[LLMResponseCache | None, str | None]:
+        """응답 캐시와 요청 키 (캐시 비활성화 시 (None, None))"""
+        cache = get_llm_response_cache()
+        if cache is None:
+            return None, None
+        return cache, cache.make_key(self.model, messages, temperature, max_tokens, **kwargs)
+
     def _try_completion(
         self,
         model: str,
@@ -175,12 +442,17 @@ class LLMProvider:
         try:
             logger.debug(f"LLM completion 요청: model={model}, messages={len(messages)}개")
 
-            response = completion(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs
+            response = self._governed_call(
+                model,
+                messages,
+                max_tokens,
+                lambda: completion(
+                    model=model,
+                    messages=self._prepare_messages(model, messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs
+                )
             )
 
             # 응답 파싱
@@ -188,14 +460,7 @@ class LLMProvider:
                 content = response.choices[0].message.content
 
                 # 비용 추적 로깅
-                usage = getattr(response, "usage", None)
-                if usage:
-                    logger.info(
-                        f"LLM 사용량: model={model}, "
-                        f"prompt_tokens={usage.prompt_tokens}, "
-                        f"completion_tokens={usage.completion_tokens}, "
-                        f"total_tokens={usage.total_tokens}"
-                    )
+                self._record_usage(model, response, "LLM 사용량")
 
                 logger.debug(f"LLM completion 성공: {len(content)} 문자")
                 return content
@@ -208,7 +473,7 @@ class LLMProvider:
             return None
 
         except RateLimitError as e:
-            logger.error(f"LLM Rate Limit 초과 ({model}): {e}")
+            logger.error(f"LLM Rate Limit 초과, 재시도 소진 ({model}): {e}")
             return None
 
         except Exception as e:
@@ -239,26 +504,24 @@ class LLMProvider:
         try:
             logger.debug(f"비동기 LLM completion 요청: model={model}")
 
-            response = await acompletion(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs
+            response = await self._agoverned_call(
+                model,
+                messages,
+                max_tokens,
+                lambda: acompletion(
+                    model=model,
+                    messages=self._prepare_messages(model, messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs
+                )
             )
 
             if response and response.choices:
                 content = response.choices[0].message.content
 
                 # 비용 추적 로깅
-                usage = getattr(response, "usage", None)
-                if usage:
-                    logger.info(
-                        f"비동기 LLM 사용량: model={model}, "
-                        f"prompt_tokens={usage.prompt_tokens}, "
-                        f"completion_tokens={usage.completion_tokens}, "
-                        f"total_tokens={usage.total_tokens}"
-                    )
+                self._record_usage(model, response, "비동기 LLM 사용량")
 
                 logger.debug(f"비동기 LLM completion 성공: {len(content)} 문자")
                 return content
@@ -271,13 +534,234 @@ class LLMProvider:
             return None
 
         except RateLimitError as e:
-            logger.error(f"비동기 LLM Rate Limit 초과 ({model}): {e}")
+            logger.error(f"비동기 LLM Rate Limit 초과, 재시도 소진 ({model}): {e}")
             return None
 
         except Exception as e:
             logger.error(f"비동기 LLM completion 오류 ({model}): {e}", exc_info=True)
             return None
 
+    def _try_stream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        **kwargs
+    ) -> Any:
+        """
+        단일 모델로 스트림 열기
+
+        Returns:
+            청크 이터레이터 또는 실패 시 None
+        """
+        try:
+            logger.debug(f"LLM 스트리밍 요청: model={model}, messages={len(messages)}개")
+            return self._governed_call(
+                model,
+                messages,
+                max_tokens,
+                lambda: completion(
+                    model=model,
+                    messages=self._prepare_messages(model, messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **kwargs
+                )
+            )
+
+        except Exception as e:
+            logger.error(f"LLM 스트리밍 요청 실패 ({model}): {e}")
+            return None
+
+    async def _try_astream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        **kwargs
+    ) -> Any:
+        """
+        단일 모델로 비동기 스트림 열기
+
+        Returns:
+            비동기 청크 이터레이터 또는 실패 시 None
+        """
+        try:
+            logger.debug(f"비동기 LLM 스트리밍 요청: model={model}, messages={len(messages)}개")
+            return await self._agoverned_call(
+                model,
+                messages,
+                max_tokens,
+                lambda: acompletion(
+                    model=model,
+                    messages=self._prepare_messages(model, messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **kwargs
+                )
+            )
+
+        except Exception as e:
+            logger.error(f"비동기 LLM 스트리밍 요청 실패 ({model}): {e}")
+            return None
+
+    def _stream_text(self, model: str, chunk: Any, label: str) -> str | None:
+        """스트림 청크의 텍스트 (사용량이 담긴 마지막 청크는 사용량 기록)"""
+        if getattr(chunk, "usage", None):
+            self._record_usage(model, chunk, label)
+
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return None
+        delta = getattr(choices[0], "delta", None)
+        return getattr(delta, "content", None)
+
+    def _governed_call(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int,
+        call: Callable[[], Any]
+    ) -> Any:
+        """
+        속도 제한기를 거쳐 API 호출 (차례 대기, 사용량 정산, 429 재시도)
+
+        Args:
+            model: 모델 이름
+            messages: 메시지 리스트 (토큰 예약량 추정용)
+            max_tokens: 최대 출력 토큰 수
+            call: 실제 API 호출
+
+        Returns:
+            API 응답 (재시도를 모두 소진하면 RateLimitError 발생)
+        """
+        governor = get_llm_governor()
+        if governor is None:
+            return call()
+
+        reserved = estimate_prompt_tokens(model, messages) + max_tokens
+        attempts = settings.llm_rate_limit_max_retries + 1
+
+        for attempt in range(attempts):
+            governor.acquire(model, reserved)
+            try:
+                response = call()
+            except RateLimitError as e:
+                governor.settle(model, reserved, 0)
+                if attempt + 1 >= attempts:
+                    raise
+                delay = governor.rate_limited(model, e, attempt)
+                logger.warning(
+                    f"LLM Rate Limit ({model}): {delay:.1f}초 후 재시도 "
+                    f"({attempt + 1}/{attempts - 1})"
+                )
+                time.sleep(delay)
+                continue
+            except Exception:
+                governor.settle(model, reserved, 0)
+                raise
+
+            governor.settle(model, reserved, _total_tokens(response, reserved))
+            return response
+
+    async def _agoverned_call(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int,
+        call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """_governed_call의 비동기 버전 (대기는 asyncio.sleep)"""
+        governor = get_llm_governor()
+        if governor is None:
+            return await call()
+
+        # 토크나이저 로드·계산은 워커 스레드에서
+        reserved = await asyncio.to_thread(estimate_prompt_tokens, model, messages) + max_tokens
+        attempts = settings.llm_rate_limit_max_retries + 1
+
+        for attempt in range(attempts):
+            await governor.aacquire(model, reserved)
+            try:
+                response = await call()
+            except RateLimitError as e:
+                governor.settle(model, reserved, 0)
+                if attempt + 1 >= attempts:
+                    raise
+                delay = governor.rate_limited(model, e, attempt)
+                logger.warning(
+                    f"비동기 LLM Rate Limit ({model}): {delay:.1f}초 후 재시도 "
+                    f"({attempt + 1}/{attempts - 1})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                governor.settle(model, reserved, 0)
+                raise
+
+            governor.settle(model, reserved, _total_tokens(response, reserved))
+            return response
+
+    def _prepare_messages(self, model: str, messages: list[dict]) -> list[dict]:
+        """
+        프롬프트 캐싱 적용 (Anthropic: 마지막 system 메시지까지를 캐시 구간으로 표시)
+
+        OpenAI 등은 동일 prefix를 자동 캐시하므로 메시지를 그대로 보냅니다.
+        """
+        if not settings.llm_prompt_cache_enabled or not supports_cache_control(model):
+            return messages
+
+        last_system = max(
+            (i for i, message in enumerate(messages) if message["role"] == "system"),
+            default=None
+        )
+        if last_system is None or not isinstance(messages[last_system]["content"], str):
+            return messages
+
+        prepared = list(messages)
+        prepared[last_system] = {
+            **messages[last_system],
+            "content": [{
+                "type": "text",
+                "text": messages[last_system]["content"],
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
+        return prepared
+
+    def _record_usage(self, model: str, response: Any, label: str) -> None:
+        """응답 사용량(캐시 토큰 포함) 로깅 및 현재 실행 합계에 반영"""
+        usage = getattr(response, "usage", None)
+        if not usage:
+            return
+
+        details = getattr(usage, "prompt_tokens_details", None)
+        summary = {
+            "calls": 1,
+            "prompt_tokens": usage.prompt_tokens or 0,
+            "completion_tokens": usage.completion_tokens or 0,
+            "cached_tokens": getattr(details, "cached_tokens", None) or 0,
+            "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+        }
+        logger.info(
+            f"{label}: model={model}, "
+            f"prompt_tokens={summary['prompt_tokens']}, "
+            f"completion_tokens={summary['completion_tokens']}, "
+            f"total_tokens={usage.total_tokens}, "
+            f"cached_tokens={summary['cached_tokens']}, "
+            f"cache_write_tokens={summary['cache_write_tokens']}"
+        )
+
+        run_usage = _run_usage.get()
+        if run_usage is not None:
+            add_usage(run_usage, summary)
+
 
 # 싱글톤 인스턴스
 _default_provider: LLMProvider | None = None
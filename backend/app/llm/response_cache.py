@@ -0,0 +1,249 @@
+"""
+LLM 응답 캐시
+
+입력이 바뀌지 않은 기업을 다시 분석하면(같은 공시·뉴스·재무 데이터) LLM 호출도 같은 요청이
+됩니다. (model, messages, temperature, max_tokens, 추가 인자)의 SHA-256 해시를 키로
+응답 텍스트를 로컬 SQLite 파일에 저장해 두고, 같은 요청은 API 호출 없이 반환합니다.
+
+- 기본 비활성화 (settings.llm_response_cache_enabled)
+- TTL이 지난 응답은 사용하지 않고 다시 호출합니다.
+- 전체 용량이 상한을 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다.
+- 여러 프로세스가 같은 파일을 공유할 수 있습니다 (WAL 모드).
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 용량 초과 시 이 비율까지 줄임 (매 저장마다 정리하지 않도록 여유를 둠)
+_EVICT_TARGET_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_used_at ON llm_responses (used_at);
+"""
+
+
+class LLMResponseCache:
+    """LLM 응답 SQLite 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str | Path, ttl_seconds: float, max_bytes: int):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_seconds: 응답 유효 시간 (초)
+            max_bytes: 저장 응답 최대 용량 (바이트, UTF-8 기준)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=10.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._size_bytes = self._total_size()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        **kwargs
+    ) -> str:
+        """캐시 키 (요청 내용의 SHA-256 해시, dict 키 순서와 무관)"""
+        raw = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "kwargs": kwargs,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key() 결과
+
+        Returns:
+            저장된 응답 또는 None (없음·만료)
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT content, created_at, size FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row and now - row[1] < self.ttl_seconds:
+                    # LRU 정리를 위해 사용 시각 갱신
+                    self._conn.execute(
+                        "UPDATE llm_responses SET used_at = ? WHERE key = ?", (now, key)
+                    )
+                    self.hits += 1
+                    return row[0]
+
+                if row:
+                    self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    self._size_bytes -= row[2]
+                self.misses += 1
+                return None
+
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 응답 캐시 읽기 실패: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+
+    def put(self, key: str, model: str, content: str) -> None:
+        """
+        응답 저장
+
+        Args:
+            key: make_key() 결과
+            model: 요청 모델 (통계·정리용)
+            content: 응답 텍스트
+        """
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        try:
+            with self._lock:
+                old = self._conn.execute(
+                    "SELECT size FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(key, model, content, size, created_at, used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, content, size, now, now),
+                )
+                self._size_bytes += size - (old[0] if old else 0)
+                self.writes += 1
+                over_limit = self._size_bytes > self.max_bytes
+
+            if over_limit:
+                self.evict()
+
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 응답 캐시 저장 실패: {e}")
+
+    def evict(self) -> int:
+        """
+        만료 응답 삭제 후, 용량 상한 초과 시 오래 사용하지 않은 응답부터 삭제
+
+        Returns:
+            삭제한 응답 수
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at <= ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+
+            # 다른 프로세스가 쓴 응답도 반영하여 다시 계산
+            total = self._total_size()
+            target = self.max_bytes * _EVICT_TARGET_RATIO
+            stale_keys = []
+            if total > target:
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM llm_responses ORDER BY used_at"
+                ):
+                    if total <= target:
+                        break
+                    stale_keys.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", stale_keys)
+
+            removed += len(stale_keys)
+            self._size_bytes = total
+            self.evictions += removed
+
+        if removed:
+            logger.info(f"LLM 응답 캐시 정리: {removed}개 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def clear(self) -> None:
+        """모든 응답 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._size_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        캐시 통계
+
+        Returns:
+            {"hits", "misses", "hit_rate", "writes", "evictions", "entries", "size_bytes"}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": self._size_bytes,
+            }
+
+    def _total_size(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+
+
+# 전역 캐시 인스턴스 (싱글톤)
+_response_cache: LLMResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """
+    LLM 응답 캐시 싱글톤 가져오기
+
+    Returns:
+        LLMResponseCache 인스턴스 또는 캐시 비활성화 시 None
+    """
+    global _response_cache
+    if not settings.llm_response_cache_enabled:
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = LLMResponseCache(
+                path=settings.llm_response_cache_path,
+                ttl_seconds=settings.llm_response_cache_ttl_hours * 3600,
+                max_bytes=settings.llm_response_cache_max_mb * 1024 * 1024,
+            )
+            logger.info(f"LLM 응답 캐시 초기화: {settings.llm_response_cache_path}")
+        return _response_cache
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -5,14 +6,21 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
 from app.config import settings
+from app.data_sources.public_data_client import close_async_http
+from app.data_sources.symbol_directory import run_symbol_directory_refresh
+from app.services.analysis_queue import shutdown_analysis_queue
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     # TODO: Initialize scheduler in production
+    symbol_refresh = asyncio.create_task(run_symbol_directory_refresh())
     yield
     # Shutdown
+    symbol_refresh.cancel()
+    await shutdown_analysis_queue()
+    await close_async_http()
 
 
 app = FastAPI(
@@ -0,0 +1,169 @@
+"""
+분석 실행 큐
+
+/analysis/run, /analysis/batch 요청을 asyncio 태스크로 받아 세마포어로 동시 실행 수를
+제한합니다 (settings.analysis_max_concurrency). 파이프라인은 비동기 그래프
+(arun_analysis_pipeline)로 실행되므로 대기 중인 LLM·HTTP 호출이 스레드를 점유하지 않고,
+한도를 넘는 요청은 pending 상태로 제출 순서대로 기다립니다.
+"""
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from app.config import settings
+from app.llm.provider import USAGE_FIELDS, add_usage, format_usage
+from app.services.analysis_service import arun_analysis_pipeline, aupdate_run
+
+logger = logging.getLogger(__name__)
+
+Pipeline = Callable[[int, int, str, str], Awaitable[dict]]
+
+
+class AnalysisRunQueue:
+    """세마포어로 동시 실행 수를 제한하는 분석 실행 큐 (이벤트 루프 하나에서 사용)"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        pipeline: Pipeline = arun_analysis_pipeline,
+        on_cancel: Callable[[int], Awaitable[None]] | None = None
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 실행할 최대 분석 수
+            pipeline: (run_id, company_id, stock_code, company_name) → 결과 dict
+            on_cancel: 실행이 취소됐을 때 호출 (기본값: AnalysisRun을 failed로 기록)
+        """
+        self.max_concurrency = max_concurrency
+        self.pipeline = pipeline
+        self.on_cancel = on_cancel or _mark_cancelled
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        # 큐가 빌 때까지(배치 1회) LLM 사용량 합계
+        self._batch_usage = {field: 0 for field in USAGE_FIELDS}
+        self._batch_runs = 0
+
+    def submit(
+        self,
+        run_id: int,
+        company_id: int,
+        stock_code: str,
+        company_name: str
+    ) -> asyncio.Task:
+        """
+        분석 실행 예약 (즉시 반환, 실행 슬롯이 나면 시작)
+
+        Returns:
+            실행 태스크 (결과 dict 반환)
+        """
+        task = asyncio.create_task(
+            self._run(run_id, company_id, stock_code, company_name),
+            name=f"analysis-run-{run_id}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(
+        self,
+        run_id: int,
+        company_id: int,
+        stock_code: str,
+        company_name: str
+    ) -> dict | None:
+        try:
+            async with self._semaphore:
+                self._running += 1
+                try:
+                    result = await self.pipeline(run_id, company_id, stock_code, company_name)
+                finally:
+                    self._running -= 1
+
+        except asyncio.CancelledError:
+            logger.warning(f"분석 실행 취소: run_id={run_id}")
+            try:
+                await self.on_cancel(run_id)
+            except Exception as e:
+                logger.error(f"취소 상태 기록 실패: run_id={run_id} - {e}")
+            raise
+
+        except Exception as e:
+            # 파이프라인은 실패를 결과로 반환하므로 여기까지 오는 경우는 상태 기록 실패 등
+            self._failed += 1
+            logger.error(f"파이프라인 실행 오류: run_id={run_id} - {e}", exc_info=True)
+            return None
+
+        if result.get("success"):
+            self._completed += 1
+        else:
+            self._failed += 1
+        logger.info(f"파이프라인 완료: {result}")
+
+        self._batch_runs += 1
+        add_usage(self._batch_usage, result.get("llm_usage") or {})
+        if len(self._tasks) <= 1:
+            # 마지막 실행: 배치 전체의 캐시 토큰 절감 효과 로깅 후 초기화
+            logger.info(
+                f"배치 LLM 사용량 ({self._batch_runs}건): {format_usage(self._batch_usage)}"
+            )
+            self._batch_usage = {field: 0 for field in USAGE_FIELDS}
+            self._batch_runs = 0
+        return result
+
+    def stats(self) -> dict:
+        """{"max_concurrency", "running", "queued", "completed", "failed"}"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "running": self._running,
+            "queued": len(self._tasks) - self._running,
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+
+    async def shutdown(self) -> None:
+        """대기·실행 중인 분석을 모두 취소 (애플리케이션 종료 시)"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"분석 실행 큐 종료: {len(tasks)}개 취소")
+
+
+async def _mark_cancelled(run_id: int) -> None:
+    await aupdate_run(
+        run_id,
+        status="failed",
+        error_message="서버 종료로 분석이 중단되었습니다.",
+        completed_at=datetime.utcnow(),
+    )
+
+
+# 이벤트 루프별 실행 큐 (asyncio.Semaphore는 생성한 루프에 묶임)
+_queue: tuple[asyncio.AbstractEventLoop, AnalysisRunQueue] | None = None
+_queue_lock = threading.Lock()
+
+
+def get_analysis_queue() -> AnalysisRunQueue:
+    """현재 이벤트 루프의 분석 실행 큐"""
+    global _queue
+    loop = asyncio.get_running_loop()
+    with _queue_lock:
+        if _queue is None or _queue[0] is not loop:
+            _queue = (loop, AnalysisRunQueue(settings.analysis_max_concurrency))
+        return _queue[1]
+
+
+async def shutdown_analysis_queue() -> None:
+    """실행 큐 종료 (애플리케이션 종료 시 호출)"""
+    global _queue
+    with _queue_lock:
+        current, _queue = _queue, None
+    if current is not None and current[0] is asyncio.get_running_loop():
+        await current[1].shutdown()
@@ -3,10 +3,11 @@
 import logging
 from datetime import datetime
 
-from app.agents.graph import analysis_graph
+from app.agents.graph import analysis_graph, async_analysis_graph
 from app.agents.state import AnalysisState
 from app.db.models import AnalysisRun, Company
-from app.db.session import get_sync_session
+from app.db.session import async_session_factory, get_sync_session
+from app.llm.provider import format_usage, track_llm_usage
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +43,9 @@ def run_analysis_pipeline(run_id: int, company_id: int, stock_code: str, company
             "analysis_run_id": run_id,
         }
 
-        # LangGraph 파이프라인 실행
-        final_state = analysis_graph.invoke(initial_state)
+        # LangGraph 파이프라인 실행 (LLM 사용량·캐시 토큰 합산)
+        with track_llm_usage() as llm_usage:
+            final_state = analysis_graph.invoke(initial_state)
 
         # 성공 상태로 업데이트
         with get_sync_session() as session:
@@ -51,8 +53,14 @@ def run_analysis_pipeline(run_id: int, company_id: int, stock_code: str, company
             if run:
                 run.status = "completed"
                 run.completed_at = datetime.utcnow()
+                run.metadata_json = {
+                    "stage_timings": final_state.get("stage_timings", {}),
+                    "llm_usage": llm_usage,
+                }
 
-        logger.info(f"분석 파이프라인 완료: {company_name}({stock_code})")
+        logger.info(
+            f"분석 파이프라인 완료: {company_name}({stock_code}), LLM {format_usage(llm_usage)}"
+        )
 
         return {
             "success": True,
@@ -60,6 +68,7 @@ def run_analysis_pipeline(run_id: int, company_id: int, stock_code: str, company
             "report_id": final_state.get("report_id"),
             "overall_score": final_state.get("overall_score"),
             "overall_verdict": final_state.get("overall_verdict"),
+            "llm_usage": llm_usage,
         }
 
     except Exception as e:
@@ -80,10 +89,100 @@ def run_analysis_pipeline(run_id: int, company_id: int, stock_code: str, company
         }
 
 
+async def aupdate_run(run_id: int, **fields) -> None:
+    """AnalysisRun 필드 업데이트 (비동기 세션)"""
+    async with async_session_factory() as session:
+        run = await session.get(AnalysisRun, run_id)
+        if run:
+            for key, value in fields.items():
+                setattr(run, key, value)
+            await session.commit()
+
+
+async def arun_analysis_pipeline(
+    run_id: int,
+    company_id: int,
+    stock_code: str,
+    company_name: str
+) -> dict:
+    """
+    LangGraph 분석 파이프라인을 비동기로 실행합니다 (async_analysis_graph.ainvoke).
+
+    노드의 LLM·HTTP 호출을 이벤트 루프에서 기다리므로, 한 프로세스에서
+    여러 기업 분석을 스레드 없이 동시에 진행할 수 있습니다.
+
+    Args:
+        run_id: AnalysisRun ID
+        company_id: Company ID
+        stock_code: 종목코드
+        company_name: 회사명
+
+    Returns:
+        최종 상태 딕셔너리
+    """
+    logger.info(f"분석 파이프라인 시작: {company_name}({stock_code}), run_id={run_id}")
+
+    # 상태를 running으로 업데이트
+    await aupdate_run(run_id, status="running", started_at=datetime.utcnow())
+
+    try:
+        # 초기 상태 생성
+        initial_state: AnalysisState = {
+            "company_id": company_id,
+            "stock_code": stock_code,
+            "company_name": company_name,
+            "analysis_run_id": run_id,
+        }
+
+        # LangGraph 파이프라인 실행 (LLM 사용량·캐시 토큰 합산)
+        with track_llm_usage() as llm_usage:
+            final_state = await async_analysis_graph.ainvoke(initial_state)
+
+        # 성공 상태로 업데이트
+        await aupdate_run(
+            run_id,
+            status="completed",
+            completed_at=datetime.utcnow(),
+            metadata_json={
+                "stage_timings": final_state.get("stage_timings", {}),
+                "llm_usage": llm_usage,
+            },
+        )
+
+        logger.info(
+            f"분석 파이프라인 완료: {company_name}({stock_code}), LLM {format_usage(llm_usage)}"
+        )
+
+        return {
+            "success": True,
+            "run_id": run_id,
+            "report_id": final_state.get("report_id"),
+            "overall_score": final_state.get("overall_score"),
+            "overall_verdict": final_state.get("overall_verdict"),
+            "llm_usage": llm_usage,
+        }
+
+    except Exception as e:
+        logger.error(f"분석 파이프라인 실패: {company_name}({stock_code}) - {e}")
+
+        # 실패 상태로 업데이트
+        await aupdate_run(
+            run_id,
+            status="failed",
+            error_message=str(e)[:1000],
+            completed_at=datetime.utcnow(),
+        )
+
+        return {
+            "success": False,
+            "run_id": run_id,
+            "error": str(e),
+        }
+
+
 async def get_analysis_status(run_id: int) -> dict | None:
     """분석 실행 상태를 조회합니다."""
     from sqlalchemy import select
-    from app.db.session import async_session_factory
 
     async with async_session_factory() as session:
         result = await session.execute(
@@ -0,0 +1,285 @@
+"""
+전체 종목 일괄 갱신 서비스
+
+활성 종목 전체의 재무데이터(또는 PER/PBR)를 워커 풀로 나눠 병렬 갱신합니다.
+
+- 회사 단위 진행 상황을 refresh_checkpoints 테이블에 기록하여,
+  중단된 작업을 같은 job_name으로 다시 실행하면 완료된 회사는 건너뜁니다.
+  job_name을 지정하지 않으면 실행마다 새 이름을 만들고 재개하지 않습니다.
+- DART 일일 호출 한도가 부족하면 새 회사 처리를 멈추고 나머지는 다음 실행으로 미룹니다.
+- 회사별 소요 시간과 처리량, p50/p95 지연 시간을 집계합니다.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import settings
+from app.data_sources.dart_cache import get_finstate_cache
+from app.data_sources.dart_corp_registry import get_dart_daily_quota
+from app.db.models import Company, RefreshCheckpoint
+from app.db.session import async_session_factory
+from app.services.financial_service import collect_financial_data, update_per_pbr
+
+logger = logging.getLogger(__name__)
+
+# 회사 1곳 재수집 시 예상 DART 호출 수 (연간 8건 + 분기 8건, CFS/OFS 최대 2회씩)
+_ESTIMATED_DART_CALLS_PER_COMPANY = 32
+
+# 갱신 모드
+MODE_FINANCIALS = "financials"  # 재무제표 재수집 (+ PER/PBR)
+MODE_PER_PBR = "per_pbr"  # PER/PBR만 재계산
+
+
+async def load_refresh_targets(
+    stock_codes: list[str] | None = None,
+    active_only: bool = True
+) -> list[dict]:
+    """
+    갱신 대상 회사 목록을 조회합니다.
+
+    Args:
+        stock_codes: 특정 종목코드만 (None이면 전체)
+        active_only: True면 is_active 종목만
+
+    Returns:
+        [{"id", "stock_code", "company_name", "corp_code"}, ...]
+    """
+    query = select(
+        Company.id, Company.stock_code, Company.company_name, Company.corp_code
+    ).order_by(Company.id)
+
+    if stock_codes:
+        query = query.where(Company.stock_code.in_(stock_codes))
+    if active_only:
+        query = query.where(Company.is_active.is_(True))
+
+    async with async_session_factory() as session:
+        result = await session.execute(query)
+        return [dict(row._mapping) for row in result]
+
+
+async def get_completed_company_ids(job_name: str) -> set[int]:
+    """체크포인트에서 이미 완료된 회사 ID 목록을 조회합니다."""
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(RefreshCheckpoint.company_id).where(
+                RefreshCheckpoint.job_name == job_name,
+                RefreshCheckpoint.status == "completed",
+            )
+        )
+        return set(result.scalars().all())
+
+
+async def save_checkpoint(job_name: str, company_id: int, **values) -> None:
+    """
+    회사 단위 체크포인트 저장 (upsert)
+
+    Args:
+        job_name: 작업 이름
+        company_id: Company.id
+        **values: status, started_at, finished_at, duration_seconds, result_json, error_message
+    """
+    async with async_session_factory() as session:
+        stmt = pg_insert(RefreshCheckpoint).values(
+            job_name=job_name, company_id=company_id, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["job_name", "company_id"],
+            set_={key: stmt.excluded[key] for key in values},
+        )
+        await session.execute(stmt)
+        await session.commit()
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """
+    백분위수 계산 (선형 보간)
+
+    Args:
+        values: 값 목록
+        pct: 백분위 (0~100)
+
+    Returns:
+        백분위 값 또는 값이 없으면 None
+    """
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+async def _refresh_company(company: dict, mode: str, force_update: bool) -> dict:
+    """회사 1곳 갱신"""
+    if mode == MODE_PER_PBR:
+        await update_per_pbr(company["id"], company["stock_code"])
+        return {"success": True}
+
+    if not company["corp_code"]:
+        raise ValueError("DART 기업코드 없음")
+
+    return await collect_financial_data(
+        company_id=company["id"],
+        stock_code=company["stock_code"],
+        corp_code=company["corp_code"],
+        force_update=force_update
+    )
+
+
+async def run_batch_refresh(
+    job_name: str | None = None,
+    mode: str = MODE_FINANCIALS,
+    workers: int | None = None,
+    stock_codes: list[str] | None = None,
+    active_only: bool = True,
+    resume: bool = True,
+    force_update: bool = True
+) -> dict:
+    """
+    전체 종목 일괄 갱신
+
+    Args:
+        job_name: 작업 이름 (체크포인트 키). 재개하려면 지정해야 하며,
+            None이면 "{mode}-YYYYMMDD-HHMMSS"로 새 작업을 시작하고 재개하지 않음
+        mode: "financials" (재무제표 재수집) 또는 "per_pbr" (PER/PBR만)
+        workers: 동시에 처리할 회사 수 (기본값: settings.batch_refresh_workers)
+        stock_codes: 특정 종목코드만 (None이면 전체)
+        active_only: True면 is_active 종목만
+        resume: True면 같은 job_name에서 이미 완료된 회사는 건너뜀 (job_name 지정 시)
+        force_update: collect_financial_data의 force_update
+
+    Returns:
+        {
+            "job_name": str, "total": int, "resumed_skip": int,
+            "succeeded": int, "failed": int, "deferred": int,
+            "elapsed_seconds": float, "throughput_per_hour": float,
+            "latency_p50": float | None, "latency_p95": float | None,
+            "failed_companies": [str, ...],
+            "dart_cache": dict | None
+        }
+    """
+    if mode not in (MODE_FINANCIALS, MODE_PER_PBR):
+        raise ValueError(f"지원하지 않는 갱신 모드: {mode}")
+
+    if not job_name:
+        # 날짜가 들어간 기본 이름은 다음 날 같은 작업을 가리키지 못하므로 재개 대상이 아님
+        job_name = f"{mode}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        resume = False
+        logger.info(f"job_name 미지정: 새 작업 {job_name} (중단 후 재개하려면 이 이름을 지정)")
+    workers = workers or settings.batch_refresh_workers
+
+    companies = await load_refresh_targets(stock_codes, active_only)
+    completed_ids = await get_completed_company_ids(job_name) if resume else set()
+    pending = [c for c in companies if c["id"] not in completed_ids]
+
+    logger.info(
+        f"일괄 갱신 시작: job={job_name}, mode={mode}, 워커={workers}, "
+        f"대상={len(companies)}개 (완료 건너뜀 {len(companies) - len(pending)}개)"
+    )
+
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    for company in pending:
+        queue.put_nowait(company)
+
+    quota = get_dart_daily_quota()
+    quota_exhausted = asyncio.Event()
+
+    latencies: list[float] = []
+    failed_companies: list[str] = []
+    started = time.perf_counter()
+
+    async def _worker(worker_id: int):
+        while not queue.empty() and not quota_exhausted.is_set():
+            company = queue.get_nowait()
+            label = f"{company['company_name']}({company['stock_code']})"
+
+            # 남은 DART 한도가 회사 1곳 분량보다 적으면 다음 실행으로 미룸
+            if mode == MODE_FINANCIALS and quota.remaining() < _ESTIMATED_DART_CALLS_PER_COMPANY:
+                logger.warning(
+                    f"DART 일일 한도 부족 ({quota.used}/{quota.limit}) — "
+                    f"남은 회사는 다음 실행에서 재개"
+                )
+                quota_exhausted.set()
+                queue.put_nowait(company)
+                break
+
+            company_started = time.perf_counter()
+            await save_checkpoint(
+                job_name, company["id"], status="running", started_at=datetime.utcnow()
+            )
+
+            try:
+                result = await _refresh_company(company, mode, force_update)
+                duration = time.perf_counter() - company_started
+                latencies.append(duration)
+
+                await save_checkpoint(
+                    job_name,
+                    company["id"],
+                    status="completed",
+                    finished_at=datetime.utcnow(),
+                    duration_seconds=duration,
+                    result_json=result,
+                    error_message=None,
+                )
+
+                done = len(latencies)
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"[worker {worker_id}] 완료: {label} {duration:.1f}s "
+                    f"(진행 {done}/{len(pending)}, 처리량 {done / elapsed * 3600:.0f}개/시간)"
+                )
+
+            except Exception as e:
+                duration = time.perf_counter() - company_started
+                failed_companies.append(label)
+                logger.error(f"[worker {worker_id}] 실패: {label} - {e}", exc_info=True)
+
+                await save_checkpoint(
+                    job_name,
+                    company["id"],
+                    status="failed",
+                    finished_at=datetime.utcnow(),
+                    duration_seconds=duration,
+                    error_message=str(e)[:1000],
+                )
+
+    await asyncio.gather(*(_worker(i) for i in range(1, workers + 1)))
+
+    elapsed = time.perf_counter() - started
+    succeeded = len(latencies)
+    summary = {
+        "job_name": job_name,
+        "total": len(companies),
+        "resumed_skip": len(companies) - len(pending),
+        "succeeded": succeeded,
+        "failed": len(failed_companies),
+        "deferred": queue.qsize(),
+        "elapsed_seconds": round(elapsed, 2),
+        "throughput_per_hour": round(succeeded / elapsed * 3600, 1) if elapsed > 0 else 0.0,
+        "latency_p50": percentile(latencies, 50),
+        "latency_p95": percentile(latencies, 95),
+        "failed_companies": failed_companies,
+    }
+
+    # 재무제표 캐시 적중률 (캐시 비활성화 시 None)
+    finstate_cache = get_finstate_cache()
+    summary["dart_cache"] = finstate_cache.stats() if finstate_cache else None
+    if summary["dart_cache"]:
+        logger.info(f"재무제표 캐시: {summary['dart_cache']}")
+
+    p50 = f"{summary['latency_p50']:.1f}s" if latencies else "N/A"
+    p95 = f"{summary['latency_p95']:.1f}s" if latencies else "N/A"
+    logger.info(
+        f"일괄 갱신 완료: job={job_name} 성공 {succeeded}, 실패 {summary['failed']}, "
+        f"보류 {summary['deferred']}, 소요 {elapsed:.1f}s, p50={p50}, p95={p95}"
+    )
+
+    return summary
@@ -4,7 +4,10 @@
 DART에서 재무제표를 수집하여 DB에 저장합니다.
 증분 업데이트 방식으로 이미 있는 데이터는 스킵합니다.
 """
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Set, Tuple
 
@@ -12,14 +15,28 @@ import pandas as pd
 from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.data_sources.dart_client import DARTClient
-from app.data_sources.stock_client import StockClient
+from app.config import settings
+from app.data_sources.dart_client import (
+    DARTClient,
+    parse_statement_frames,
+    parsed_frames_to_dicts,
+)
 from app.data_sources.dart_web_scraper import get_dart_web_financials
+from app.data_sources.krx_session import run_krx
+from app.data_sources.stock_client import StockClient
+from app.data_sources.trading_calendar import get_trading_calendar
 from app.db.models import FinancialStatement
 from app.db.session import async_session_factory
 
 logger = logging.getLogger(__name__)
 
+# DART 조회 워커 풀 (OpenDartReader는 동기 I/O이므로 이벤트 루프 밖에서 실행)
+# 프로세스 전역으로 공유하여 여러 회사를 동시에 수집해도 동시 호출 수가 제한됨
+_dart_executor = ThreadPoolExecutor(
+    max_workers=settings.dart_fetch_concurrency,
+    thread_name_prefix="dart-fetch"
+)
+
 
 async def get_existing_statements(company_id: int) -> Set[Tuple[int, int]]:
     """
@@ -41,6 +58,93 @@ async def get_existing_statements(company_id: int) -> Set[Tuple[int, int]]:
         return existing
 
 
+async def fetch_statements_concurrently(
+    dart_client: DARTClient,
+    corp_code: str,
+    targets: list[tuple[int, int, str]]
+) -> tuple[dict[tuple[int, int], pd.DataFrame | None], float]:
+    """
+    여러 기간의 재무제표를 워커 풀에서 동시에 조회합니다.
+
+    호출 빈도는 DARTClient의 API 키별 속도 제한기가 조율합니다.
+
+    Args:
+        dart_client: DARTClient
+        corp_code: DART 기업코드
+        targets: (year, quarter, report_type) 목록
+
+    Returns:
+        ({(year, quarter): DataFrame 또는 None}, 조회 소요 시간(초)) 튜플
+    """
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+
+    def _fetch(year: int, report_type: str) -> pd.DataFrame | None:
+        return dart_client.get_financial_statements(
+            corp_code=corp_code,
+            year=year,
+            report_type=report_type
+        )
+
+    futures = [
+        loop.run_in_executor(_dart_executor, _fetch, year, report_type)
+        for year, _, report_type in targets
+    ]
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    fetched: dict[tuple[int, int], pd.DataFrame | None] = {}
+    for (year, quarter, _), result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.error(f"재무제표 조회 오류: {corp_code} {year}년 {quarter}분기 - {result}")
+            result = None
+        fetched[(year, quarter)] = result
+
+    fetch_seconds = time.perf_counter() - started
+    logger.info(
+        f"DART 동시 조회 완료: {corp_code} {len(targets)}건, {fetch_seconds:.2f}s "
+        f"(워커 {settings.dart_fetch_concurrency}개)"
+    )
+    return fetched, fetch_seconds
+
+
+def parse_fetched_statements(
+    dart_client: DARTClient,
+    fetched: dict[tuple[int, int], pd.DataFrame | None]
+) -> dict[tuple[int, int], dict]:
+    """
+    조회한 재무제표 전체를 일괄 파서로 한 번에 파싱
+
+    Args:
+        dart_client: DARTClient (일괄 파싱 실패 시 기간별 파싱에 사용)
+        fetched: {(year, quarter): DataFrame 또는 None}
+
+    Returns:
+        {(year, quarter): 파싱된 재무 데이터 딕셔너리}
+    """
+    frames = [
+        df.assign(fiscal_year=year, fiscal_quarter=quarter)
+        for (year, quarter), df in fetched.items()
+        if df is not None and not df.empty
+    ]
+    if not frames:
+        return {}
+
+    try:
+        parsed = parse_statement_frames(
+            pd.concat(frames, ignore_index=True),
+            keys=("fiscal_year", "fiscal_quarter")
+        )
+        return parsed_frames_to_dicts(parsed)
+
+    except Exception as e:
+        logger.warning(f"일괄 파싱 실패, 기간별 파싱으로 재시도: {e}", exc_info=True)
+        return {
+            period: dart_client.parse_financial_data(df)
+            for period, df in fetched.items()
+            if df is not None and not df.empty
+        }
+
+
 async def collect_financial_data(
     company_id: int,
     stock_code: str,
@@ -119,25 +223,29 @@ async def collect_financial_data(
         f"(총 {len(targets)}건, 기존 {len(existing)}건)"
     )
 
-    # DART에서 수집
-    for year, quarter, report_type in targets:
-        try:
-            logger.info(f"수집 중: {stock_code} {year}년 {quarter}분기 ({report_type})")
+    # DART에서 수집 (워커 풀에서 동시 조회)
+    wall_started = time.perf_counter()
+    fetched, fetch_seconds = await fetch_statements_concurrently(
+        dart_client, corp_code, targets
+    )
 
-            # DART API 호출
-            df = dart_client.get_financial_statements(
-                corp_code=corp_code,
-                year=year,
-                report_type=report_type
-            )
+    # 조회한 모든 기간을 한 번에 파싱
+    parsed_by_period = parse_fetched_statements(dart_client, fetched)
+
+    # 파싱 및 저장은 의존성 순서대로 (연도 → 1Q → 2Q → 3Q → 연간)
+    # 2Q/3Q 현금흐름 단독 변환에 직전 분기 누적 값이 필요하기 때문
+    cumulative_by_period: dict[tuple[int, int], dict] = {}
+
+    for year, quarter, report_type in sorted(targets, key=lambda t: (t[0], t[1])):
+        try:
+            df = fetched.get((year, quarter))
 
             if df is None or df.empty:
                 logger.warning(f"데이터 없음: {stock_code} {year}년 {quarter}분기")
                 failed += 1
                 continue
 
-            # 재무 데이터 파싱
-            data = dart_client.parse_financial_data(df)
+            data = parsed_by_period.get((year, quarter))
 
             if not data:
                 logger.warning(f"파싱 실패: {stock_code} {year}년 {quarter}분기")
@@ -147,11 +255,13 @@ async def collect_financial_data(
             # 현금흐름표는 DART가 누적으로 제공하므로 단독 실적으로 변환
             # 손익계산서는 이미 단독, 재무상태표는 시점 기준이므로 변환 불필요
             if quarter != 4:  # 분기 데이터만 (Q4는 연간이므로 나중에 처리)
+                cumulative_by_period[(year, quarter)] = data
                 data = await convert_cashflow_to_standalone(
                     company_id=company_id,
                     fiscal_year=year,
                     fiscal_quarter=quarter,
-                    cumulative_data=data
+                    cumulative_data=data,
+                    prev_cumulative=cumulative_by_period.get((year, quarter - 1))
                 )
 
             # DB 저장
@@ -182,9 +292,11 @@ async def collect_financial_data(
 
     skipped = len(existing) if not force_update else 0
 
+    wall_seconds = time.perf_counter() - wall_started
     logger.info(
         f"재무데이터 수집 완료: {stock_code} "
-        f"(수집: {collected}, 스킵: {skipped}, 실패: {failed})"
+        f"(수집: {collected}, 스킵: {skipped}, 실패: {failed}, "
+        f"DART 조회: {fetch_seconds:.2f}s, 전체: {wall_seconds:.2f}s)"
     )
 
     # 다중 소스 fallback (DART 실패한 연간 데이터만)
@@ -354,26 +466,34 @@ def validate_financial_data(
     }
 
 
-async def save_financial_statement(
+# financial_statements 재무 항목 컬럼 (파싱 결과 딕셔너리 키와 동일)
+STATEMENT_FIELDS = (
+    "revenue", "operating_income", "net_income",
+    "total_assets", "total_liabilities", "total_equity",
+    "current_assets", "current_liabilities", "inventories",
+    "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "capex",
+)
+
+
+def prepare_statement_record(
     company_id: int,
     fiscal_year: int,
-    fiscal_quarter: int,
-    report_type: str,
     data: dict,
     metadata: dict = None,
     stock_code: str = None
-):
+) -> tuple[dict, dict]:
     """
-    재무제표 데이터를 DB에 저장 (upsert)
+    저장할 재무 항목 값과 메타데이터를 만듭니다 (단위 검증 및 자동 수정 적용).
 
     Args:
         company_id: Company.id
         fiscal_year: 회계연도
-        fiscal_quarter: 분기 (1-4)
-        report_type: "annual" 또는 "quarterly"
         data: 파싱된 재무 데이터
         metadata: 메타데이터 (추정 여부 등)
-        stock_code: 종목 코드 (검증용, 선택)
+        stock_code: 종목 코드 (로깅용)
+
+    Returns:
+        ({컬럼: 값}, raw_data_json에 저장할 메타데이터)
     """
     # 데이터 검증 및 자동 수정
     validation = validate_financial_data(company_id, fiscal_year, data, stock_code, metadata)
@@ -387,48 +507,53 @@ async def save_financial_statement(
         logger.warning(f"단위 검증 경고가 있습니다. 자동 수정 적용됨: {metadata.get('auto_corrections', [])}")
         if "unit_validation_warnings" not in metadata:
             metadata["unit_validation_warnings"] = validation["warnings"]
+
+    return {field: data.get(field) for field in STATEMENT_FIELDS}, metadata or {}
+
+
+async def save_financial_statement(
+    company_id: int,
+    fiscal_year: int,
+    fiscal_quarter: int,
+    report_type: str,
+    data: dict,
+    metadata: dict = None,
+    stock_code: str = None
+):
+    """
+    재무제표 데이터를 DB에 저장 (upsert)
+
+    Args:
+        company_id: Company.id
+        fiscal_year: 회계연도
+        fiscal_quarter: 분기 (1-4)
+        report_type: "annual" 또는 "quarterly"
+        data: 파싱된 재무 데이터
+        metadata: 메타데이터 (추정 여부 등)
+        stock_code: 종목 코드 (검증용, 선택)
+    """
+    values, metadata = prepare_statement_record(
+        company_id, fiscal_year, data, metadata, stock_code
+    )
+
     async with async_session_factory() as session:
         stmt = pg_insert(FinancialStatement).values(
             company_id=company_id,
             fiscal_year=fiscal_year,
             fiscal_quarter=fiscal_quarter,
             report_type=report_type,
-            revenue=data.get("revenue"),
-            operating_income=data.get("operating_income"),
-            net_income=data.get("net_income"),
-            total_assets=data.get("total_assets"),
-            total_liabilities=data.get("total_liabilities"),
-            total_equity=data.get("total_equity"),
-            current_assets=data.get("current_assets"),
-            current_liabilities=data.get("current_liabilities"),
-            inventories=data.get("inventories"),
-            operating_cash_flow=data.get("operating_cash_flow"),
-            investing_cash_flow=data.get("investing_cash_flow"),
-            financing_cash_flow=data.get("financing_cash_flow"),
-            capex=data.get("capex"),
+            **values,
             dividends_paid=None,  # 현재 파싱 안 됨
             shares_outstanding=None,  # 현재 파싱 안 됨
-            raw_data_json=metadata or {}  # 메타데이터 저장
+            raw_data_json=metadata  # 메타데이터 저장
         )
 
         # Unique constraint 충돌 시 업데이트
         stmt = stmt.on_conflict_do_update(
             index_elements=["company_id", "fiscal_year", "fiscal_quarter", "report_type"],
             set_={
-                "revenue": stmt.excluded.revenue,
-                "operating_income": stmt.excluded.operating_income,
-                "net_income": stmt.excluded.net_income,
-                "total_assets": stmt.excluded.total_assets,
-                "total_liabilities": stmt.excluded.total_liabilities,
-                "total_equity": stmt.excluded.total_equity,
-                "current_assets": stmt.excluded.current_assets,
-                "current_liabilities": stmt.excluded.current_liabilities,
-                "inventories": stmt.excluded.inventories,
-                "operating_cash_flow": stmt.excluded.operating_cash_flow,
-                "investing_cash_flow": stmt.excluded.investing_cash_flow,
-                "financing_cash_flow": stmt.excluded.financing_cash_flow,
-                "capex": stmt.excluded.capex,
-                "raw_data_json": stmt.excluded.raw_data_json,
+                column: stmt.excluded[column]
+                for column in (*STATEMENT_FIELDS, "raw_data_json")
             }
         )
 
@@ -496,12 +621,29 @@ async def update_per_pbr(company_id: int, stock_code: str):
     # 시가총액 배치 조회 (금융위원회 → pykrx fallback)
     market_data = {}
     try:
-        market_data = _get_market_cap_batch_with_fallback(
-            stock_code,
-            dates_to_fetch,
-            public_client,
-            stock_client
-        )
+        # 1차: 금융위원회 API (비동기 동시 조회)
+        if public_client:
+            try:
+                market_data = await public_client.aget_market_cap_batch(stock_code, dates_to_fetch)
+                if market_data:
+                    logger.info(
+                        f"✓ 시가총액: 금융위원회 ({stock_code}, "
+                        f"{len(market_data)}/{len(dates_to_fetch)}건)"
+                    )
+            except Exception as e:
+                logger.warning(f"금융위원회 API 실패: {e} → pykrx fallback")
+
+        # 2차: pykrx (빠진 날짜만, 동기 조회이므로 KRX 워커 풀에서 실행)
+        missing_dates = [d for d in dates_to_fetch if d not in market_data]
+        if missing_dates:
+            market_data.update(await run_krx(
+                _get_market_cap_batch_with_fallback,
+                stock_code,
+                missing_dates,
+                None,
+                stock_client
+            ))
+
         if market_data:
             logger.info(f"시가총액 조회 성공: {stock_code} ({len(market_data)}/{len(dates_to_fetch)}건)")
         else:
@@ -737,16 +879,20 @@ def _get_market_cap_batch_with_fallback(
     missing_dates = [d for d in dates if d not in results]
     if missing_dates:
         try:
-            # 최소/최대 날짜 범위로 조회
-            min_date = min(missing_dates)
-            max_date = max(missing_dates)
+            # 휴장일 대응: 거래일 캘린더로 각 날짜의 직전 거래일을 찾아 정확한 범위만 조회
+            calendar = get_trading_calendar()
+            trading_days = [calendar.last_trading_day(d) for d in missing_dates]
 
-            # 휴장일 대응: 앞 45일, 뒤 7일 여유 (연말 특별 휴장 대응)
-            min_date_dt = datetime.strptime(min_date, "%Y%m%d")
-            max_date_dt = datetime.strptime(max_date, "%Y%m%d")
+            if all(trading_days):
+                start = min(trading_days).strftime("%Y%m%d")
+                end = max(trading_days).strftime("%Y%m%d")
+            else:
+                # 캘린더를 쓸 수 없으면 앞 45일, 뒤 7일 여유 (연말 특별 휴장 대응)
+                min_date_dt = datetime.strptime(min(missing_dates), "%Y%m%d")
+                max_date_dt = datetime.strptime(max(missing_dates), "%Y%m%d")
 
-            start = (min_date_dt - timedelta(days=45)).strftime("%Y%m%d")
-            end = (max_date_dt + timedelta(days=7)).strftime("%Y%m%d")
+                start = (min_date_dt - timedelta(days=45)).strftime("%Y%m%d")
+                end = (max_date_dt + timedelta(days=7)).strftime("%Y%m%d")
 
             cap_df = stock_client.get_market_cap(stock_code, start, end)
 
@@ -774,11 +920,67 @@ def _get_market_cap_batch_with_fallback(
     return results
 
 
+# DART가 연초부터 누적으로 제공하는 현금흐름표 항목
+CASHFLOW_FIELDS = ("operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "capex")
+
+
+def _sum_standalone_cashflow(statements: list) -> dict:
+    """
+    저장된 단독 분기 현금흐름의 합계 (= 마지막 분기까지의 누적)
+
+    Args:
+        statements: 1Q부터 연속된 단독 분기 FinancialStatement 목록
+
+    Returns:
+        {항목: 누적 값} (한 분기라도 값이 없는 항목은 None)
+    """
+    cumulative = {}
+    for field in CASHFLOW_FIELDS:
+        values = [getattr(stmt, field, None) for stmt in statements]
+        cumulative[field] = sum(values) if all(v is not None for v in values) else None
+    return cumulative
+
+
+def _subtract_cashflow(data: dict, prior_cumulative: dict, label: str) -> dict:
+    """현금흐름 누적 값에서 직전 분기까지의 누적을 빼서 단독 값으로 변환 (data를 갱신하여 반환)"""
+    for field in CASHFLOW_FIELDS:
+        value = data.get(field)
+        prior_value = prior_cumulative.get(field)
+        if value is not None and prior_value is not None:
+            data[field] = value - prior_value
+            logger.debug(
+                f"{label} {field} 단독 변환: "
+                f"누적 {value:,} - 직전분기 누적 {prior_value:,} = {data[field]:,}"
+            )
+    return data
+
+
+async def _load_prior_quarter_statements(
+    company_id: int,
+    fiscal_year: int,
+    fiscal_quarter: int
+) -> list[FinancialStatement]:
+    """같은 연도의 저장된 단독 분기 실적 (1Q ~ fiscal_quarter-1, 분기 순)"""
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(FinancialStatement)
+            .where(
+                FinancialStatement.company_id == company_id,
+                FinancialStatement.fiscal_year == fiscal_year,
+                FinancialStatement.fiscal_quarter < fiscal_quarter,
+                FinancialStatement.report_type == "quarterly"
+            )
+            .order_by(FinancialStatement.fiscal_quarter)
+        )
+        return list(result.scalars().all())
+
+
 async def convert_cashflow_to_standalone(
     company_id: int,
     fiscal_year: int,
     fiscal_quarter: int,
-    cumulative_data: dict
+    cumulative_data: dict,
+    prev_cumulative: dict | None = None
 ) -> dict:
     """
     현금흐름표 항목을 누적에서 단독 실적으로 변환합니다.
@@ -788,6 +990,9 @@ async def convert_cashflow_to_standalone(
     - 2Q: 누적 - 1Q 누적 = 2Q 단독
     - 3Q: 누적 - 2Q 누적 = 3Q 단독
 
+    직전 분기 누적은 같은 수집 실행에서 조회한 값(prev_cumulative)을 쓰고, 없으면
+    DB에 저장된 1Q ~ 직전 분기 단독 값을 합산해 구합니다. 두 경로의 결과는 같습니다.
+
     손익계산서는 DART가 이미 단독으로 제공하므로 변환하지 않습니다.
     재무상태표는 시점 기준이므로 변환 개념이 없습니다.
 
@@ -796,51 +1001,36 @@ async def convert_cashflow_to_standalone(
         fiscal_year: 회계연도
         fiscal_quarter: 분기 (1, 2, 3)
         cumulative_data: DART에서 파싱한 누적 데이터
+        prev_cumulative: 직전 분기 누적 데이터 (같은 수집 실행에서 조회한 경우).
+            없으면 DB에 저장된 단독 분기 값의 합계를 사용합니다.
 
     Returns:
         단독 실적으로 변환된 데이터
     """
     data = cumulative_data.copy()
+    label = f"{fiscal_year}/{fiscal_quarter}Q"
 
     # 1분기는 누적 = 단독이므로 변환 불필요
     if fiscal_quarter == 1:
         return data
 
-    # 이전 분기 데이터 조회
-    prev_quarter = fiscal_quarter - 1
-
-    async with async_session_factory() as session:
-        result = await session.execute(
-            select(FinancialStatement)
-            .where(
-                FinancialStatement.company_id == company_id,
-                FinancialStatement.fiscal_year == fiscal_year,
-                FinancialStatement.fiscal_quarter == prev_quarter
-            )
-        )
-        prev_statement = result.scalar_one_or_none()
+    # 현금흐름표 항목만 단독으로 변환 (손익, 재무상태는 그대로)
+    if prev_cumulative is not None:
+        return _subtract_cashflow(data, prev_cumulative, label)
 
-    if not prev_statement:
+    # 저장된 1Q ~ 직전 분기 단독 값 합계 = 직전 분기 누적
+    prior_statements = await _load_prior_quarter_statements(
+        company_id, fiscal_year, fiscal_quarter
+    )
+    missing = set(range(1, fiscal_quarter)) - {stmt.fiscal_quarter for stmt in prior_statements}
+    if missing:
         logger.warning(
-            f"이전 분기 데이터 없음: {fiscal_year}/{prev_quarter}Q - "
+            f"이전 분기 데이터 없음: {fiscal_year}/{sorted(missing)}Q - "
             f"현금흐름 단독 변환 불가, 누적 값 사용"
         )
         return data
 
-    # 현금흐름표 항목만 단독으로 변환 (손익, 재무상태는 그대로)
-    cf_fields = ["operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "capex"]
-
-    for field in cf_fields:
-        if field in data and data[field] is not None:
-            prev_value = getattr(prev_statement, field, None)
-            if prev_value is not None:
-                data[field] = data[field] - prev_value
-                logger.debug(
-                    f"{fiscal_year}/{fiscal_quarter}Q {field} 단독 변환: "
-                    f"누적 {cumulative_data[field]:,} - 이전분기 {prev_value:,} = {data[field]:,}"
-                )
-
-    return data
+    return _subtract_cashflow(data, _sum_standalone_cashflow(prior_statements), label)
 
 
 async def generate_q4_standalone_statements(company_id: int, stock_code: str):
@@ -948,29 +1138,17 @@ async def generate_q4_standalone_statements(company_id: int, stock_code: str):
                 "current_liabilities": annual.current_liabilities,
                 "inventories": annual.inventories,
 
-                # 현금흐름: 연간 - 3Q 누적
-                "operating_cash_flow": (
-                    (annual.operating_cash_flow - q3_statement.operating_cash_flow)
-                    if (annual.operating_cash_flow and q3_statement.operating_cash_flow)
-                    else None
-                ),
-                "investing_cash_flow": (
-                    (annual.investing_cash_flow - q3_statement.investing_cash_flow)
-                    if (annual.investing_cash_flow and q3_statement.investing_cash_flow)
-                    else None
-                ),
-                "financing_cash_flow": (
-                    (annual.financing_cash_flow - q3_statement.financing_cash_flow)
-                    if (annual.financing_cash_flow and q3_statement.financing_cash_flow)
-                    else None
-                ),
-                "capex": (
-                    (annual.capex - q3_statement.capex)
-                    if (annual.capex and q3_statement.capex)
-                    else None
-                ),
+                # 현금흐름: 연간 누적 (아래에서 단독으로 변환)
+                **{field: getattr(annual, field, None) for field in CASHFLOW_FIELDS},
             }
 
+            # 현금흐름: 연간 - 3Q 누적 (= 저장된 1Q+2Q+3Q 단독 합계, 2Q·3Q 변환과 같은 규칙)
+            prior_cumulative = _sum_standalone_cashflow([*q1_q2_statements, q3_statement])
+            _subtract_cashflow(q4_data, prior_cumulative, f"{year}/4Q")
+            for field in CASHFLOW_FIELDS:
+                if prior_cumulative[field] is None:
+                    q4_data[field] = None  # 연간 누적을 4Q 단독으로 저장하지 않음
+
             # 4Q 단독 실적 저장 (fiscal_quarter=4, report_type="quarterly")
             await save_financial_statement(
                 company_id=company_id,
@@ -0,0 +1,234 @@
+"""
+일별 주가 적재 서비스
+
+종목별로 stock_prices에 저장된 마지막 거래일 이후 구간만 KRX에서 받아
+OHLCV + 시가총액을 일괄 upsert합니다. 장 마감 후 하루 한 번 실행하는 것을 전제로 합니다.
+
+- 처음 적재하는 종목은 settings.stock_price_history_days 기간을 받습니다.
+- KRX 조회는 run_krx()로 KRX 워커 풀에서 실행하여 여러 종목을 동시에 처리합니다.
+
+run_snapshot_ingest()는 종목별 조회 대신 거래일마다 시장 전체 조회 3건
+(OHLCV, 시가총액, PER/PBR 등 지표)으로 전 종목 행을 만들어 저장합니다.
+전체 종목을 매일 갱신할 때는 이 방식이 요청 수가 훨씬 적습니다.
+조회에 실패한 날은 저장된 행이 없는 거래일로 남아 다음 실행에서 다시 받습니다.
+"""
+import asyncio
+import logging
+import time
+from datetime import date, timedelta
+
+from app.config import settings
+from app.data_sources.krx_session import run_krx
+from app.data_sources.stock_client import StockClient
+from app.data_sources.stock_price_store import StockPriceStore, get_stock_price_store
+from app.data_sources.trading_calendar import get_trading_calendar
+from app.services.batch_refresh_service import load_refresh_targets
+
+logger = logging.getLogger(__name__)
+
+
+async def run_price_ingest(
+    stock_codes: list[str] | None = None,
+    workers: int | None = None,
+    history_days: int | None = None,
+    active_only: bool = True
+) -> dict:
+    """
+    일별 주가 증분 적재
+
+    Args:
+        stock_codes: 특정 종목코드만 (None이면 전체)
+        workers: 동시에 조회할 종목 수 (기본값: settings.krx_pool_size)
+        history_days: 처음 적재하는 종목의 조회 기간 (기본값: settings.stock_price_history_days)
+        active_only: True면 is_active 종목만
+
+    Returns:
+        {
+            "total": int, "updated": int, "up_to_date": int, "failed": int,
+            "rows": int, "elapsed_seconds": float, "failed_companies": [str, ...]
+        }
+    """
+    workers = workers or settings.krx_pool_size
+    history_days = history_days or settings.stock_price_history_days
+
+    store = get_stock_price_store()
+    client = StockClient(read_through=False)  # 적재는 항상 KRX 원본 조회
+
+    companies = await load_refresh_targets(stock_codes, active_only)
+    last_dates = await asyncio.to_thread(
+        store.get_last_trade_dates, [company["id"] for company in companies]
+    )
+
+    today = date.today()
+    default_start = today - timedelta(days=history_days)
+    pending = []
+    for company in companies:
+        last_date = last_dates.get(company["id"])
+        start = last_date + timedelta(days=1) if last_date else default_start
+        if start <= today:
+            pending.append((company, start))
+
+    logger.info(
+        f"주가 적재 시작: 대상 {len(companies)}개 (최신 {len(companies) - len(pending)}개 제외), "
+        f"동시 {workers}개"
+    )
+
+    semaphore = asyncio.Semaphore(workers)
+    failed_companies: list[str] = []
+    rows_written: list[int] = []
+    started = time.perf_counter()
+
+    async def _ingest(company: dict, start: date):
+        label = f"{company['company_name']}({company['stock_code']})"
+        async with semaphore:
+            try:
+                df = await run_krx(
+                    client.get_price_history,
+                    company["stock_code"],
+                    start.strftime("%Y%m%d"),
+                    today.strftime("%Y%m%d"),
+                )
+                written = await asyncio.to_thread(store.upsert, company["id"], df)
+                rows_written.append(written)
+                logger.info(f"주가 적재: {label} {start}~{today} {written}일")
+            except Exception as e:
+                failed_companies.append(label)
+                logger.error(f"주가 적재 실패: {label} - {e}", exc_info=True)
+
+    await asyncio.gather(*(_ingest(company, start) for company, start in pending))
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "total": len(companies),
+        "updated": sum(1 for written in rows_written if written),
+        "up_to_date": len(companies) - len(pending),
+        "failed": len(failed_companies),
+        "rows": sum(rows_written),
+        "elapsed_seconds": round(elapsed, 2),
+        "failed_companies": failed_companies,
+    }
+
+    logger.info(
+        f"주가 적재 완료: 갱신 {summary['updated']}개, {summary['rows']}행, "
+        f"실패 {summary['failed']}개, 소요 {elapsed:.1f}s"
+    )
+    return summary
+
+
+def _weekdays(start: date, end: date) -> list[date]:
+    """start~end 사이 평일 (공휴일은 조회 결과가 비어 있어 건너뜀)"""
+    days = []
+    current = start
+    while current <= end:
+        if current.weekday() < 5:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def _pending_snapshot_dates(
+    store: StockPriceStore,
+    today: date,
+    history_days: int
+) -> list[date]:
+    """
+    시장 스냅샷을 받아야 할 날짜
+
+    적재 기간(저장된 첫 거래일 또는 history_days 전부터 오늘까지) 중 저장된 행이 없는 거래일.
+    마지막 저장일 이후만 보면 중간에 실패한 날을 다시 받지 못하므로 거래일 캘린더로
+    빈 날을 찾습니다. 캘린더를 확인할 수 없으면 마지막 저장일 다음 날부터의 평일로 대신합니다.
+    """
+    window_start = today - timedelta(days=history_days)
+    stored = store.get_trade_dates(window_start, today)
+    if not stored:
+        return _weekdays(window_start, today)
+
+    start = min(stored)
+    trading_days = get_trading_calendar().trading_days(start, today - timedelta(days=1))
+    if trading_days is None:
+        logger.warning("거래일 캘린더 확인 실패, 마지막 저장일 이후만 적재")
+        return _weekdays(max(stored) + timedelta(days=1), today)
+
+    # 오늘은 캘린더에 아직 없으므로 평일이면 조회 (휴장일이면 스냅샷이 비어 건너뜀)
+    candidates = list(trading_days)
+    if today.weekday() < 5:
+        candidates.append(today)
+    return [day for day in candidates if day not in stored]
+
+
+async def run_snapshot_ingest(
+    trade_dates: list[date] | None = None,
+    workers: int | None = None,
+    history_days: int | None = None
+) -> dict:
+    """
+    시장 전체 일별 스냅샷 적재
+
+    Args:
+        trade_dates: 적재할 날짜 (None이면 적재 기간 중 저장된 행이 없는 거래일과 오늘,
+                     저장된 데이터가 없으면 history_days 기간)
+        workers: 동시에 조회할 날짜 수 (기본값: settings.krx_pool_size)
+        history_days: 최초 적재 기간 (기본값: settings.stock_price_history_days)
+
+    Returns:
+        {
+            "dates": int, "trading_days": int, "holidays": int, "failed": int,
+            "rows": int, "elapsed_seconds": float, "failed_dates": [str, ...]
+        }
+    """
+    workers = workers or settings.krx_pool_size
+    history_days = history_days or settings.stock_price_history_days
+
+    store = get_stock_price_store()
+    client = StockClient(read_through=False)
+
+    today = date.today()
+    if trade_dates is None:
+        trade_dates = await asyncio.to_thread(
+            _pending_snapshot_dates, store, today, history_days
+        )
+
+    company_ids = await asyncio.to_thread(store.get_company_ids)
+    logger.info(f"시장 스냅샷 적재 시작: {len(trade_dates)}일, 등록 종목 {len(company_ids)}개")
+
+    semaphore = asyncio.Semaphore(workers)
+    rows_written: list[int] = []
+    failed_dates: list[str] = []
+    holidays = 0
+    started = time.perf_counter()
+
+    async def _ingest(trade_date: date):
+        nonlocal holidays
+        async with semaphore:
+            try:
+                df = await run_krx(client.get_market_snapshot, trade_date.strftime("%Y%m%d"))
+                if df is None:
+                    holidays += 1
+                    return
+                written = await asyncio.to_thread(
+                    store.upsert_snapshot, trade_date, df, company_ids
+                )
+                rows_written.append(written)
+                logger.info(f"시장 스냅샷 적재: {trade_date} {written}개 종목")
+            except Exception as e:
+                failed_dates.append(str(trade_date))
+                logger.error(f"시장 스냅샷 적재 실패: {trade_date} - {e}", exc_info=True)
+
+    await asyncio.gather(*(_ingest(trade_date) for trade_date in trade_dates))
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "dates": len(trade_dates),
+        "trading_days": len(rows_written),
+        "holidays": holidays,
+        "failed": len(failed_dates),
+        "rows": sum(rows_written),
+        "elapsed_seconds": round(elapsed, 2),
+        "failed_dates": sorted(failed_dates),
+    }
+
+    logger.info(
+        f"시장 스냅샷 적재 완료: 거래일 {summary['trading_days']}일, {summary['rows']}행, "
+        f"휴장 {holidays}일, 실패 {summary['failed']}일, 소요 {elapsed:.1f}s"
+    )
+    return summary
@@ -0,0 +1,261 @@
+"""
+보관된 DART 사업보고서 재파싱 서비스
+
+파서 개선 후 dart_documents에 보관된 원문 XML을 다시 파싱하여,
+DART 웹 폴백(source="dart_web")으로 저장된 연간 재무제표를 갱신합니다.
+
+- XML 파싱은 CPU 작업이므로 ProcessPoolExecutor로 문서를 나눠 처리합니다.
+  워커는 보관 파일만 읽으며 DB·네트워크에 접근하지 않습니다.
+- 새 파싱 결과를 기존 컬럼 값과 raw_data_json 메타데이터와 비교하여
+  달라진 행만 한 번의 bulk UPDATE로 반영합니다.
+- 연간 값에서 계산하는 4Q 단독 실적과 PER/PBR은 갱신된 회사만 다시 계산합니다.
+"""
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.data_sources.dart_document_store import DARTDocumentStore, get_document_store
+from app.data_sources.dart_web_scraper import DARTDocumentParser
+from app.db.models import Company, FinancialStatement
+from app.db.session import get_sync_session
+from app.services.financial_service import (
+    STATEMENT_FIELDS,
+    generate_q4_standalone_statements,
+    prepare_statement_record,
+    update_per_pbr,
+)
+
+logger = logging.getLogger(__name__)
+
+# 재파싱 대상 행의 출처 (웹 폴백으로 저장된 연간 재무제표)
+_REPARSE_SOURCE = "dart_web"
+
+
+def _reparse_document(rcept_no: str, root_dir: str) -> tuple[str, dict | None, dict]:
+    """
+    워커 프로세스: 보관된 문서 1건 재파싱
+
+    Args:
+        rcept_no: 접수번호
+        root_dir: 문서 보관 디렉토리
+
+    Returns:
+        (접수번호, 재무 데이터 또는 None, 파싱 메타데이터)
+    """
+    xml_content = DARTDocumentStore(root_dir).load(rcept_no)
+    if not xml_content:
+        return rcept_no, None, {}
+
+    data, metadata = DARTDocumentParser().parse_document(xml_content)
+    return rcept_no, data or None, metadata
+
+
+def _normalize_json(value: dict) -> dict:
+    """JSONB 저장 후 값과 비교할 수 있도록 정규화 (튜플 → 리스트, 키 → 문자열)"""
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def diff_statement(existing: dict, values: dict, metadata: dict) -> list[str]:
+    """
+    기존 행과 재파싱 결과 비교
+
+    Args:
+        existing: 기존 행 ({재무 항목, "raw_data_json"})
+        values: 재파싱 후 재무 항목 값
+        metadata: 재파싱 후 raw_data_json
+
+    Returns:
+        달라진 컬럼 이름 목록 (같으면 빈 리스트)
+    """
+    changed = [field for field in STATEMENT_FIELDS if existing.get(field) != values.get(field)]
+    if (existing.get("raw_data_json") or {}) != _normalize_json(metadata):
+        changed.append("raw_data_json")
+    return changed
+
+
+def load_reparse_targets(
+    store: DARTDocumentStore,
+    corp_codes: list[str] | None = None,
+    years: list[int] | None = None
+) -> list[dict]:
+    """
+    재파싱 대상 조회 (보관 문서가 있는 웹 폴백 연간 재무제표)
+
+    같은 기간 문서가 여러 건(정정 공시)이면 가장 최근 접수번호를 사용합니다.
+
+    Returns:
+        [{"rcept_no", "statement_id", "company_id", "stock_code", "fiscal_year",
+          재무 항목..., "raw_data_json"}, ...]
+    """
+    documents = {
+        (doc["corp_code"], doc["fiscal_year"]): doc["rcept_no"]
+        for doc in store.list_documents(corp_codes, years)
+    }
+    if not documents:
+        return []
+
+    columns = [getattr(FinancialStatement, field) for field in STATEMENT_FIELDS]
+    query = (
+        select(
+            FinancialStatement.id.label("statement_id"),
+            FinancialStatement.company_id,
+            FinancialStatement.fiscal_year,
+            FinancialStatement.raw_data_json,
+            Company.corp_code,
+            Company.stock_code,
+            *columns,
+        )
+        .join(Company, Company.id == FinancialStatement.company_id)
+        .where(
+            FinancialStatement.fiscal_quarter == 4,
+            FinancialStatement.report_type == "annual",
+            FinancialStatement.raw_data_json["source"].astext == _REPARSE_SOURCE,
+            Company.corp_code.in_({corp_code for corp_code, _ in documents}),
+        )
+    )
+    if years:
+        query = query.where(FinancialStatement.fiscal_year.in_(years))
+
+    with get_sync_session() as session:
+        rows = [dict(row._mapping) for row in session.execute(query)]
+
+    targets = []
+    for row in rows:
+        rcept_no = documents.get((row["corp_code"], row["fiscal_year"]))
+        if rcept_no:
+            targets.append({"rcept_no": rcept_no, **row})
+    return targets
+
+
+async def refresh_derived_statements(companies: dict[int, str]) -> int:
+    """
+    연간 재무제표에서 계산하는 행 재계산 (4Q 단독 실적 → PER/PBR)
+
+    Args:
+        companies: {company_id: stock_code}
+
+    Returns:
+        재계산에 실패한 회사 수
+    """
+    failed = 0
+    for company_id, stock_code in companies.items():
+        try:
+            await generate_q4_standalone_statements(company_id, stock_code)
+            await update_per_pbr(company_id, stock_code)
+        except Exception as e:
+            failed += 1
+            logger.error(f"4Q 단독·PER/PBR 재계산 실패: {stock_code} - {e}", exc_info=True)
+    return failed
+
+
+def run_reparse(
+    corp_codes: list[str] | None = None,
+    years: list[int] | None = None,
+    workers: int | None = None,
+    dry_run: bool = False
+) -> dict:
+    """
+    보관 문서 재파싱 후 달라진 재무제표만 갱신
+
+    Args:
+        corp_codes: 특정 DART 기업코드만 (None이면 전체)
+        years: 특정 회계연도만 (None이면 전체)
+        workers: 파싱 프로세스 수 (기본값: settings.reparse_workers)
+        dry_run: True면 비교만 하고 DB에 쓰지 않음
+
+    Returns:
+        {
+            "total": int, "changed": int, "unchanged": int, "failed": int,
+            "changed_fields": {컬럼: 건수}, "derived_failed": int, "elapsed_seconds": float
+        }
+    """
+    store = get_document_store()
+    if store is None:
+        raise RuntimeError("DART 문서 보관이 비활성화되어 있습니다 (DART_DOCUMENT_ARCHIVE_ENABLED)")
+
+    workers = workers or settings.reparse_workers
+    targets = load_reparse_targets(store, corp_codes, years)
+    logger.info(f"재파싱 시작: 대상 {len(targets)}건, 프로세스 {workers}개")
+
+    started = time.perf_counter()
+    by_rcept_no = {target["rcept_no"]: target for target in targets}
+    updates: list[dict] = []
+    updated_companies: dict[int, str] = {}
+    changed_fields: dict[str, int] = {}
+    failed = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_reparse_document, rcept_no, str(store.root_dir)): rcept_no
+            for rcept_no in by_rcept_no
+        }
+
+        # 문서별로 결과 처리 (한 문서의 오류가 나머지 결과를 버리지 않도록)
+        for future in as_completed(futures):
+            rcept_no = futures[future]
+            target = by_rcept_no[rcept_no]
+            label = f"{target['stock_code']} {target['fiscal_year']}년 (rcpNo={rcept_no})"
+
+            try:
+                _, data, xml_metadata = future.result()
+            except Exception as e:
+                failed += 1
+                logger.error(f"재파싱 오류 (기존 값 유지): {label} - {e}", exc_info=True)
+                continue
+
+            if not data or not any(data.values()):
+                failed += 1
+                logger.warning(f"재파싱 실패 (기존 값 유지): {label}")
+                continue
+
+            # 웹 폴백 저장과 같은 방식으로 메타데이터 구성 및 검증
+            values, metadata = prepare_statement_record(
+                target["company_id"],
+                target["fiscal_year"],
+                data,
+                {"source": _REPARSE_SOURCE, "fallback": True, **xml_metadata},
+                target["stock_code"],
+            )
+
+            changed = diff_statement(target, values, metadata)
+            if not changed:
+                continue
+
+            for field in changed:
+                changed_fields[field] = changed_fields.get(field, 0) + 1
+            logger.info(f"변경 감지: {label} - {', '.join(changed)}")
+            updates.append({"id": target["statement_id"], **values, "raw_data_json": metadata})
+            updated_companies[target["company_id"]] = target["stock_code"]
+
+    derived_failed = 0
+    if updates and not dry_run:
+        # 기본키 기준 ORM bulk UPDATE (executemany 1회)
+        with get_sync_session() as session:
+            session.execute(update(FinancialStatement), updates)
+
+        # 연간 값으로 계산한 4Q 단독 실적·PER/PBR 갱신
+        logger.info(f"4Q 단독·PER/PBR 재계산: {len(updated_companies)}개 회사")
+        derived_failed = asyncio.run(refresh_derived_statements(updated_companies))
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "total": len(by_rcept_no),
+        "changed": len(updates),
+        "unchanged": len(by_rcept_no) - len(updates) - failed,
+        "failed": failed,
+        "changed_fields": changed_fields,
+        "derived_failed": derived_failed,
+        "elapsed_seconds": round(elapsed, 2),
+    }
+
+    logger.info(
+        f"재파싱 완료{' (dry-run)' if dry_run else ''}: 대상 {summary['total']}건, "
+        f"변경 {summary['changed']}, 동일 {summary['unchanged']}, 실패 {failed}, "
+        f"소요 {elapsed:.1f}s"
+    )
+    return summary
@@ -0,0 +1,133 @@
+"""
+보고서 생성 스트림
+
+비동기 보고서 생성 노드(agenerate_report_node)가 LLM에서 받는 텍스트 조각을 실행(run_id)별
+스트림에 publish하면, /analysis/runs/{run_id}/report/stream(SSE) 구독자가 이를 받아 전달합니다.
+
+- 구독자는 먼저 지금까지 생성된 본문(snapshot)을 받고, 이후 조각(delta)을 순서대로 받습니다.
+- 생성이 끝나면 done(보고서 ID, slug) 또는 error 이벤트로 종료됩니다.
+- 스트림은 생성 중인 프로세스의 메모리에만 있습니다. 다른 프로세스나 종료 후에는
+  DB에 저장된 부분 본문(체크포인트)으로 대신합니다.
+"""
+import asyncio
+import logging
+import threading
+from typing import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+# 스트림을 끝내는 이벤트
+TERMINAL_EVENTS = ("done", "error")
+
+
+class ReportStream:
+    """보고서 1건의 생성 스트림 (이벤트 루프 하나에서 사용)"""
+
+    def __init__(self, run_id: int, report_id: int | None = None, slug: str | None = None):
+        """
+        Args:
+            run_id: 분석 실행 ID
+            report_id: 초안 보고서 ID
+            slug: 보고서 slug
+        """
+        self.run_id = run_id
+        self.report_id = report_id
+        self.slug = slug
+
+        self._parts: list[str] = []
+        self._subscribers: set[asyncio.Queue] = set()
+        self._finished: tuple[str, dict] | None = None
+
+    @property
+    def content(self) -> str:
+        """지금까지 생성된 본문"""
+        return "".join(self._parts)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, text: str) -> None:
+        """생성된 조각을 구독자에게 전달"""
+        self._parts.append(text)
+        for queue in self._subscribers:
+            queue.put_nowait(("delta", {"content": text}))
+
+    def finish(self, event: str, data: dict) -> None:
+        """
+        스트림 종료
+
+        Args:
+            event: "done" 또는 "error"
+            data: 이벤트 데이터 (done: report_id, slug / error: message)
+        """
+        self._finished = (event, data)
+        for queue in self._subscribers:
+            queue.put_nowait((event, data))
+
+    async def events(self) -> AsyncIterator[tuple[str, dict]]:
+        """
+        구독: snapshot → delta … → done/error 순서로 (이벤트, 데이터) 반환
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        # snapshot 이후의 조각만 큐로 받도록 등록과 snapshot을 같은 시점에
+        self._subscribers.add(queue)
+        try:
+            yield "snapshot", {
+                "content": self.content,
+                "report_id": self.report_id,
+                "slug": self.slug,
+            }
+            if self._finished is not None:
+                yield self._finished
+                return
+
+            while True:
+                event, data = await queue.get()
+                yield event, data
+                if event in TERMINAL_EVENTS:
+                    return
+        finally:
+            self._subscribers.discard(queue)
+
+
+# 생성 중인 보고서 스트림 (run_id → ReportStream)
+_streams: dict[int, ReportStream] = {}
+_streams_lock = threading.Lock()
+
+
+def open_report_stream(
+    run_id: int,
+    report_id: int | None = None,
+    slug: str | None = None
+) -> ReportStream:
+    """보고서 생성 스트림 등록 (같은 run_id의 이전 스트림은 대체)"""
+    stream = ReportStream(run_id, report_id=report_id, slug=slug)
+    with _streams_lock:
+        _streams[run_id] = stream
+    return stream
+
+
+def get_report_stream(run_id: int) -> ReportStream | None:
+    """생성 중인 보고서 스트림 (없으면 None)"""
+    with _streams_lock:
+        return _streams.get(run_id)
+
+
+def close_report_stream(run_id: int, event: str, data: dict) -> None:
+    """
+    보고서 생성 스트림 종료 및 등록 해제 (등록되지 않았으면 무시)
+
+    Args:
+        run_id: 분석 실행 ID
+        event: "done" 또는 "error"
+        data: 이벤트 데이터
+    """
+    with _streams_lock:
+        stream = _streams.pop(run_id, None)
+    if stream is not None:
+        stream.finish(event, data)
+        logger.debug(
+            f"보고서 스트림 종료: run_id={run_id}, event={event}, "
+            f"구독자 {stream.subscribers}명"
+        )
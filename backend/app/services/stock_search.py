@@ -0,0 +1,154 @@
+"""
+종목 검색 색인
+
+/stocks/search의 검색 순서(종목코드 일치 → 종목명 시작 → 종목명 포함 → 종목코드 포함,
+같은 단계에서는 목록 순서)를 유지하면서, 매 검색마다 전체 목록을 훑지 않도록
+목록이 바뀔 때 한 번 색인을 만들어 둡니다.
+
+- 종목코드 일치: dict
+- 시작 일치: 정렬된 (문자열, 위치) 목록 + 이분 탐색
+- 포함 일치: 1·2글자 n-gram → 위치 목록(오름차순) 역색인, 후보를 교집합 후 확인
+- 초성 검색: 검색어가 모두 한글 초성(ㄱ~ㅎ)이면 종목명 초성 문자열로 시작·포함 일치
+  (예: "ㅅㅅㅈㅈ" → 삼성전자)
+"""
+import bisect
+from typing import Iterator
+
+# 한글 음절(가~힣)의 초성 (호환 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_HANGUL_START, _HANGUL_END = ord("가"), ord("힣")
+_SYLLABLES_PER_CHOSEONG = 21 * 28  # 중성 21 × 종성 28
+
+# 포함 검색 n-gram 길이 (1글자 검색어는 1-gram, 그 이상은 2-gram 교집합)
+_NGRAM_SIZES = (1, 2)
+
+
+def to_choseong(text: str) -> str:
+    """
+    한글 음절을 초성으로 변환 (한글이 아닌 문자는 그대로)
+
+    Args:
+        text: 예: "삼성전자"
+
+    Returns:
+        예: "ㅅㅅㅈㅈ"
+    """
+    chars = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            chars.append(CHOSEONG[(code - _HANGUL_START) // _SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def is_choseong_query(query: str) -> bool:
+    """검색어가 모두 한글 초성인지"""
+    return bool(query) and all(char in _CHOSEONG_SET for char in query)
+
+
+class _TextIndex:
+    """문자열 목록의 시작·포함 일치 색인 (결과는 목록 위치 오름차순)"""
+
+    def __init__(self, texts: list[str]):
+        self.texts = texts
+        self._sorted = sorted((text, position) for position, text in enumerate(texts))
+
+        grams: dict[str, list[int]] = {}
+        for position, text in enumerate(texts):
+            seen = set()
+            for size in _NGRAM_SIZES:
+                for start in range(len(text) - size + 1):
+                    gram = text[start:start + size]
+                    if gram not in seen:
+                        seen.add(gram)
+                        grams.setdefault(gram, []).append(position)
+        self._grams = grams
+
+    def prefix(self, query: str) -> list[int]:
+        """query로 시작하는 문자열 위치 (오름차순)"""
+        start = bisect.bisect_left(self._sorted, (query, -1))
+        positions = []
+        for text, position in self._sorted[start:]:
+            if not text.startswith(query):
+                break
+            positions.append(position)
+        positions.sort()
+        return positions
+
+    def contains(self, query: str) -> Iterator[int]:
+        """query를 포함하는 문자열 위치 (오름차순, 필요한 만큼만 확인)"""
+        if len(query) == 1:
+            yield from self._grams.get(query, ())
+            return
+
+        postings = []
+        for start in range(len(query) - 1):
+            posting = self._grams.get(query[start:start + 2])
+            if not posting:
+                return
+            postings.append(posting)
+
+        # 가장 짧은 위치 목록을 기준으로 나머지 n-gram을 모두 가진 후보만 확인
+        postings.sort(key=len)
+        others = [set(posting) for posting in postings[1:]]
+        for position in postings[0]:
+            if all(position in other for other in others) and query in self.texts[position]:
+                yield position
+
+
+class StockSearchIndex:
+    """종목 검색 색인 (생성 후 읽기 전용, 스레드 안전)"""
+
+    def __init__(self, entries: list[dict]):
+        """
+        Args:
+            entries: [{"stock_code", "company_name", ...}, ...] (목록 순서 = 같은 단계 내 순위)
+        """
+        codes = [entry["stock_code"] for entry in entries]
+        names = [entry["company_name"] or "" for entry in entries]
+
+        self._by_code: dict[str, int] = {}
+        for position, code in enumerate(codes):
+            self._by_code.setdefault(code, position)
+
+        self._codes = _TextIndex(codes)
+        self._names = _TextIndex(names)
+        self._choseong = _TextIndex([to_choseong(name) for name in names])
+
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        """
+        검색
+
+        Args:
+            query: 종목명·종목코드·초성 검색어 (앞뒤 공백 제거)
+            limit: 최대 결과 수
+
+        Returns:
+            검색 순위 순서의 목록 위치
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        names = self._choseong if is_choseong_query(query) else self._names
+        tiers = (
+            [self._by_code[query]] if query in self._by_code else [],  # 1차: 종목코드 일치
+            names.prefix(query),  # 2차: 종목명 시작 일치
+            names.contains(query),  # 3차: 종목명 부분 일치
+            self._codes.contains(query),  # 4차: 종목코드 부분 일치
+        )
+
+        results: list[int] = []
+        seen: set[int] = set()
+        for tier in tiers:
+            for position in tier:
+                if position in seen:
+                    continue
+                seen.add(position)
+                results.append(position)
+                if len(results) >= limit:
+                    return results
+        return results
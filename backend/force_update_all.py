@@ -5,123 +5,72 @@
 - 과거 잘못 저장된 데이터 정리
 - 최신 파싱 로직으로 모든 데이터 재수집
 - 증분 수집으로 인한 누락 데이터 해결
+
+회사들을 워커 풀로 나눠 병렬 처리하며(app.services.batch_refresh_service),
+진행 상황은 refresh_checkpoints 테이블에 기록되므로 중단 후 같은 --job으로
+다시 실행하면 완료된 회사는 건너뜁니다.
+
+Usage:
+    python force_update_all.py [--workers 4] [--job force-20260101] [--no-resume]
+    python force_update_all.py --stock-code 005930 --stock-code 000660
 """
-import sys
+import argparse
 import asyncio
-from pathlib import Path
+import logging
+import sys
 from datetime import datetime
+from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.services.financial_service import collect_financial_data
 from sqlalchemy import text
+
 from app.db.session import sync_engine
+from app.services.batch_refresh_service import MODE_FINANCIALS, run_batch_refresh
 
-async def force_update_all():
-    """전체 회사 재무 데이터 force_update"""
 
-    # 전체 회사 목록 조회
-    with sync_engine.connect() as conn:
-        result = conn.execute(
-            text("""
-                SELECT id, stock_code, company_name, corp_code
-                FROM companies
-                WHERE is_active = true
-                ORDER BY id
-            """)
-        )
-        companies = [dict(row._mapping) for row in result]
-
-    total = len(companies)
+async def force_update_all(
+    workers: int | None = None,
+    job_name: str | None = None,
+    resume: bool = True,
+    stock_codes: list[str] | None = None
+):
+    """전체 회사 재무 데이터 force_update"""
     print("=" * 100)
     print(f"전체 재무 데이터 강제 재수집 (force_update=True)")
-    print(f"대상: {total}개 회사")
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 100)
 
-    success_count = 0
-    failed_companies = []
-
-    for idx, company in enumerate(companies, 1):
-        company_id = company["id"]
-        stock_code = company["stock_code"]
-        company_name = company["company_name"]
-        corp_code = company["corp_code"]
-
-        print(f"\n[{idx}/{total}] {company_name} ({stock_code})")
-        print("-" * 100)
-
-        try:
-            # force_update=True로 재수집
-            result = await collect_financial_data(
-                company_id=company_id,
-                stock_code=stock_code,
-                corp_code=corp_code,
-                force_update=True
-            )
-
-            collected = result.get("collected", 0)
-            failed = result.get("failed", 0)
-
-            if result.get("success"):
-                success_count += 1
-                status = "✅ 성공"
-            else:
-                status = "⚠️ 부분 성공"
-                failed_companies.append(company_name)
-
-            print(f"\n결과: {status}")
-            print(f"  - 수집: {collected}건")
-            print(f"  - 실패: {failed}건")
-
-            # 수집된 데이터 샘플 확인 (최근 2년 연간)
-            with sync_engine.connect() as conn:
-                check_result = conn.execute(
-                    text("""
-                        SELECT
-                            fiscal_year,
-                            CASE WHEN revenue IS NULL THEN 'NULL' ELSE ROUND(revenue::numeric / 1e12, 2)::text || '조' END as revenue,
-                            CASE WHEN current_assets IS NULL THEN 'NULL' ELSE ROUND(current_assets::numeric / 1e12, 2)::text || '조' END as ca,
-                            CASE WHEN operating_cash_flow IS NULL THEN 'NULL' ELSE ROUND(operating_cash_flow::numeric / 1e12, 2)::text || '조' END as ocf
-                        FROM financial_statements
-                        WHERE company_id = :company_id
-                          AND report_type = 'annual'
-                          AND fiscal_year >= 2023
-                        ORDER BY fiscal_year DESC
-                        LIMIT 2
-                    """),
-                    {"company_id": company_id}
-                )
-
-                rows = list(check_result)
-                if rows:
-                    print(f"\n  최근 연간 데이터:")
-                    for row in rows:
-                        print(f"    {row[0]}년: 매출 {row[1]}, 유동자산 {row[2]}, 영업CF {row[3]}")
-                else:
-                    print(f"\n  ⚠️ 연간 데이터 없음")
-
-        except Exception as e:
-            print(f"\n❌ 오류 발생: {e}")
-            failed_companies.append(company_name)
-            import traceback
-            traceback.print_exc()
-
-        # 진행률 표시
-        print(f"\n진행률: {idx}/{total} ({idx/total*100:.1f}%)")
+    summary = await run_batch_refresh(
+        job_name=job_name,
+        mode=MODE_FINANCIALS,
+        workers=workers,
+        stock_codes=stock_codes,
+        resume=resume,
+        force_update=True
+    )
 
     # 최종 요약
     print("\n" + "=" * 100)
     print("전체 재수집 완료!")
     print("=" * 100)
     print(f"종료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"작업: {summary['job_name']}")
     print(f"\n결과:")
-    print(f"  - 성공: {success_count}/{total}개 회사")
-    print(f"  - 실패: {len(failed_companies)}개 회사")
-
-    if failed_companies:
+    print(f"  - 대상: {summary['total']}개 회사 (이전 실행에서 완료: {summary['resumed_skip']}개)")
+    print(f"  - 성공: {summary['succeeded']}개 회사")
+    print(f"  - 실패: {summary['failed']}개 회사")
+    print(f"  - 보류 (DART 일일 한도): {summary['deferred']}개 회사")
+    print("\n성능:")
+    print(f"  - 소요 시간: {summary['elapsed_seconds']:.1f}초")
+    print(f"  - 처리량: {summary['throughput_per_hour']:.1f}개/시간")
+    if summary["latency_p50"] is not None:
+        print(f"  - 회사별 소요 시간 p50: {summary['latency_p50']:.1f}초")
+        print(f"  - 회사별 소요 시간 p95: {summary['latency_p95']:.1f}초")
+
+    if summary["failed_companies"]:
         print(f"\n실패한 회사:")
-        for name in failed_companies:
+        for name in summary["failed_companies"]:
             print(f"  - {name}")
 
     # 전체 통계
@@ -157,5 +106,33 @@ async def force_update_all():
 
     print("\n" + "=" * 100)
 
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 재무 데이터 강제 재수집")
+    parser.add_argument(
+        "--workers", type=int, help="동시에 처리할 회사 수 (기본값: BATCH_REFRESH_WORKERS)"
+    )
+    parser.add_argument(
+        "--job", type=str, help="작업 이름 (체크포인트 키, 기본값: financials-YYYYMMDD-HHMMSS)"
+    )
+    parser.add_argument(
+        "--no-resume", action="store_true", help="체크포인트 무시하고 처음부터 실행"
+    )
+    parser.add_argument("--stock-code", action="append", help="특정 종목코드만 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    asyncio.run(force_update_all(
+        workers=args.workers,
+        job_name=args.job,
+        resume=not args.no_resume,
+        stock_codes=args.stock_code
+    ))
+
+
 if __name__ == "__main__":
-    asyncio.run(force_update_all())
+    main()
@@ -3,66 +3,51 @@
 모든 종목의 PER/PBR을 일괄 갱신합니다.
 
 Usage:
-    python scripts/batch_update_per_pbr.py [--stock-code 005930]
+    python scripts/batch_update_per_pbr.py [--stock-code 005930] [--workers 4]
 """
 import asyncio
 import argparse
+import logging
 import sys
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
-from app.db.models import Company
-from app.db.session import async_session_factory
-from app.services.financial_service import update_per_pbr
+from app.services.batch_refresh_service import MODE_PER_PBR, run_batch_refresh
 
 
-async def update_all_stocks(stock_code: str = None):
+async def update_all_stocks(stock_code: str = None, workers: int = None):
     """
     모든 종목 또는 특정 종목의 PER/PBR을 갱신합니다.
 
     Args:
         stock_code: 특정 종목코드 (None이면 전체)
+        workers: 동시에 처리할 종목 수 (None이면 설정값)
     """
-    async with async_session_factory() as session:
-        query = select(Company.id, Company.stock_code, Company.company_name)
-
-        if stock_code:
-            query = query.where(Company.stock_code == stock_code)
-        else:
-            query = query.order_by(Company.stock_code)
-
-        result = await session.execute(query)
-        companies = result.all()
-
-    if not companies:
-        print(f"종목을 찾을 수 없습니다: {stock_code if stock_code else '전체'}")
-        return
-
-    total = len(companies)
     print(f"\n{'='*60}")
-    print(f"PER/PBR 일괄 갱신 시작: {total}개 종목")
+    print(f"PER/PBR 일괄 갱신 시작: {stock_code if stock_code else '전체'}")
     print(f"{'='*60}\n")
 
-    success = 0
-    failed = 0
-
-    for idx, (company_id, stock_code, company_name) in enumerate(companies, 1):
-        print(f"[{idx}/{total}] {stock_code} {company_name}")
-        print("-" * 60)
+    summary = await run_batch_refresh(
+        mode=MODE_PER_PBR,
+        workers=workers,
+        stock_codes=[stock_code] if stock_code else None,
+        active_only=False,
+        resume=False
+    )
 
-        try:
-            await update_per_pbr(company_id, stock_code)
-            success += 1
-            print(f"✓ 완료\n")
-        except Exception as e:
-            failed += 1
-            print(f"✗ 실패: {e}\n")
+    if not summary["total"]:
+        print(f"종목을 찾을 수 없습니다: {stock_code if stock_code else '전체'}")
+        return
 
     print(f"\n{'='*60}")
-    print(f"갱신 완료: 성공 {success}개, 실패 {failed}개")
+    print(f"갱신 완료: 성공 {summary['succeeded']}개, 실패 {summary['failed']}개")
+    if summary["latency_p50"] is not None:
+        print(
+            f"소요 {summary['elapsed_seconds']:.1f}초, "
+            f"p50 {summary['latency_p50']:.1f}초, p95 {summary['latency_p95']:.1f}초"
+        )
     print(f"{'='*60}\n")
 
 
@@ -73,9 +58,19 @@ def main():
         type=str,
         help="특정 종목코드만 갱신 (생략 시 전체)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="동시에 처리할 종목 수 (생략 시 BATCH_REFRESH_WORKERS)"
+    )
     args = parser.parse_args()
 
-    asyncio.run(update_all_stocks(args.stock_code))
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    asyncio.run(update_all_stocks(args.stock_code, args.workers))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+일별 주가(OHLCV + 시가총액)를 stock_prices 테이블에 증분 적재합니다.
+
+종목별 마지막 저장일 이후 구간만 KRX에서 조회하므로 매일 장 마감 후 실행합니다.
+--snapshot은 거래일마다 시장 전체 조회(3건)로 전 종목을 한 번에 적재합니다 (PER/PBR 포함).
+
+Usage:
+    python scripts/ingest_stock_prices.py [--stock-code 005930] [--workers 8] [--history-days 730]
+    python scripts/ingest_stock_prices.py --snapshot [--date 2024-06-28]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.price_ingest_service import run_price_ingest, run_snapshot_ingest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일별 주가 증분 적재")
+    parser.add_argument(
+        "--stock-code",
+        type=str,
+        action="append",
+        help="특정 종목코드만 (여러 번 지정 가능, 생략 시 전체)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="동시에 조회할 종목 수 (생략 시 KRX_POOL_SIZE)"
+    )
+    parser.add_argument(
+        "--history-days",
+        type=int,
+        help="처음 적재하는 종목의 조회 기간 (생략 시 STOCK_PRICE_HISTORY_DAYS)"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="비활성 종목도 포함"
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="시장 전체 일별 스냅샷으로 적재 (전 종목 갱신 시 요청 수 최소)"
+    )
+    parser.add_argument(
+        "--date",
+        type=str,
+        action="append",
+        help="--snapshot 적재 날짜 YYYY-MM-DD (여러 번 지정 가능, 생략 시 저장되지 않은 거래일)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    if args.snapshot:
+        trade_dates = (
+            [datetime.strptime(d, "%Y-%m-%d").date() for d in args.date] if args.date else None
+        )
+        summary = asyncio.run(run_snapshot_ingest(
+            trade_dates=trade_dates,
+            workers=args.workers,
+            history_days=args.history_days
+        ))
+
+        print(f"\n{'='*60}")
+        print(
+            f"시장 스냅샷 적재 완료: {summary['dates']}일 중 거래일 {summary['trading_days']}일 "
+            f"({summary['rows']}행), 휴장 {summary['holidays']}일, 실패 {summary['failed']}일"
+        )
+        print(f"소요 {summary['elapsed_seconds']:.1f}초")
+        print(f"{'='*60}\n")
+        return
+
+    summary = asyncio.run(run_price_ingest(
+        stock_codes=args.stock_code,
+        workers=args.workers,
+        history_days=args.history_days,
+        active_only=not args.all
+    ))
+
+    print(f"\n{'='*60}")
+    print(
+        f"주가 적재 완료: 대상 {summary['total']}개, 갱신 {summary['updated']}개 "
+        f"({summary['rows']}행), 최신 {summary['up_to_date']}개, 실패 {summary['failed']}개"
+    )
+    print(f"소요 {summary['elapsed_seconds']:.1f}초")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+보관된 DART 사업보고서를 다시 파싱하여 웹 폴백 재무제표를 갱신합니다.
+
+파서를 수정한 뒤 DART API 재호출 없이 기존 데이터에 반영할 때 사용합니다.
+
+Usage:
+    python scripts/reparse_archived_documents.py [--corp-code 00126380] [--year 2015]
+        [--workers 4] [--dry-run]
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.reparse_service import run_reparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 사업보고서 재파싱")
+    parser.add_argument(
+        "--corp-code",
+        type=str,
+        action="append",
+        help="특정 DART 기업코드만 (여러 번 지정 가능, 생략 시 전체)"
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        action="append",
+        help="특정 회계연도만 (여러 번 지정 가능, 생략 시 전체)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="파싱 프로세스 수 (생략 시 REPARSE_WORKERS)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="변경 사항만 확인하고 DB에 쓰지 않음"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    summary = run_reparse(
+        corp_codes=args.corp_code,
+        years=args.year,
+        workers=args.workers,
+        dry_run=args.dry_run
+    )
+
+    print(f"\n{'='*60}")
+    print(
+        f"재파싱 완료{' (dry-run)' if args.dry_run else ''}: 대상 {summary['total']}건, "
+        f"변경 {summary['changed']}건, 동일 {summary['unchanged']}건, 실패 {summary['failed']}건"
+    )
+    for field, count in sorted(summary["changed_fields"].items()):
+        print(f"  {field}: {count}건")
+    if summary["derived_failed"]:
+        print(f"4Q 단독·PER/PBR 재계산 실패: {summary['derived_failed']}개 회사")
+    print(f"소요 {summary['elapsed_seconds']:.1f}초")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+분석 실행 큐 테스트
+
+LLM·DB 대신 지연만 있는 가짜 파이프라인으로
+1. 동시 실행 수가 max_concurrency를 넘지 않고, 한도까지는 동시에 실행되는지
+2. 스레드 2개 실행기 대비 처리 시간
+3. 종료 시 대기·실행 중 분석이 취소 기록되는지
+를 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+import time
+
+from app.services.analysis_queue import AnalysisRunQueue
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+# 분석 1건의 I/O 대기 시간 (LLM 호출 등)
+_RUN_SECONDS = 0.05
+
+
+class _FakePipeline:
+    """지연 후 성공을 반환, 동시 실행 수 기록"""
+
+    def __init__(self, seconds: float = _RUN_SECONDS):
+        self.seconds = seconds
+        self.active = 0
+        self.peak = 0
+        self.started: list[int] = []
+
+    async def __call__(
+        self,
+        run_id: int,
+        company_id: int,
+        stock_code: str,
+        company_name: str
+    ) -> dict:
+        self.started.append(run_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.seconds)
+        finally:
+            self.active -= 1
+        return {"success": True, "run_id": run_id}
+
+
+async def _run_batch(
+    count: int,
+    max_concurrency: int
+) -> tuple[_FakePipeline, AnalysisRunQueue, float]:
+    pipeline = _FakePipeline()
+    queue = AnalysisRunQueue(max_concurrency, pipeline=pipeline)
+
+    started = time.perf_counter()
+    tasks = [
+        queue.submit(run_id, run_id, f"{run_id:06d}", f"회사{run_id}") for run_id in range(count)
+    ]
+    results = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    assert [result["run_id"] for result in results] == list(range(count))
+    return pipeline, queue, elapsed
+
+
+def test_concurrency_limit():
+    """동시 실행 수 = min(요청 수, max_concurrency), 제출 순서대로 시작"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 동시 실행 한도")
+    print("=" * 80)
+
+    pipeline, queue, _ = asyncio.run(_run_batch(count=40, max_concurrency=16))
+    assert pipeline.peak == 16
+    assert pipeline.started == list(range(40))
+    assert queue.stats() == {
+        "max_concurrency": 16, "running": 0, "queued": 0, "completed": 40, "failed": 0
+    }
+
+    print(f"✓ 최대 동시 실행 {pipeline.peak}개, 40건 완료")
+
+
+def test_throughput():
+    """40개 기업: 동시 실행 2개(기존 스레드풀) vs 16개"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 처리 시간 비교")
+    print("=" * 80)
+
+    _, _, before = asyncio.run(_run_batch(count=40, max_concurrency=2))
+    _, _, after = asyncio.run(_run_batch(count=40, max_concurrency=16))
+
+    print(
+        f"  40건 (건당 {_RUN_SECONDS * 1000:.0f}ms 대기): "
+        f"동시 2개 {before * 1000:.0f}ms → 동시 16개 {after * 1000:.0f}ms"
+    )
+    assert after < before / 3
+
+
+def test_shutdown_cancels_runs():
+    """종료 시 실행 중·대기 중 분석을 취소하고 취소를 기록"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 종료 시 취소")
+    print("=" * 80)
+
+    async def _scenario():
+        cancelled = []
+
+        async def on_cancel(run_id: int):
+            cancelled.append(run_id)
+
+        pipeline = _FakePipeline(seconds=10)
+        queue = AnalysisRunQueue(2, pipeline=pipeline, on_cancel=on_cancel)
+        for run_id in range(5):
+            queue.submit(run_id, run_id, "000000", "회사")
+        await asyncio.sleep(0.01)
+
+        assert queue.stats()["running"] == 2 and queue.stats()["queued"] == 3
+        await queue.shutdown()
+        return sorted(cancelled), queue.stats()
+
+    cancelled, stats = asyncio.run(_scenario())
+    assert cancelled == [0, 1, 2, 3, 4]
+    assert stats["running"] == 0 and stats["queued"] == 0
+
+    print("✓ 5건 모두 취소 기록")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("분석 실행 큐 테스트")
+    print("=" * 80)
+
+    test_concurrency_limit()
+    test_throughput()
+    test_shutdown_cancels_runs()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
@@ -12,8 +12,18 @@ sys.path.insert(0, str(backend_dir))
 
 import asyncio
 import logging
+import time
+import warnings
 
-from app.data_sources.dart_client import DARTClient
+import pandas as pd
+
+from app.data_sources.dart_client import (
+    DARTClient,
+    parse_statement_frame,
+    parse_statement_frame_rowwise,
+    parse_statement_frames,
+    parsed_frames_to_dicts,
+)
 
 # 로깅 설정
 logging.basicConfig(
@@ -146,6 +156,213 @@ def test_search_disclosures(corp_code: str):
         return False
 
 
+# ============================================================
+# 파서 검증용 고정 데이터 (finstate_all 응답 형식, API 호출 없음)
+# ============================================================
+
+_COLUMNS = ["sj_div", "account_id", "account_nm", "thstrm_amount"]
+
+
+def _manufacturing_frame() -> pd.DataFrame:
+    """제조업: 표준 태그 + 중복 행(첫 값 무효) + 쉼표 금액"""
+    rows = [
+        ("BS", "ifrs-full_CurrentAssets", "유동자산", "218,470,581,000,000"),
+        ("BS", "ifrs-full_Inventories", "재고자산", "51625912000000"),
+        ("BS", "ifrs-full_Assets", "자산총계", "455905980000000"),
+        ("BS", "ifrs-full_CurrentLiabilities", "유동부채", "75719452000000"),
+        ("BS", "ifrs-full_Liabilities", "부채총계", "92228115000000"),
+        ("BS", "ifrs-full_Equity", "자본총계", "363677865000000"),
+        ("IS", "ifrs-full_Revenue", "매출액", ""),
+        ("IS", "ifrs-full_Revenue", "매출액", "258935494000000"),
+        ("IS", "dart_OperatingIncomeLoss", "영업이익", "6566976000000"),
+        ("IS", "ifrs-full_ProfitLoss", "당기순이익", "15487100000000"),
+        ("CIS", "ifrs-full_ProfitLoss", "당기순이익", "99"),
+        ("CF", "ifrs-full_CashFlowsFromUsedInOperatingActivities",
+         "영업활동현금흐름", "44137427000000"),
+        ("CF", "ifrs-full_CashFlowsFromUsedInInvestingActivities",
+         "투자활동현금흐름", "-16922817000000"),
+        ("CF", "ifrs-full_CashFlowsFromUsedInFinancingActivities",
+         "재무활동현금흐름", "-8593059000000"),
+        ("CF", "ifrs-full_PurchaseOfPropertyPlantAndEquipmentClassifiedAsInvestingActivities",
+         "유형자산의 취득", "-57611292000000"),
+    ]
+    return pd.DataFrame(rows, columns=_COLUMNS)
+
+
+def _financial_frame() -> pd.DataFrame:
+    """금융업: 매출액 합산 + 순영업손익 + CAPEX 세부 합산"""
+    rows = [
+        ("BS", "ifrs-full_Assets", "자산총계", "700000000000000"),
+        ("BS", "ifrs-full_Liabilities", "부채총계", "650000000000000"),
+        ("BS", "ifrs-full_Equity", "자본총계", "50000000000000"),
+        ("CIS", "ifrs-full_FeeAndCommissionIncome", "수수료수익", "2,000,000,000"),
+        ("CIS", "ifrs-full_RevenueFromInterest", "이자수익", "-"),
+        ("CIS", "ifrs-full_RevenueFromInterest", "이자수익", "15000000000"),
+        ("CIS", "-표준계정코드 미사용-", "순영업손익", "9000000000"),
+        ("CIS", "ifrs-full_ProfitLossBeforeTax", "법인세비용차감전순이익", "4500000000"),
+        ("CF", "dart_PurchaseOfLand", "토지의 취득", "-100000000"),
+        ("CF", "dart_PurchaseOfBuildings", "건물의 취득", "-250000000"),
+        ("CF", "dart_PurchaseOfVehicles", "차량운반구의 취득", None),
+    ]
+    return pd.DataFrame(rows, columns=_COLUMNS)
+
+
+def _non_standard_frame() -> pd.DataFrame:
+    """비표준 계정: 순이익은 최하위(마지막) 행, CAPEX는 절대값"""
+    rows = [
+        ("BS", "ifrs-full_Assets", "자산총계", "1000"),
+        ("IS", "-표준계정코드 미사용-", " 분기순이익 ", "300"),
+        ("IS", "-표준계정코드 미사용-", "지배기업 소유주지분 분기순이익", "250"),
+        ("IS", "-표준계정코드 미사용-", "비지배지분 분기순이익", "N/A"),
+        ("BS", "-표준계정코드 미사용-", "당기순이익", "777"),
+        ("CF", "-표준계정코드 미사용-", "유형자산 취득", "-120.7"),
+        ("CF", "-표준계정코드 미사용-", "유형자산의 취득", "-999"),
+    ]
+    return pd.DataFrame(rows, columns=_COLUMNS)
+
+
+def _large_frame(repeat: int = 20) -> pd.DataFrame:
+    """실제 응답 크기(수백 행)에 가깝도록 관련 없는 계정을 섞은 DataFrame"""
+    filler = pd.DataFrame(
+        [("BS", f"dart_Filler{i}", f"기타계정{i}", str(i * 1000)) for i in range(repeat * 10)],
+        columns=_COLUMNS,
+    )
+    return pd.concat([filler, _manufacturing_frame(), filler], ignore_index=True)
+
+
+PARSER_FIXTURES = {
+    "manufacturing": _manufacturing_frame,
+    "financial": _financial_frame,
+    "non_standard": _non_standard_frame,
+    "large": _large_frame,
+}
+
+
+def test_vectorized_parser_matches_rowwise():
+    """벡터화 파서가 행 단위 참조 파서와 같은 결과를 내는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 5: 벡터화 파서 결과 동일성")
+    print("=" * 80)
+
+    for name, make_frame in PARSER_FIXTURES.items():
+        df = make_frame()
+        expected = parse_statement_frame_rowwise(df)
+        actual = parse_statement_frame(df)
+        assert actual == expected, f"{name}: {actual} != {expected}"
+        print(f"✓ {name}: {len(actual)}개 필드 일치")
+
+    # 대표 값 확인
+    financial = parse_statement_frame(_financial_frame())
+    assert financial["revenue"] == 17_000_000_000
+    assert financial["operating_income"] == 9_000_000_000
+    assert financial["net_income"] == 4_500_000_000
+    assert financial["capex"] == -350_000_000
+
+    non_standard = parse_statement_frame(_non_standard_frame())
+    assert non_standard["net_income"] == 250
+    assert non_standard["capex"] == 120
+
+    assert parse_statement_frame(pd.DataFrame(columns=_COLUMNS)) == {}
+
+
+def test_parser_benchmark(iterations: int = 200):
+    """행 단위 파서 대비 벡터화 파서 마이크로 벤치마크"""
+    print("\n" + "=" * 80)
+    print(f"TEST 6: 파서 벤치마크 ({iterations}회 반복)")
+    print("=" * 80)
+
+    for name, make_frame in PARSER_FIXTURES.items():
+        df = make_frame()
+        assert parse_statement_frame(df) == parse_statement_frame_rowwise(df)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            parse_statement_frame_rowwise(df)
+        rowwise = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            parse_statement_frame(df)
+        vectorized = time.perf_counter() - started
+
+        print(
+            f"  {name:<14} {len(df):>4}행: 행 단위 {rowwise / iterations * 1000:.2f}ms, "
+            f"벡터화 {vectorized / iterations * 1000:.2f}ms "
+            f"({rowwise / vectorized:.1f}배)"
+        )
+
+
+def test_batch_parser_matches_single(companies: int = 50):
+    """일괄 파서가 그룹별 단건 파서와 같은 결과를 내는지 검증"""
+    print("\n" + "=" * 80)
+    print(f"TEST 7: 일괄 파서 결과 동일성 ({companies}개 회사 × {len(PARSER_FIXTURES)}개 보고서)")
+    print("=" * 80)
+
+    frames = {}
+    for corp_index in range(companies):
+        corp_code = f"{corp_index:08d}"
+        for year_offset, make_frame in enumerate(PARSER_FIXTURES.values()):
+            frames[(corp_code, 2020 + year_offset, "11011")] = make_frame()
+    # 계정이 하나도 없는 보고서도 행으로 포함되어야 함
+    frames[("99999999", 2024, "11014")] = pd.DataFrame(
+        [("BS", "dart_Unknown", "기타", "1")], columns=_COLUMNS
+    )
+
+    long_df = pd.concat(
+        [
+            df.assign(corp_code=corp_code, bsns_year=year, reprt_code=reprt_code)
+            for (corp_code, year, reprt_code), df in frames.items()
+        ],
+        ignore_index=True,
+    )
+
+    started = time.perf_counter()
+    parsed = parsed_frames_to_dicts(parse_statement_frames(long_df))
+    batch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = {key: parse_statement_frame(df) for key, df in frames.items()}
+    single_seconds = time.perf_counter() - started
+
+    assert parsed == expected
+    assert parsed[("99999999", 2024, "11014")] == {}
+    assert parse_statement_frames(long_df.iloc[0:0]).empty
+
+    print(
+        f"✓ {len(frames)}개 보고서 일치 ({len(long_df)}행): "
+        f"단건 반복 {single_seconds * 1000:.1f}ms, 일괄 {batch_seconds * 1000:.1f}ms"
+    )
+
+
+def test_batch_parser_single_key():
+    """그룹 키가 하나일 때도 일괄 파서가 단건 파서와 같은 결과를 내는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 8: 일괄 파서 단일 그룹 키")
+    print("=" * 80)
+
+    frames = {
+        f"{corp_index:08d}": make_frame()
+        for corp_index, make_frame in enumerate(PARSER_FIXTURES.values())
+    }
+    # 계정이 하나도 없는 회사 (모든 전략 결과가 비어 있음)
+    frames["99999999"] = pd.DataFrame([("BS", "dart_Unknown", "기타", "1")], columns=_COLUMNS)
+
+    long_df = pd.concat(
+        [df.assign(corp_code=corp_code) for corp_code, df in frames.items()],
+        ignore_index=True,
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        parsed = parsed_frames_to_dicts(parse_statement_frames(long_df, keys=("corp_code",)))
+
+    expected = {(corp_code,): parse_statement_frame(df) for corp_code, df in frames.items()}
+    assert parsed == expected, parsed
+    assert parsed[("99999999",)] == {}
+
+    print(f"✓ {len(frames)}개 회사 일치 (키: corp_code)")
+
+
 def main():
     """전체 테스트 실행"""
     print("\n" + "=" * 80)
@@ -168,6 +385,12 @@ def main():
     # TEST 4: 공시 검색
     test_search_disclosures(corp_code)
 
+    # TEST 5~8: 파서 검증 (API 호출 없음)
+    test_vectorized_parser_matches_rowwise()
+    test_parser_benchmark()
+    test_batch_parser_matches_single()
+    test_batch_parser_single_key()
+
     print("\n" + "=" * 80)
     print("✓ 모든 테스트 완료")
     print("=" * 80 + "\n")
@@ -0,0 +1,296 @@
+"""
+DART 기업코드 레지스트리 테스트
+
+DART 다운로드 대신 합성 기업코드 목록(약 10만 행)으로
+1. OpenDartReader.find_corp_code와 같은 결과를 내는지
+2. 저장 파일 재사용·하루 단위 갱신·다운로드 실패 시 이전 파일 사용
+3. 생성·조회 비용 비교 (OpenDartReader 방식 vs 레지스트리)
+4. 일일 한도 사용량이 저장소를 통해 재시작·프로세스 간에 이어지는지
+5. 공시 검색·원문·재무제표·기업 개황·기업코드 목록 호출이 모두 일일 한도에 기록되는지
+를 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import os
+import random
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import OpenDartReader
+import pandas as pd
+
+from app.data_sources.dart_corp_registry import DARTCorpRegistry
+from app.data_sources.rate_limiter import DailyQuota, get_daily_quota
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _synthetic_corp_codes(rows: int = 100_000, listed: int = 3_900, seed: int = 3) -> pd.DataFrame:
+    """corpCode.xml 규모의 합성 목록 (상장사만 종목코드, 회사명 일부 중복)"""
+    rng = random.Random(seed)
+    corp_codes = [f"{code:08d}" for code in rng.sample(range(100_000, 99_999_999), rows)]
+    stock_codes = [f"{code:06d}" for code in rng.sample(range(1, 999_999), listed)]
+    return pd.DataFrame({
+        "corp_code": corp_codes,
+        "corp_name": [f"회사{rng.randrange(rows // 2)}" for _ in range(rows)],
+        "stock_code": stock_codes + [" "] * (rows - listed),
+        "modify_date": ["20240101"] * rows,
+    })
+
+
+class _Fetcher:
+    """다운로드 대신 합성 목록 반환, 호출 횟수 기록"""
+
+    def __init__(self, df: pd.DataFrame, fail: bool = False):
+        self.df = df
+        self.fail = fail
+        self.calls = 0
+
+    def __call__(self, api_key: str) -> pd.DataFrame:
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("opendart.fss.or.kr 접속 불가")
+        return self.df
+
+
+def test_same_result_as_open_dart_reader():
+    """종목코드·기업코드·회사명 조회 규칙이 OpenDartReader와 같은지"""
+    print("\n" + "=" * 80)
+    print("TEST 1: find_corp_code 결과 비교")
+    print("=" * 80)
+
+    df = _synthetic_corp_codes(rows=20_000, listed=800)
+    registry = DARTCorpRegistry("test-key", fetcher=_Fetcher(df))
+    original = SimpleNamespace(corp_codes=df)
+
+    rng = random.Random(5)
+    queries = (
+        rng.sample(list(df["stock_code"][:800]), 50)
+        + rng.sample(list(df["corp_code"]), 50)
+        + rng.sample(list(df["corp_name"]), 50)
+        + ["999999", "00000000", "없는회사"]
+    )
+    for query in queries:
+        expected = OpenDartReader.find_corp_code(original, query)
+        assert registry.find_corp_code(query) == expected, query
+
+    reader = registry.reader()
+    assert reader.corp_codes is df
+    assert reader.find_corp_code(queries[0]) == registry.get_corp_code(queries[0])
+
+    print(f"✓ {len(queries)}개 조회 결과 일치")
+
+
+def test_daily_refresh():
+    """같은 날은 저장 파일 재사용, 날짜가 바뀌면 다시 받고, 실패 시 이전 파일 사용"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 저장 파일 및 하루 단위 갱신")
+    print("=" * 80)
+
+    df = _synthetic_corp_codes(rows=5_000, listed=300)
+    stock_code = df["stock_code"][0]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "corp_codes.parquet"
+
+        corp_code = df["corp_code"][0]
+        fetcher = _Fetcher(df)
+        assert DARTCorpRegistry("test-key", path, fetcher).get_corp_code(stock_code) == corp_code
+        assert fetcher.calls == 1 and path.exists()
+
+        # 다른 프로세스(새 레지스트리): 오늘 파일이 있으므로 다운로드 없음
+        fetcher = _Fetcher(df)
+        assert DARTCorpRegistry("test-key", path, fetcher).get_corp_code(stock_code) == corp_code
+        assert fetcher.calls == 0
+
+        # 어제 파일: 다시 받음
+        yesterday = time.time() - 86_400
+        os.utime(path, (yesterday, yesterday))
+        fetcher = _Fetcher(df)
+        DARTCorpRegistry("test-key", path, fetcher).get_corp_code(stock_code)
+        assert fetcher.calls == 1
+
+        # 어제 파일 + 다운로드 실패: 이전 파일로 응답, 재시도는 대기 시간 이후
+        os.utime(path, (yesterday, yesterday))
+        fetcher = _Fetcher(df, fail=True)
+        registry = DARTCorpRegistry("test-key", path, fetcher)
+        assert registry.get_corp_code(stock_code) == df["corp_code"][0]
+        registry.get_corp_code(stock_code)
+        assert fetcher.calls == 1
+
+    print("✓ 파일 재사용, 날짜 변경 시 갱신, 실패 시 이전 파일 사용")
+
+
+def benchmark_registry():
+    """OpenDartReader 방식(생성 시 목록 읽기 + DataFrame 탐색) vs 레지스트리"""
+    df = _synthetic_corp_codes()
+    stock_codes = list(df["stock_code"][:3_900])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 기존: OpenDartReader()는 매번 당일 pickle 캐시를 읽음
+        pickle_path = Path(tmp_dir) / "opendartreader_corp_codes.pkl"
+        df.to_pickle(pickle_path)
+        started = time.perf_counter()
+        for _ in range(10):
+            original = SimpleNamespace(corp_codes=pd.read_pickle(pickle_path))
+        construct_before = (time.perf_counter() - started) / 10 * 1000
+
+        started = time.perf_counter()
+        for stock_code in stock_codes[:200]:
+            OpenDartReader.find_corp_code(original, stock_code)
+        lookup_before = (time.perf_counter() - started) / 200 * 1e6
+
+        # 레지스트리: 프로세스 첫 사용 시 한 번 로드, 이후 핸들만 반환
+        registry = DARTCorpRegistry("test-key", Path(tmp_dir) / "corp_codes.parquet", _Fetcher(df))
+        started = time.perf_counter()
+        registry.corp_codes
+        first_load = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for _ in range(10_000):
+            registry.reader()
+        construct_after = (time.perf_counter() - started) / 10_000 * 1e6
+
+        started = time.perf_counter()
+        for stock_code in stock_codes:
+            registry.find_corp_code(stock_code)
+        lookup_after = (time.perf_counter() - started) / len(stock_codes) * 1e6
+
+    print(f"기업코드 목록 {len(df):,}행")
+    print(
+        f"  생성: OpenDartReader {construct_before:.1f}ms/회 → "
+        f"레지스트리 핸들 {construct_after:.2f}µs/회"
+    )
+    print(f"        (레지스트리는 프로세스 첫 사용 시 한 번 {first_load:.1f}ms)")
+    print(f"  조회: DataFrame 탐색 {lookup_before:.0f}µs/회 → dict {lookup_after:.2f}µs/회")
+    return construct_before * 1000, construct_after, lookup_before, lookup_after
+
+
+def test_registry_benchmark():
+    """레지스트리 생성·조회가 기존 방식보다 빠른지"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 생성·조회 비용 비교")
+    print("=" * 80)
+
+    construct_before, construct_after, lookup_before, lookup_after = benchmark_registry()
+    assert construct_after < construct_before
+    assert lookup_after < lookup_before
+
+
+class _MemoryUsageStore:
+    """api_daily_usage 테이블 대신 dict (fail=True면 DB 장애)"""
+
+    def __init__(self):
+        self.rows: dict[tuple, int] = {}
+        self.fail = False
+
+    def get(self, key, day) -> int:
+        if self.fail:
+            raise ConnectionError("DB 접속 불가")
+        return self.rows.get((key, day), 0)
+
+    def add(self, key, day, count) -> int:
+        if self.fail:
+            raise ConnectionError("DB 접속 불가")
+        self.rows[(key, day)] = self.rows.get((key, day), 0) + count
+        return self.rows[(key, day)]
+
+
+def test_quota_persisted():
+    """재시작·다른 프로세스의 사용량을 이어서 셈, 저장소 장애 중 사용량은 복구 후 기록"""
+    print("\n" + "=" * 80)
+    print("TEST 4: 일일 한도 사용량 저장")
+    print("=" * 80)
+
+    store = _MemoryUsageStore()
+    first = DailyQuota(limit=10, key="dart:test-key", store=store)
+    first.record(3)
+
+    # 재시작한 프로세스: 저장된 사용량에서 시작
+    second = DailyQuota(limit=10, key="dart:test-key", store=store)
+    assert second.used == 3 and second.remaining() == 7
+    second.record(2)
+
+    # 먼저 띄운 프로세스도 기록할 때 다른 프로세스 사용량까지 반영
+    first.record(1)
+    assert first.used == 6 and sum(store.rows.values()) == 6
+
+    # 저장소 장애: 메모리로 계속 세고, 재시도 시점에 못 쓴 사용량을 함께 기록
+    store.fail = True
+    second.record(2)
+    assert second.used == 7
+    store.fail = False
+    second._store_failed_at -= 3600
+    second.record(1)
+    assert sum(store.rows.values()) == 9 and second.used == 9
+
+    print(f"✓ 저장된 사용량 {sum(store.rows.values())}/10")
+
+
+def test_all_dart_calls_counted():
+    """reader의 모든 API 호출과 기업코드 목록 다운로드가 일일 한도에 기록되는지"""
+    print("\n" + "=" * 80)
+    print("TEST 5: DART 호출별 한도 기록")
+    print("=" * 80)
+
+    store = _MemoryUsageStore()
+    quota = get_daily_quota("dart:quota-test-key", limit=100, store=store)
+    fetcher = _Fetcher(_synthetic_corp_codes(rows=100, listed=10))
+    registry = DARTCorpRegistry("quota-test-key", fetcher=fetcher)
+    reader = registry.reader()
+    assert reader.daily_quota is quota
+
+    empty = pd.DataFrame()
+    with mock.patch.object(OpenDartReader, "list", return_value=empty), \
+            mock.patch.object(OpenDartReader, "document", return_value="<xml/>"), \
+            mock.patch.object(OpenDartReader, "finstate_all", return_value=empty), \
+            mock.patch.object(OpenDartReader, "company", return_value={}):
+        registry.corp_codes  # 기업코드 목록 다운로드
+        reader.list(corp="00126380", kind="A", final=True)
+        reader.document("20240312000736")
+        reader.finstate_all("00126380", 2023, reprt_code="11011", fs_div="CFS")
+        reader.company("00126380")
+
+    assert quota.used == 5 and sum(store.rows.values()) == 5
+    print(f"✓ 호출 5건 기록: {quota.used}/{quota.limit}")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("DART 기업코드 레지스트리 테스트")
+    print("=" * 80)
+
+    test_same_result_as_open_dart_reader()
+    test_daily_refresh()
+    test_registry_benchmark()
+    test_quota_persisted()
+    test_all_dart_calls_counted()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
@@ -0,0 +1,327 @@
+"""
+DART 사업보고서 XML 파서 테스트
+
+스트리밍(lxml.iterparse) 파서가 BeautifulSoup 파서와 같은 결과를 내는지 검증하고,
+두 파서의 파싱 시간과 최대 메모리 사용량을 비교합니다.
+스트리밍 파서가 놓친 재무제표를 BeautifulSoup 파서로 보완하는지,
+사업보고서 접수번호 조회가 정정 공시(최종보고서)를 반영하는지도 확인합니다.
+
+API 호출 없이 DART 문서 형식의 합성 문서를 사용하며,
+저장해 둔 실제 문서가 있으면 인자로 넘겨 벤치마크할 수 있습니다.
+
+    python tests/test_dart_web_scraper.py [문서.xml ...]
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import multiprocessing
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pandas as pd
+
+from app.data_sources import dart_web_scraper
+from app.data_sources.dart_web_scraper import DARTDocumentParser, DARTWebScraper
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 합성 사업보고서 문서
+# ============================================================
+
+def _table(rows: list[list[str]], header: list[str] | None = None) -> str:
+    head = "<TR>" + "".join(f"<TH>{cell}</TH>" for cell in header) + "</TR>" if header else ""
+    body = "".join(
+        "<TR>" + "".join(f"<TE>{cell}</TE>" for cell in row) + "</TR>" for row in rows
+    )
+    return f"<TABLE><THEAD>{head}</THEAD><TBODY>{body}</TBODY></TABLE>"
+
+
+def _note_section(index: int) -> str:
+    """재무제표와 무관한 주석 섹션 (문서 크기를 키우는 용도)"""
+    rows = [[f"항목{index}-{i}", f"{i * 1234:,}", f"{i * 987:,}"] for i in range(40)]
+    return (
+        f"<P>{index}. 기타 주석 사항</P>"
+        f"<P>당기 중 특이사항은 없으며 세부 내역은 다음과 같습니다.</P>"
+        + _table(rows)
+    )
+
+
+def _statement_sections() -> str:
+    """연결재무제표 섹션 (단위 표기 방식이 서로 다른 세 재무제표)"""
+    balance = _table([
+        ["과목", "제55기", "제54기"],
+        ["자산", "", ""],
+        ["Ⅰ. 유동자산", "218,470,581", "195,936,557"],
+        ["재고자산", "51,625,912", "52,187,866"],
+        ["Ⅱ. 비유동자산", "237,435,399", "252,048,413"],
+        ["자산총계", "455,905,980", "448,424,507"],
+        ["유동부채", "75,719,452", "78,344,852"],
+        ["부채총계", "92,228,115", "93,674,903"],
+        ["자본총계", "363,677,865", "354,749,604"],
+    ])
+    income = _table([
+        ["과목", "제55기", "제54기"],
+        ["매출액", "258,935,494,000", "302,231,360,000"],
+        ["매출원가", "180,388,580,000", "190,041,770,000"],
+        ["영업이익", "6,566,976,000", "43,376,630,000"],
+        ["법인세비용", "(4,480,835,000)", "9,213,603,000"],
+        ["당기순이익", "15,487,100,000", "55,654,077,000"],
+        ["지배기업 소유주지분 당기순이익", "14,473,401,000", "54,730,018,000"],
+    ])
+    cash_flow = _table(header=["과목 (단위 : 원)", "제55기", "제54기"], rows=[
+        ["영업활동현금흐름", "44,137,427,000,000", "62,181,346,000,000"],
+        ["투자활동현금흐름", "(16,922,817,000,000)", "(31,602,764,000,000)"],
+        ["유형자산의 취득", "(57,611,292,000,000)", "(49,430,428,000,000)"],
+        ["재무활동현금흐름", "(8,593,059,000,000)", "(19,390,049,000,000)"],
+        ["현금및현금성자산의 증가", "18,621,551,000,000", "11,188,533,000,000"],
+    ])
+    return (
+        "<SECTION-2><TITLE>2. 연결재무제표</TITLE>"
+        "<P>가. 연결재무상태표</P>"
+        + _table([["(단위 : 백만원)"]])
+        + balance
+        + "<P>나. 연결포괄손익계산서 (단위: 천원)</P>"
+        + income
+        + "<P>다. 연결현금흐름표</P>"
+        + cash_flow
+        + "</SECTION-2>"
+    )
+
+
+def build_sample_document(notes_before: int = 100, notes_after: int = 1000) -> str:
+    """
+    DART 문서 형식의 합성 사업보고서
+
+    Args:
+        notes_before: 재무제표 앞쪽 주석 섹션 수
+        notes_after: 재무제표 뒤쪽 주석 섹션 수 (실제 보고서처럼 주석이 대부분)
+    """
+    before = "".join(_note_section(i) for i in range(notes_before))
+    after = "".join(_note_section(i) for i in range(notes_before, notes_before + notes_after))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        "<DOCUMENT><DOCUMENT-NAME>사업보고서</DOCUMENT-NAME><BODY>"
+        "<SECTION-1><TITLE>I. 회사의 개요</TITLE>"
+        # 요약 재무정보는 제외 대상, 본문 언급 뒤 작은 표는 데이터 테이블이 아님
+        "<P>가. 요약연결재무상태표</P>" + _table([["자산총계", "1", "2"]] * 12)
+        + "<P>당사의 재무상태표는 아래와 같이 작성되었습니다.</P>" + _table([["구분", "내용"]])
+        + before
+        + "</SECTION-1>"
+        "<SECTION-1><TITLE>III. 재무에 관한 사항</TITLE>"
+        + _statement_sections()
+        + after
+        + "</SECTION-1></BODY></DOCUMENT>"
+    )
+
+
+# ============================================================
+# 벤치마크 (파서별 별도 프로세스에서 실행하여 최대 RSS 측정)
+# ============================================================
+
+def _current_rss_kb() -> int:
+    """현재 RSS (KB, /proc 미지원 환경이면 최대 RSS)"""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_parser(method: str, path: str) -> tuple[float, float, tuple]:
+    """자식 프로세스에서 파서 실행 → (소요 시간, 최대 RSS 증가량 MB, 결과)"""
+    xml_content = Path(path).read_text(encoding="utf-8")
+    parser = DARTDocumentParser()
+
+    baseline_kb = _current_rss_kb()
+    started = time.perf_counter()
+    result = getattr(parser, method)(xml_content)
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return elapsed, (peak_kb - baseline_kb) / 1024, result
+
+
+def _measure(method: str, path: str) -> tuple[float, float, tuple]:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_run_parser, method, path).result()
+
+
+def benchmark_documents(paths: list[str]):
+    """문서별 BeautifulSoup 파서 대비 스트리밍 파서 시간·메모리 비교"""
+    for path in paths:
+        size_mb = Path(path).stat().st_size / 1024 / 1024
+        soup_seconds, soup_mb, soup_result = _measure("parse_document_soup", path)
+        stream_seconds, stream_mb, stream_result = _measure("parse_document_streaming", path)
+
+        assert stream_result == soup_result, f"{path}: 파싱 결과 불일치"
+        print(f"✓ {Path(path).name} ({size_mb:.1f}MB, 결과 일치 {len(stream_result[0])}개 항목)")
+        print(f"  BeautifulSoup: {soup_seconds:.2f}s, 최대 메모리 +{soup_mb:.0f}MB")
+        print(
+            f"  스트리밍:      {stream_seconds:.2f}s, 최대 메모리 +{stream_mb:.0f}MB "
+            f"({soup_seconds / stream_seconds:.1f}배 빠름)"
+        )
+
+
+def test_streaming_matches_soup():
+    """스트리밍 파서 결과가 BeautifulSoup 파서와 같은지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 스트리밍 파서 결과 동일성")
+    print("=" * 80)
+
+    parser = DARTDocumentParser()
+    xml_content = build_sample_document(notes_before=5, notes_after=5)
+
+    expected = parser.parse_document_soup(xml_content)
+    actual = parser.parse_document_streaming(xml_content)
+    assert actual == expected
+
+    data, metadata = actual
+    assert data["total_assets"] == 455_905_980_000_000  # 단위 표(형제 요소) → 백만원
+    assert data["revenue"] == 258_935_494_000_000  # 제목 단위 → 천원
+    assert data["net_income"] == 15_487_100_000_000
+    assert data["capex"] == -57_611_292_000_000  # 헤더 단위 → 원
+    assert metadata["unit_conversion"]["balance_sheet"]["detected_method"] == "section_parse"
+    assert metadata["unit_conversion"]["cash_flow"]["detected_method"] == "header_parse"
+
+    # bytes 입력도 동일
+    assert parser.parse_document_streaming(xml_content.encode("utf-8")) == expected
+    assert parser.parse_document(xml_content) == expected
+
+    print(f"✓ {len(data)}개 항목 일치")
+
+
+def test_streaming_benchmark():
+    """합성 문서로 파싱 시간·메모리 비교"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 스트리밍 파서 벤치마크 (합성 문서)")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "sample_report.xml"
+        path.write_text(build_sample_document(), encoding="utf-8")
+        benchmark_documents([str(path)])
+
+
+class _FakeDart:
+    """dart.list 대신 정해 둔 공시 목록 반환, 호출 인자 기록"""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.calls: list[dict] = []
+
+    def list(self, **kwargs) -> pd.DataFrame:
+        self.calls.append(kwargs)
+        return pd.DataFrame(self.rows)
+
+
+def test_annual_report_rcpno_amended():
+    """메모이제이션 TTL이 지나면 공시 검색으로 정정 공시 접수번호를 다시 받는지"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 사업보고서 접수번호 (정정 공시)")
+    print("=" * 80)
+
+    scraper = DARTWebScraper.__new__(DARTWebScraper)  # DART 키 없이 생성
+    scraper.document_store = None
+    scraper.dart = _FakeDart([{"report_nm": "사업보고서 (2022.12)", "rcept_no": "20230310000111"}])
+    dart_web_scraper._rcpno_memo.clear()
+
+    assert scraper.get_annual_report_rcpno("00126380", 2022) == "20230310000111"
+    assert scraper.dart.calls[0]["final"] is True
+    assert scraper.dart.calls[0]["end"] >= "20231231"  # 정정 공시 제출 기간 포함
+
+    # TTL 이내: 공시 검색 없이 메모이제이션 사용
+    assert scraper.get_annual_report_rcpno("00126380", 2022) == "20230310000111"
+    assert len(scraper.dart.calls) == 1
+
+    # 정정 공시 제출 후 TTL 경과: 최종 접수번호로 교체
+    scraper.dart.rows = [
+        {"report_nm": "[기재정정]사업보고서 (2022.12)", "rcept_no": "20230801000222"}
+    ]
+    rcpno, recorded_at = dart_web_scraper._rcpno_memo[("00126380", 2022)]
+    expired = recorded_at - dart_web_scraper._RCPNO_MEMO_TTL_SECONDS
+    dart_web_scraper._rcpno_memo[("00126380", 2022)] = (rcpno, expired)
+    assert scraper.get_annual_report_rcpno("00126380", 2022) == "20230801000222"
+    assert len(scraper.dart.calls) == 2
+
+    dart_web_scraper._rcpno_memo.clear()
+    print("✓ 정정 공시 접수번호 반영")
+
+
+def test_missing_section_falls_back_to_soup():
+    """스트리밍 파서가 현금흐름표를 놓치면 그 섹션만 BeautifulSoup 결과로 보완"""
+    print("\n" + "=" * 80)
+    print("TEST 4: 누락 섹션 보완")
+    print("=" * 80)
+
+    parser = DARTDocumentParser()
+    xml_content = build_sample_document(notes_before=5, notes_after=5)
+    expected = parser.parse_document_soup(xml_content)
+
+    streaming = parser._parse_sections_streaming
+
+    def without_cash_flow(content):
+        sections = streaming(content)
+        sections["cash_flow"] = ({}, {"parsing_details": {}, "unit_conversion": {}})
+        return sections
+
+    with mock.patch.object(parser, "_parse_sections_streaming", side_effect=without_cash_flow):
+        data, metadata = parser.parse_document(xml_content)
+
+    assert (data, metadata) == expected
+    assert data["capex"] == -57_611_292_000_000
+    assert metadata["unit_conversion"]["cash_flow"]["detected_method"] == "header_parse"
+
+    print(f"✓ 현금흐름표 보완, {len(data)}개 항목")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("DART 사업보고서 XML 파서 테스트")
+    print("=" * 80)
+
+    test_streaming_matches_soup()
+    test_annual_report_rcpno_amended()
+    test_missing_section_falls_back_to_soup()
+
+    sample_paths = sys.argv[1:]
+    if sample_paths:
+        print("\n" + "=" * 80)
+        print(f"TEST 2: 스트리밍 파서 벤치마크 (저장된 문서 {len(sample_paths)}개)")
+        print("=" * 80)
+        benchmark_documents(sample_paths)
+    else:
+        test_streaming_benchmark()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
@@ -0,0 +1,204 @@
+"""
+LLM 속도 제한 테스트
+
+1. RPM·TPM 버킷: 한도를 넘는 예약은 도착 순서대로 대기, 실제 사용량 정산 시 토큰 반환
+2. 429 응답: Retry-After 헤더 해석, 중지 기간 동안 새 예약 대기, 지수 백오프 상한
+3. LLMProvider: RateLimitError를 받으면 기다렸다가 재시도, 재시도 소진 시 None
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import httpx
+from litellm.exceptions import RateLimitError
+
+from app.config import settings
+from app.llm import governor as governor_module
+from app.llm import provider as provider_module
+from app.llm.governor import LLMGovernor, ModelRateLimiter, retry_after_seconds
+from app.llm.provider import LLMProvider
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+_MESSAGES = [{"role": "user", "content": "삼성전자(005930)를 평가하세요."}]
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rate_limit_error(headers: dict | None = None) -> RateLimitError:
+    response = httpx.Response(429, headers=headers or {}, request=httpx.Request("POST", "https://api.test"))
+    return RateLimitError("rate limited", llm_provider="openai", model="gpt-4o", response=response)
+
+
+def test_bucket_fifo_and_settle():
+    """한도 초과 예약은 앞선 예약 뒤로 줄을 서고, 남은 토큰은 정산 시 반환"""
+    print("\n" + "=" * 80)
+    print("TEST 1: RPM·TPM 버킷")
+    print("=" * 80)
+
+    clock = _FakeClock()
+    limiter = ModelRateLimiter("gpt-4o", rpm=60, tpm=6000, clock=clock)
+
+    # RPM 60 = 초당 1건: 버킷 60건은 즉시, 이후는 1초 간격으로 줄을 섬
+    waits = [limiter.reserve(10) for _ in range(63)]
+    assert waits[:60] == [0.0] * 60
+    assert [round(w, 3) for w in waits[60:]] == [1.0, 2.0, 3.0]
+
+    # 시간이 지나면 버킷 충전
+    clock.now += 10
+    assert limiter.reserve(10) == 0.0
+
+    # TPM: 예약(6000)은 한도 전체, 실제 사용량(1000)으로 정산하면 5000 반환
+    limiter = ModelRateLimiter("gpt-4o", rpm=600, tpm=6000, clock=clock)
+    assert limiter.reserve(6000) == 0.0
+    assert round(limiter.reserve(3000), 3) == 30.0  # 초당 100토큰
+    limiter.settle(6000, 1000)
+    limiter.settle(3000, 3000)
+    assert limiter.reserve(2000) == 0.0
+
+    # 한도보다 큰 요청도 영원히 기다리지 않음 (한도로 제한)
+    limiter = ModelRateLimiter("gpt-4o", rpm=600, tpm=6000, clock=clock)
+    assert limiter.reserve(100_000) == 0.0
+
+    print(f"✓ stats={limiter.stats()}")
+
+
+def test_retry_after_and_penalty():
+    """Retry-After 해석, 429 후 중지 기간, 백오프 상한"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 429 응답 처리")
+    print("=" * 80)
+
+    assert retry_after_seconds(_rate_limit_error({"retry-after": "7"})) == 7.0
+    assert retry_after_seconds(_rate_limit_error({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after_seconds(_rate_limit_error()) is None
+    assert retry_after_seconds(ValueError("no headers")) is None
+
+    governor = LLMGovernor(backoff_seconds=2.0, max_backoff_seconds=10.0)
+    clock = _FakeClock()
+    governor._limiters["gpt-4o"] = ModelRateLimiter("gpt-4o", rpm=600, tpm=100_000, clock=clock)
+
+    # Retry-After 우선, 지터는 0~25%
+    delay = governor.rate_limited("gpt-4o", _rate_limit_error({"retry-after": "4"}), attempt=0)
+    assert 4.0 <= delay <= 5.0
+    limiter = governor.limiter("gpt-4o")
+    assert limiter.blocked_for() == 4.0
+    assert limiter.reserve(10) == 4.0  # 중지 기간 동안 새 호출도 대기
+
+    # 헤더 없음: 2초 × 2^회차, 상한 10초
+    assert 4.0 <= governor.rate_limited("gpt-4o", _rate_limit_error(), attempt=1) <= 5.0
+    assert 10.0 <= governor.rate_limited("gpt-4o", _rate_limit_error(), attempt=5) <= 12.5
+
+    stats = governor.stats()["gpt-4o"]
+    assert stats["rate_limited"] == 3 and stats["blocked_for_seconds"] == 10.0
+
+    print(f"✓ stats={stats}")
+
+
+def test_provider_retries_rate_limit():
+    """RateLimitError 후 재시도해 성공, 재시도 소진 시 None"""
+    print("\n" + "=" * 80)
+    print("TEST 3: LLMProvider 429 재시도")
+    print("=" * 80)
+
+    calls = {"count": 0, "fail": 0}
+
+    def fake_completion(**kwargs):
+        calls["count"] += 1
+        if calls["count"] <= calls["fail"]:
+            raise _rate_limit_error({"retry-after-ms": "10"})
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="점수: 70"))],
+            usage=SimpleNamespace(prompt_tokens=20, completion_tokens=5, total_tokens=25),
+        )
+
+    async def fake_acompletion(**kwargs):
+        return fake_completion(**kwargs)
+
+    original = (
+        provider_module.completion,
+        provider_module.acompletion,
+        settings.llm_governor_enabled,
+        settings.llm_rate_limit_max_retries,
+        settings.llm_response_cache_enabled,
+    )
+    try:
+        provider_module.completion = fake_completion
+        provider_module.acompletion = fake_acompletion
+        settings.llm_governor_enabled = True
+        settings.llm_rate_limit_max_retries = 2
+        settings.llm_response_cache_enabled = False
+        governor_module._governor = None
+
+        provider = LLMProvider(model="gpt-4o")
+
+        calls.update(count=0, fail=2)
+        assert provider.complete(_MESSAGES, max_tokens=100) == "점수: 70"
+        assert calls["count"] == 3
+
+        calls.update(count=0, fail=1)
+        assert asyncio.run(provider.acomplete(_MESSAGES, max_tokens=100)) == "점수: 70"
+        assert calls["count"] == 2
+
+        # 재시도 2회 소진 (폴백 모델 없음)
+        calls.update(count=0, fail=10)
+        assert provider.complete(_MESSAGES, max_tokens=100) is None
+        assert calls["count"] == 3
+
+        stats = governor_module.get_llm_governor().stats()["gpt-4o"]
+        assert stats["requests"] == 8 and stats["rate_limited"] == 5
+
+        print(f"✓ stats={stats}")
+    finally:
+        (
+            provider_module.completion,
+            provider_module.acompletion,
+            settings.llm_governor_enabled,
+            settings.llm_rate_limit_max_retries,
+            settings.llm_response_cache_enabled,
+        ) = original
+        governor_module._governor = None
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("LLM 속도 제한 테스트")
+    print("=" * 80)
+
+    test_bucket_fifo_and_settle()
+    test_retry_after_and_penalty()
+    test_provider_retries_rate_limit()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
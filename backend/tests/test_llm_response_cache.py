@@ -0,0 +1,219 @@
+"""
+LLM 응답 캐시 테스트
+
+1. 키: 같은 요청(dict 키 순서 무관)은 같은 키, 인자가 하나라도 다르면 다른 키
+2. TTL 만료 및 용량 상한 초과 시 오래 사용하지 않은 응답부터 삭제
+3. LLMProvider: 같은 요청은 API 호출 없이 반환, bypass 시 새로 호출, 실행별 적중 수 합산
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+import tempfile
+import time
+
+from app.config import settings
+from app.llm import response_cache
+from app.llm.provider import LLMProvider, bypass_llm_response_cache, track_llm_usage
+from app.llm.response_cache import LLMResponseCache
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+_MESSAGES = [
+    {"role": "system", "content": "당신은 가치투자 전문가입니다."},
+    {"role": "user", "content": "삼성전자(005930)를 평가하세요."},
+]
+
+
+def test_cache_key_and_expiry():
+    """키 규칙, TTL 만료, LRU 용량 정리"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 캐시 키·만료·용량 정리")
+    print("=" * 80)
+
+    make_key = LLMResponseCache.make_key
+    key = make_key("gpt-4o", _MESSAGES, 0.3, 2000)
+    reordered = [{"content": m["content"], "role": m["role"]} for m in _MESSAGES]
+    assert make_key("gpt-4o", reordered, 0.3, 2000) == key
+    assert make_key("gpt-4o", _MESSAGES, 0.5, 2000) != key
+    assert make_key("gpt-4o", _MESSAGES, 0.3, 4000) != key
+    assert make_key("claude-3-opus-20240229", _MESSAGES, 0.3, 2000) != key
+    assert make_key("gpt-4o", _MESSAGES, 0.3, 2000, top_p=0.9) != key
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "responses.sqlite3"
+
+        # TTL: 만료된 응답은 미스 처리 후 삭제
+        cache = LLMResponseCache(path, ttl_seconds=0.2, max_bytes=10_000)
+        cache.put(key, "gpt-4o", "점수: 70")
+        assert cache.get(key) == "점수: 70"
+        time.sleep(0.25)
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+        # 다른 프로세스(새 인스턴스)도 같은 파일의 응답 사용
+        cache.put(key, "gpt-4o", "점수: 70")
+        assert LLMResponseCache(path, ttl_seconds=60, max_bytes=10_000).get(key) == "점수: 70"
+
+        # 용량: 1,000바이트 응답 10개 저장 가능, 최근 사용한 응답은 남김
+        cache = LLMResponseCache(Path(tmp_dir) / "lru.sqlite3", ttl_seconds=60, max_bytes=10_000)
+        keys = [f"{i:064x}" for i in range(12)]
+        for i, k in enumerate(keys[:10]):
+            cache.put(k, "gpt-4o", "가" * 333 + "a")  # 1,000바이트
+            time.sleep(0.001)
+        assert cache.get(keys[0]) is not None  # 가장 오래된 응답을 다시 사용
+        cache.put(keys[10], "gpt-4o", "b" * 1000)
+        cache.put(keys[11], "gpt-4o", "c" * 1000)
+
+        stats = cache.stats()
+        assert stats["size_bytes"] <= 10_000 and stats["evictions"] > 0
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[11]) is not None
+
+        print(f"✓ stats={cache.stats()}")
+
+
+class _CountingProvider(LLMProvider):
+    """API 대신 호출 횟수를 세는 프로바이더"""
+
+    def __init__(self):
+        super().__init__(model="gpt-4o")
+        self.calls = 0
+
+    def _try_completion(self, model, messages, temperature, max_tokens, **kwargs):
+        self.calls += 1
+        return f"응답 {self.calls}"
+
+    async def _try_acompletion(self, model, messages, temperature, max_tokens, **kwargs):
+        self.calls += 1
+        return f"응답 {self.calls}"
+
+
+def test_provider_uses_cache():
+    """같은 요청은 API 호출 없이 반환, bypass는 새로 호출 후 캐시 갱신"""
+    print("\n" + "=" * 80)
+    print("TEST 2: LLMProvider 응답 캐시")
+    print("=" * 80)
+
+    original = (settings.llm_response_cache_enabled, settings.llm_response_cache_path)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            settings.llm_response_cache_enabled = True
+            settings.llm_response_cache_path = str(Path(tmp_dir) / "responses.sqlite3")
+            response_cache._response_cache = None
+
+            provider = _CountingProvider()
+            with track_llm_usage() as usage:
+                assert provider.complete(_MESSAGES, temperature=0.3, max_tokens=2000) == "응답 1"
+                assert provider.complete(_MESSAGES, temperature=0.3, max_tokens=2000) == "응답 1"
+                answer = asyncio.run(
+                    provider.acomplete(_MESSAGES, temperature=0.3, max_tokens=2000)
+                )
+                assert answer == "응답 1"
+                # 다른 요청
+                assert provider.complete(_MESSAGES, temperature=0.5, max_tokens=2000) == "응답 2"
+            assert provider.calls == 2
+            assert usage["response_cache_hits"] == 2
+
+            # 우회: 호출별 플래그, 범위 전체
+            answer = provider.complete(
+                _MESSAGES, temperature=0.3, max_tokens=2000, bypass_cache=True
+            )
+            assert answer == "응답 3"
+            with bypass_llm_response_cache():
+                assert provider.complete(_MESSAGES, temperature=0.3, max_tokens=2000) == "응답 4"
+            assert provider.complete(_MESSAGES, temperature=0.3, max_tokens=2000) == "응답 4"
+            assert provider.calls == 4
+
+            stats = response_cache.get_llm_response_cache().stats()
+            assert stats["hits"] == 3 and stats["misses"] == 2
+
+            print(f"✓ API 호출 {provider.calls}회, stats={stats}")
+    finally:
+        settings.llm_response_cache_enabled, settings.llm_response_cache_path = original
+        response_cache._response_cache = None
+
+
+class _FlakyPrimaryProvider(LLMProvider):
+    """메인 모델이 down이면 폴백 모델이 답하는 프로바이더"""
+
+    def __init__(self):
+        super().__init__(model="gpt-4o", fallback_models=["gpt-4o-mini"])
+        self.primary_down = True
+        self.requested: list[str] = []
+
+    def _try_completion(self, model, messages, temperature, max_tokens, **kwargs):
+        self.requested.append(model)
+        if model == self.model and self.primary_down:
+            return None
+        return f"{model} 응답"
+
+    async def _try_acompletion(self, model, messages, temperature, max_tokens, **kwargs):
+        return self._try_completion(model, messages, temperature, max_tokens, **kwargs)
+
+
+def test_fallback_not_cached():
+    """폴백 모델 응답은 메인 모델 키로 캐시하지 않음"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 폴백 응답 캐시 제외")
+    print("=" * 80)
+
+    original = (settings.llm_response_cache_enabled, settings.llm_response_cache_path)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            settings.llm_response_cache_enabled = True
+            settings.llm_response_cache_path = str(Path(tmp_dir) / "responses.sqlite3")
+            response_cache._response_cache = None
+
+            provider = _FlakyPrimaryProvider()
+            assert provider.complete(_MESSAGES, max_tokens=2000) == "gpt-4o-mini 응답"
+            assert asyncio.run(provider.acomplete(_MESSAGES, max_tokens=2000)) == "gpt-4o-mini 응답"
+            assert response_cache.get_llm_response_cache().stats()["entries"] == 0
+
+            # 메인 모델 복구: 캐시에 폴백 응답이 없으므로 메인 모델을 다시 호출하고 그 응답을 저장
+            provider.primary_down = False
+            assert provider.complete(_MESSAGES, max_tokens=2000) == "gpt-4o 응답"
+            assert provider.complete(_MESSAGES, max_tokens=2000) == "gpt-4o 응답"
+            assert provider.requested == ["gpt-4o", "gpt-4o-mini"] * 2 + ["gpt-4o"]
+
+            print(f"✓ 요청 모델={provider.requested}")
+    finally:
+        settings.llm_response_cache_enabled, settings.llm_response_cache_path = original
+        response_cache._response_cache = None
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("LLM 응답 캐시 테스트")
+    print("=" * 80)
+
+    test_cache_key_and_expiry()
+    test_provider_uses_cache()
+    test_fallback_not_cached()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
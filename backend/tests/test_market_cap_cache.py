@@ -0,0 +1,205 @@
+"""
+금융위원회 시가총액 캐시 테스트
+
+DB 대신 메모리 저장소, API 대신 호출 기록용 함수로
+캐시된 날짜는 API를 다시 호출하지 않는지, "데이터 없음" TTL이 지나면
+재조회하는지, API 오류는 캐시하지 않는지를 검증합니다.
+비동기 조회는 httpx.MockTransport로 재시도와 캐시 저장을 확인합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+from datetime import timedelta
+
+import httpx
+
+from app.config import settings
+from app.data_sources import public_data_client
+from app.data_sources.market_cap_cache import MarketCapCache
+from app.data_sources.public_data_client import PublicDataAPIError, PublicDataClient
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _MemoryMarketCapCache(MarketCapCache):
+    """market_cap_points 대신 메모리 dict에 저장"""
+
+    def __init__(self):
+        super().__init__(success_ttl=timedelta(days=365), failure_ttl=timedelta(hours=24))
+        self.rows: dict[tuple[str, str], dict] = {}
+
+    def _select(self, stock_code, dates):
+        return [
+            {"base_date": date, **self.rows[(stock_code, date)]}
+            for date in dates
+            if (stock_code, date) in self.rows
+        ]
+
+    def _upsert(self, records):
+        for record in records:
+            record = dict(record)
+            self.rows[(record.pop("stock_code"), record.pop("base_date"))] = record
+
+
+def _make_client(cache: MarketCapCache, missing: set[str], failing: set[str]):
+    """API 호출을 기록하는 PublicDataClient (missing: 데이터 없음, failing: 호출 오류)"""
+    client = PublicDataClient("test-key", cache=cache)
+    client.calls = []
+
+    def _request_market_data(stock_code, date):
+        client.calls.append(date)
+        if date in failing:
+            raise PublicDataAPIError("API 호출 실패: timeout")
+        if date in missing:
+            return None
+        return {
+            "date": date,
+            "market_cap": 400_000_000_000_000 + int(date[-4:]),
+            "close_price": 70_000,
+            "listed_shares": 5_969_782_550,
+        }
+
+    client._request_market_data = _request_market_data
+    return client
+
+
+def test_prefetch_hits_network_once():
+    """두 번째 일괄 조회는 새 날짜만 API 호출 (다른 클라이언트 인스턴스도 공유)"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 캐시 우선 일괄 조회")
+    print("=" * 80)
+
+    cache = _MemoryMarketCapCache()
+    dates = ["20230331", "20230630", "20230929", "20231228"]
+
+    first = _make_client(cache, missing={"20230630"}, failing={"20231228"})
+    results = first.prefetch_market_caps("005930", dates)
+    assert first.calls == dates
+    assert results["20230331"]["market_cap"] == 400_000_000_000_331
+    assert results["20230630"] is None  # 데이터 없음 (캐시됨)
+    assert "20231228" not in results  # 호출 오류 (캐시되지 않음)
+
+    # 재시작한 프로세스: 오류 났던 날짜와 새 날짜만 호출
+    second = _make_client(cache, missing=set(), failing=set())
+    results = second.prefetch_market_caps("005930", [*dates, "20240329"])
+    assert second.calls == ["20231228", "20240329"]
+    assert results["20230630"] is None
+    assert results["20231228"]["close_price"] == 70_000
+
+    # 반환 dict를 수정해도 캐시에는 영향 없음
+    results["20230331"]["market_cap"] = 0
+    assert second.prefetch_market_caps("005930", ["20230331"])["20230331"]["market_cap"] > 0
+    assert second.calls == ["20231228", "20240329"]
+
+    print(f"✓ 캐시 통계: {cache.stats()}")
+
+
+def test_failure_ttl():
+    """"데이터 없음"은 failure TTL이 지나면 재조회"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 데이터 없음 재조회")
+    print("=" * 80)
+
+    cache = _MemoryMarketCapCache()
+    client = _make_client(cache, missing={"20240628"}, failing=set())
+
+    assert client._fetch_market_data("005930", "20240628") is None
+    assert client._fetch_market_data("005930", "20240628") is None
+    assert client.calls == ["20240628"]
+
+    # 저장 시각을 failure TTL 이전으로 되돌림
+    cache.rows[("005930", "20240628")]["fetched_at"] -= timedelta(hours=25)
+    client = _make_client(cache, missing=set(), failing=set())
+    assert client._fetch_market_data("005930", "20240628")["market_cap"] > 0
+    assert client.calls == ["20240628"]
+    assert cache.rows[("005930", "20240628")]["status"] == "ok"
+
+    print("✓ TTL 경과 후 재조회 및 덮어쓰기")
+
+
+def _fake_api(request: httpx.Request, attempts: dict[str, int]) -> httpx.Response:
+    """basDt별 호출 횟수 기록, 첫 호출은 503, 20230630은 항상 빈 응답"""
+    date = request.url.params["basDt"]
+    attempts[date] = attempts.get(date, 0) + 1
+    if attempts[date] == 1:
+        return httpx.Response(503)
+    items = (
+        {"item": [{"mrktTotAmt": "420000000000000", "clpr": "70500", "lstgStCnt": "5969782550"}]}
+        if date != "20230630" else ""
+    )
+    return httpx.Response(200, json={"response": {"body": {"items": items}}})
+
+
+def test_async_prefetch_retry():
+    """비동기 일괄 조회: 공유 AsyncClient로 동시 조회, 503 재시도, 캐시 저장"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 비동기 일괄 조회 및 재시도")
+    print("=" * 80)
+
+    cache = _MemoryMarketCapCache()
+    client = PublicDataClient("test-key", cache=cache)
+    client._get_stock_name = lambda stock_code: "삼성전자"  # 심볼 디렉터리(DB) 대신
+    dates = ["20230331", "20230630", "20230929"]
+    attempts: dict[str, int] = {}
+
+    async def _run():
+        transport = httpx.MockTransport(lambda request: _fake_api(request, attempts))
+        http = httpx.AsyncClient(transport=transport)
+        public_data_client._async_http = (asyncio.get_running_loop(), http, asyncio.Semaphore(2))
+        try:
+            first = await client.aprefetch_market_caps("005930", dates)
+            second = await client.aprefetch_market_caps("005930", dates)
+        finally:
+            await public_data_client.close_async_http()
+        return first, second
+
+    backoff = settings.public_data_retry_backoff_seconds
+    settings.public_data_retry_backoff_seconds = 0.01
+    try:
+        first, second = asyncio.run(_run())
+    finally:
+        settings.public_data_retry_backoff_seconds = backoff
+
+    assert attempts == {date: 2 for date in dates}  # 503 한 번 후 성공, 두 번째 조회는 캐시
+    assert first["20230331"]["market_cap"] == 420_000_000_000_000
+    assert first["20230630"] is None
+    assert second == first
+
+    print(f"✓ API 호출 {sum(attempts.values())}회 (재시도 포함), 캐시 통계: {cache.stats()}")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("금융위원회 시가총액 캐시 테스트")
+    print("=" * 80)
+
+    test_prefetch_hits_network_once()
+    test_failure_ttl()
+    test_async_prefetch_retry()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
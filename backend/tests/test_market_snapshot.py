@@ -0,0 +1,250 @@
+"""
+시장 전체 일별 스냅샷 테스트
+
+1. pykrx 시장 전체 응답(한글 컬럼)을 종목별 행으로 결합하는 로직 검증 (네트워크 불필요)
+2. 조회에 실패한 날은 휴장일로 세지 않고 다음 적재에서 다시 받는지 검증 (네트워크 불필요)
+3. 종목별 조회 대비 시장 스냅샷 조회의 KRX 요청 수·소요 시간 벤치마크 (KRX 접속 필요)
+
+    python tests/test_market_snapshot.py [YYYYMMDD] [표본 종목 수]
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import pandas as pd
+
+from app.data_sources.krx_session import get_krx_session
+from app.data_sources.stock_client import StockClient
+from app.data_sources.stock_price_store import StockPriceStore
+from app.data_sources.trading_calendar import TradingCalendar
+from app.services import price_ingest_service
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_merge_market_snapshot():
+    """시장 전체 OHLCV·시가총액·지표가 종목코드 기준으로 결합되는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 시장 스냅샷 결합")
+    print("=" * 80)
+
+    tickers = pd.Index(["005930", "000660", "035720"], name="티커")
+    ohlcv = pd.DataFrame({
+        "시가": [70000, 180000, 40000],
+        "고가": [71000, 185000, 41000],
+        "저가": [69500, 179000, 39500],
+        "종가": [70500, 183000, 40500],
+        "거래량": [12_000_000, 3_000_000, 0],
+        "거래대금": [0, 0, 0],
+        "등락률": [0.5, 1.2, 0.0],
+    }, index=tickers)
+    # 시가총액·지표 응답은 종목 순서와 구성이 다를 수 있음
+    cap = pd.DataFrame({
+        "종가": [183000, 70500],
+        "시가총액": [133_000_000_000_000, 420_000_000_000_000],
+        "거래량": [3_000_000, 12_000_000],
+        "거래대금": [0, 0],
+        "상장주식수": [728_002_365, 5_969_782_550],
+    }, index=pd.Index(["000660", "005930"], name="티커"))
+    fundamental = pd.DataFrame({
+        "BPS": [52002.0, 115718.0, 30000.0],
+        "PER": [13.5, 0.0, 40.1],
+        "PBR": [1.36, 1.58, 1.35],
+        "EPS": [5222.0, 0.0, 1010.0],
+        "DIV": [2.05, 0.66, 0.15],
+        "DPS": [1444.0, 1200.0, 61.0],
+    }, index=tickers)
+
+    df = StockClient._merge_market_snapshot(ohlcv, cap, fundamental)
+
+    assert list(df.index) == ["005930", "000660", "035720"]
+    assert list(df.columns) == [
+        "open", "high", "low", "close", "volume", "market_cap", "shares_outstanding",
+        "per", "pbr", "eps", "bps", "dividend_yield",
+    ]
+    assert df.loc["005930", "market_cap"] == 420_000_000_000_000
+    assert df.loc["000660", "shares_outstanding"] == 728_002_365
+    assert pd.isna(df.loc["035720", "market_cap"])  # 시가총액 응답에 없는 종목
+    assert df.loc["000660", "per"] == 0.0
+    assert df.loc["035720", "dividend_yield"] == 0.15
+
+    print(f"✓ {len(df)}개 종목, {len(df.columns)}개 컬럼 결합")
+
+
+class _MemorySnapshotStore(StockPriceStore):
+    """stock_prices 테이블 대신 저장된 거래일만 기록하는 저장소"""
+
+    def __init__(self, trade_dates: set[date]):
+        super().__init__()
+        self.trade_dates = set(trade_dates)
+
+    def get_company_ids(self):
+        return {"005930": 1}
+
+    def get_trade_dates(self, start, end):
+        return {day for day in self.trade_dates if start <= day <= end}
+
+    def upsert_snapshot(self, trade_date, df, company_ids):
+        self.trade_dates.add(trade_date)
+        return len(df)
+
+
+def test_failed_snapshot_retried():
+    """조회 실패일은 failed_dates로 집계되고, 다음 실행에서 빈 거래일로 다시 조회되는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 시장 스냅샷 실패일 재시도")
+    print("=" * 80)
+
+    today = date.today()
+    business_days = list(pd.bdate_range(today - timedelta(days=30), today - timedelta(days=1)).date)
+    # 저장된 거래일: 앞 구간 (중간 하루 누락)
+    stored = set(business_days[:10])
+    gap_day = business_days[5]
+    stored.discard(gap_day)
+    failed_day = business_days[12]
+
+    store = _MemorySnapshotStore(stored)
+    calendar = TradingCalendar(fetcher=lambda s, e: list(pd.bdate_range(s, e).date))
+    failing = {failed_day}
+    requested = []
+
+    def fake_snapshot(self, date_str):
+        day = datetime.strptime(date_str, "%Y%m%d").date()
+        requested.append(day)
+        if day in failing:
+            raise RuntimeError("KRX 시가총액 응답 없음")
+        return pd.DataFrame({"close": [70_000]}, index=pd.Index(["005930"], name="stock_code"))
+
+    with mock.patch.object(
+        price_ingest_service, "get_stock_price_store", return_value=store
+    ), mock.patch.object(
+        price_ingest_service, "get_trading_calendar", return_value=calendar
+    ), mock.patch.object(StockClient, "get_market_snapshot", fake_snapshot):
+        first = asyncio.run(price_ingest_service.run_snapshot_ingest(workers=2, history_days=60))
+
+        # 중간에 빠진 날과 마지막 저장일 이후를 조회, 실패일은 휴장일이 아닌 실패로 집계
+        assert gap_day in requested and failed_day in requested
+        assert first["failed_dates"] == [str(failed_day)] and first["holidays"] == 0
+        assert failed_day not in store.trade_dates
+        assert max(store.trade_dates) > failed_day  # 이후 거래일은 적재됨
+
+        # 다음 실행: 이후 거래일이 저장돼 있어도 실패일을 다시 조회
+        failing.clear()
+        requested.clear()
+        second = asyncio.run(price_ingest_service.run_snapshot_ingest(workers=2, history_days=60))
+
+    assert requested == [failed_day], requested
+    assert second["failed"] == 0 and failed_day in store.trade_dates
+
+    print(f"✓ 1차 {first['dates']}일 조회 (실패 {first['failed_dates']}), 2차 {requested} 재조회")
+
+
+def _recent_weekday() -> str:
+    day = datetime.now() - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.strftime("%Y%m%d")
+
+
+def benchmark_snapshot(date: str | None = None, sample_size: int = 20):
+    """
+    하루치 전 종목 데이터를 얻는 두 방식의 KRX 요청 수·소요 시간 비교
+
+    종목별 방식은 표본 종목만 실제 조회하고 전체 종목 수로 환산합니다.
+    """
+    date = date or _recent_weekday()
+    client = StockClient(read_through=False)
+    session = get_krx_session()
+
+    # 시장 전체 스냅샷
+    requests_before = session.stats()["requests"]
+    started = time.perf_counter()
+    try:
+        snapshot = client.get_market_snapshot(date)
+    except Exception as e:
+        print(f"⚠ {date} KRX 접속 불가로 벤치마크를 건너뜁니다: {e}")
+        return
+    snapshot_seconds = time.perf_counter() - started
+    snapshot_requests = session.stats()["requests"] - requests_before
+
+    if snapshot is None:
+        print(f"⚠ {date} 휴장일이라 벤치마크를 건너뜁니다")
+        return
+
+    # 종목별 조회 (OHLCV + 시가총액 + 지표, 표본)
+    sample = list(snapshot.index[:sample_size])
+    requests_before = session.stats()["requests"]
+    started = time.perf_counter()
+    for stock_code in sample:
+        client.get_ohlcv(stock_code, date, date)
+        client.get_market_cap(stock_code, date, date)
+        client.get_fundamental_data(stock_code, date)
+    per_ticker_seconds = (time.perf_counter() - started) / len(sample)
+    per_ticker_requests = (session.stats()["requests"] - requests_before) / len(sample)
+
+    total = len(snapshot)
+    print(f"기준일 {date}, 전체 {total}개 종목")
+    print(f"  시장 스냅샷: KRX 요청 {snapshot_requests}건, {snapshot_seconds:.1f}s")
+    print(
+        f"  종목별 조회: KRX 요청 {per_ticker_requests * total:,.0f}건, "
+        f"{per_ticker_seconds * total:,.0f}s (표본 {len(sample)}개 기준 환산)"
+    )
+    print(
+        f"  → 요청 수 {per_ticker_requests * total / max(snapshot_requests, 1):,.0f}배 감소, "
+        f"소요 시간 {per_ticker_seconds * total / snapshot_seconds:,.0f}배 단축"
+    )
+
+
+def test_snapshot_benchmark():
+    """시장 스냅샷 vs 종목별 조회 벤치마크 (KRX 접속 필요)"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 시장 스냅샷 vs 종목별 조회 벤치마크")
+    print("=" * 80)
+
+    benchmark_snapshot()
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("시장 전체 일별 스냅샷 테스트")
+    print("=" * 80)
+
+    test_merge_market_snapshot()
+    test_failed_snapshot_retried()
+
+    print("\n" + "=" * 80)
+    print("TEST 3: 시장 스냅샷 vs 종목별 조회 벤치마크")
+    print("=" * 80)
+    date = sys.argv[1] if len(sys.argv) > 1 else None
+    sample_size = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    benchmark_snapshot(date, sample_size)
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
@@ -0,0 +1,165 @@
+"""
+투자 철학 로드 캐시 및 프롬프트 캐싱 테스트
+
+1. load_knowledge_base: 한 번 읽은 뒤 파일이 바뀔 때(mtime)만 다시 읽는지
+2. 가치투자 평가 메시지: system 메시지(투자 철학)가 기업과 무관하게 같은지 (고정 prefix)
+3. LLMProvider: Claude 모델에만 cache_control 추가, 캐시 토큰 사용량 합산
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+from app.agents.valuation import prompts
+from app.agents.valuation.agent import _deep_value_messages, _quality_messages
+from app.llm.provider import LLMProvider, track_llm_usage
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_knowledge_base_cache():
+    """같은 파일은 다시 읽지 않고, 수정되면 새 내용 반환"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 투자 철학 로드 캐시")
+    print("=" * 80)
+
+    original_dir = prompts.KNOWLEDGE_DIR
+    original_cache = dict(prompts._knowledge_cache)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prompts.KNOWLEDGE_DIR = Path(tmp_dir)
+            prompts._knowledge_cache.clear()
+
+            deep_value_path = Path(tmp_dir) / "deep_value.md"
+            deep_value_path.write_text("안전마진 v1", encoding="utf-8")
+
+            knowledge = prompts.load_knowledge_base()
+            assert knowledge["deep_value"] == "안전마진 v1"
+            assert "찾을 수 없습니다" in knowledge["quality"]
+
+            # 같은 mtime: 캐시된 문자열 객체 그대로
+            assert prompts.load_knowledge_base()["deep_value"] is knowledge["deep_value"]
+
+            # 파일 수정: 다시 읽음
+            deep_value_path.write_text("안전마진 v2", encoding="utf-8")
+            later = time.time() + 5
+            os.utime(deep_value_path, (later, later))
+            assert prompts.load_knowledge_base()["deep_value"] == "안전마진 v2"
+
+            # 파일 추가
+            (Path(tmp_dir) / "quality.md").write_text("해자", encoding="utf-8")
+            assert prompts.load_knowledge_base()["quality"] == "해자"
+    finally:
+        prompts.KNOWLEDGE_DIR = original_dir
+        prompts._knowledge_cache.clear()
+        prompts._knowledge_cache.update(original_cache)
+
+    print("✓ mtime 기준 재로드")
+
+
+def test_stable_prefix():
+    """기업이 달라도 system 메시지는 동일, 기업 데이터는 user 메시지에만"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 고정 prefix")
+    print("=" * 80)
+
+    knowledge = {"deep_value": "Deep Value 철학", "quality": "Quality 철학"}
+    samsung = {"company_name": "삼성전자", "stock_code": "005930", "financial_analysis_text": "A"}
+    kakao = {"company_name": "카카오", "stock_code": "035720", "financial_analysis_text": "B"}
+
+    for build in (_deep_value_messages, _quality_messages):
+        first, second = build(samsung, knowledge), build(kakao, knowledge)
+        assert first[0]["role"] == "system" and first[0] == second[0]
+        assert first[1] != second[1]
+        assert "삼성전자" not in first[0]["content"] and "삼성전자" in first[1]["content"]
+
+    assert "Deep Value 철학" in _deep_value_messages(samsung, knowledge)[0]["content"]
+    assert "Quality 철학" in _quality_messages(samsung, knowledge)[0]["content"]
+
+    print("✓ system 메시지 동일, 기업 데이터는 user 메시지")
+
+
+def test_provider_cache_control_and_usage():
+    """Claude만 system에 cache_control, 캐시 토큰을 실행 범위별로 합산"""
+    print("\n" + "=" * 80)
+    print("TEST 3: cache_control 및 캐시 토큰 합산")
+    print("=" * 80)
+
+    provider = LLMProvider(model="gpt-4o")
+    messages = [
+        {"role": "system", "content": "고정 prefix"},
+        {"role": "user", "content": "기업 데이터"},
+    ]
+
+    assert provider._prepare_messages("gpt-4o", messages) is messages
+
+    prepared = provider._prepare_messages("claude-3-5-sonnet-20241022", messages)
+    assert prepared[0]["content"] == [{
+        "type": "text", "text": "고정 prefix", "cache_control": {"type": "ephemeral"}
+    }]
+    assert prepared[1] == messages[1] and messages[0]["content"] == "고정 prefix"
+
+    def response(prompt_tokens, cached_tokens, cache_write_tokens=None):
+        return SimpleNamespace(usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=100,
+            total_tokens=prompt_tokens + 100,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+            cache_creation_input_tokens=cache_write_tokens,
+        ))
+
+    with track_llm_usage() as usage:
+        provider._record_usage("claude", response(2000, 0, 1800), "LLM 사용량")
+        provider._record_usage("claude", response(2100, 1800), "LLM 사용량")
+    # 범위 밖 호출은 합산하지 않음
+    provider._record_usage("claude", response(500, 0), "LLM 사용량")
+
+    assert usage == {
+        "calls": 2,
+        "prompt_tokens": 4100,
+        "completion_tokens": 200,
+        "cached_tokens": 1800,
+        "cache_write_tokens": 1800,
+        "response_cache_hits": 0,
+    }
+
+    print(f"✓ usage={usage}")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("투자 철학 로드 캐시 및 프롬프트 캐싱 테스트")
+    print("=" * 80)
+
+    test_knowledge_base_cache()
+    test_stable_prefix()
+    test_provider_cache_control_and_usage()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
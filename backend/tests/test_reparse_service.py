@@ -0,0 +1,177 @@
+"""
+보관 문서 재파싱 서비스 테스트
+
+DB 없이 임시 보관소에 합성 사업보고서를 저장한 뒤,
+프로세스 풀 워커의 재파싱 결과와 기존 행 비교(diff) 로직,
+문서별 오류 처리와 파생 행(4Q 단독·PER/PBR) 재계산을 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest import mock
+
+import zstandard
+
+from app.data_sources.dart_document_store import DARTDocumentStore
+from app.data_sources.dart_web_scraper import DARTDocumentParser
+from app.services import reparse_service
+from app.services.financial_service import STATEMENT_FIELDS, prepare_statement_record
+from app.services.reparse_service import _normalize_json, _reparse_document, diff_statement
+from tests.test_dart_web_scraper import build_sample_document
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _archive(store: DARTDocumentStore, rcept_no: str, xml_content: str) -> None:
+    """색인 등록 없이 보관 파일만 기록"""
+    path = store.path_for(rcept_no)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(zstandard.ZstdCompressor().compress(xml_content.encode("utf-8")))
+
+
+def test_reparse_worker():
+    """프로세스 풀 워커가 보관 문서를 직접 파싱한 결과와 같은지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 보관 문서 재파싱 워커")
+    print("=" * 80)
+
+    xml_content = build_sample_document(notes_before=5, notes_after=5)
+    expected = DARTDocumentParser().parse_document(xml_content)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = DARTDocumentStore(tmp_dir)
+        _archive(store, "20160330003536", xml_content)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                _reparse_document,
+                ["20160330003536", "20160330009999"],
+                [tmp_dir, tmp_dir],
+            ))
+
+    rcept_no, data, metadata = results[0]
+    assert rcept_no == "20160330003536"
+    assert (data, metadata) == expected
+
+    # 보관되지 않은 문서는 실패로 반환
+    assert results[1] == ("20160330009999", None, {})
+
+    print(f"✓ {len(data)}개 항목 재파싱, 누락 문서 실패 처리")
+
+
+def test_diff_statement():
+    """재파싱 결과가 같은 행은 건너뛰고 달라진 컬럼만 찾는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 기존 행 비교")
+    print("=" * 80)
+
+    data, xml_metadata = DARTDocumentParser().parse_document(
+        build_sample_document(notes_before=5, notes_after=5)
+    )
+    values, metadata = prepare_statement_record(
+        1, 2015, data, {"source": "dart_web", "fallback": True, **xml_metadata}
+    )
+
+    # 저장된 행 (JSONB 왕복 후 형태)
+    existing = {**values, "raw_data_json": _normalize_json(metadata)}
+    assert diff_statement(existing, values, metadata) == []
+
+    # 이전 파서가 단위를 잘못 적용한 경우
+    stale = {**existing, "revenue": values["revenue"] // 1000}
+    stale["raw_data_json"] = {**existing["raw_data_json"], "unit_conversion": {}}
+    assert diff_statement(stale, values, metadata) == ["revenue", "raw_data_json"]
+
+    assert set(values) == set(STATEMENT_FIELDS)
+    print("✓ 동일 행 건너뜀, 변경 컬럼 감지")
+
+
+def test_run_reparse_isolates_errors():
+    """워커 오류가 난 문서만 실패로 세고, 갱신된 회사의 파생 행을 재계산하는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 문서별 오류 처리와 파생 행 재계산")
+    print("=" * 80)
+
+    xml_content = build_sample_document(notes_before=5, notes_after=5)
+    data, xml_metadata = DARTDocumentParser().parse_document(xml_content)
+    stale = {field: None for field in STATEMENT_FIELDS}
+
+    targets = [
+        {"rcept_no": "20160330003536", "statement_id": 11, "company_id": 1,
+         "stock_code": "005930", "fiscal_year": 2015, **stale, "raw_data_json": {}},
+        {"rcept_no": "20160330009999", "statement_id": 12, "company_id": 2,
+         "stock_code": "000660", "fiscal_year": 2015, **stale, "raw_data_json": {}},
+    ]
+
+    def fake_reparse(rcept_no, root_dir):
+        if rcept_no == "20160330009999":
+            raise ValueError("손상된 문서")
+        return rcept_no, data, xml_metadata
+
+    executed = []
+
+    class _Session:
+        def execute(self, stmt, params):
+            executed.extend(params)
+
+    @contextmanager
+    def fake_session():
+        yield _Session()
+
+    with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.multiple(
+        reparse_service,
+        get_document_store=mock.Mock(return_value=DARTDocumentStore(tmp_dir)),
+        load_reparse_targets=mock.Mock(return_value=targets),
+        ProcessPoolExecutor=ThreadPoolExecutor,
+        _reparse_document=fake_reparse,
+        get_sync_session=fake_session,
+        generate_q4_standalone_statements=mock.AsyncMock(),
+        update_per_pbr=mock.AsyncMock(),
+    ):
+        summary = reparse_service.run_reparse(workers=2)
+
+        assert summary["failed"] == 1 and summary["changed"] == 1, summary
+        assert [row["id"] for row in executed] == [11]
+        reparse_service.generate_q4_standalone_statements.assert_awaited_once_with(1, "005930")
+        reparse_service.update_per_pbr.assert_awaited_once_with(1, "005930")
+        assert summary["derived_failed"] == 0
+
+    print(f"✓ 실패 {summary['failed']}건, 변경 {summary['changed']}건 반영 후 파생 행 재계산")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("보관 문서 재파싱 서비스 테스트")
+    print("=" * 80)
+
+    test_reparse_worker()
+    test_diff_statement()
+    test_run_reparse_isolates_errors()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
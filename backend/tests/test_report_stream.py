@@ -0,0 +1,289 @@
+"""
+보고서 스트리밍 생성 테스트
+
+1. ReportStream: 구독자는 snapshot(지금까지 본문) → delta → done 순서로 받음
+2. LLMProvider.stream/astream: 조각 순서, 스트림을 열지 못하면 폴백, 사용량 기록
+3. agenerate_report_node: 조각을 스트림에 전달, 주기적 체크포인트, 완료 시 공개,
+   실패·취소 시 구독자에게 error 전달 후 스트림 해제
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from app.agents.report import agent as report_agent
+from app.config import settings
+from app.llm import provider as provider_module
+from app.llm.provider import LLMProvider, track_llm_usage
+from app.services.report_stream import close_report_stream, get_report_stream, open_report_stream
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+_MESSAGES = [{"role": "user", "content": "삼성전자 보고서를 작성하세요."}]
+_PIECES = ["# 삼성전자", " 투자", " 분석"]
+
+
+def _chunks(pieces: list[str]) -> list:
+    """LiteLLM 스트림 청크 모양 (마지막 청크에 사용량)"""
+    chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+        for piece in pieces
+    ]
+    chunks.append(SimpleNamespace(
+        choices=[],
+        usage=SimpleNamespace(prompt_tokens=30, completion_tokens=3, total_tokens=33),
+    ))
+    return chunks
+
+
+async def _collect(stream) -> list[tuple[str, dict]]:
+    return [event async for event in stream.events()]
+
+
+def test_report_stream_events():
+    """늦게 들어온 구독자도 지금까지의 본문을 snapshot으로 받음"""
+    print("\n" + "=" * 80)
+    print("TEST 1: ReportStream 구독")
+    print("=" * 80)
+
+    async def scenario():
+        stream = open_report_stream(1, report_id=10, slug="samsung")
+        stream.publish("# 삼성전자")
+
+        early = asyncio.create_task(_collect(stream))
+        await asyncio.sleep(0)
+        stream.publish(" 투자")
+
+        late = asyncio.create_task(_collect(stream))
+        await asyncio.sleep(0)
+        stream.publish(" 분석")
+        close_report_stream(1, "done", {"report_id": 10, "slug": "samsung"})
+
+        return await early, await late
+
+    early, late = asyncio.run(scenario())
+
+    assert early[0] == ("snapshot", {"content": "# 삼성전자", "report_id": 10, "slug": "samsung"})
+    assert [data["content"] for event, data in early[1:-1]] == [" 투자", " 분석"]
+    assert early[-1] == ("done", {"report_id": 10, "slug": "samsung"})
+
+    assert late[0][1]["content"] == "# 삼성전자 투자"
+    assert late[1:] == [
+        ("delta", {"content": " 분석"}),
+        ("done", {"report_id": 10, "slug": "samsung"}),
+    ]
+    assert get_report_stream(1) is None
+
+    print(f"✓ 구독자 2명, 이벤트 {len(early)}개/{len(late)}개")
+
+
+def test_provider_stream():
+    """조각 순서, 폴백, 사용량 합산"""
+    print("\n" + "=" * 80)
+    print("TEST 2: LLMProvider 스트리밍")
+    print("=" * 80)
+
+    requested = []
+
+    def fake_completion(model, **kwargs):
+        requested.append(model)
+        assert kwargs["stream"] is True
+        if model == "gpt-4o":
+            raise provider_module.APIConnectionError(
+                message="down", llm_provider="openai", model=model
+            )
+        return iter(_chunks(_PIECES))
+
+    async def fake_acompletion(model, **kwargs):
+        requested.append(model)
+
+        async def chunks():
+            for chunk in _chunks(_PIECES):
+                yield chunk
+        return chunks()
+
+    original = (
+        provider_module.completion,
+        provider_module.acompletion,
+        settings.llm_governor_enabled,
+        settings.llm_response_cache_enabled,
+    )
+    try:
+        provider_module.completion = fake_completion
+        provider_module.acompletion = fake_acompletion
+        settings.llm_governor_enabled = False
+        settings.llm_response_cache_enabled = False
+
+        provider = LLMProvider(model="gpt-4o", fallback_models=["gpt-4o-mini"])
+
+        async def collect_async():
+            return [text async for text in provider.astream(_MESSAGES, max_tokens=100)]
+
+        with track_llm_usage() as usage:
+            # 메인 모델 연결 실패 → 폴백 모델로 스트리밍
+            assert list(provider.stream(_MESSAGES, max_tokens=100)) == _PIECES
+            assert asyncio.run(collect_async()) == _PIECES
+
+        assert requested == ["gpt-4o", "gpt-4o-mini", "gpt-4o"]
+        assert usage["calls"] == 2 and usage["completion_tokens"] == 6
+
+        print(f"✓ 요청 모델={requested}, usage={usage}")
+    finally:
+        (
+            provider_module.completion,
+            provider_module.acompletion,
+            settings.llm_governor_enabled,
+            settings.llm_response_cache_enabled,
+        ) = original
+
+
+class _StreamingProvider:
+    """조각 사이에 잠시 멈추는 스트리밍 프로바이더"""
+
+    def __init__(self, fail_after: int | None = None):
+        self.fail_after = fail_after
+
+    async def astream(self, messages, **kwargs):
+        for i, piece in enumerate(_PIECES):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("연결 끊김")
+            await asyncio.sleep(0.01)
+            yield piece
+
+
+def test_report_node_checkpoints():
+    """조각을 스트림에 전달, 체크포인트 저장, 완료 시 공개 / 실패·취소 시 부분 본문 보존"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 보고서 노드 체크포인트")
+    print("=" * 80)
+
+    saved = {"checkpoints": [], "published": None}
+
+    def fake_create_draft(state):
+        return 10, "samsung"
+
+    def fake_checkpoint(report_id, content):
+        saved["checkpoints"].append(content)
+
+    def fake_publish(report_id, content):
+        saved["published"] = content
+        return content
+
+    async def fake_revalidation(slug):
+        return True
+
+    state = {
+        "analysis_run_id": 7,
+        "company_id": 1,
+        "company_name": "삼성전자",
+        "stock_code": "005930",
+        "errors": [],
+    }
+
+    original = (
+        report_agent._create_draft_report,
+        report_agent._checkpoint_report,
+        report_agent._publish_report,
+        report_agent.atrigger_revalidation,
+        report_agent.get_llm_provider,
+        settings.report_checkpoint_seconds,
+    )
+    try:
+        report_agent._create_draft_report = fake_create_draft
+        report_agent._checkpoint_report = fake_checkpoint
+        report_agent._publish_report = fake_publish
+        report_agent.atrigger_revalidation = fake_revalidation
+        settings.report_checkpoint_seconds = 0.0  # 조각마다 체크포인트
+
+        async def scenario(provider):
+            report_agent.get_llm_provider = lambda: provider
+            node = asyncio.create_task(report_agent.agenerate_report_node(state))
+            while get_report_stream(7) is None:
+                await asyncio.sleep(0)
+            events = await _collect(get_report_stream(7))
+            return await node, events
+
+        result, events = asyncio.run(scenario(_StreamingProvider()))
+        assert result["current_stage"] == "report_generated" and result["report_id"] == 10
+        assert saved["published"] == "".join(_PIECES)
+        assert saved["checkpoints"] == ["# 삼성전자", "# 삼성전자 투자", "# 삼성전자 투자 분석"]
+        assert "".join(data.get("content", "") for event, data in events) == "".join(_PIECES)
+        assert events[-1] == ("done", {"report_id": 10, "slug": "samsung"})
+
+        # 스트림 도중 실패: 생성된 부분 저장, 공개하지 않음, 구독자에게 error
+        saved.update(checkpoints=[], published=None)
+        settings.report_checkpoint_seconds = 60.0
+        result, events = asyncio.run(scenario(_StreamingProvider(fail_after=2)))
+        assert result["current_stage"] == "report_failed"
+        assert saved["checkpoints"] == ["# 삼성전자 투자"] and saved["published"] is None
+        assert events[-1][0] == "error"
+
+        # 생성 도중 취소: 스트림 등록 해제, 구독자는 error로 종료, 부분 본문 저장
+        async def cancelled_scenario():
+            report_agent.get_llm_provider = lambda: _StreamingProvider()
+            node = asyncio.create_task(report_agent.agenerate_report_node(state))
+            while get_report_stream(7) is None:
+                await asyncio.sleep(0)
+            subscriber = asyncio.create_task(_collect(get_report_stream(7)))
+            while not get_report_stream(7).content:
+                await asyncio.sleep(0)
+            node.cancel()
+            try:
+                await node
+            except asyncio.CancelledError:
+                pass
+            return await asyncio.wait_for(subscriber, timeout=1.0)
+
+        saved.update(checkpoints=[], published=None)
+        events = asyncio.run(cancelled_scenario())
+        assert events[-1] == ("error", {"message": "보고서 생성 취소"})
+        assert get_report_stream(7) is None
+        assert saved["checkpoints"] == ["# 삼성전자"] and saved["published"] is None
+
+        print(f"✓ 이벤트 {len(events)}개, 취소 시 체크포인트={saved['checkpoints']}")
+    finally:
+        (
+            report_agent._create_draft_report,
+            report_agent._checkpoint_report,
+            report_agent._publish_report,
+            report_agent.atrigger_revalidation,
+            report_agent.get_llm_provider,
+            settings.report_checkpoint_seconds,
+        ) = original
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("보고서 스트리밍 생성 테스트")
+    print("=" * 80)
+
+    test_report_stream_events()
+    test_provider_stream()
+    test_report_node_checkpoints()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
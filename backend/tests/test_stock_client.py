@@ -11,9 +11,20 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 
+import numpy as np
+import pandas as pd
+
+from app.agents.financial.tools.stock_price_tool import get_stock_analysis
+from app.data_sources.krx_session import KRXSessionManager
 from app.data_sources.stock_client import StockClient
+from app.data_sources.stock_price_store import StockPriceStore
+from app.data_sources.trading_calendar import TradingCalendar
 
 # 로깅 설정
 logging.basicConfig(
@@ -186,6 +197,289 @@ def test_get_52week_high_low():
         return False
 
 
+class _FakeKrxHandler(BaseHTTPRequestHandler):
+    """GET /은 SCOUTER 쿠키 발급, POST는 현재 유효한 쿠키가 없으면 403"""
+
+    valid_cookie = "v1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Set-Cookie", f"SCOUTER={self.valid_cookie}; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        ok = f"SCOUTER={self.valid_cookie}" in (self.headers.get("Cookie") or "")
+        body = b"{}" if ok else b""
+        self.send_response(200 if ok else 403)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_krx_session_refresh_coordination():
+    """동시에 403을 받아도 쿠키 갱신은 한 번만 하는지 검증 (로컬 서버, 네트워크 불필요)"""
+    print("\n" + "=" * 80)
+    print("TEST 7: KRX 세션 쿠키 갱신 조율 (로컬 서버)")
+    print("=" * 80)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeKrxHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        session = KRXSessionManager(pool_size=4, timeout=5, home_url=f"{base_url}/")
+
+        def _post(i):
+            return session.post(f"{base_url}/data", data={"i": i}).status_code
+
+        # 첫 요청 전 쿠키 발급
+        assert _post(0) == 200
+        assert session.stats()["refreshes"] == 1
+
+        # 서버 쪽 쿠키 만료 → 16개 요청이 동시에 403
+        _FakeKrxHandler.valid_cookie = "v2"
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = list(executor.map(_post, range(16)))
+
+        stats = session.stats()
+        assert statuses == [200] * 16
+        assert stats["refreshes"] == 2, stats
+        print(f"✓ 동시 요청 16건 성공, 쿠키 갱신 {stats['refreshes'] - 1}회")
+    finally:
+        server.shutdown()
+        server.server_close()
+        _FakeKrxHandler.valid_cookie = "v1"
+
+
+def _synthetic_ohlcv(start: str, end: str) -> pd.DataFrame:
+    """영업일 기준 합성 OHLCV (네트워크 없이 get_ohlcv 대체)"""
+    index = pd.bdate_range(start, end)
+    close = 70_000 + np.asarray(index.dayofyear) * 10  # 날짜별로 고정된 값
+    return pd.DataFrame(
+        {"open": close, "high": close + 500, "low": close - 500, "close": close, "volume": 1_000},
+        index=index,
+    )
+
+
+def _synthetic_market_cap(start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end)
+    return pd.DataFrame(
+        {
+            "market_cap": 400_000_000_000_000.0,
+            "volume": 1_000,
+            "trade_value": 0,
+            "shares_outstanding": 5_969_782_550,
+        },
+        index=index,
+    )
+
+
+def test_price_snapshot_single_fetch():
+    """get_stock_analysis가 종목당 OHLCV·시가총액을 한 번씩만 조회하는지 검증 (네트워크 불필요)"""
+    print("\n" + "=" * 80)
+    print("TEST 8: 주가 요약 단일 조회")
+    print("=" * 80)
+
+    with mock.patch.object(
+        StockClient, "get_ohlcv", side_effect=lambda code, start, end: _synthetic_ohlcv(start, end)
+    ) as ohlcv, mock.patch.object(
+        StockClient, "get_market_cap",
+        side_effect=lambda code, start, end: _synthetic_market_cap(start, end)
+    ) as market_cap, mock.patch.object(
+        StockClient, "get_fundamental_data", return_value=None
+    ):
+        report = get_stock_analysis.invoke({"stock_code": "005930", "days": 252})
+        assert ohlcv.call_count == 1, ohlcv.call_count
+        assert market_cap.call_count == 1, market_cap.call_count
+
+        # 개별 메서드 결과와 동일
+        client = StockClient()
+        snapshot = client.get_price_snapshot("005930", days=252)
+        assert snapshot["change_rates"] == client.get_price_change_rate("005930", days=252)
+        assert snapshot["week_52"] == client.get_52week_high_low("005930")
+
+    assert "52주 기준" in report and "6개월" in report
+    print(f"✓ OHLCV {ohlcv.call_count}회, 시가총액 {market_cap.call_count}회 조회로 분석 완료")
+
+
+class _MemoryPriceStore(StockPriceStore):
+    """stock_prices 테이블 대신 메모리 DataFrame을 쓰는 저장소"""
+
+    def __init__(self, frame: pd.DataFrame):
+        super().__init__()
+        self.frame = frame
+
+    def get_company_id(self, stock_code):
+        return 1
+
+    def load(self, company_id, start, end):
+        index = self.frame.index
+        return self.frame[(index >= pd.Timestamp(start)) & (index <= pd.Timestamp(end))]
+
+    def get_trade_date_range(self, company_id):
+        if self.frame.empty:
+            return None
+        return self.frame.index[0].date(), self.frame.index[-1].date()
+
+    def upsert(self, company_id, df):
+        # 같은 거래일은 받은 컬럼만 덮어씀 (스냅샷 지표 컬럼 유지)
+        frame = df.assign(adjusted=True).combine_first(self.frame)
+        frame["adjusted"] = frame["adjusted"].astype(bool)
+        self.frame = frame
+        return len(df)
+
+
+def test_read_through_fetches_tail_only():
+    """read-through 모드에서 저장된 구간은 DB에서 읽고 확인되지 않은 구간만 KRX 조회하는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 9: 주가 read-through")
+    print("=" * 80)
+
+    end = datetime.now()
+    start = end - timedelta(days=120)
+    stored_until = end - timedelta(days=7)
+    start_str, end_str = start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+
+    # 수정주가 배율 (액면분할 시 과거 수정주가가 모두 바뀜)
+    price = {"factor": 1}
+
+    def _ohlcv(start_date, end_date):
+        df = _synthetic_ohlcv(start_date, end_date)
+        df[["open", "high", "low", "close"]] //= price["factor"]
+        return df
+
+    def _live(start_date, end_date):
+        return _ohlcv(start_date, end_date).join(
+            _synthetic_market_cap(start_date, end_date)[["market_cap", "shares_outstanding"]]
+        )
+
+    stored = _live(start_str, stored_until.strftime("%Y%m%d"))
+    store = _MemoryPriceStore(stored.assign(adjusted=True))
+    stored_rows = len(store.frame)
+    # 마지막 저장일을 겹쳐 조회 (수정주가 기준 확인)
+    expected_start = store.frame.index[-1].strftime("%Y%m%d")
+
+    calendar = TradingCalendar(fetcher=lambda s, e: list(pd.bdate_range(s, e).date))
+
+    with mock.patch(
+        "app.data_sources.stock_client.get_stock_price_store", return_value=store
+    ), mock.patch(
+        "app.data_sources.stock_client.get_trading_calendar", return_value=calendar
+    ), mock.patch.object(
+        StockClient, "get_ohlcv", side_effect=lambda code, s, e: _ohlcv(s, e)
+    ) as ohlcv, mock.patch.object(
+        StockClient, "get_market_cap", side_effect=lambda code, s, e: _synthetic_market_cap(s, e)
+    ):
+        client = StockClient(read_through=True)
+        df = client.get_price_history("005930", start_str, end_str)
+
+        assert ohlcv.call_count == 1
+        assert ohlcv.call_args.args[1] == expected_start, ohlcv.call_args
+
+        live = _live(start_str, end_str)
+        assert list(df.index) == list(live.index)
+        assert df["close"].tolist() == live["close"].tolist()
+        assert len(store.frame) == len(live)  # 조회한 구간은 저장소에 기록
+        assert "adjusted" not in df.columns and store.frame["adjusted"].all()
+
+        # 시장 전체 스냅샷(원주가) 행은 수정주가로 다시 조회하여 덮어씀
+        raw_from = store.frame.index[-20]
+        store.frame.loc[store.frame.index >= raw_from, "adjusted"] = False
+        store.frame.loc[store.frame.index >= raw_from, "close"] *= 2  # 분할 전 원주가
+        ohlcv.reset_mock()
+
+        df = client.get_price_history("005930", start_str, end_str)
+        assert ohlcv.call_args.args[1] == store.frame.index[-21].strftime("%Y%m%d"), ohlcv.call_args
+        assert df["close"].tolist() == live["close"].tolist()
+        assert store.frame["adjusted"].all()
+
+        # 중간에 빠진 거래일: 빠진 날 직전 저장일부터 조회
+        missing = store.frame.index[30:33]
+        store.frame = store.frame.drop(missing)
+        ohlcv.reset_mock()
+
+        df = client.get_price_history("005930", start_str, end_str)
+        assert ohlcv.call_args.args[1] == store.frame.index[29].strftime("%Y%m%d"), ohlcv.call_args
+        assert list(df.index) == list(live.index)
+        assert len(store.frame) == len(live)
+
+        # 액면분할로 수정주가 변경: 겹친 날 종가가 달라 전체 재적재
+        price["factor"] = 2
+        ohlcv.reset_mock()
+
+        df = client.get_price_history("005930", start_str, end_str)
+        assert ohlcv.call_count == 2 and ohlcv.call_args.args[1] == start_str, ohlcv.call_args
+        assert df["close"].tolist() == _live(start_str, end_str)["close"].tolist()
+        assert store.frame["close"].tolist() == df["close"].tolist()
+
+    print(f"✓ DB {stored_rows}일 + KRX {len(df) - stored_rows}일 (조회 시작 {expected_start})")
+
+
+def test_read_through_adjustment_keeps_earlier_history():
+    """수정주가 변경 시 요청 구간 이전에 저장된 주가도 새 기준으로 덮어쓰고 지우지 않는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 10: 수정주가 변경 시 저장 기간 전체 재적재")
+    print("=" * 80)
+
+    end = datetime.now()
+    start = end - timedelta(days=60)
+    stored_from = end - timedelta(days=180)
+    stored_until = end - timedelta(days=7)
+    start_str, end_str = start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+
+    def _live(start_date, end_date, factor=1):
+        df = _synthetic_ohlcv(start_date, end_date)
+        df[["open", "high", "low", "close"]] //= factor
+        return df.join(
+            _synthetic_market_cap(start_date, end_date)[["market_cap", "shares_outstanding"]]
+        )
+
+    # 분할 전 기준으로 저장된 주가 (시장 스냅샷 지표 per 포함)
+    stored = _live(stored_from.strftime("%Y%m%d"), stored_until.strftime("%Y%m%d"))
+    store = _MemoryPriceStore(stored.assign(per=12.5, adjusted=True))
+    first_stored = store.frame.index[0]
+
+    calendar = TradingCalendar(fetcher=lambda s, e: list(pd.bdate_range(s, e).date))
+
+    def _split_ohlcv(start_date, end_date):
+        """1:2 액면분할 이후 수정주가"""
+        df = _synthetic_ohlcv(start_date, end_date)
+        df[["open", "high", "low", "close"]] //= 2
+        return df
+
+    with mock.patch(
+        "app.data_sources.stock_client.get_stock_price_store", return_value=store
+    ), mock.patch(
+        "app.data_sources.stock_client.get_trading_calendar", return_value=calendar
+    ), mock.patch.object(
+        StockClient, "get_ohlcv", side_effect=lambda code, s, e: _split_ohlcv(s, e)
+    ) as ohlcv, mock.patch.object(
+        StockClient, "get_market_cap", side_effect=lambda code, s, e: _synthetic_market_cap(s, e)
+    ):
+        df = StockClient(read_through=True).get_price_history("005930", start_str, end_str)
+
+    # 겹친 날 종가가 달라 저장된 첫 거래일부터 다시 조회
+    assert ohlcv.call_count == 2
+    assert ohlcv.call_args.args[1] == first_stored.strftime("%Y%m%d"), ohlcv.call_args
+
+    # 반환은 요청 구간만
+    assert list(df.index) == list(_live(start_str, end_str).index)
+    assert df["close"].tolist() == _live(start_str, end_str, factor=2)["close"].tolist()
+
+    # 요청 구간 이전 행도 남아 있고 새 기준으로 덮어씀, 지표 컬럼 유지
+    earlier = store.frame[store.frame.index < pd.Timestamp(start_str)]
+    assert earlier.index[0] == first_stored
+    assert earlier["close"].tolist() == (stored.loc[earlier.index, "close"] // 2).tolist()
+    assert (earlier["per"] == 12.5).all() and store.frame["adjusted"].all()
+
+    print(f"✓ 요청 구간 이전 {len(earlier)}일 유지 (저장 시작 {first_stored.date()})")
+
+
 def main():
     """전체 테스트 실행"""
     print("\n" + "=" * 80)
@@ -211,6 +505,18 @@ def main():
     # TEST 6: 52주 최고/최저
     test_get_52week_high_low()
 
+    # TEST 7: KRX 세션
+    test_krx_session_refresh_coordination()
+
+    # TEST 8: 주가 요약 단일 조회
+    test_price_snapshot_single_fetch()
+
+    # TEST 9: 주가 read-through
+    test_read_through_fetches_tail_only()
+
+    # TEST 10: 수정주가 변경 시 저장 기간 전체 재적재
+    test_read_through_adjustment_keeps_earlier_history()
+
     print("\n" + "=" * 80)
     print("✓ 모든 테스트 완료")
     print("=" * 80 + "\n")
@@ -0,0 +1,200 @@
+"""
+종목 검색 색인 테스트
+
+1. 기존 /stocks/search 선형 탐색(4단계)과 같은 순위를 내는지 합성 종목 목록으로 비교
+2. 초성 검색
+3. 검색 지연 시간 벤치마크 (p50/p99)
+
+    python tests/test_stock_search.py
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import random
+import time
+
+from app.services.stock_search import StockSearchIndex, to_choseong
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+_SYLLABLES = (
+    "삼성전자에스케이하이닉스현대차기아엘지화학네이버카카오"
+    "셀트리온포스코한국대우신한우리금융바이오제약건설증권"
+)
+_SUFFIXES = ["", "우", "홀딩스", "바이오", "전자", "중공업", "2우B", "스팩1호", "ETF"]
+
+
+def _synthetic_universe(size: int = 2700, seed: int = 7) -> list[dict]:
+    """KOSPI+KOSDAQ 규모의 합성 종목 목록 (이름 중복·공통 접두어 포함)"""
+    rng = random.Random(seed)
+    entries = []
+    codes = rng.sample(range(1, 999999), size)
+    for code in codes:
+        name = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        name += rng.choice(_SUFFIXES)
+        if rng.random() < 0.05:
+            name = rng.choice(["KB", "SK", "LG", "GS", "CJ"]) + name
+        entries.append({
+            "stock_code": f"{code:06d}",
+            "company_name": name,
+            "market": rng.choice(["KOSPI", "KOSDAQ"]),
+        })
+    return entries
+
+
+def _linear_search(entries: list[dict], query: str, limit: int = 10) -> list[int]:
+    """기존 search_stocks의 4단계 선형 탐색 (위치 목록으로 반환)"""
+    query = query.strip()
+    results = [i for i, e in enumerate(entries) if e["stock_code"] == query]
+    for match in (
+        lambda e: e["company_name"].startswith(query),
+        lambda e: query in e["company_name"],
+        lambda e: query in e["stock_code"],
+    ):
+        if len(results) >= limit:
+            break
+        for i, e in enumerate(entries):
+            if i not in results and match(e):
+                results.append(i)
+                if len(results) >= limit:
+                    break
+    return results[:limit]
+
+
+def _sample_queries(entries: list[dict], count: int, seed: int = 11) -> list[str]:
+    """이름 앞부분·중간·종목코드 일부·전체 코드·없는 검색어 혼합"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        entry = rng.choice(entries)
+        name, code = entry["company_name"], entry["stock_code"]
+        start = rng.randrange(len(name))
+        queries.append(rng.choice([
+            name[:rng.randint(1, len(name))],
+            name[start:start + rng.randint(1, 3)],
+            code[:rng.randint(1, 6)],
+            code[rng.randrange(5):],
+            code,
+            "없는종목",
+        ]))
+    return queries
+
+
+def test_same_ranking_as_linear():
+    """색인 검색 결과가 기존 선형 탐색과 같은 순서인지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 기존 검색과 순위 비교")
+    print("=" * 80)
+
+    entries = _synthetic_universe()
+    index = StockSearchIndex(entries)
+
+    queries = _sample_queries(entries, 2000)
+    for query in queries:
+        assert index.search(query) == _linear_search(entries, query), query
+
+    print(f"✓ {len(queries)}개 검색어 결과 일치")
+
+
+def test_choseong_search():
+    """초성 검색어는 종목명 초성으로 시작·포함 일치"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 초성 검색")
+    print("=" * 80)
+
+    entries = [
+        {"stock_code": "005930", "company_name": "삼성전자"},
+        {"stock_code": "005935", "company_name": "삼성전자우"},
+        {"stock_code": "009150", "company_name": "삼성전기"},
+        {"stock_code": "000660", "company_name": "SK하이닉스"},
+        {"stock_code": "035720", "company_name": "카카오"},
+    ]
+    index = StockSearchIndex(entries)
+
+    assert to_choseong("SK하이닉스") == "SKㅎㅇㄴㅅ"
+    assert index.search("ㅅㅅㅈ") == [0, 1, 2]
+    assert index.search("ㅈㅈ") == [0, 1]  # 부분 일치
+    assert index.search("ㅋㅋㅇ") == [4]
+    assert index.search("ㅎㅇㄴㅅ") == [3]
+    # 음절이 섞인 검색어는 기존 방식대로 종목명 비교
+    assert index.search("삼성ㅈ") == []
+
+    print("✓ 초성 검색 정확")
+
+
+def benchmark_search(query_count: int = 20000):
+    """합성 2,700종목 기준 검색 지연 시간 (색인 vs 기존 선형 탐색)"""
+    entries = _synthetic_universe()
+
+    started = time.perf_counter()
+    index = StockSearchIndex(entries)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    queries = _sample_queries(entries, query_count, seed=23)
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+
+    linear = []
+    for query in queries[:500]:
+        started = time.perf_counter()
+        _linear_search(entries, query)
+        linear.append(time.perf_counter() - started)
+    linear.sort()
+    linear_p99 = linear[int(len(linear) * 0.99)] * 1e6
+
+    print(f"종목 {len(entries)}개, 색인 생성 {build_ms:.1f}ms")
+    print(f"  색인 검색: p50 {p50:.1f}µs, p99 {p99:.1f}µs ({query_count}회)")
+    print(f"  선형 탐색: p99 {linear_p99:.1f}µs ({len(linear)}회)")
+    return p99
+
+
+def test_search_benchmark():
+    """검색 p99 1ms 미만"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 검색 지연 시간 벤치마크")
+    print("=" * 80)
+
+    p99 = benchmark_search()
+    assert p99 < 1000, f"p99 {p99:.1f}µs"
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("종목 검색 색인 테스트")
+    print("=" * 80)
+
+    test_same_ranking_as_linear()
+    test_choseong_search()
+    test_search_benchmark()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
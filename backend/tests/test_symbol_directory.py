@@ -0,0 +1,237 @@
+"""
+종목 심볼 디렉터리 테스트
+
+DB·DART·KRX 대신 메모리 로더로 출처 병합 우선순위, 기업코드 역조회(중복 종목코드는 첫 행),
+상장 목록 순서, 미등록 종목 조회 시 companies 재로드,
+파일 저장 후 재사용과 갱신 중 기존 목록 응답(stale-while-revalidate),
+KRX 일부 시장 조회 실패 시 기존 목록 유지를 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import tempfile
+import threading
+from datetime import date, timedelta
+from unittest import mock
+
+import pandas as pd
+
+from app.data_sources.dart_corp_registry import DARTCorpRegistry
+from app.data_sources.symbol_directory import (
+    SymbolDirectory,
+    _load_krx_listing,
+    corp_code_entries,
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+_DART_CORP_CODES = pd.DataFrame({
+    "corp_code": ["00126380", "00164779", "00258801", "00999999"],
+    "corp_name": ["삼성전자", "에스케이하이닉스", "카카오", "비상장회사"],
+    "stock_code": ["005930", "000660", "035720", " "],
+})
+
+
+def test_merge_sources():
+    """companies > krx > dart 우선순위로 병합, 기업코드 역조회"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 출처 병합")
+    print("=" * 80)
+
+    companies = [
+        {"stock_code": "005930", "company_name": "삼성전자", "corp_code": None, "market": "KOSPI"},
+    ]
+    directory = SymbolDirectory(loaders={
+        "companies": lambda: companies,
+        "dart": lambda: corp_code_entries(_DART_CORP_CODES),
+    })
+
+    # 비상장(종목코드 공백) 제외
+    assert directory.get("005930")["corp_code"] == "00126380"  # 첫 조회 시 로드
+    assert directory.stats()["sources"] == {"companies": 1, "dart": 3}
+    assert directory.get_name("000660") == "에스케이하이닉스"
+    assert directory.get_by_corp_code("00258801")["stock_code"] == "035720"
+
+    # KRX 목록: 종목명·시장을 채우고 상장 목록 순서를 정함 (DB 등록 회사 값이 우선)
+    directory.update_source("krx", [
+        {"stock_code": "000660", "company_name": "SK하이닉스", "market": "KOSPI"},
+        {"stock_code": "035720", "company_name": "카카오", "market": "KOSPI"},
+        {"stock_code": "005930", "company_name": "삼성전자우", "market": "KOSPI"},
+    ])
+    assert directory.get_name("000660") == "SK하이닉스"
+    assert directory.get_corp_code("000660") == "00164779"
+    assert directory.get_name("005930") == "삼성전자"
+    assert [entry["stock_code"] for entry in directory.listed()] == ["000660", "035720", "005930"]
+
+    # 같은 종목코드가 여러 행: DARTCorpRegistry와 같은 기업코드 (첫 행)
+    duplicated = pd.concat([_DART_CORP_CODES, pd.DataFrame({
+        "corp_code": ["00777777"], "corp_name": ["삼성전자(구)"], "stock_code": ["005930 "],
+    })], ignore_index=True)
+    registry = DARTCorpRegistry("test-key", fetcher=lambda api_key: duplicated)
+    entries = {entry["stock_code"]: entry["corp_code"] for entry in corp_code_entries(duplicated)}
+    assert entries["005930"] == registry.get_corp_code("005930") == "00126380"
+
+    print(f"✓ 병합 결과: {directory.stats()}")
+
+
+def test_miss_reload():
+    """미등록 종목은 companies만 다시 읽되, 최소 간격 안에서는 한 번만"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 미등록 종목 재로드")
+    print("=" * 80)
+
+    companies = []
+    calls = {"companies": 0, "dart": 0}
+
+    def _load_companies():
+        calls["companies"] += 1
+        return list(companies)
+
+    def _load_dart():
+        calls["dart"] += 1
+        return corp_code_entries(_DART_CORP_CODES)
+
+    directory = SymbolDirectory(loaders={"companies": _load_companies, "dart": _load_dart})
+    directory.ensure_loaded()
+    assert calls == {"companies": 1, "dart": 1}
+
+    # 새로 등록된 회사 → 재로드로 찾음 (DART 목록은 다시 받지 않음)
+    companies.append(
+        {"stock_code": "123456", "company_name": "신규상장", "corp_code": None, "market": "KOSDAQ"}
+    )
+    assert directory.get_name("123456") == "신규상장"
+    assert calls == {"companies": 2, "dart": 1}
+
+    # 없는 종목 반복 조회는 간격 제한으로 DB를 다시 읽지 않음
+    assert directory.get_name("999999") is None
+    assert directory.get_name("999999") is None
+    assert calls == {"companies": 2, "dart": 1}
+
+    print(f"✓ 로더 호출: {calls}")
+
+
+def test_persist_and_stale_refresh():
+    """저장 파일로 즉시 시작, 오래된 목록만 갱신, 갱신 중에는 기존 목록으로 응답"""
+    print("\n" + "=" * 80)
+    print("TEST 3: 저장 파일 재사용 및 백그라운드 갱신")
+    print("=" * 80)
+
+    listing = {"name": "삼성전자"}
+    calls = {"krx": 0, "companies": 0}
+    release = threading.Event()
+    release.set()
+
+    def _load_krx():
+        calls["krx"] += 1
+        release.wait(timeout=5)
+        return [{"stock_code": "005930", "company_name": listing["name"], "market": "KOSPI"}]
+
+    def _load_companies():
+        calls["companies"] += 1
+        return []
+
+    loaders = {"companies": _load_companies, "krx": _load_krx}
+    max_age = timedelta(hours=24)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "symbols.json"
+        SymbolDirectory(loaders, path).ensure_loaded()
+        assert calls == {"krx": 1, "companies": 1}
+
+        # 재시작: 로더 호출 없이 저장 파일로 응답
+        directory = SymbolDirectory(loaders, path)
+        assert directory.get_name("005930") == "삼성전자"
+        assert calls == {"krx": 1, "companies": 1}
+
+        # 주기적 갱신: KRX 목록은 TTL 이내라 건너뜀
+        directory.refresh(max_age=max_age)
+        assert calls == {"krx": 1, "companies": 2}
+
+        # TTL이 지난 목록: 갱신이 끝나기 전까지 기존 목록으로 응답
+        directory._loaded_at["krx"] -= timedelta(hours=25)
+        listing["name"] = "삼성전자(신)"
+        release.clear()
+        refresher = threading.Thread(target=directory.refresh, kwargs={"max_age": max_age})
+        refresher.start()
+        assert directory.get_name("005930") == "삼성전자"
+        release.set()
+        refresher.join()
+        assert directory.get_name("005930") == "삼성전자(신)"
+        assert SymbolDirectory(loaders, path).get_name("005930") == "삼성전자(신)"
+
+    print(f"✓ 로더 호출: {calls}")
+
+
+def test_krx_partial_listing_keeps_previous():
+    """한 시장의 목록이 비면(pykrx 조회 오류) 실패로 처리하여 기존 KRX 목록을 유지"""
+    print("\n" + "=" * 80)
+    print("TEST 4: KRX 일부 시장 조회 실패")
+    print("=" * 80)
+
+    listings = {
+        "KOSPI": pd.Series({"005930": "삼성전자"}),
+        "KOSDAQ": pd.Series({"035720": "카카오"}),
+    }
+    calendar = mock.Mock()
+    calendar.last_trading_day.return_value = date(2024, 6, 28)
+
+    with mock.patch(
+        "pykrx.website.krx.get_market_ticker_and_name",
+        side_effect=lambda base_date, market: listings[market],
+    ), mock.patch(
+        "app.data_sources.trading_calendar.get_trading_calendar", return_value=calendar
+    ):
+        directory = SymbolDirectory({"krx": _load_krx_listing})
+        directory.ensure_loaded()
+        assert directory.get_name("035720") == "카카오"
+
+        # KOSDAQ 조회 오류: pykrx는 빈 DataFrame을 반환
+        listings["KOSDAQ"] = pd.DataFrame()
+        try:
+            _load_krx_listing()
+            raise AssertionError("일부 시장이 빈 목록인데 예외가 발생하지 않음")
+        except ValueError as e:
+            assert "KOSDAQ" in str(e)
+
+        assert directory.refresh(sources=["krx"]) == {}
+        assert directory.get_name("035720") == "카카오"
+        assert directory.get_name("005930") == "삼성전자"
+
+    print("✓ KOSDAQ 조회 실패 시 기존 KRX 목록 유지")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("종목 심볼 디렉터리 테스트")
+    print("=" * 80)
+
+    test_merge_sources()
+    test_miss_reload()
+    test_persist_and_stale_refresh()
+    test_krx_partial_listing_keeps_previous()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
@@ -0,0 +1,141 @@
+"""
+KRX 거래일 캘린더 테스트
+
+KRX 조회 대신 주말·지정 휴장일을 제외한 합성 거래일 목록으로
+직전 거래일 조회, 확인 구간 확장 횟수, 파일 저장/재사용을 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import logging
+import tempfile
+from datetime import date, timedelta
+
+from app.data_sources.trading_calendar import TradingCalendar
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+# 합성 휴장일 (2023 연말 휴장, 2024 설 연휴)
+_HOLIDAYS = {
+    date(2023, 12, 29),
+    date(2024, 1, 1),
+    date(2024, 2, 9), date(2024, 2, 12),
+}
+
+
+class _FakeFetcher:
+    """평일 - 휴장일 = 거래일, 호출 구간 기록"""
+
+    def __init__(self):
+        self.calls: list[tuple[date, date]] = []
+
+    def __call__(self, start: date, end: date) -> list[date]:
+        self.calls.append((start, end))
+        days, current = [], start
+        while current <= end:
+            if current.weekday() < 5 and current not in _HOLIDAYS:
+                days.append(current)
+            current += timedelta(days=1)
+        return days
+
+
+def test_last_trading_day():
+    """휴장일·주말 기준일이 직전 거래일로 해석되는지 검증"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 직전 거래일 조회")
+    print("=" * 80)
+
+    fetcher = _FakeFetcher()
+    calendar = TradingCalendar(fetcher=fetcher)
+
+    assert calendar.last_trading_day("20231231") == date(2023, 12, 28)  # 일요일 + 연말 휴장
+    assert calendar.last_trading_day("2024-01-01") == date(2023, 12, 28)  # 신정
+    assert calendar.last_trading_day(date(2024, 1, 2)) == date(2024, 1, 2)
+    assert calendar.is_trading_day("20240102") is True
+    assert calendar.is_trading_day("20231230") is False
+
+    # 기존 확인 구간 안의 조회는 추가 KRX 조회 없음
+    calls_before = len(fetcher.calls)
+    for day in ("20231215", "20231220", "20231228"):
+        calendar.last_trading_day(day)
+    assert len(fetcher.calls) == calls_before
+
+    # 구간 밖 조회는 모자란 부분만 한 번 조회
+    assert calendar.last_trading_day("20240212") == date(2024, 2, 8)  # 설 연휴 대체휴일
+    assert len(fetcher.calls) == calls_before + 1
+    assert fetcher.calls[-1][0] == date(2024, 1, 3)
+
+    # 기간 내 거래일 목록 (확인 구간 안이면 추가 조회 없음)
+    calls_before = len(fetcher.calls)
+    assert calendar.trading_days("20231227", "20240103") == [
+        date(2023, 12, 27), date(2023, 12, 28), date(2024, 1, 2), date(2024, 1, 3)
+    ]
+    assert len(fetcher.calls) == calls_before
+
+    # 아직 확정되지 않은 날짜(오늘 이후)는 판단 보류
+    assert calendar.last_trading_day(date.today() + timedelta(days=3)) is None
+    assert calendar.trading_days("20240102", date.today() + timedelta(days=3)) is None
+
+    print(f"✓ 직전 거래일 조회 정확, KRX 조회 {len(fetcher.calls)}회")
+
+
+def test_persist_and_learn():
+    """파일 저장 후 재시작 시 재사용, 가격 데이터로 캘린더 보강"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 캘린더 저장 및 보강")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "calendar.json"
+
+        fetcher = _FakeFetcher()
+        TradingCalendar(path, fetcher=fetcher).last_trading_day("20231231")
+        assert path.exists()
+
+        # 재시작: 파일에서 로드하여 KRX 조회 없이 응답
+        reloaded_fetcher = _FakeFetcher()
+        reloaded = TradingCalendar(path, fetcher=reloaded_fetcher)
+        assert reloaded.last_trading_day("20231230") == date(2023, 12, 28)
+        assert reloaded_fetcher.calls == []
+
+        # 이어지는 구간의 가격 데이터 날짜 인덱스로 보강
+        learned = [date(2024, 1, 2), date(2024, 1, 3)]
+        reloaded.learn(learned, date(2024, 1, 1), date(2024, 1, 3))
+        assert reloaded.last_trading_day("20240103") == date(2024, 1, 3)
+        assert reloaded_fetcher.calls == []
+
+    print("✓ 파일 재사용 및 보강 시 KRX 조회 없음")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("KRX 거래일 캘린더 테스트")
+    print("=" * 80)
+
+    test_last_trading_day()
+    test_persist_and_learn()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")
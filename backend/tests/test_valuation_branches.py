@@ -0,0 +1,164 @@
+"""
+가치투자 평가 병렬 분기 테스트
+
+LLM 대신 지연 후 점수를 돌려주는 가짜 프로바이더로
+1. Deep Value·Quality 분기가 동시에 실행되어 단계 시간이 분기 하나 수준인지 (동기·비동기 그래프)
+2. 점수 병합·투자 판단과 분기별 소요 시간(stage_timings) 기록
+3. 한 분기가 실패하면 valuation_failed로 병합되는지
+를 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import asyncio
+import logging
+import time
+
+from langgraph.graph import END, START, StateGraph
+
+from app.agents.state import AnalysisState
+from app.agents.valuation import agent as valuation_agent
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+# LLM 호출 1회 지연 (초)
+_LLM_SECONDS = 0.2
+
+
+class _FakeLLM:
+    """프롬프트 종류별 고정 점수를 지연 후 반환"""
+
+    def __init__(self, fail_quality: bool = False):
+        self.fail_quality = fail_quality
+
+    def _answer(self, messages: list[dict]) -> str:
+        prompt = messages[-1]["content"]
+        if "Quality" in prompt or "quality" in prompt:
+            if self.fail_quality:
+                raise RuntimeError("quality 호출 실패")
+            return "**점수**: 80"
+        return "점수: 60"
+
+    def complete(self, messages, **kwargs):
+        time.sleep(_LLM_SECONDS)
+        return self._answer(messages)
+
+    async def acomplete(self, messages, **kwargs):
+        await asyncio.sleep(_LLM_SECONDS)
+        return self._answer(messages)
+
+
+def _valuation_graph(async_mode: bool):
+    """분석 그래프의 평가 구간과 같은 배선 (fan-out 두 분기 → score_valuation)"""
+    graph = StateGraph(AnalysisState)
+    if async_mode:
+        graph.add_node("evaluate_deep_value", valuation_agent.aevaluate_deep_value_node)
+        graph.add_node("evaluate_quality", valuation_agent.aevaluate_quality_node)
+    else:
+        graph.add_node("evaluate_deep_value", valuation_agent.evaluate_deep_value_node)
+        graph.add_node("evaluate_quality", valuation_agent.evaluate_quality_node)
+    graph.add_node("score_valuation", valuation_agent.score_valuation_node)
+    graph.add_edge(START, "evaluate_deep_value")
+    graph.add_edge(START, "evaluate_quality")
+    graph.add_edge("evaluate_deep_value", "score_valuation")
+    graph.add_edge("evaluate_quality", "score_valuation")
+    graph.add_edge("score_valuation", END)
+    return graph.compile()
+
+
+def _run(async_mode: bool, llm: _FakeLLM) -> tuple[dict, float]:
+    original = valuation_agent.get_llm_provider
+    valuation_agent.get_llm_provider = lambda: llm
+    try:
+        state = {
+            "company_id": 1,
+            "stock_code": "005930",
+            "company_name": "삼성전자",
+            "financial_analysis_text": "재무 분석",
+            "errors": [],
+        }
+        graph = _valuation_graph(async_mode)
+        started = time.perf_counter()
+        if async_mode:
+            final_state = asyncio.run(graph.ainvoke(state))
+        else:
+            final_state = graph.invoke(state)
+        return final_state, time.perf_counter() - started
+    finally:
+        valuation_agent.get_llm_provider = original
+
+
+def test_branches_run_concurrently():
+    """두 분기가 동시에 실행: 단계 시간 < LLM 호출 2회"""
+    print("\n" + "=" * 80)
+    print("TEST 1: 병렬 분기 실행 및 점수 병합")
+    print("=" * 80)
+
+    for async_mode in (False, True):
+        final_state, elapsed = _run(async_mode, _FakeLLM())
+
+        assert final_state["current_stage"] == "valuation_completed"
+        assert final_state["deep_value_evaluation"]["score"] == 60
+        assert final_state["quality_evaluation"]["score"] == 80
+        assert final_state["overall_score"] == 60 * 0.4 + 80 * 0.6
+        assert final_state["overall_verdict"] == "buy"
+
+        timings = final_state["stage_timings"]
+        assert set(timings) == {"valuation.deep_value", "valuation.quality", "valuation"}
+        assert timings["valuation"] >= _LLM_SECONDS
+        assert elapsed < _LLM_SECONDS * 1.8, f"{elapsed:.2f}s"
+
+        mode = "비동기" if async_mode else "동기"
+        sequential_ms = _LLM_SECONDS * 2 * 1000
+        print(f"✓ {mode} 그래프: {elapsed * 1000:.0f}ms (순차 실행 시 약 {sequential_ms:.0f}ms)")
+        print(f"  stage_timings={timings}")
+
+
+def test_branch_failure():
+    """한 분기 실패 시 오류를 모아 valuation_failed"""
+    print("\n" + "=" * 80)
+    print("TEST 2: 분기 실패 병합")
+    print("=" * 80)
+
+    final_state, _ = _run(True, _FakeLLM(fail_quality=True))
+
+    assert final_state["current_stage"] == "valuation_failed"
+    assert final_state["errors"] == ["가치투자 평가 오류: quality 호출 실패"]
+    assert "overall_score" not in final_state
+    assert "valuation.quality" in final_state["stage_timings"]
+
+    print(f"✓ errors={final_state['errors']}")
+
+
+def main():
+    """전체 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("가치투자 평가 병렬 분기 테스트")
+    print("=" * 80)
+
+    test_branches_run_concurrently()
+    test_branch_failure()
+
+    print("\n" + "=" * 80)
+    print("✓ 모든 테스트 완료")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n테스트 중단됨")
+    except Exception as e:
+        logger.error(f"테스트 오류: {e}", exc_info=True)
+        print(f"\n❌ 테스트 실패: {e}")